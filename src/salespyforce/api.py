@@ -4,11 +4,12 @@
 :Synopsis:          Defines the basic functions associated with the Salesforce API
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff (via GPT-5.5-codex)
-:Modified Date:     15 Jul 2026
+:Modified Date:     18 Oct 2026
 """
 
 from __future__ import annotations
 
+import json
 from typing import Optional
 
 import requests
@@ -29,6 +30,7 @@ def get(
     timeout: Optional[int] = None,
     show_full_error: bool = True,
     return_json: bool = True,
+    stream: bool = False,
 ):
     """This method performs a GET request against the Salesforce instance.
     (`Reference <https://jereze.com/code/authentification-salesforce-rest-api-python/>`__)
@@ -41,6 +43,12 @@ def get(
     .. versionchanged:: 1.5.0
        Successful responses with empty bodies are returned without attempting JSON conversion.
 
+    .. versionchanged:: 1.6.0
+       JSON responses are served from and stored in the response cache when one is attached to the core object,
+       and concurrent identical requests from multiple threads now share a single API call. The optional ``stream``
+       parameter can also be used to retrieve the response body incrementally. Cached responses are scoped to the
+       access token used for the request so that they are never returned to a different authenticated user.
+
     :param sfdc_object: The instantiated SalesPyForce object
     :type sfdc_object: class[salespyforce.Salesforce]
     :param endpoint: The API endpoint to query
@@ -54,6 +62,10 @@ def get(
     :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
     :type show_full_error: bool
     :param return_json: Determines if the response should be returned in JSON format (defaults to ``True``)
+    :param stream: Returns the ``requests`` object without downloading the response body so that it can be read
+                   with the ``iter_content`` method, bypassing the response cache and request coalescing
+                   (defaults to ``False``)
+    :type stream: bool
     :returns: The API response in JSON format or as a ``requests`` object
     :raises: :py:exc:`TypeError`,
              :py:exc:`RuntimeError`,
@@ -62,26 +74,48 @@ def get(
     # Define the parameters as an empty dictionary if none are provided
     params = {} if params is None else params
 
+    # Construct the request URL
+    url = _construct_full_query_url(endpoint, sfdc_object.instance_url)
+
+    # Return the cached response when available
+    response_cache = getattr(sfdc_object, 'response_cache', None)
+    cache_key = None
+    if response_cache is not None and return_json and not stream:
+        identity = _get_authorization_value(headers) or sfdc_object.access_token
+        cache_key = response_cache.build_key(const.API_REQUEST_TYPES.GET, url, params, headers, identity)
+        cached_content = response_cache.get(cache_key)
+        if cached_content is not None:
+            return json.loads(cached_content)
+
     # Define the headers
     default_headers = _get_headers(sfdc_object.access_token)
     headers = default_headers if not headers else headers
 
-    # Construct the request URL
-    url = _construct_full_query_url(endpoint, sfdc_object.instance_url)
-
     # Define the API request timeout (using default value if not explicitly defined with parameter)
     timeout = const.DEFAULT_API_TIMEOUT_SECONDS if not timeout else timeout
 
-    # Perform the API call
-    response = requests.get(url, headers=headers, params=params, timeout=timeout)
+    # Perform the API call (sharing the response with any identical requests that are already in flight)
+    inflight_requests = getattr(sfdc_object, 'inflight_requests', None)
+    if stream:
+        response = requests.get(url, headers=headers, params=params, timeout=timeout, stream=True)
+    elif inflight_requests is not None:
+        request_key = (url, _get_hashable_items(params), _get_hashable_items(headers))
+        response = inflight_requests.do(request_key, requests.get, url, headers=headers, params=params, timeout=timeout)
+    else:
+        response = requests.get(url, headers=headers, params=params, timeout=timeout)
     if response.status_code >= 300:
         # TODO: Functionalize this segment and figure out how to improve on the approach somehow
         if show_full_error:
             raise RuntimeError(f'The GET request failed with a {response.status_code} status code.\n{response.text}')
         else:
             raise RuntimeError(f'The GET request failed with a {response.status_code} status code.')
+    if stream:
+        return response
     if return_json and not _has_empty_response_body(response):
+        content = getattr(response, 'content', None)
         response = response.json()
+        if cache_key is not None:
+            response_cache.set(cache_key, content)
     return response
 
 
@@ -107,6 +141,9 @@ def api_call_with_payload(
     .. versionchanged:: 1.5.0
        Successful responses with empty bodies are returned without attempting JSON conversion.
 
+    .. versionchanged:: 1.6.0
+       Successful PATCH and PUT requests now invalidate any cached responses for the same record URL.
+
     :param sfdc_object: The instantiated SalesPyForce object
     :type sfdc_object: class[salespyforce.Salesforce]
     :param method: The API method (``post``, ``put``, or ``patch``)
@@ -160,6 +197,8 @@ def api_call_with_payload(
             raise RuntimeError(f'The {method.upper()} request failed with a {response.status_code} status code.\n{response.text}')
         else:
             raise RuntimeError(f'The {method.upper()} request failed with a {response.status_code} status code.')
+    if method.upper() in (const.API_REQUEST_TYPES.PATCH, const.API_REQUEST_TYPES.PUT):
+        _invalidate_cached_responses(sfdc_object, url)
     if return_json and not _has_empty_response_body(response):
         try:
             response = response.json()
@@ -185,6 +224,9 @@ def delete(
     .. versionchanged:: 1.5.0
        Successful responses with empty bodies are returned without attempting JSON conversion.
 
+    .. versionchanged:: 1.6.0
+       Successful requests now invalidate any cached responses for the same record URL.
+
     :param sfdc_object: The instantiated SalesPyForce object
     :type sfdc_object: class[salespyforce.Salesforce]
     :param endpoint: The API endpoint to query
@@ -224,11 +266,55 @@ def delete(
             raise RuntimeError(f'The DELETE request failed with a {response.status_code} status code.\n{response.text}')
         else:
             raise RuntimeError(f'The DELETE request failed with a {response.status_code} status code.')
+    _invalidate_cached_responses(sfdc_object, url)
     if return_json and not _has_empty_response_body(response):
         response = response.json()
     return response
 
 
+def _get_hashable_items(_data: dict) -> tuple:
+    """This function converts a dictionary of parameters or headers into a sorted tuple that can be hashed.
+
+    .. versionadded:: 1.6.0
+
+    :param _data: The dictionary to convert
+    :type _data: dict
+    :returns: The sorted key value pairs as a tuple of strings
+    """
+    return tuple(sorted((str(_key), str(_val)) for _key, _val in _data.items()))
+
+
+def _get_authorization_value(_headers: Optional[dict]) -> Optional[str]:
+    """This function retrieves the value of the ``Authorization`` header from explicitly provided request headers.
+
+    .. versionadded:: 1.6.0
+
+    :param _headers: The explicitly provided headers for the request (where applicable)
+    :type _headers: dict, None
+    :returns: The value of the ``Authorization`` header or ``None`` if it is not present
+    """
+    for _key, _val in (_headers or {}).items():
+        if str(_key).lower() == const.HEADERS.AUTHORIZATION.lower():
+            return _val
+    return None
+
+
+def _invalidate_cached_responses(_sfdc_object, _url: str) -> None:
+    """This function removes cached responses for a record URL after it has been modified or deleted.
+
+    .. versionadded:: 1.6.0
+
+    :param _sfdc_object: The instantiated SalesPyForce object
+    :type _sfdc_object: class[salespyforce.Salesforce]
+    :param _url: The fully qualified URL (or REST path) of the record that was modified or deleted
+    :type _url: str
+    :returns: None
+    """
+    _response_cache = getattr(_sfdc_object, 'response_cache', None)
+    if _response_cache is not None:
+        _response_cache.invalidate(_url)
+
+
 def _has_empty_response_body(_response) -> bool:
     """Determine whether a successful API response has an empty body.
 
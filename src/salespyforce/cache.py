@@ -0,0 +1,578 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            salespyforce.cache
+:Synopsis:          Defines the optional caches that can be leveraged by the core object to reduce API calls
+:Usage:             ``from salespyforce.cache import ArticleNumberIndex, RecordAccessCache, ResponseCache``
+:Example:           ``sfdc = Salesforce(helper=helper_file_path, response_cache=ResponseCache(default_ttl=60))``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from typing import Optional, Union
+
+from . import constants as const
+from .utils import core_utils, log_utils
+
+# Initialize logging
+logger = log_utils.initialize_logging(__name__)
+
+
+class _CacheEntry:
+    """This class stores a single cached response body along with its metadata.
+
+    .. versionadded:: 1.6.0
+    """
+
+    __slots__ = ('content', 'expires_at', 'path', 'size')
+
+    def __init__(self, content: bytes, expires_at: float, path: str):
+        self.content = content
+        self.expires_at = expires_at
+        self.path = path
+        self.size = len(content)
+
+
+class ResponseCache:
+    """This class is a thread-safe TTL and LRU cache for idempotent GET responses (including SOQL queries).
+
+    .. versionadded:: 1.6.0
+
+    Responses are keyed by the request method, the normalized endpoint URL (which includes the instance URL), the
+    query parameters, any explicitly provided headers (excluding the ``Authorization`` header) and a hash of the
+    access token used for the request. The raw response bodies are stored so that every cache hit returns a new
+    deserialized object, and the least recently used entries are evicted once the total size of the stored bodies
+    exceeds the ``max_bytes`` value.
+
+    Because the key is scoped to the access token, a single instance can be shared between core objects that are
+    authenticated as different users without one user being served the records cached for another. Entries cached
+    under a previous access token are not reused after the token changes and are eventually expired or evicted.
+
+    :param default_ttl: The number of seconds a cached response remains valid (``300`` by default)
+    :type default_ttl: int, float
+    :param max_bytes: The maximum combined size in bytes of the cached response bodies (64 MB by default)
+    :type max_bytes: int
+    :param ttl_rules: Optional mapping of regex patterns to TTL values (in seconds) that are evaluated in order
+                      against the endpoint path to override the default TTL (a TTL of ``0`` disables caching)
+    :type ttl_rules: dict, None
+    :raises: :py:exc:`ValueError`
+    """
+
+    def __init__(
+        self,
+        default_ttl: Union[int, float] = const.CACHE_SETTINGS.DEFAULT_TTL_SECONDS,
+        max_bytes: int = const.CACHE_SETTINGS.DEFAULT_MAX_BYTES,
+        ttl_rules: Optional[dict] = None,
+    ) -> None:
+        """This method instantiates the response cache object."""
+        if default_ttl < 0 or max_bytes < 0:
+            error_msg = 'The default_ttl and max_bytes values for the response cache cannot be negative'
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self._ttl_rules = [(re.compile(_pattern), _ttl) for _pattern, _ttl in (ttl_rules or {}).items()]
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """This method normalizes a URL so that equivalent requests share the same cache key.
+
+        :param url: The fully qualified URL to normalize
+        :type url: str
+        :returns: The URL with a lowercase scheme and host, no trailing slash and sorted query parameters
+        """
+        _parts = urllib.parse.urlsplit(url)
+        _path = _parts.path.rstrip('/') or '/'
+        _query = urllib.parse.urlencode(sorted(urllib.parse.parse_qsl(_parts.query, keep_blank_values=True)))
+        return urllib.parse.urlunsplit((_parts.scheme.lower(), _parts.netloc.lower(), _path, _query, ''))
+
+    def build_key(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        identity: Optional[str] = None,
+    ) -> tuple:
+        """This method constructs the cache key for a given request.
+
+        :param method: The API request method (e.g. ``GET``)
+        :type method: str
+        :param url: The fully qualified URL of the request
+        :type url: str
+        :param params: The query parameters of the request (where applicable)
+        :type params: dict, None
+        :param headers: Explicitly provided headers for the request (where applicable)
+        :type headers: dict, None
+        :param identity: The access token (or other value identifying the authenticated user) for the request, which
+                         is hashed so that responses are never shared between users
+        :type identity: str, None
+        :returns: The cache key as a tuple
+        """
+        _params = tuple(sorted((str(_key), str(_val)) for _key, _val in (params or {}).items()))
+        _headers = tuple(
+            sorted(
+                (str(_key).lower(), str(_val))
+                for _key, _val in (headers or {}).items()
+                if str(_key).lower() != const.HEADERS.AUTHORIZATION.lower()
+            )
+        )
+        _identity = hashlib.sha256(str(identity).encode('utf-8')).hexdigest() if identity else ''
+        return method.upper(), self.normalize_url(url), _params, _headers, _identity
+
+    def get_ttl(self, url: str) -> Union[int, float]:
+        """This method identifies the TTL to apply to a response for a given URL.
+
+        :param url: The URL (or normalized URL) of the request
+        :type url: str
+        :returns: The TTL value in seconds
+        """
+        _path = urllib.parse.urlsplit(url).path
+        for _pattern, _ttl in self._ttl_rules:
+            if _pattern.search(_path):
+                return _ttl
+        return self.default_ttl
+
+    def get(self, key: tuple) -> Optional[bytes]:
+        """This method retrieves a cached response body if it is present and has not expired.
+
+        :param key: The cache key constructed with the :py:meth:`build_key` method
+        :type key: tuple
+        :returns: The cached response body or ``None`` if there is no valid entry
+        """
+        with self._lock:
+            _entry = self._entries.get(key)
+            if _entry is not None and _entry.expires_at <= time.monotonic():
+                self._remove(key)
+                _entry = None
+            if _entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return _entry.content
+
+    def set(self, key: tuple, content: Union[bytes, str]) -> bool:
+        """This method stores a response body in the cache and evicts the least recently used entries as needed.
+
+        :param key: The cache key constructed with the :py:meth:`build_key` method
+        :type key: tuple
+        :param content: The raw response body to store
+        :type content: bytes, str
+        :returns: Boolean value indicating whether the response body was stored
+        """
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        if not isinstance(content, bytes):
+            return False
+        _ttl = self.get_ttl(key[1])
+        if _ttl <= 0 or len(content) > self.max_bytes:
+            return False
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            _entry = _CacheEntry(content, time.monotonic() + _ttl, urllib.parse.urlsplit(key[1]).path)
+            self._entries[key] = _entry
+            self._size += _entry.size
+            while self._size > self.max_bytes and self._entries:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+        return True
+
+    def invalidate(self, url: str) -> int:
+        """This method removes the cached responses associated with a record or resource URL.
+
+        Entries are removed when their path starts with the path of the provided URL or, when the URL ends with a
+        Salesforce record ID, when that ID is found in any segment of their path.
+
+        :param url: The URL of the record or resource that was modified
+        :type url: str
+        :returns: The number of entries that were removed
+        """
+        _path = urllib.parse.urlsplit(self.normalize_url(url)).path
+        _last_segment = _path.rsplit('/', 1)[-1]
+        _record_id = _last_segment if re.fullmatch(const.SALESFORCE_ID_PATTERN, _last_segment) else None
+        with self._lock:
+            _keys = [
+                _key
+                for _key, _entry in self._entries.items()
+                if _entry.path.startswith(_path) or (_record_id and _record_id in _entry.path.split('/'))
+            ]
+            for _key in _keys:
+                self._remove(_key)
+            self._invalidations += len(_keys)
+        if _keys:
+            logger.debug(f'Invalidated {len(_keys)} cached response(s) for {_path}')
+        return len(_keys)
+
+    def clear(self) -> None:
+        """This method removes all entries from the cache without resetting the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    @property
+    def stats(self) -> dict:
+        """This property returns the hit, miss, eviction and size statistics for the cache.
+
+        :returns: Dictionary with the cache statistics
+        """
+        with self._lock:
+            _lookups = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / _lookups if _lookups else 0.0,
+                'evictions': self._evictions,
+                'invalidations': self._invalidations,
+                'entries': len(self._entries),
+                'size_bytes': self._size,
+                'max_bytes': self.max_bytes,
+            }
+
+    def _remove(self, _key: tuple) -> None:
+        """This method removes a single entry from the cache (the lock must already be held)."""
+        _entry = self._entries.pop(_key)
+        self._size -= _entry.size
+
+    def __len__(self) -> int:
+        """This method returns the number of entries currently stored in the cache."""
+        return len(self._entries)
+
+
+class RecordAccessCache:
+    """This class is a thread-safe TTL and LRU cache for ``UserRecordAccess`` data keyed by user and record.
+
+    .. versionadded:: 1.6.0
+
+    The user and record IDs are normalized to their 18-character form so that 15-character and 18-character IDs
+    share the same entry, and the least recently used entries are evicted once ``max_entries`` is exceeded.
+
+    :param ttl: The number of seconds the access data for a user and record remains valid (``60`` by default)
+    :type ttl: int, float
+    :param max_entries: The maximum number of user and record pairs to store (``10000`` by default)
+    :type max_entries: int
+    :raises: :py:exc:`ValueError`
+    """
+
+    def __init__(
+        self,
+        ttl: Union[int, float] = const.CACHE_SETTINGS.RECORD_ACCESS_TTL_SECONDS,
+        max_entries: int = const.CACHE_SETTINGS.RECORD_ACCESS_MAX_ENTRIES,
+    ) -> None:
+        """This method instantiates the record access cache object."""
+        if ttl < 0 or max_entries < 0:
+            error_msg = 'The ttl and max_entries values for the record access cache cannot be negative'
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def _normalize_id(_record_id: str) -> str:
+        """This method returns the 18-character form of an ID (or the original value if it cannot be converted)."""
+        try:
+            return core_utils.get_18_char_id(_record_id)
+        except ValueError:
+            return _record_id
+
+    def get(self, user_id: str, record_id: str) -> Optional[dict]:
+        """This method retrieves the cached access data for a user and record if it has not expired.
+
+        :param user_id: The ``Id`` of the user
+        :type user_id: str
+        :param record_id: The ``Id`` of the record
+        :type record_id: str
+        :returns: A copy of the cached access data or ``None`` if there is no valid entry
+        """
+        _key = (self._normalize_id(user_id), self._normalize_id(record_id))
+        with self._lock:
+            _entry = self._entries.get(_key)
+            if _entry is not None and _entry[0] <= time.monotonic():
+                del self._entries[_key]
+                _entry = None
+            if _entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(_key)
+            self._hits += 1
+            return dict(_entry[1])
+
+    def set(self, user_id: str, record_id: str, record_access: dict) -> bool:
+        """This method stores the access data for a user and record and evicts the least recently used entries.
+
+        :param user_id: The ``Id`` of the user
+        :type user_id: str
+        :param record_id: The ``Id`` of the record
+        :type record_id: str
+        :param record_access: The access data with the ``HasReadAccess``, ``HasEditAccess`` and ``HasDeleteAccess``
+                              values
+        :type record_access: dict
+        :returns: Boolean value indicating whether the access data was stored
+        """
+        if self.ttl <= 0 or self.max_entries == 0:
+            return False
+        _key = (self._normalize_id(user_id), self._normalize_id(record_id))
+        with self._lock:
+            self._entries.pop(_key, None)
+            self._entries[_key] = (time.monotonic() + self.ttl, dict(record_access))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return True
+
+    def invalidate_user(self, user_id: str) -> int:
+        """This method removes the cached access data for all records of a given user.
+
+        :param user_id: The ``Id`` of the user
+        :type user_id: str
+        :returns: The number of entries that were removed
+        """
+        return self._invalidate(_position=0, _value=self._normalize_id(user_id))
+
+    def invalidate_record(self, record_id: str) -> int:
+        """This method removes the cached access data for all users of a given record.
+
+        :param record_id: The ``Id`` of the record
+        :type record_id: str
+        :returns: The number of entries that were removed
+        """
+        return self._invalidate(_position=1, _value=self._normalize_id(record_id))
+
+    def _invalidate(self, _position: int, _value: str) -> int:
+        """This method removes the entries whose key matches a value at a given position."""
+        with self._lock:
+            _keys = [_key for _key in self._entries if _key[_position] == _value]
+            for _key in _keys:
+                del self._entries[_key]
+            self._invalidations += len(_keys)
+        return len(_keys)
+
+    def clear(self) -> None:
+        """This method removes all entries from the cache without resetting the statistics."""
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> dict:
+        """This property returns the hit, miss, eviction and size statistics for the cache.
+
+        :returns: Dictionary with the cache statistics
+        """
+        with self._lock:
+            _lookups = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / _lookups if _lookups else 0.0,
+                'evictions': self._evictions,
+                'invalidations': self._invalidations,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+            }
+
+    def __len__(self) -> int:
+        """This method returns the number of entries currently stored in the cache."""
+        return len(self._entries)
+
+
+class ArticleNumberIndex:
+    """This class is a thread-safe index that maps knowledge article numbers to their ``Id`` values.
+
+    .. versionadded:: 1.6.0
+
+    The article numbers are normalized to their zero-padded 9-character form so that ``1234`` and ``'000001234'``
+    share the same entry. The index tracks the latest ``SystemModstamp`` value loaded for each sObject so that it
+    can be refreshed incrementally with the :py:func:`salespyforce.knowledge.load_article_number_index` function.
+    """
+
+    def __init__(self) -> None:
+        """This method instantiates the article number index object."""
+        self._entries = {}
+        self._watermarks = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def normalize_article_number(article_number: Union[str, int]) -> str:
+        """This method returns the zero-padded 9-character form of an article number.
+
+        :param article_number: The article number to normalize
+        :type article_number: str, int
+        :returns: The normalized article number
+        """
+        return str(article_number).strip().zfill(const.SOQL_QUERIES.ARTICLE_NUMBER_LENGTH)
+
+    def get(self, sobject: str, article_number: Union[str, int]) -> Optional[str]:
+        """This method retrieves the indexed ``Id`` value for an article number.
+
+        :param sobject: The knowledge sObject (e.g. ``Knowledge__kav``)
+        :type sobject: str
+        :param article_number: The article number to look up
+        :type article_number: str, int
+        :returns: The ``Id`` value or ``None`` if the article number is not indexed
+        """
+        _key = (sobject, self.normalize_article_number(article_number))
+        with self._lock:
+            _article_id = self._entries.get(_key)
+            if _article_id is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return _article_id
+
+    def update(self, sobject: str, article_ids: dict, watermark: Optional[str] = None) -> None:
+        """This method adds or replaces the ``Id`` values for multiple article numbers.
+
+        :param sobject: The knowledge sObject (e.g. ``Knowledge__kav``)
+        :type sobject: str
+        :param article_ids: Dictionary mapping article numbers to their ``Id`` values
+        :type article_ids: dict
+        :param watermark: The latest ``SystemModstamp`` value that has been loaded for the sObject (optional)
+        :type watermark: str, None
+        :returns: None
+        """
+        with self._lock:
+            for _article_number, _article_id in article_ids.items():
+                self._entries[(sobject, self.normalize_article_number(_article_number))] = _article_id
+            if watermark and watermark > self._watermarks.get(sobject, ''):
+                self._watermarks[sobject] = watermark
+
+    def get_watermark(self, sobject: str) -> Optional[str]:
+        """This method returns the latest ``SystemModstamp`` value that has been loaded for an sObject.
+
+        :param sobject: The knowledge sObject (e.g. ``Knowledge__kav``)
+        :type sobject: str
+        :returns: The ``SystemModstamp`` value or ``None`` if the index has not been loaded for the sObject
+        """
+        with self._lock:
+            return self._watermarks.get(sobject)
+
+    def clear(self, sobject: Optional[str] = None) -> None:
+        """This method removes the indexed article numbers for one or all sObjects.
+
+        :param sobject: The knowledge sObject to clear (all sObjects are cleared by default)
+        :type sobject: str, None
+        :returns: None
+        """
+        with self._lock:
+            if sobject is None:
+                self._entries.clear()
+                self._watermarks.clear()
+                return
+            for _key in [_key for _key in self._entries if _key[0] == sobject]:
+                del self._entries[_key]
+            self._watermarks.pop(sobject, None)
+
+    @property
+    def stats(self) -> dict:
+        """This property returns the hit, miss and size statistics for the index.
+
+        :returns: Dictionary with the index statistics
+        """
+        with self._lock:
+            _lookups = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / _lookups if _lookups else 0.0,
+                'entries': len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        """This method returns the number of article numbers currently stored in the index."""
+        return len(self._entries)
+
+
+def get_response_cache(response_cache: Optional[Union[bool, ResponseCache]] = None) -> Optional[ResponseCache]:
+    """This function returns the response cache to attach to the core object based on the provided value.
+
+    .. versionadded:: 1.6.0
+
+    :param response_cache: ``True`` to use a cache with default settings, an existing
+                           :py:class:`salespyforce.cache.ResponseCache` instance, or ``None``/``False`` to disable
+    :type response_cache: bool, class[salespyforce.cache.ResponseCache], None
+    :returns: The response cache object or ``None`` if caching is disabled
+    :raises: :py:exc:`TypeError`
+    """
+    return _get_cache_object(response_cache, ResponseCache, 'response_cache')
+
+
+def get_record_access_cache(
+    record_access_cache: Optional[Union[bool, RecordAccessCache]] = None,
+) -> Optional[RecordAccessCache]:
+    """This function returns the record access cache to attach to the core object based on the provided value.
+
+    .. versionadded:: 1.6.0
+
+    :param record_access_cache: ``True`` to use a cache with default settings, an existing
+                                :py:class:`salespyforce.cache.RecordAccessCache` instance, or ``None``/``False``
+                                to disable
+    :type record_access_cache: bool, class[salespyforce.cache.RecordAccessCache], None
+    :returns: The record access cache object or ``None`` if caching is disabled
+    :raises: :py:exc:`TypeError`
+    """
+    return _get_cache_object(record_access_cache, RecordAccessCache, 'record_access_cache')
+
+
+def get_article_number_index(
+    article_number_index: Optional[Union[bool, ArticleNumberIndex]] = None,
+) -> Optional[ArticleNumberIndex]:
+    """This function returns the article number index to attach to the core object based on the provided value.
+
+    .. versionadded:: 1.6.0
+
+    :param article_number_index: ``True`` to use a new index, an existing
+                                 :py:class:`salespyforce.cache.ArticleNumberIndex` instance, or ``None``/``False``
+                                 to disable
+    :type article_number_index: bool, class[salespyforce.cache.ArticleNumberIndex], None
+    :returns: The article number index object or ``None`` if the index is disabled
+    :raises: :py:exc:`TypeError`
+    """
+    return _get_cache_object(article_number_index, ArticleNumberIndex, 'article_number_index')
+
+
+def _get_cache_object(_value, _cache_class: type, _param_name: str):
+    """This function returns a cache object of a given class based on a Boolean, cache object or ``None`` value.
+
+    .. versionadded:: 1.6.0
+
+    :param _value: The value provided for the cache parameter
+    :param _cache_class: The class of the cache object
+    :type _cache_class: type
+    :param _param_name: The name of the cache parameter to use in the error message
+    :type _param_name: str
+    :returns: The cache object or ``None`` if caching is disabled
+    :raises: :py:exc:`TypeError`
+    """
+    if _value is None or _value is False:
+        return None
+    if _value is True:
+        return _cache_class()
+    if isinstance(_value, _cache_class):
+        return _value
+    _error_msg = f'The {_param_name} value must be a Boolean or a {_cache_class.__name__} object (provided: {type(_value)})'
+    logger.error(_error_msg)
+    raise TypeError(_error_msg)
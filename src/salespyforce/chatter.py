@@ -3,21 +3,33 @@
 :Module:            salespyforce.chatter
 :Synopsis:          Defines the Chatter-related functions associated with the Salesforce Connect API
 :Created By:        Jeff Shurtliff
-:Last Modified:     Jeff Shurtliff (via GPT-5.5-codex)
-:Modified Date:     15 Jul 2026
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
 """
 
 from __future__ import annotations
 
-from typing import Optional
+import asyncio
+import re
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import AsyncIterator, Iterator, Mapping, Optional, Union
 
 from . import constants as const
 from . import errors
-from .utils import log_utils
+from .utils import concurrency_utils, core_utils, log_utils
 
 # Initialize logging
 logger = log_utils.initialize_logging(__name__)
 
+# Define the pattern that identifies the escaped braces, placeholders and markup tags of a message template
+_TEMPLATE_TOKEN_REGEX = re.compile(
+    r'(?P<escaped>\{\{|\}\})'
+    r'|\{(?:(?P<shorthand>[@#])|(?P<kind>mention|hashtag|link):)?(?P<name>\w+)\}'
+    rf'|<(?P<closing>/?)(?P<tag>{"|".join(const.CHATTER_SETTINGS.MARKUP_TYPES)})>',
+    re.IGNORECASE,
+)
+
 
 def _get_site_endpoint_segment(_site_id: Optional[str] = None) -> str:
     """This function constructs the endpoint segment when querying a specific Experience Cloud site.
@@ -97,6 +109,624 @@ def get_group_feed(sfdc_object, group_id: str, site_id: Optional[str] = None):
     return sfdc_object.get(endpoint)
 
 
+def iter_my_news_feed(
+    sfdc_object,
+    site_id: Optional[str] = None,
+    page_size: int = const.QUERY_PARAMS.MAX_PAGE_SIZE,
+    since: Optional[Union[datetime, str]] = None,
+    max_elements: Optional[int] = None,
+    sort: Optional[str] = None,
+) -> Iterator[dict]:
+    """This function yields the feed elements of the news feed for the user calling the function across every page.
+    (`Reference <https://developer.salesforce.com/docs/atlas.en-us.chatterapi.meta/chatterapi/quickreference_get_news_feed.htm>`__)
+
+    .. versionadded:: 1.6.0
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param site_id: The ID of an Experience Cloud site against which to query (optional)
+    :type site_id: str, None
+    :param page_size: The number of feed elements to retrieve per page (``100`` by default, which is the maximum)
+    :type page_size: int
+    :param since: Stops the iteration at the first feed element that is older than this date (optional)
+    :type since: datetime, str, None
+    :param max_elements: Stops the iteration once this number of feed elements has been yielded (optional)
+    :type max_elements: int, None
+    :param sort: The ``sortParam`` value (``CreatedDateDesc`` by default when ``since`` is defined)
+    :type sort: str, None
+    :returns: Generator that yields each feed element
+    :raises: :py:exc:`RuntimeError`
+    """
+    endpoint_root = _get_endpoint_root_segment(sfdc_object.version, site_id)
+    endpoint = endpoint_root + const.REST_PATHS.CHATTER_MY_NEWS_FEED
+    return _iter_feed_elements(sfdc_object, endpoint, page_size, since, max_elements, sort)
+
+
+def iter_user_news_feed(
+    sfdc_object,
+    user_id: str,
+    site_id: Optional[str] = None,
+    page_size: int = const.QUERY_PARAMS.MAX_PAGE_SIZE,
+    since: Optional[Union[datetime, str]] = None,
+    max_elements: Optional[int] = None,
+    sort: Optional[str] = None,
+) -> Iterator[dict]:
+    """This function yields the feed elements of another user's news feed across every page.
+    (`Reference <https://developer.salesforce.com/docs/atlas.en-us.chatterapi.meta/chatterapi/quickreference_get_user_profile_feed.htm>`__)
+
+    .. versionadded:: 1.6.0
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param user_id: The ID of the user whose feed you wish to return
+    :type user_id: str
+    :param site_id: The ID of an Experience Cloud site against which to query (optional)
+    :type site_id: str, None
+    :param page_size: The number of feed elements to retrieve per page (``100`` by default, which is the maximum)
+    :type page_size: int
+    :param since: Stops the iteration at the first feed element that is older than this date (optional)
+    :type since: datetime, str, None
+    :param max_elements: Stops the iteration once this number of feed elements has been yielded (optional)
+    :type max_elements: int, None
+    :param sort: The ``sortParam`` value (``CreatedDateDesc`` by default when ``since`` is defined)
+    :type sort: str, None
+    :returns: Generator that yields each feed element
+    :raises: :py:exc:`RuntimeError`
+    """
+    endpoint_root = _get_endpoint_root_segment(sfdc_object.version, site_id)
+    endpoint = endpoint_root + const.REST_PATHS.CHATTER_USER_NEWS_FEED.format(user_id=user_id)
+    return _iter_feed_elements(sfdc_object, endpoint, page_size, since, max_elements, sort)
+
+
+def iter_group_feed(
+    sfdc_object,
+    group_id: str,
+    site_id: Optional[str] = None,
+    page_size: int = const.QUERY_PARAMS.MAX_PAGE_SIZE,
+    since: Optional[Union[datetime, str]] = None,
+    max_elements: Optional[int] = None,
+    sort: Optional[str] = None,
+) -> Iterator[dict]:
+    """This function yields the feed elements of a group's news feed across every page.
+    (`Reference <https://developer.salesforce.com/docs/atlas.en-us.chatterapi.meta/chatterapi/quickreference_get_group_feed.htm>`__)
+
+    .. versionadded:: 1.6.0
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param group_id: The ID of the group whose feed you wish to return
+    :type group_id: str
+    :param site_id: The ID of an Experience Cloud site against which to query (optional)
+    :type site_id: str, None
+    :param page_size: The number of feed elements to retrieve per page (``100`` by default, which is the maximum)
+    :type page_size: int
+    :param since: Stops the iteration at the first feed element that is older than this date (optional)
+    :type since: datetime, str, None
+    :param max_elements: Stops the iteration once this number of feed elements has been yielded (optional)
+    :type max_elements: int, None
+    :param sort: The ``sortParam`` value (``CreatedDateDesc`` by default when ``since`` is defined)
+    :type sort: str, None
+    :returns: Generator that yields each feed element
+    :raises: :py:exc:`RuntimeError`
+    """
+    endpoint_root = _get_endpoint_root_segment(sfdc_object.version, site_id)
+    endpoint = endpoint_root + const.REST_PATHS.CHATTER_GROUP_NEWS_FEED.format(group_id=group_id)
+    return _iter_feed_elements(sfdc_object, endpoint, page_size, since, max_elements, sort)
+
+
+def get_feed_elements(
+    sfdc_object,
+    feed_element_ids: Union[list, tuple, set],
+    site_id: Optional[str] = None,
+    max_workers: int = 1,
+) -> dict:
+    """This function retrieves many feed elements using batched requests of up to 500 feed elements.
+    (`Reference <https://developer.salesforce.com/docs/atlas.en-us.chatterapi.meta/chatterapi/connect_resources_feed_element_batch.htm>`__)
+
+    .. versionadded:: 1.6.0
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param feed_element_ids: The IDs of the feed elements to retrieve
+    :type feed_element_ids: list, tuple, set
+    :param site_id: The ID of an Experience Cloud site against which to query (optional)
+    :type site_id: str, None
+    :param max_workers: The maximum number of batches to retrieve concurrently (``1`` by default)
+    :type max_workers: int
+    :returns: Dictionary mapping each feed element ID to its feed element (or ``None`` if it could not be retrieved)
+    :raises: :py:exc:`RuntimeError`
+    """
+    feed_element_ids = list(dict.fromkeys(feed_element_ids or []))
+    endpoint_root = _get_endpoint_root_segment(sfdc_object.version, site_id)
+
+    # Define the function that retrieves a single batch of feed elements
+    def _get_batch(_ids: list) -> list:
+        _endpoint = endpoint_root + const.REST_PATHS.CHATTER_FEED_ELEMENTS_BATCH_IDS.format(feed_element_ids=','.join(_ids))
+        _batch_results = (sfdc_object.get(_endpoint) or {}).get(const.RESPONSE_KEYS.RESULTS) or []
+        _elements = []
+        for _id, _batch_result in zip(_ids, _batch_results + [{}] * (len(_ids) - len(_batch_results))):
+            _result = _batch_result.get(const.RESPONSE_KEYS.RESULT)
+            if _batch_result.get(const.RESPONSE_KEYS.STATUS_CODE, 0) < 300 and isinstance(_result, dict):
+                _elements.append(_result)
+            else:
+                logger.warning(f'Unable to retrieve the feed element {_id}: {_get_batch_result(_batch_result)["error"]}')
+                _elements.append(None)
+        return _elements
+
+    # Retrieve the batches and map each feed element to its ID
+    batches = list(core_utils.chunk_iterable(feed_element_ids, const.CHATTER_SETTINGS.MAX_BATCH_FEED_ELEMENTS))
+    elements = {}
+    for ids, batch_elements in zip(batches, concurrency_utils.run_concurrently(_get_batch, batches, max_workers=max_workers)):
+        elements.update(zip(ids, batch_elements))
+    return elements
+
+
+def get_comment_threads(
+    sfdc_object,
+    feed_element_ids: Union[list, tuple, set],
+    site_id: Optional[str] = None,
+    max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+) -> dict:
+    """This function retrieves the complete comment threads of many feed elements.
+    (`Reference <https://developer.salesforce.com/docs/atlas.en-us.chatterapi.meta/chatterapi/connect_resources_feed_element_capability_comments_items.htm>`__)
+
+    .. versionadded:: 1.6.0
+
+    The feed elements are retrieved with the :py:func:`get_feed_elements` function and the comments included with
+    each feed element are used as-is. The remaining comments are only retrieved (concurrently) for the feed
+    elements that have more comments than were included with the feed element.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param feed_element_ids: The IDs of the feed elements whose comments should be retrieved
+    :type feed_element_ids: list, tuple, set
+    :param site_id: The ID of an Experience Cloud site against which to query (optional)
+    :type site_id: str, None
+    :param max_workers: The maximum number of comment threads to retrieve concurrently (``8`` by default)
+    :type max_workers: int
+    :returns: Dictionary mapping each feed element ID to its list of comments (or ``None`` if it could not be
+              retrieved)
+    :raises: :py:exc:`RuntimeError`
+    """
+    threads, incomplete_ids = {}, []
+    for feed_element_id, element in get_feed_elements(sfdc_object, feed_element_ids, site_id=site_id).items():
+        if element is None:
+            threads[feed_element_id] = None
+            continue
+        comment_page = ((element.get(const.RESPONSE_KEYS.CAPABILITIES) or {}).get(const.RESPONSE_KEYS.COMMENTS) or {}).get(
+            const.RESPONSE_KEYS.PAGE
+        ) or {}
+        threads[feed_element_id] = comment_page.get(const.RESPONSE_KEYS.ITEMS) or []
+        if comment_page.get(const.RESPONSE_KEYS.NEXT_PAGE_URL) or comment_page.get(const.RESPONSE_KEYS.TOTAL, 0) > len(
+            threads[feed_element_id]
+        ):
+            incomplete_ids.append(feed_element_id)
+
+    # Retrieve every page of the comment threads that were not fully included with their feed elements
+    endpoint_root = _get_endpoint_root_segment(sfdc_object.version, site_id)
+
+    def _get_thread(_feed_element_id: str) -> list:
+        _endpoint = endpoint_root + const.REST_PATHS.CHATTER_FEED_ELEMENT_COMMENTS.format(feed_element_id=_feed_element_id)
+        return _get_comment_thread(sfdc_object, _endpoint)
+
+    results = concurrency_utils.run_concurrently(_get_thread, incomplete_ids, max_workers=max_workers, return_exceptions=True)
+    for feed_element_id, result in zip(incomplete_ids, results):
+        if isinstance(result, Exception):
+            logger.error(f'Failed to retrieve the comments of the feed element {feed_element_id}: {result}')
+            result = None
+        threads[feed_element_id] = result
+    return threads
+
+
+def get_record_feeds(
+    sfdc_object,
+    subject_ids: Union[list, tuple, set],
+    site_id: Optional[str] = None,
+    max_elements: Optional[int] = const.CHATTER_SETTINGS.DEFAULT_RECORD_FEED_ELEMENTS,
+    since: Optional[Union[datetime, str]] = None,
+    max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+    requests_per_second: Optional[Union[int, float]] = None,
+) -> dict:
+    """This function retrieves the record feeds of many records (e.g. groups, users or cases) concurrently.
+    (`Reference <https://developer.salesforce.com/docs/atlas.en-us.chatterapi.meta/chatterapi/connect_resources_record_feed_elements.htm>`__)
+
+    .. versionadded:: 1.6.0
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param subject_ids: The IDs of the records whose feeds should be retrieved
+    :type subject_ids: list, tuple, set
+    :param site_id: The ID of an Experience Cloud site against which to query (optional)
+    :type site_id: str, None
+    :param max_elements: The maximum number of feed elements to retrieve per record (``20`` by default and
+                         ``None`` retrieves every feed element)
+    :type max_elements: int, None
+    :param since: Excludes the feed elements that are older than this date (optional)
+    :type since: datetime, str, None
+    :param max_workers: The maximum number of record feeds to retrieve concurrently (``8`` by default)
+    :type max_workers: int
+    :param requests_per_second: The maximum number of API calls to perform per second (unlimited by default)
+    :type requests_per_second: int, float, None
+    :returns: Dictionary mapping each subject ID to its list of feed elements (or ``None`` if the feed could not be
+              retrieved)
+    :raises: :py:exc:`RuntimeError`
+    """
+    subject_ids = list(dict.fromkeys(subject_ids or []))
+    endpoint_root = _get_endpoint_root_segment(sfdc_object.version, site_id)
+    page_size = min(max_elements or const.QUERY_PARAMS.MAX_PAGE_SIZE, const.QUERY_PARAMS.MAX_PAGE_SIZE)
+    rate_limiter = concurrency_utils.RateLimiter(requests_per_second) if requests_per_second else None
+
+    # Define the function that retrieves the feed elements of a single record feed
+    def _get_record_feed(_subject_id: str) -> list:
+        _endpoint = endpoint_root + const.REST_PATHS.CHATTER_RECORD_FEED.format(record_id=_subject_id)
+        return list(_iter_feed_elements(sfdc_object, _endpoint, page_size, since, max_elements, None))
+
+    # Retrieve the record feeds and map each list of feed elements to its subject ID
+    results = concurrency_utils.run_concurrently(
+        _get_record_feed, subject_ids, max_workers=max_workers, return_exceptions=True, rate_limiter=rate_limiter
+    )
+    feeds = {}
+    for subject_id, result in zip(subject_ids, results):
+        if isinstance(result, Exception):
+            logger.error(f'Failed to retrieve the record feed of {subject_id}: {result}')
+            result = None
+        feeds[subject_id] = result
+    return feeds
+
+
+def _iter_feed_elements(
+    sfdc_object,
+    _endpoint: str,
+    _page_size: int,
+    _since: Optional[Union[datetime, str]],
+    _max_elements: Optional[int],
+    _sort: Optional[str],
+) -> Iterator[dict]:
+    """This function yields the feed elements of a feed while following the ``nextPageUrl`` of each page.
+
+    .. versionadded:: 1.6.0
+
+    Each page is only retrieved once the feed elements of the previous page have been consumed. When a ``since``
+    date is defined, the feed is sorted by the date being compared (i.e. the ``createdDate`` value unless sorted
+    with ``LastModifiedDateDesc``) so that the iteration can stop at the first older feed element.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param _endpoint: The feed elements endpoint of the feed
+    :type _endpoint: str
+    :param _page_size: The number of feed elements to retrieve per page
+    :type _page_size: int
+    :param _since: Stops the iteration at the first feed element that is older than this date
+    :type _since: datetime, str, None
+    :param _max_elements: Stops the iteration once this number of feed elements has been yielded
+    :type _max_elements: int, None
+    :param _sort: The ``sortParam`` value
+    :type _sort: str, None
+    :returns: Generator that yields each feed element
+    :raises: :py:exc:`RuntimeError`
+    """
+    _since = _parse_feed_date(_since) if _since else None
+    if _since and not _sort:
+        _sort = const.PAYLOAD_VALUES.CREATED_DATE_DESC
+    _date_key = (
+        const.RESPONSE_KEYS.MODIFIED_DATE
+        if _sort == const.PAYLOAD_VALUES.LAST_MODIFIED_DATE_DESC
+        else const.RESPONSE_KEYS.CREATED_DATE
+    )
+    _params = {const.QUERY_PARAMS.PAGE_SIZE: max(1, min(_page_size, const.QUERY_PARAMS.MAX_PAGE_SIZE))}
+    if _sort:
+        _params[const.QUERY_PARAMS.SORT_PARAM] = _sort
+
+    # Yield the feed elements of each page until the feed or one of the bounds has been reached
+    _yielded = 0
+    while _endpoint and (_max_elements is None or _yielded < _max_elements):
+        _response = sfdc_object.get(_endpoint, params=_params) or {}
+        for _element in _response.get(const.RESPONSE_KEYS.ELEMENTS) or []:
+            if _since and _element.get(_date_key) and _parse_feed_date(_element[_date_key]) < _since:
+                return
+            yield _element
+            _yielded += 1
+            if _max_elements is not None and _yielded >= _max_elements:
+                return
+
+        # The next page URL already includes the query parameters of the request
+        _endpoint = _response.get(const.RESPONSE_KEYS.NEXT_PAGE_URL)
+        _params = None
+
+
+def _parse_feed_date(_value: Union[datetime, str]) -> datetime:
+    """This function converts a feed element date (or a provided bound) into a timezone-aware datetime.
+
+    .. versionadded:: 1.6.0
+
+    :param _value: The datetime object or ISO 8601 string (e.g. ``2026-10-18T14:30:00.000Z``)
+    :type _value: datetime, str
+    :returns: The timezone-aware datetime (in UTC when no timezone was defined)
+    :raises: :py:exc:`ValueError`
+    """
+    if not isinstance(_value, datetime):
+        _value = datetime.fromisoformat(str(_value).replace('Z', '+00:00'))
+    return _value if _value.tzinfo else _value.replace(tzinfo=timezone.utc)
+
+
+def _get_comment_thread(sfdc_object, _endpoint: str) -> list:
+    """This function retrieves every comment of a feed element while following the ``nextPageUrl`` of each page.
+
+    .. versionadded:: 1.6.0
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param _endpoint: The comments endpoint of the feed element
+    :type _endpoint: str
+    :returns: List of the comments
+    :raises: :py:exc:`RuntimeError`
+    """
+    _comments = []
+    _params = {const.QUERY_PARAMS.PAGE_SIZE: const.QUERY_PARAMS.MAX_PAGE_SIZE}
+    while _endpoint:
+        _response = sfdc_object.get(_endpoint, params=_params) or {}
+        _comments.extend(_response.get(const.RESPONSE_KEYS.ITEMS) or [])
+
+        # The next page URL already includes the query parameters of the request
+        _endpoint = _response.get(const.RESPONSE_KEYS.NEXT_PAGE_URL)
+        _params = None
+    return _comments
+
+
+class FeedPoller:
+    """This class polls a Chatter feed for new feed elements using the change-detection URLs of the feed.
+    (`Reference <https://developer.salesforce.com/docs/atlas.en-us.chatterapi.meta/chatterapi/connect_responses_feed_element_page.htm>`__)
+
+    .. versionadded:: 1.6.0
+
+    The first poll retrieves the first page of the feed to establish a baseline. Each subsequent poll first requests
+    the ``isModifiedUrl`` of the feed (when provided), which only reports whether the feed has changed, and only
+    retrieves the ``updatesUrl`` of the feed (or its first page when no ``updatesToken`` is provided) once a change
+    has been detected. Feed elements that were already returned are never returned again.
+
+    The poller can be consumed synchronously with the :py:meth:`poll` method or as an asynchronous iterator that
+    yields each new feed element (oldest first) until the :py:meth:`stop` method is called.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param group_id: The ID of the group whose feed should be polled (optional)
+    :type group_id: str, None
+    :param user_id: The ID of the user whose news feed should be polled when no group is defined (optional)
+    :type user_id: str, None
+    :param site_id: The ID of an Experience Cloud site against which to query (optional)
+    :type site_id: str, None
+    :param poll_interval: The number of seconds to wait between polls when iterating (``5`` by default)
+    :type poll_interval: int, float
+    :param page_size: The number of feed elements to retrieve when the feed has changed (``25`` by default)
+    :type page_size: int
+    :param include_existing: Determines if the feed elements of the first poll should be returned (``False`` by
+                             default)
+    :type include_existing: bool
+    """
+
+    def __init__(
+        self,
+        sfdc_object,
+        group_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        site_id: Optional[str] = None,
+        poll_interval: Union[int, float] = const.CHATTER_SETTINGS.DEFAULT_POLL_INTERVAL_SECONDS,
+        page_size: int = const.CHATTER_SETTINGS.DEFAULT_POLL_PAGE_SIZE,
+        include_existing: bool = False,
+    ) -> None:
+        """This method instantiates the feed poller (the news feed of the calling user is polled by default)."""
+        self.sfdc_object = sfdc_object
+        self.poll_interval = poll_interval
+        self.include_existing = include_existing
+        endpoint_root = _get_endpoint_root_segment(sfdc_object.version, site_id)
+        if group_id:
+            self.feed_url = endpoint_root + const.REST_PATHS.CHATTER_GROUP_NEWS_FEED.format(group_id=group_id)
+        elif user_id:
+            self.feed_url = endpoint_root + const.REST_PATHS.CHATTER_USER_NEWS_FEED.format(user_id=user_id)
+        else:
+            self.feed_url = endpoint_root + const.REST_PATHS.CHATTER_MY_NEWS_FEED
+        self.page_size = max(1, min(page_size, const.QUERY_PARAMS.MAX_PAGE_SIZE))
+        self.is_modified_url = None
+        self.updates_url = None
+        self.updates_token = None
+        self._seen_ids = OrderedDict()
+        self._polled = False
+        self._stopped = False
+        self._stats = {'polls': 0, 'unmodified': 0, 'retrieved': 0, 'elements': 0}
+
+    def poll(self) -> list:
+        """This method checks the feed for changes and returns any feed elements that are new since the last poll.
+
+        :returns: List of the new feed elements (oldest first)
+        :raises: :py:exc:`RuntimeError`
+        """
+        self._stats['polls'] += 1
+
+        # Only ask whether the feed has changed when a change-detection URL is available
+        if self._polled and self.is_modified_url:
+            _response = self._get(self.is_modified_url)
+            self.is_modified_url = _response.get(const.RESPONSE_KEYS.NEXT_POLL_URL) or self.is_modified_url
+            if not _response.get(const.RESPONSE_KEYS.IS_MODIFIED):
+                self._stats['unmodified'] += 1
+                return []
+
+        # Retrieve the feed elements that are new (or updated) since the last poll
+        if self._polled and self.updates_url:
+            _response = self._get(self.updates_url)
+        else:
+            _response = self._get(self.feed_url, {const.QUERY_PARAMS.PAGE_SIZE: self.page_size})
+        self._stats['retrieved'] += 1
+        self.is_modified_url = _response.get(const.RESPONSE_KEYS.IS_MODIFIED_URL) or self.is_modified_url
+        self.updates_url = _response.get(const.RESPONSE_KEYS.UPDATES_URL) or self.updates_url
+        self.updates_token = _response.get(const.RESPONSE_KEYS.UPDATES_TOKEN) or self.updates_token
+
+        # Identify the feed elements that have not been returned previously
+        _new_elements = []
+        for _element in reversed(_response.get(const.RESPONSE_KEYS.ELEMENTS) or []):
+            _element_id = _element.get(const.RESPONSE_KEYS.ID)
+            if _element_id in self._seen_ids:
+                continue
+            self._seen_ids[_element_id] = None
+            _new_elements.append(_element)
+        while len(self._seen_ids) > const.CHATTER_SETTINGS.MAX_TRACKED_FEED_ELEMENTS:
+            self._seen_ids.popitem(last=False)
+        _is_baseline = not self._polled
+        self._polled = True
+        if _is_baseline and not self.include_existing:
+            return []
+        self._stats['elements'] += len(_new_elements)
+        return _new_elements
+
+    def stop(self) -> None:
+        """This method stops the asynchronous iteration after the current poll.
+
+        :returns: None
+        """
+        self._stopped = True
+
+    @property
+    def stats(self) -> dict:
+        """This property returns the number of polls, unmodified polls, feed retrievals and new feed elements.
+
+        :returns: Dictionary with the feed poller statistics
+        """
+        return dict(self._stats)
+
+    def __aiter__(self) -> AsyncIterator[dict]:
+        """This method returns an asynchronous iterator that yields each new feed element as it is detected."""
+        return self._iter_new_elements()
+
+    async def _iter_new_elements(self) -> AsyncIterator[dict]:
+        """This method polls the feed in a worker thread at each interval and yields the new feed elements."""
+        self._stopped = False
+        while not self._stopped:
+            for _element in await asyncio.to_thread(self.poll):
+                yield _element
+            if not self._stopped:
+                await asyncio.sleep(self.poll_interval)
+
+    def _get(self, _endpoint: str, _params: Optional[dict] = None) -> dict:
+        """This method performs a GET request that bypasses the response cache so that each poll is current."""
+        _response = self.sfdc_object.get(_endpoint, params=_params, return_json=False)
+        return _response.json() or {}
+
+
+class MessageTemplate:
+    """This class parses a message template once so that it can be rendered as message segments many times.
+
+    .. versionadded:: 1.6.0
+
+    The template supports the following placeholders and tags, which are converted into message segments:
+
+    * ``{name}`` - Text defined by the ``name`` value
+    * ``{@name}`` or ``{mention:name}`` - A mention of the user or group ID defined by the ``name`` value
+    * ``{#name}`` or ``{hashtag:name}`` - A hashtag (i.e. topic) defined by the ``name`` value
+    * ``{link:name}`` - A link to the URL defined by the ``name`` value
+    * ``<b>``, ``<i>``, ``<u>``, ``<s>``, ``<p>``, ``<code>``, ``<ul>``, ``<ol>`` and ``<li>`` - Markup tags
+      (e.g. ``<b>Bold text</b>``)
+    * ``{{`` and ``}}`` - Literal braces
+
+    The rendered message segments can be used with the ``message_segments`` parameter of the
+    :py:func:`post_feed_item` and :py:func:`post_comment` functions or with the ``message_template`` parameter of
+    the :py:func:`post_feed_items` and :py:func:`post_comments` functions.
+
+    :param template: The message template (e.g. ``Hello {@user}, see {link:url}``)
+    :type template: str
+    :raises: :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+    """
+
+    def __init__(self, template: str) -> None:
+        """This method instantiates the message template object and parses the template into a segment plan."""
+        if not isinstance(template, str) or not template:
+            error_msg = 'The message template must be a non-empty string'
+            logger.error(error_msg)
+            raise errors.exceptions.InvalidParameterError(error_msg)
+        self.template = template
+        self._plan = self._parse(template)
+        self.placeholders = tuple(dict.fromkeys(_value for _kind, _value in self._plan if _kind != 'segment'))
+
+    @staticmethod
+    def _parse(_template: str) -> tuple:
+        """This method parses a message template into a plan of static segments and placeholders.
+
+        :param _template: The message template
+        :type _template: str
+        :returns: Tuple of ``(kind, value)`` tuples where the value is a message segment or a placeholder name
+        :raises: :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+        """
+        _plan, _text, _position = [], '', 0
+        _literals = []
+        for _match in _TEMPLATE_TOKEN_REGEX.finditer(_template):
+            _literals.append(_template[_position : _match.start()])
+            _text += _literals[-1]
+            _position = _match.end()
+            if _match.group('escaped'):
+                _text += _match.group('escaped')[0]
+                continue
+
+            # Store the pending literal text before the placeholder or markup tag
+            if _text:
+                _plan.append(('segment', _construct_simple_message_segment(_text)[0]))
+                _text = ''
+            if _match.group('name'):
+                _kind = {'@': 'mention', '#': 'hashtag'}.get(_match.group('shorthand')) or _match.group('kind') or 'text'
+                _plan.append((_kind.lower(), _match.group('name')))
+            else:
+                _segment_type = const.PAYLOAD_VALUES.MARKUP_END if _match.group('closing') else const.PAYLOAD_VALUES.MARKUP_BEGIN
+                _markup_type = const.CHATTER_SETTINGS.MARKUP_TYPES[_match.group('tag').lower()]
+                _plan.append(('segment', {const.QUERY_PARAMS.TYPE: _segment_type, const.QUERY_PARAMS.MARKUP_TYPE: _markup_type}))
+        _literals.append(_template[_position:])
+        _text += _literals[-1]
+        if _text:
+            _plan.append(('segment', _construct_simple_message_segment(_text)[0]))
+
+        # Ensure that every brace outside of the placeholders has been escaped
+        if any('{' in _literal or '}' in _literal for _literal in _literals):
+            error_msg = f'The message template includes an invalid placeholder or an unescaped brace: {_template}'
+            logger.error(error_msg)
+            raise errors.exceptions.InvalidParameterError(error_msg)
+        return tuple(_plan)
+
+    def render(self, values: Optional[Mapping] = None, **kwargs) -> list:
+        """This method renders the message segments of the template using the values of its placeholders.
+
+        :param values: The values of the placeholders (optional if the values are passed as keyword arguments)
+        :type values: dict, None
+        :param kwargs: The values of the placeholders as keyword arguments
+        :returns: The list of message segments
+        :raises: :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
+        """
+        values = {**(values or {}), **kwargs}
+        missing = [_name for _name in self.placeholders if values.get(_name) is None]
+        if missing:
+            error_msg = f'The message template is missing values for the following placeholder(s): {", ".join(missing)}'
+            logger.error(error_msg)
+            raise errors.exceptions.MissingRequiredDataError(error_msg)
+
+        # Render each step of the plan and combine adjacent text segments into a single segment
+        segments = []
+        for kind, value in self._plan:
+            if kind == 'segment':
+                segment = dict(value)
+            elif kind == 'text':
+                segment = {const.QUERY_PARAMS.TYPE: const.PAYLOAD_VALUES.TEXT, const.QUERY_PARAMS.TEXT: str(values[value])}
+            elif kind == 'mention':
+                segment = {const.QUERY_PARAMS.TYPE: const.PAYLOAD_VALUES.MENTION, const.QUERY_PARAMS.ID: values[value]}
+            elif kind == 'hashtag':
+                segment = {const.QUERY_PARAMS.TYPE: const.PAYLOAD_VALUES.HASHTAG, const.QUERY_PARAMS.TAG: values[value]}
+            else:
+                segment = {const.QUERY_PARAMS.TYPE: const.PAYLOAD_VALUES.LINK, const.QUERY_PARAMS.URL: values[value]}
+            if (
+                segments
+                and segment[const.QUERY_PARAMS.TYPE] == const.PAYLOAD_VALUES.TEXT
+                and segments[-1][const.QUERY_PARAMS.TYPE] == const.PAYLOAD_VALUES.TEXT
+            ):
+                segments[-1][const.QUERY_PARAMS.TEXT] += segment[const.QUERY_PARAMS.TEXT]
+            else:
+                segments.append(segment)
+        return segments
+
+
 def post_feed_item(
     sfdc_object,
     subject_id: str,
@@ -128,17 +758,7 @@ def post_feed_item(
     :raises: :py:exc:`RuntimeError`,
              :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
     """
-    if not any((message_text, message_segments)):
-        raise errors.exceptions.MissingRequiredDataError('Message text or message segments are required to post a feed item.')
-    if not message_segments:
-        message_segments = _construct_simple_message_segment(message_text)
-    payload = {
-        const.QUERY_PARAMS.BODY: {const.QUERY_PARAMS.MESSAGE_SEGMENTS: message_segments},
-        const.QUERY_PARAMS.FEED_ELEMENT_TYPE: const.PAYLOAD_VALUES.FEED_ITEM,
-        const.QUERY_PARAMS.SUBJECT_ID: subject_id,
-    }
-    if created_by_id:
-        payload[const.QUERY_PARAMS.CREATED_BY_ID] = created_by_id
+    payload = _construct_feed_item_payload(subject_id, message_text, message_segments, created_by_id)
     endpoint_root = _get_endpoint_root_segment(sfdc_object.version, site_id)
     endpoint = (
         f'{endpoint_root}{const.REST_PATHS.CHATTER_FEED_ELEMENTS}?'
@@ -194,6 +814,222 @@ def post_comment(
     return sfdc_object.post(endpoint=endpoint, payload=payload)
 
 
+def post_feed_items(
+    sfdc_object,
+    items: Union[list, tuple],
+    site_id: Optional[str] = None,
+    max_workers: int = 1,
+    message_template: Optional[MessageTemplate] = None,
+) -> list:
+    """This function publishes many Chatter feed items using batched requests of up to 500 feed items.
+    (`Reference <https://developer.salesforce.com/docs/atlas.en-us.chatterapi.meta/chatterapi/connect_resources_feed_element_batch_post.htm>`__)
+
+    .. versionadded:: 1.6.0
+
+    Each item is a dictionary with the ``subject_id`` value and either the ``message_text`` or ``message_segments``
+    value, along with an optional ``created_by_id`` value (i.e. the parameters of the :py:func:`post_feed_item`
+    function). Items without a message can instead be rendered from a :py:class:`MessageTemplate` using their
+    ``template_values``. A failed feed item does not prevent the other feed items in the batch from being published.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param items: The dictionaries that define the feed items to publish
+    :type items: list, tuple
+    :param site_id: The ID of an Experience Cloud site against which to query (optional)
+    :type site_id: str, None
+    :param max_workers: The maximum number of batches to submit concurrently (``1`` by default)
+    :type max_workers: int
+    :param message_template: The template used to render the message of the items without a message (optional)
+    :type message_template: class[salespyforce.chatter.MessageTemplate], None
+    :returns: List of dictionaries in the order of the items with the ``subject_id``, ``id`` and ``error`` values
+    :raises: :py:exc:`RuntimeError`,
+             :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
+    """
+    # Construct the payload of each feed item (which validates the items before anything is published)
+    payloads = []
+    for item in _apply_message_template(items, message_template):
+        if not isinstance(item, dict) or not item.get('subject_id'):
+            error_msg = f'The feed item {item} must be a dictionary that includes a subject_id value'
+            logger.error(error_msg)
+            raise errors.exceptions.MissingRequiredDataError(error_msg)
+        payloads.append(
+            _construct_feed_item_payload(
+                item['subject_id'], item.get('message_text'), item.get('message_segments'), item.get('created_by_id')
+            )
+        )
+    endpoint = _get_endpoint_root_segment(sfdc_object.version, site_id) + const.REST_PATHS.CHATTER_FEED_ELEMENTS_BATCH
+
+    # Define the function that publishes a single batch of feed items
+    def _post_batch(_payloads: list) -> list:
+        _batch_payload = {const.QUERY_PARAMS.INPUTS: [{const.QUERY_PARAMS.RICH_INPUT: _payload} for _payload in _payloads]}
+        try:
+            _response = sfdc_object.post(endpoint=endpoint, payload=_batch_payload)
+        except (RuntimeError, errors.exceptions.SalesPyForceError) as _exc:
+            logger.error(f'Failed to publish a batch of {len(_payloads)} feed items: {_exc}')
+            return [{'id': None, 'error': str(_exc)} for _ in _payloads]
+        _batch_results = (_response or {}).get(const.RESPONSE_KEYS.RESULTS) or []
+        _results = []
+        for _index in range(len(_payloads)):
+            _batch_result = _batch_results[_index] if _index < len(_batch_results) else {}
+            _results.append(_get_batch_result(_batch_result))
+        return _results
+
+    # Publish the batches and return the outcome of each feed item
+    batches = core_utils.chunk_iterable(payloads, const.CHATTER_SETTINGS.MAX_BATCH_FEED_ELEMENTS)
+    results = []
+    for batch_results in concurrency_utils.run_concurrently(_post_batch, batches, max_workers=max_workers):
+        results.extend(batch_results)
+    return [{'subject_id': _payload[const.QUERY_PARAMS.SUBJECT_ID], **_result} for _payload, _result in zip(payloads, results)]
+
+
+def post_comments(
+    sfdc_object,
+    comments: Union[list, tuple],
+    site_id: Optional[str] = None,
+    max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+    requests_per_second: Optional[Union[int, float]] = None,
+    message_template: Optional[MessageTemplate] = None,
+) -> list:
+    """This function publishes many comments on Chatter feed elements using concurrent, rate-limited requests.
+    (`Reference <https://developer.salesforce.com/docs/atlas.en-us.chatterapi.meta/chatterapi/quickreference_post_comment_to_feed_element.htm>`__)
+
+    .. versionadded:: 1.6.0
+
+    As the Connect REST API does not provide a batch resource for comments, each comment is published with the
+    :py:func:`post_comment` function. Each comment is a dictionary with the ``feed_element_id`` value and either the
+    ``message_text`` or ``message_segments`` value, along with an optional ``created_by_id`` value. Comments without
+    a message can instead be rendered from a :py:class:`MessageTemplate` using their ``template_values``.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param comments: The dictionaries that define the comments to publish
+    :type comments: list, tuple
+    :param site_id: The ID of an Experience Cloud site against which to query (optional)
+    :type site_id: str, None
+    :param max_workers: The maximum number of comments to publish concurrently (``8`` by default)
+    :type max_workers: int
+    :param requests_per_second: The maximum number of API calls to perform per second (unlimited by default)
+    :type requests_per_second: int, float, None
+    :param message_template: The template used to render the message of the comments without a message (optional)
+    :type message_template: class[salespyforce.chatter.MessageTemplate], None
+    :returns: List of dictionaries in the order of the comments with the ``feed_element_id``, ``id`` and ``error``
+              values
+    :raises: :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
+    """
+    # Ensure every comment is defined appropriately before anything is published
+    comments = _apply_message_template(comments, message_template)
+    for comment in comments:
+        if (
+            not isinstance(comment, dict)
+            or not comment.get('feed_element_id')
+            or not any((comment.get('message_text'), comment.get('message_segments')))
+        ):
+            error_msg = (
+                f'The comment {comment} must be a dictionary that includes a feed_element_id value and either '
+                'message text or message segments'
+            )
+            logger.error(error_msg)
+            raise errors.exceptions.MissingRequiredDataError(error_msg)
+
+    # Define the function that publishes a single comment
+    def _post_comment(_comment: dict) -> dict:
+        try:
+            _response = post_comment(
+                sfdc_object,
+                _comment['feed_element_id'],
+                message_text=_comment.get('message_text'),
+                message_segments=_comment.get('message_segments'),
+                site_id=site_id,
+                created_by_id=_comment.get('created_by_id'),
+            )
+            return {'id': (_response or {}).get(const.RESPONSE_KEYS.ID), 'error': None}
+        except (RuntimeError, errors.exceptions.SalesPyForceError) as _exc:
+            logger.error(f'Failed to publish a comment on the feed element {_comment["feed_element_id"]}: {_exc}')
+            return {'id': None, 'error': str(_exc)}
+
+    # Publish the comments concurrently and return the outcome of each comment
+    rate_limiter = concurrency_utils.RateLimiter(requests_per_second) if requests_per_second else None
+    results = concurrency_utils.run_concurrently(_post_comment, comments, max_workers=max_workers, rate_limiter=rate_limiter)
+    return [{'feed_element_id': _comment['feed_element_id'], **_result} for _comment, _result in zip(comments, results)]
+
+
+def _apply_message_template(_items: Optional[Union[list, tuple]], _message_template: Optional[MessageTemplate]) -> list:
+    """This function renders the message segments of the feed items or comments that do not define a message.
+
+    .. versionadded:: 1.6.0
+
+    :param _items: The dictionaries that define the feed items or comments
+    :type _items: list, tuple, None
+    :param _message_template: The template used to render the messages (optional)
+    :type _message_template: class[salespyforce.chatter.MessageTemplate], None
+    :returns: List of the feed items or comments (with rendered ``message_segments`` values where applicable)
+    :raises: :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
+    """
+    _items = list(_items or [])
+    if not _message_template:
+        return _items
+    return [
+        {**_item, 'message_segments': _message_template.render(_item.get('template_values'))}
+        if isinstance(_item, dict) and not any((_item.get('message_text'), _item.get('message_segments')))
+        else _item
+        for _item in _items
+    ]
+
+
+def _construct_feed_item_payload(
+    _subject_id: str,
+    _message_text: Optional[str] = None,
+    _message_segments: Optional[list] = None,
+    _created_by_id: Optional[str] = None,
+) -> dict:
+    """This function constructs the payload used to publish a feed item.
+
+    .. versionadded:: 1.6.0
+
+    :param _subject_id: The Subject ID against which to publish the feed item
+    :type _subject_id: str
+    :param _message_text: Plaintext to be used as the message body
+    :type _message_text: str, None
+    :param _message_segments: Collection of message segments to use instead of a plaintext message
+    :type _message_segments: list, None
+    :param _created_by_id: The ID of the user to impersonate (**Experimental**)
+    :type _created_by_id: str, None
+    :returns: The feed item payload
+    :raises: :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
+    """
+    if not any((_message_text, _message_segments)):
+        raise errors.exceptions.MissingRequiredDataError('Message text or message segments are required to post a feed item.')
+    if not _message_segments:
+        _message_segments = _construct_simple_message_segment(_message_text)
+    _payload = {
+        const.QUERY_PARAMS.BODY: {const.QUERY_PARAMS.MESSAGE_SEGMENTS: _message_segments},
+        const.QUERY_PARAMS.FEED_ELEMENT_TYPE: const.PAYLOAD_VALUES.FEED_ITEM,
+        const.QUERY_PARAMS.SUBJECT_ID: _subject_id,
+    }
+    if _created_by_id:
+        _payload[const.QUERY_PARAMS.CREATED_BY_ID] = _created_by_id
+    return _payload
+
+
+def _get_batch_result(_batch_result: dict) -> dict:
+    """This function returns the ID or the error message(s) of a single result from a batch request.
+
+    .. versionadded:: 1.6.0
+
+    :param _batch_result: The batch result with the ``statusCode`` and ``result`` values
+    :type _batch_result: dict
+    :returns: Dictionary with the ``id`` and ``error`` values
+    """
+    _result = _batch_result.get(const.RESPONSE_KEYS.RESULT)
+    if _batch_result.get(const.RESPONSE_KEYS.STATUS_CODE, 0) < 300 and isinstance(_result, dict):
+        return {'id': _result.get(const.RESPONSE_KEYS.ID), 'error': None}
+    _errors = _result if isinstance(_result, list) else [_result or {}]
+    _error_msg = '; '.join(
+        str(_error.get(const.RESPONSE_KEYS.MESSAGE, _error)) for _error in _errors if isinstance(_error, dict) and _error
+    )
+    return {'id': None, 'error': _error_msg or 'No result was returned for the feed item'}
+
+
 def _construct_simple_message_segment(_message_text: str) -> list:
     """This function constructs a simple message segments collection to be used in an API payload.
 
@@ -4,7 +4,7 @@
 :Synopsis:          Constants that are utilized throughout the package
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff (via GPT-5.5-codex)
-:Modified Date:     15 Jul 2026
+:Modified Date:     18 Oct 2026
 """
 
 from __future__ import annotations
@@ -22,7 +22,9 @@ FALLBACK_SFDC_API_VERSION: Final[str] = '65.0'  # Used if querying the org for t
 # --------------------------------------
 # Common Validation Criteria / Mapping
 # --------------------------------------
+SALESFORCE_ID_PATTERN: Final[str] = r'[a-zA-Z0-9]{15}(?:[a-zA-Z0-9]{3})?'
 SALESFORCE_ID_SUFFIX_ALPHABET: Final[str] = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ012345'
+SALESFORCE_ID_VECTORIZE_MIN_BATCH_SIZE: Final[int] = 1000  # Minimum batch size to convert IDs with NumPy
 VALID_SALESFORCE_URL_PATTERN: Final[str] = r'^https://[a-zA-Z0-9._-]+\.salesforce\.com(/|$)'
 YAML_BOOLEAN_MAPPING: Final[Mapping[Union[str, bool], bool]] = MappingProxyType(
     {
@@ -192,11 +194,163 @@ class HelperSettings:
     SSL_VERIFY: str = 'ssl_verify'
 
 
+# -----------------------------
+# Response Caching
+# -----------------------------
+@dataclass(frozen=True)
+class CacheSettings:
+    """Default values leveraged by the caches in the :py:mod:`salespyforce.cache` module.
+
+    .. versionadded:: 1.6.0
+    """
+
+    # Response cache defaults
+    DEFAULT_TTL_SECONDS: ClassVar[int] = 300
+    DEFAULT_MAX_BYTES: ClassVar[int] = 64 * 1024 * 1024
+
+    # Record access cache defaults
+    RECORD_ACCESS_TTL_SECONDS: ClassVar[int] = 60
+    RECORD_ACCESS_MAX_ENTRIES: ClassVar[int] = 10000
+
+
+# -----------------------------
+# Chatter
+# -----------------------------
+@dataclass(frozen=True)
+class ChatterSettings:
+    """Default values leveraged by the :py:mod:`salespyforce.chatter` module.
+
+    .. versionadded:: 1.6.0
+    """
+
+    # Feed poller defaults
+    DEFAULT_POLL_INTERVAL_SECONDS: ClassVar[float] = 5.0
+    DEFAULT_POLL_PAGE_SIZE: ClassVar[int] = 25
+    MAX_TRACKED_FEED_ELEMENTS: ClassVar[int] = 1000
+
+    # Batch request limits
+    MAX_BATCH_FEED_ELEMENTS: ClassVar[int] = 500
+
+    # Bulk read defaults
+    DEFAULT_RECORD_FEED_ELEMENTS: ClassVar[int] = 20
+
+    # Message template markup tags and their corresponding markup types
+    MARKUP_TYPES: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
+            'b': 'Bold',
+            'code': 'Code',
+            'i': 'Italic',
+            'li': 'ListItem',
+            'ol': 'OrderedList',
+            'p': 'Paragraph',
+            's': 'Strikethrough',
+            'u': 'Underline',
+            'ul': 'UnorderedList',
+        }
+    )
+
+
+# -----------------------------
+# Concurrency
+# -----------------------------
+@dataclass(frozen=True)
+class ConcurrencySettings:
+    """Default values leveraged when performing API calls concurrently.
+
+    .. versionadded:: 1.6.0
+    """
+
+    DEFAULT_MAX_WORKERS: ClassVar[int] = 8
+    DEFAULT_PUBLISH_CHUNK_SIZE: ClassVar[int] = 50
+    MAX_STANDARD_ACTION_INPUTS: ClassVar[int] = 200
+    MAX_SOBJECT_COLLECTION_RECORDS: ClassVar[int] = 200
+    MAX_COMPOSITE_BATCH_REQUESTS: ClassVar[int] = 25
+
+
+# -----------------------------
+# Knowledge Export
+# -----------------------------
+@dataclass(frozen=True)
+class ExportSettings:
+    """Default values and file names leveraged by the :py:mod:`salespyforce.knowledge_export` module.
+
+    .. versionadded:: 1.6.0
+    """
+
+    # File and directory names
+    CHECKPOINT_FILE_NAME: ClassVar[str] = '.export_checkpoint.json'
+    MANIFEST_FILE_NAME: ClassVar[str] = 'manifest.json'
+    VERSIONS_DIR: ClassVar[str] = 'versions'
+    CATEGORIES_DIR: ClassVar[str] = 'categories'
+    IMAGES_DIR: ClassVar[str] = 'images'
+
+    # Export defaults
+    DEFAULT_PAGE_SIZE: ClassVar[int] = 2000
+    DEFAULT_MIN_REMAINING_API_REQUESTS: ClassVar[int] = 1000
+    LIMIT_CHECK_INTERVAL_PAGES: ClassVar[int] = 10
+    ARCHIVE_FORMATS: ClassVar[frozenset[str]] = frozenset({'zip', 'tar', 'gztar', 'bztar', 'xztar'})
+
+    # Org limit names and fields
+    DAILY_API_REQUESTS: ClassVar[str] = 'DailyApiRequests'
+    REMAINING: ClassVar[str] = 'Remaining'
+
+
+# -----------------------------
+# Knowledge Import
+# -----------------------------
+@dataclass(frozen=True)
+class ImportSettings:
+    """Default values and file names leveraged by the :py:mod:`salespyforce.knowledge_import` module.
+
+    .. versionadded:: 1.6.0
+    """
+
+    # File names
+    JOURNAL_FILE_NAME: ClassVar[str] = '.import_journal.json'
+
+    # Methods of matching the imported articles to existing articles
+    MATCH_BY_TITLE: ClassVar[str] = 'title'
+    MATCH_BY_NUMBER: ClassVar[str] = 'number'
+    VALID_MATCH_BY: ClassVar[frozenset[str]] = frozenset({MATCH_BY_TITLE, MATCH_BY_NUMBER})
+
+    # Fields that are never copied from the source records
+    EXCLUDED_FIELDS: ClassVar[frozenset[str]] = frozenset(
+        {
+            'Id',
+            'ArticleNumber',
+            'KnowledgeArticleId',
+            'MasterVersionId',
+            'PublishStatus',
+            'VersionNumber',
+            'attributes',
+        }
+    )
+
+
+# -----------------------------
+# Search
+# -----------------------------
+@dataclass(frozen=True)
+class SearchSettings:
+    """Default values and limits leveraged by the :py:mod:`salespyforce.search` module.
+
+    .. versionadded:: 1.6.0
+    """
+
+    # Pagination defaults and limits
+    DEFAULT_PAGE_SIZE: ClassVar[int] = 200
+    MAX_OFFSET: ClassVar[int] = 2000
+
+    # Valid search groups (i.e. the fields in which to search)
+    VALID_SEARCH_GROUPS: ClassVar[frozenset[str]] = frozenset({'ALL', 'EMAIL', 'NAME', 'PHONE', 'SIDEBAR'})
+
+
 # -----------------------------
 # HTTP / Networking Defaults
 # -----------------------------
 DEFAULT_API_TIMEOUT_SECONDS: Final[int] = 30
 DEFAULT_API_MAX_RETRIES: Final[int] = 3
+DEFAULT_DOWNLOAD_CHUNK_SIZE_BYTES: Final[int] = 64 * 1024
 HEADER_TYPE_DEFAULT: Final[str] = 'default'
 HEADER_TYPE_ARTICLES: Final[str] = 'articles'
 VALID_HEADER_TYPES: Final[frozenset[str]] = frozenset(
@@ -367,7 +521,12 @@ class RestPaths:
     SERVICES_DATA: ClassVar[str] = '/services/data'
     SERVICES_DATA_API: ClassVar[str] = SERVICES_DATA + '/{api_version}'  # Vars: api_version
     SERVICES_DATA_API_SITE = SERVICES_DATA_API + '{site_segment}'  # Vars: api_version, site_segment
+    COMPOSITE: ClassVar[str] = SERVICES_DATA_API + '/composite'  # Vars: api_version
+    COMPOSITE_BATCH: ClassVar[str] = COMPOSITE + '/batch'  # Vars: api_version
+    COMPOSITE_SOBJECTS: ClassVar[str] = COMPOSITE + '/sobjects'  # Vars: api_version
+    COMPOSITE_SOBJECTS_BY_SOBJECT: ClassVar[str] = COMPOSITE_SOBJECTS + '/{sobject}'  # Vars: api_version, sobject
     LIMITS: ClassVar[str] = SERVICES_DATA_API + '/limits'  # Vars: api_version
+    PARAMETERIZED_SEARCH: ClassVar[str] = SERVICES_DATA_API + '/parameterizedSearch'  # Vars: api_version
     QUERY: ClassVar[str] = SERVICES_DATA_API + '/query'  # Vars: api_version
     SEARCH: ClassVar[str] = SERVICES_DATA_API + '/search'  # Vars: api_version
     SOBJECTS: ClassVar[str] = SERVICES_DATA_API + '/sobjects'  # Vars: api_version
@@ -391,6 +550,9 @@ class RestPaths:
     CHATTER_USER_NEWS_FEED: ClassVar[str] = CHATTER_FEEDS + '/user-profile/{user_id}/feed-elements'  # Vars: user_id
     CHATTER_GROUP_NEWS_FEED: ClassVar[str] = CHATTER_FEEDS + '/record/{group_id}/feed-elements'  # VARS: group_id
     CHATTER_FEED_ELEMENTS: ClassVar[str] = '/chatter/feed-elements'
+    CHATTER_FEED_ELEMENTS_BATCH: ClassVar[str] = CHATTER_FEED_ELEMENTS + '/batch'
+    CHATTER_FEED_ELEMENTS_BATCH_IDS: ClassVar[str] = CHATTER_FEED_ELEMENTS_BATCH + '/{feed_element_ids}'  # Vars: feed_element_ids
+    CHATTER_RECORD_FEED: ClassVar[str] = CHATTER_FEEDS + '/record/{record_id}/feed-elements'  # Vars: record_id
     CHATTER_FEED_ELEMENT_COMMENTS: ClassVar[str] = CHATTER_FEED_ELEMENTS + '/{feed_element_id}/capabilities/comments/items'
 
     # Knowledge REST paths
@@ -429,19 +591,29 @@ class QueryParams:
 
     # Common parameter names
     Q: ClassVar[str] = 'q'
+    ALL_OR_NONE: ClassVar[str] = 'allOrNone'
+    BATCH_REQUESTS: ClassVar[str] = 'batchRequests'
     BODY: ClassVar[str] = 'body'
     CREATED_BY_ID: ClassVar[str] = 'createdById'
+    FIELDS: ClassVar[str] = 'fields'
+    HALT_ON_ERROR: ClassVar[str] = 'haltOnError'
+    IDS: ClassVar[str] = 'ids'
     INPUTS: ClassVar[str] = 'inputs'
     LIMIT: ClassVar[str] = 'limit'
+    METHOD: ClassVar[str] = 'method'
     NEXT_RECORDS_URL: ClassVar[str] = 'nextRecordsUrl'
     OFFSET: ClassVar[str] = 'offset'
     ORDER: ClassVar[str] = 'order'
+    ORDER_BY: ClassVar[str] = 'orderBy'
     PAGE_NUM: ClassVar[str] = 'pageNumber'
     PAGE_SIZE: ClassVar[str] = 'pageSize'
+    RECORDS: ClassVar[str] = 'records'
     REF_ID: ClassVar[str] = 'refid'
+    RICH_INPUT: ClassVar[str] = 'richInput'
     SORT: ClassVar[str] = 'sort'
     TEXT: ClassVar[str] = 'text'
     TYPE: ClassVar[str] = 'type'
+    URL: ClassVar[str] = 'url'
 
     # Common parameter default values
     DEFAULT_PAGE_NUM: ClassVar[int] = 1
@@ -453,8 +625,20 @@ class QueryParams:
 
     # Chatter parameter names / fields
     FEED_ELEMENT_TYPE: ClassVar[str] = 'feedElementType'
+    ID: ClassVar[str] = 'id'
+    MARKUP_TYPE: ClassVar[str] = 'markupType'
     MESSAGE_SEGMENTS: ClassVar[str] = 'messageSegments'
+    SORT_PARAM: ClassVar[str] = 'sortParam'
     SUBJECT_ID: ClassVar[str] = 'subjectId'
+    TAG: ClassVar[str] = 'tag'
+
+    # Search parameter names / fields
+    DEFAULT_LIMIT: ClassVar[str] = 'defaultLimit'
+    IN: ClassVar[str] = 'in'
+    NAME: ClassVar[str] = 'name'
+    OVERALL_LIMIT: ClassVar[str] = 'overallLimit'
+    SOBJECTS: ClassVar[str] = 'sobjects'
+    WHERE: ClassVar[str] = 'where'
 
     # Knowledge parameter names / fields
     ACTION: ClassVar[str] = 'action'
@@ -477,7 +661,14 @@ class PayloadValues:
     """
 
     # Chatter payload values
+    CREATED_DATE_DESC: ClassVar[str] = 'CreatedDateDesc'
     FEED_ITEM: ClassVar[str] = 'FeedItem'
+    HASHTAG: ClassVar[str] = 'Hashtag'
+    LAST_MODIFIED_DATE_DESC: ClassVar[str] = 'LastModifiedDateDesc'
+    LINK: ClassVar[str] = 'Link'
+    MARKUP_BEGIN: ClassVar[str] = 'MarkupBegin'
+    MARKUP_END: ClassVar[str] = 'MarkupEnd'
+    MENTION: ClassVar[str] = 'Mention'
     TEXT: ClassVar[str] = 'text'
 
     # Knowledge payload values
@@ -499,9 +690,42 @@ class ResponseKeys:
     .. versionadded:: 1.5.0
     """
 
+    ARTICLES: ClassVar[str] = 'articles'
     ATTRIBUTES: ClassVar[str] = 'attributes'
+    CAPABILITIES: ClassVar[str] = 'capabilities'
+    COMMENTS: ClassVar[str] = 'comments'
+    CREATEABLE: ClassVar[str] = 'createable'
+    CREATED_DATE: ClassVar[str] = 'createdDate'
+    DONE: ClassVar[str] = 'done'
+    DRAFT_ID: ClassVar[str] = 'draftId'
+    ELEMENTS: ClassVar[str] = 'elements'
+    ERRORS: ClassVar[str] = 'errors'
+    FIELDS: ClassVar[str] = 'fields'
+    ID: ClassVar[str] = 'id'
+    IS_MODIFIED: ClassVar[str] = 'isModified'
+    IS_MODIFIED_URL: ClassVar[str] = 'isModifiedUrl'
+    IS_SUCCESS: ClassVar[str] = 'isSuccess'
+    ITEMS: ClassVar[str] = 'items'
+    MESSAGE: ClassVar[str] = 'message'
+    MODIFIED_DATE: ClassVar[str] = 'modifiedDate'
+    NAME: ClassVar[str] = 'name'
+    NEXT_PAGE_URL: ClassVar[str] = 'nextPageUrl'
+    NEXT_POLL_URL: ClassVar[str] = 'nextPollUrl'
+    NEXT_RECORDS_URL: ClassVar[str] = 'nextRecordsUrl'
+    OUTPUT_VALUES: ClassVar[str] = 'outputValues'
+    PAGE: ClassVar[str] = 'page'
     RECORDS: ClassVar[str] = 'records'
+    RESULT: ClassVar[str] = 'result'
+    RESULTS: ClassVar[str] = 'results'
+    SEARCH_RECORDS: ClassVar[str] = 'searchRecords'
+    STATUS_CODE: ClassVar[str] = 'statusCode'
+    SUCCESS: ClassVar[str] = 'success'
+    TOTAL: ClassVar[str] = 'total'
     TOTAL_SIZE: ClassVar[str] = 'totalSize'
+    TYPE: ClassVar[str] = 'type'
+    UPDATEABLE: ClassVar[str] = 'updateable'
+    UPDATES_TOKEN: ClassVar[str] = 'updatesToken'
+    UPDATES_URL: ClassVar[str] = 'updatesUrl'
     URL: ClassVar[str] = 'url'
     VERSION: ClassVar[str] = 'version'
 
@@ -536,6 +760,7 @@ class SObjectFields:
     ID: ClassVar[str] = 'Id'
     PARENT_ID: ClassVar[str] = 'ParentId'
     RECORD_ID: ClassVar[str] = 'RecordId'
+    SYSTEM_MODSTAMP: ClassVar[str] = 'SystemModstamp'
     USER_ID: ClassVar[str] = 'UserId'
 
     # Knowledge__kav field names
@@ -595,6 +820,8 @@ class SObjectFieldValues:
 
     # Knowledge__kav
     ARCHIVED: ClassVar[str] = 'Archived'
+    DRAFT: ClassVar[str] = 'Draft'
+    ONLINE: ClassVar[str] = 'Online'
 
 
 # -----------------------------
@@ -607,6 +834,23 @@ class SoqlQueries:
     .. versionadded:: 1.5.0
     """
 
+    # Query limits
+    MAX_FIELDS_ALL_RECORDS: ClassVar[int] = 200
+    MAX_USER_RECORD_ACCESS_IDS: ClassVar[int] = 200
+    MAX_ARTICLE_NUMBER_VALUES: ClassVar[int] = 200
+    MAX_IN_CLAUSE_LENGTH: ClassVar[int] = 3500  # Keeps WHERE clauses within the 4,000 character limit
+    MAX_ENCODED_IN_CLAUSE_LENGTH: ClassVar[int] = 12000  # Keeps query URIs within the 16,384 byte limit
+
+    # Query builder
+    MAX_COMPILED_TEMPLATES: ClassVar[int] = 256
+
+    # Literal formats
+    ARTICLE_NUMBER_LENGTH: ClassVar[int] = 9
+    DATETIME_FORMAT: ClassVar[str] = '%Y-%m-%dT%H:%M:%SZ'
+
+    # Field selection functions
+    FIELDS_ALL: ClassVar[str] = 'FIELDS(ALL)'
+
     # Ordering / Sorting
     ORDER_ASC: ClassVar[str] = 'ASC'
     ORDER_DESC: ClassVar[str] = 'DESC'
@@ -651,6 +895,24 @@ URLS: Final[Urls] = Urls()
 _EXCEPTION_CLASSES: Final[ExceptionClasses] = ExceptionClasses()
 _LOG_MESSAGES: Final[LogMessages] = LogMessages()
 
+# Caching
+CACHE_SETTINGS: Final[CacheSettings] = CacheSettings()
+
+# Chatter
+CHATTER_SETTINGS: Final[ChatterSettings] = ChatterSettings()
+
+# Concurrency
+CONCURRENCY_SETTINGS: Final[ConcurrencySettings] = ConcurrencySettings()
+
+# Knowledge Export
+EXPORT_SETTINGS: Final[ExportSettings] = ExportSettings()
+
+# Knowledge Import
+IMPORT_SETTINGS: Final[ImportSettings] = ImportSettings()
+
+# Search
+SEARCH_SETTINGS: Final[SearchSettings] = SearchSettings()
+
 # Client Settings
 CLIENT_SETTINGS: Final[ClientSettings] = ClientSettings()
 
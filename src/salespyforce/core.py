@@ -5,22 +5,31 @@
 :Usage:             ``from salespyforce import Salesforce``
 :Example:           ``sfdc = Salesforce(helper=helper_file_path)``
 :Created By:        Jeff Shurtliff
-:Last Modified:     Jeff Shurtliff (via GPT-5.5-codex)
-:Modified Date:     15 Jul 2026
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
 """
 
 from __future__ import annotations
 
+import os
 import re
-from typing import Optional, Union
+import time
+from datetime import datetime
+from typing import Iterable, Iterator, Optional, Union
 
 import requests
 
 from . import api, errors
+from . import cache as cache_module
 from . import chatter as chatter_module
 from . import constants as const
 from . import knowledge as knowledge_module
-from .utils import core_utils, log_utils
+from . import knowledge_export as knowledge_export_module
+from . import knowledge_import as knowledge_import_module
+from . import records as records_module
+from . import search as search_module
+from . import soql as soql_module
+from .utils import concurrency_utils, core_utils, log_utils, rich_text_utils
 from .utils.helper import get_helper_settings
 
 # Initialize logging
@@ -37,6 +46,12 @@ class Salesforce:
     .. versionchanged:: 1.5.0
        String helper paths now infer JSON or YAML parsing from the file extension.
 
+    .. versionchanged:: 1.6.0
+       The optional ``response_cache`` parameter can be defined to cache idempotent GET responses, and concurrent
+       identical GET requests are now coalesced into a single API call unless ``coalesce_requests`` is ``False``.
+       The optional ``record_access_cache`` parameter can also be defined to cache user record access checks,
+       and the optional ``article_number_index`` parameter can be defined to cache article number lookups.
+
     :param connection_info: The information for connecting to the Salesforce instance
     :type connection_info: dict, None
     :param version: The Salesforce API version to utilize (uses latest version from org if not explicitly defined)
@@ -59,6 +74,19 @@ class Salesforce:
     :type security_token: str, None
     :param helper: The file path of a helper file
     :type helper: str, tuple, list, set, dict, None
+    :param response_cache: ``True`` to cache GET responses with the default settings, or a
+                           :py:class:`salespyforce.cache.ResponseCache` object with custom settings (disabled by default)
+    :type response_cache: bool, class[salespyforce.cache.ResponseCache], None
+    :param coalesce_requests: Determines if concurrent identical GET requests should share a single API call
+                              (``True`` by default)
+    :type coalesce_requests: bool
+    :param record_access_cache: ``True`` to cache user record access data with the default settings, or a
+                                :py:class:`salespyforce.cache.RecordAccessCache` object with custom settings
+                                (disabled by default)
+    :type record_access_cache: bool, class[salespyforce.cache.RecordAccessCache], None
+    :param article_number_index: ``True`` to index the ``Id`` values of article numbers as they are retrieved, or a
+                                 :py:class:`salespyforce.cache.ArticleNumberIndex` object (disabled by default)
+    :type article_number_index: bool, class[salespyforce.cache.ArticleNumberIndex], None
     :returns: The instantiated object
     :raises: :py:exc:`TypeError`,
              :py:exc:`RuntimeError`
@@ -78,11 +106,23 @@ class Salesforce:
         client_secret: Optional[str] = None,
         security_token: Optional[str] = None,
         helper: Optional[Union[str, tuple, list, set, dict]] = None,
+        response_cache: Optional[Union[bool, cache_module.ResponseCache]] = None,
+        coalesce_requests: bool = True,
+        record_access_cache: Optional[Union[bool, cache_module.RecordAccessCache]] = None,
+        article_number_index: Optional[Union[bool, cache_module.ArticleNumberIndex]] = None,
     ) -> None:
         """This method instantiates the core Salesforce client object."""
         # Define the default settings
         self._helper_settings = {}
 
+        # Define the optional response, record access and article number caches
+        self.response_cache = cache_module.get_response_cache(response_cache)
+        self.record_access_cache = cache_module.get_record_access_cache(record_access_cache)
+        self.article_number_index = cache_module.get_article_number_index(article_number_index)
+
+        # Define the group that allows concurrent identical GET requests to share a single API call
+        self.inflight_requests = concurrency_utils.SingleFlight() if coalesce_requests else None
+
         # Check for provided connection info
         if connection_info is None:
             # Check for a supplied helper file
@@ -285,6 +325,7 @@ class Salesforce:
         timeout: Optional[int] = None,
         show_full_error: bool = True,
         return_json: bool = True,
+        stream: bool = False,
     ):
         """This method performs a GET request against the Salesforce instance.
         (`Reference <https://jereze.com/code/authentification-salesforce-rest-api-python/>`__)
@@ -293,6 +334,9 @@ class Salesforce:
            A global constant is now leveraged for the API timeout value instead of hardcoding the value.
            (Timeout is still **30** seconds in this version)
 
+        .. versionchanged:: 1.6.0
+           The optional ``stream`` parameter can be used to retrieve the response body incrementally.
+
         :param endpoint: The API endpoint to query
         :type endpoint: str
         :param params: The query parameters (where applicable)
@@ -304,6 +348,9 @@ class Salesforce:
         :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
         :type show_full_error: bool
         :param return_json: Determines if the response should be returned in JSON format (defaults to ``True``)
+        :param stream: Returns the ``requests`` object without downloading the response body so that it can be read
+                       with the ``iter_content`` method (defaults to ``False``)
+        :type stream: bool
         :returns: The API response in JSON format or as a ``requests`` object
         :raises: :py:exc:`TypeError`,
                  :py:exc:`RuntimeError`,
@@ -317,6 +364,7 @@ class Salesforce:
             timeout=timeout,
             show_full_error=show_full_error,
             return_json=return_json,
+            stream=stream,
         )
 
     def api_call_with_payload(
@@ -557,6 +605,55 @@ class Salesforce:
             return_json=return_json,
         )
 
+    def get_response_cache_stats(self) -> dict:
+        """This method returns the hit, miss, eviction and size statistics for the response cache.
+
+        .. versionadded:: 1.6.0
+
+        :returns: Dictionary with the cache statistics (or an empty dictionary if the response cache is disabled)
+        """
+        return self.response_cache.stats if self.response_cache is not None else {}
+
+    def clear_response_cache(self) -> None:
+        """This method removes all entries from the response cache when it is enabled.
+
+        .. versionadded:: 1.6.0
+
+        :returns: None
+        """
+        if self.response_cache is not None:
+            self.response_cache.clear()
+
+    def get_record_access_cache_stats(self) -> dict:
+        """This method returns the hit, miss, eviction and size statistics for the record access cache.
+
+        .. versionadded:: 1.6.0
+
+        :returns: Dictionary with the cache statistics (or an empty dictionary if the record access cache is disabled)
+        """
+        return self.record_access_cache.stats if self.record_access_cache is not None else {}
+
+    def invalidate_record_access_cache(self, user_id: Optional[str] = None, record_id: Optional[str] = None) -> int:
+        """This method removes cached record access data for a user, a record, or all entries when enabled.
+
+        .. versionadded:: 1.6.0
+
+        :param user_id: The ``Id`` of the user whose cached access data should be removed (optional)
+        :type user_id: str, None
+        :param record_id: The ``Id`` of the record whose cached access data should be removed (optional)
+        :type record_id: str, None
+        :returns: The number of entries that were removed
+        """
+        if self.record_access_cache is None:
+            return 0
+        if not user_id and not record_id:
+            removed_count = len(self.record_access_cache)
+            self.record_access_cache.clear()
+            return removed_count
+        removed_count = self.record_access_cache.invalidate_user(user_id) if user_id else 0
+        removed_count += self.record_access_cache.invalidate_record(record_id) if record_id else 0
+        return removed_count
+
     def get_api_versions(self) -> list:
         """This method returns the API versions for the Salesforce releases.
         (`Reference <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/dome_versions.htm>`__)
@@ -664,29 +761,73 @@ class Salesforce:
         """
         return core_utils.get_18_char_id(record_id=record_id)
 
-    def soql_query(self, query: str, replace_quotes: bool = True, next_records_url: bool = False):
+    def soql_query(
+        self,
+        query: str,
+        replace_quotes: bool = True,
+        next_records_url: bool = False,
+        compact_records: bool = False,
+    ):
         """This method performs a SOQL query and returns the results in JSON format.
         (`Reference 1 <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/dome_query.htm>`__,
         `Reference 2 <https://developer.salesforce.com/docs/atlas.en-us.knowledge_dev.meta/knowledge_dev/knowledge_development_soql_sosl_intro.htm>`__)
 
+        .. versionchanged:: 1.6.0
+           Added the optional ``compact_records`` parameter to return the records as compact record objects.
+           Queries rendered with the :py:mod:`salespyforce.soql` query builder use their cached URL-encoded form.
+
         :param query: The SOQL query to perform
         :type query: str
         :param replace_quotes: Determines if double-quotes should be replaced with single-quotes (``True`` by default)
         :type replace_quotes: bool
         :param next_records_url: Indicates that the ``query`` parameter is a ``nextRecordsUrl`` value.
         :type next_records_url: bool
+        :param compact_records: Returns the records as :py:class:`salespyforce.records.CompactRecord` objects that
+                                use ``__slots__`` rather than dictionaries (``False`` by default)
+        :type compact_records: bool
         :returns: The result of the SOQL query
         :raises: :py:exc:`RuntimeError`
         """
         if next_records_url:
             query = re.sub(r'^.*/', '', query) if '/' in query else query
+        elif isinstance(query, soql_module.SoqlQuery):
+            query = f'?{const.QUERY_PARAMS.Q}={query.encoded}'
         else:
             if replace_quotes:
                 query = query.replace('"', "'")
             query = core_utils.url_encode(query)
             query = f'?{const.QUERY_PARAMS.Q}={query}'
         endpoint = f'{const.REST_PATHS.QUERY.format(api_version=self.version)}/{query}'
-        return self.get(endpoint)
+        response = self.get(endpoint)
+        if compact_records and isinstance(response, dict) and const.RESPONSE_KEYS.RECORDS in response:
+            response[const.RESPONSE_KEYS.RECORDS] = records_module.compact_records(response[const.RESPONSE_KEYS.RECORDS])
+        return response
+
+    def iter_soql_query(self, query: str, replace_quotes: bool = True, compact_records: bool = False) -> Iterator:
+        """This method performs a SOQL query and yields each record while retrieving additional pages as needed.
+
+        .. versionadded:: 1.6.0
+
+        The subsequent pages are retrieved using the ``nextRecordsUrl`` value of each response so that only a
+        single page of records is held in memory at a time.
+
+        :param query: The SOQL query to perform
+        :type query: str
+        :param replace_quotes: Determines if double-quotes should be replaced with single-quotes (``True`` by default)
+        :type replace_quotes: bool
+        :param compact_records: Yields the records as :py:class:`salespyforce.records.CompactRecord` objects that
+                                use ``__slots__`` rather than dictionaries (``False`` by default)
+        :type compact_records: bool
+        :returns: Generator that yields each record returned by the query
+        :raises: :py:exc:`RuntimeError`
+        """
+        response = self.soql_query(query, replace_quotes=replace_quotes, compact_records=compact_records)
+        while True:
+            yield from response.get(const.RESPONSE_KEYS.RECORDS) or []
+            next_url = response.get(const.RESPONSE_KEYS.NEXT_RECORDS_URL)
+            if response.get(const.RESPONSE_KEYS.DONE, True) or not next_url:
+                break
+            response = self.soql_query(next_url, next_records_url=True, compact_records=compact_records)
 
     def search_string(self, string_to_search: str):
         """This method performs a SOSL query to search for a given string.
@@ -704,11 +845,145 @@ class Salesforce:
         endpoint = f'{const.REST_PATHS.SEARCH.format(api_version=self.version)}?{const.QUERY_PARAMS.Q}={query}'
         return self.get(endpoint)
 
+    def parameterized_search(
+        self,
+        search_term: str,
+        returning: Optional[Union[str, list, tuple, dict]] = None,
+        fields: Optional[Union[str, list, tuple]] = None,
+        search_in: Optional[str] = None,
+        default_limit: Optional[int] = None,
+        overall_limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> dict:
+        """This method performs a SOSL search using the ``parameterizedSearch`` resource.
+        (`Reference <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_search_parameterized.htm>`__)
+
+        .. versionadded:: 1.6.0
+
+        :param search_term: The string for which to search
+        :type search_term: str
+        :param returning: The objects to search along with their fields and limits (e.g.
+                          ``{'Account': {'fields': ['Id', 'Name'], 'limit': 5}}``) (all searchable objects by default)
+        :type returning: str, list, tuple, dict, None
+        :param fields: The fields to return for every object that does not define its own fields (optional)
+        :type fields: str, list, tuple, None
+        :param search_in: The search group (i.e. ``ALL``, ``NAME``, ``EMAIL``, ``PHONE`` or ``SIDEBAR``) (optional)
+        :type search_in: str, None
+        :param default_limit: The maximum number of records to return for each object (optional)
+        :type default_limit: int, None
+        :param overall_limit: The maximum number of records to return across every object (optional)
+        :type overall_limit: int, None
+        :param offset: The starting row offset into the results, which requires a single object (optional)
+        :type offset: int, None
+        :returns: The search response data in JSON format
+        :raises: :py:exc:`RuntimeError`,
+                 :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+        """
+        return search_module.parameterized_search(
+            self,
+            search_term,
+            returning=returning,
+            fields=fields,
+            search_in=search_in,
+            default_limit=default_limit,
+            overall_limit=overall_limit,
+            offset=offset,
+        )
+
+    def iter_search_records(
+        self,
+        search_term: str,
+        returning: Union[str, list, tuple, dict],
+        fields: Optional[Union[str, list, tuple]] = None,
+        search_in: Optional[str] = None,
+        page_size: int = const.SEARCH_SETTINGS.DEFAULT_PAGE_SIZE,
+        max_records: Optional[int] = None,
+    ) -> Iterator[dict]:
+        """This method yields the records that match a search term while paginating through the results of one object.
+
+        .. versionadded:: 1.6.0
+
+        :param search_term: The string for which to search
+        :type search_term: str
+        :param returning: The single object to search along with its fields (e.g. ``{'Account': ['Id', 'Name']}``)
+        :type returning: str, list, tuple, dict
+        :param fields: The fields to return when they are not defined by the ``returning`` value (optional)
+        :type fields: str, list, tuple, None
+        :param search_in: The search group (i.e. ``ALL``, ``NAME``, ``EMAIL``, ``PHONE`` or ``SIDEBAR``) (optional)
+        :type search_in: str, None
+        :param page_size: The number of records to retrieve per page (``200`` by default)
+        :type page_size: int
+        :param max_records: Stops the iteration once this number of records has been yielded (optional)
+        :type max_records: int, None
+        :returns: Generator that yields each record
+        :raises: :py:exc:`RuntimeError`,
+                 :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+        """
+        return search_module.iter_search_records(
+            self,
+            search_term,
+            returning=returning,
+            fields=fields,
+            search_in=search_in,
+            page_size=page_size,
+            max_records=max_records,
+        )
+
+    def search_many(
+        self,
+        search_terms: Union[list, tuple, set],
+        returning: Optional[Union[str, list, tuple, dict]] = None,
+        fields: Optional[Union[str, list, tuple]] = None,
+        search_in: Optional[str] = None,
+        default_limit: Optional[int] = None,
+        overall_limit: Optional[int] = None,
+        max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+        requests_per_second: Optional[Union[int, float]] = None,
+    ) -> dict:
+        """This method performs parameterized SOSL searches for many search terms concurrently and merges the results.
+
+        .. versionadded:: 1.6.0
+
+        :param search_terms: The strings for which to search
+        :type search_terms: list, tuple, set
+        :param returning: The objects to search along with their fields and limits (all searchable objects by default)
+        :type returning: str, list, tuple, dict, None
+        :param fields: The fields to return for every object that does not define its own fields (optional)
+        :type fields: str, list, tuple, None
+        :param search_in: The search group (i.e. ``ALL``, ``NAME``, ``EMAIL``, ``PHONE`` or ``SIDEBAR``) (optional)
+        :type search_in: str, None
+        :param default_limit: The maximum number of records to return for each object per search term (optional)
+        :type default_limit: int, None
+        :param overall_limit: The maximum number of records to return across every object per search term (optional)
+        :type overall_limit: int, None
+        :param max_workers: The maximum number of searches to perform concurrently (``8`` by default)
+        :type max_workers: int
+        :param requests_per_second: The maximum number of API calls to perform per second (unlimited by default)
+        :type requests_per_second: int, float, None
+        :returns: Dictionary that maps the ``Id`` value of each record to the record
+        :raises: :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+        """
+        return search_module.search_many(
+            self,
+            search_terms,
+            returning=returning,
+            fields=fields,
+            search_in=search_in,
+            default_limit=default_limit,
+            overall_limit=overall_limit,
+            max_workers=max_workers,
+            requests_per_second=requests_per_second,
+        )
+
     def check_user_record_access(self, record_id: str, user_id: Optional[str] = None) -> dict:
         """This method checks the Read, Edit, and Delete access for a given record and user.
 
         .. versionadded:: 1.4.0
 
+        .. versionchanged:: 1.6.0
+           The access data is retrieved from and stored in the record access cache when it is enabled. The IDs are
+           now escaped within the query using the :py:mod:`salespyforce.soql` query builder.
+
         :param record_id: The ``Id`` value of the record against which to check the user access
         :type record_id: str
         :param user_id: The ``Id`` of the user to evaluate (or the current user's ID if not explicitly defined)
@@ -724,16 +999,13 @@ class Salesforce:
         }
 
         # Use the current/running user's ID if an ID wasn't explicitly provided
-        if not user_id:
-            user_id = self._get_cached_user_info(_field=const.CLIENT_SETTINGS.USER_ID, _retrieve_if_missing=True)
-            if user_id:
-                logger.debug(f'Using the User Id {user_id} for the running user as an Id was not specified')
+        user_id = self._get_record_access_user_id(_user_id=user_id, _record_desc=f'record Id {record_id}')
 
-        # Raise an exception if the User ID is still undefined
-        if not user_id:
-            error_msg = f'The user access for record Id {record_id} cannot be checked as the User Id is undefined'
-            logger.error(error_msg)
-            raise errors.exceptions.MissingRequiredDataError(error_msg)
+        # Return the cached access data when available
+        if self.record_access_cache is not None:
+            cached_access = self.record_access_cache.get(user_id, record_id)
+            if cached_access is not None:
+                return cached_access
 
         # Perform SOQL query for the access data
         select_fields = ', '.join(
@@ -744,23 +1016,158 @@ class Salesforce:
                 const.SOBJECT_FIELDS.HAS_DELETE_ACCESS,
             )
         )
-        query = f"""
-            SELECT {select_fields}
-            FROM {const.SOBJECTS.USER_RECORD_ACCESS}
-            WHERE {const.SOBJECT_FIELDS.USER_ID} = '{user_id}' 
-            AND {const.SOBJECT_FIELDS.RECORD_ID} = '{record_id}'
-        """
-        response = self.soql_query(query=query)
+        query_template = (
+            f'SELECT {select_fields} FROM {const.SOBJECTS.USER_RECORD_ACCESS} '
+            f'WHERE {const.SOBJECT_FIELDS.USER_ID} = :user_id AND {const.SOBJECT_FIELDS.RECORD_ID} = :record_id'
+        )
+        response = self.soql_query(query=soql_module.compile_query(query_template).render(user_id=user_id, record_id=record_id))
 
         # Parse the response to extract the relevant field values
         if const.RESPONSE_KEYS.RECORDS in response and response[const.RESPONSE_KEYS.RECORDS]:
             response = response[const.RESPONSE_KEYS.RECORDS][0]
             for field in record_access.keys():
                 record_access[field] = response.get(field, None)
+            if self.record_access_cache is not None:
+                self.record_access_cache.set(user_id, record_id, record_access)
+
+        # Return the record access data
+        return record_access
+
+    def check_user_record_access_bulk(self, record_ids: Union[str, list, tuple, set], user_id: Optional[str] = None) -> dict:
+        """This method checks the Read, Edit, and Delete access for multiple records and a given user.
+
+        .. versionadded:: 1.6.0
+
+        The records are evaluated in chunks of up to 200 record IDs per SOQL query (the maximum supported by the
+        ``UserRecordAccess`` object) rather than performing a separate query for each record, and the chunks are
+        split further when needed to keep each query within the SOQL length limits. Records whose access data is
+        found in the record access cache (when enabled) are not queried.
+
+        :param record_ids: One or more ``Id`` values of the records against which to check the user access
+        :type record_ids: str, list, tuple, set
+        :param user_id: The ``Id`` of the user to evaluate (or the current user's ID if not explicitly defined)
+        :type user_id: str, None
+        :returns: Dictionary mapping each provided record ID to a dictionary with Boolean values for
+                  ``HasReadAccess``, ``HasEditAccess``, and ``HasDeleteAccess``
+        :raises: :py:exc:`RuntimeError`,
+                 :py:exc:`ValueError`,
+                 :py:exc:`salespyforce.errors.exceptions.APIRequestError`,
+                 :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
+        """
+        # Remove duplicate record IDs while preserving the original order
+        record_ids = [record_ids] if isinstance(record_ids, str) else list(dict.fromkeys(record_ids))
+        if not record_ids:
+            return {}
+
+        # Ensure the record IDs are valid to prevent malformed queries
+        invalid_ids = [_id for _id in record_ids if not core_utils.is_valid_salesforce_id(_id, verify_checksum=False)]
+        if invalid_ids:
+            error_msg = f'The following record IDs are not valid Salesforce IDs: {invalid_ids}'
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        # Use the current/running user's ID if an ID wasn't explicitly provided and ensure that it is valid
+        user_id = self._get_record_access_user_id(_user_id=user_id, _record_desc=f'{len(record_ids)} record(s)')
+        if not core_utils.is_valid_salesforce_id(user_id, verify_checksum=False):
+            error_msg = f'The user ID {user_id!r} is not a valid Salesforce ID'
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        # Map the 18-character form of each record ID to the provided value so the query results can be matched
+        id_lookup = {core_utils.get_18_char_id(_id): _id for _id in record_ids}
+        record_access = {
+            _id: {
+                const.SOBJECT_FIELDS.HAS_READ_ACCESS: None,
+                const.SOBJECT_FIELDS.HAS_EDIT_ACCESS: None,
+                const.SOBJECT_FIELDS.HAS_DELETE_ACCESS: None,
+            }
+            for _id in record_ids
+        }
+
+        # Retrieve the cached access data when available to identify the records that must be queried
+        query_ids = record_ids
+        if self.record_access_cache is not None:
+            query_ids = []
+            for record_id in record_ids:
+                cached_access = self.record_access_cache.get(user_id, record_id)
+                if cached_access is None:
+                    query_ids.append(record_id)
+                else:
+                    record_access[record_id] = cached_access
+
+        # Perform a SOQL query for the access data of each chunk of records
+        select_fields = ', '.join(
+            (
+                const.SOBJECT_FIELDS.RECORD_ID,
+                const.SOBJECT_FIELDS.HAS_READ_ACCESS,
+                const.SOBJECT_FIELDS.HAS_EDIT_ACCESS,
+                const.SOBJECT_FIELDS.HAS_DELETE_ACCESS,
+            )
+        )
+        query_template = soql_module.compile_query(
+            f'SELECT {select_fields} FROM {const.SOBJECTS.USER_RECORD_ACCESS} '
+            f'WHERE {const.SOBJECT_FIELDS.USER_ID} = :user_id AND {const.SOBJECT_FIELDS.RECORD_ID} IN :record_ids'
+        )
+        for id_chunk in core_utils.chunk_iterable(query_ids, const.SOQL_QUERIES.MAX_USER_RECORD_ACCESS_IDS):
+            records = query_template.query_all(self, user_id=user_id, record_ids=id_chunk)
+
+            # Parse the response to extract the relevant field values for each record
+            for record in records:
+                response_id = record.get(const.SOBJECT_FIELDS.RECORD_ID)
+                if not response_id:
+                    continue
+                record_id = id_lookup.get(core_utils.get_18_char_id(response_id), response_id)
+                if record_id in record_access:
+                    for field in record_access[record_id].keys():
+                        record_access[record_id][field] = record.get(field, None)
+                    if self.record_access_cache is not None:
+                        self.record_access_cache.set(user_id, record_id, record_access[record_id])
 
         # Return the record access data
         return record_access
 
+    def _get_record_access_user_id(self, _user_id: Optional[str], _record_desc: str) -> str:
+        """This private method returns the user ID to evaluate in a record access check.
+
+        .. versionadded:: 1.6.0
+
+        :param _user_id: The explicitly provided ``Id`` of the user to evaluate (if any)
+        :type _user_id: str, None
+        :param _record_desc: Description of the record(s) being checked to use in the error message
+        :type _record_desc: str
+        :returns: The provided user ID or the current/running user's ID if one was not provided
+        :raises: :py:exc:`salespyforce.errors.exceptions.APIRequestError`,
+                 :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
+        """
+        if not _user_id:
+            _user_id = self._get_cached_user_info(_field=const.CLIENT_SETTINGS.USER_ID, _retrieve_if_missing=True)
+            if _user_id:
+                logger.debug(f'Using the User Id {_user_id} for the running user as an Id was not specified')
+
+        # Raise an exception if the User ID is still undefined
+        if not _user_id:
+            _error_msg = f'The user access for {_record_desc} cannot be checked as the User Id is undefined'
+            logger.error(_error_msg)
+            raise errors.exceptions.MissingRequiredDataError(_error_msg)
+        return _user_id
+
+    @staticmethod
+    def _get_access_type_field(_access_type: str) -> Optional[str]:
+        """This private method returns the ``UserRecordAccess`` field that corresponds to a given access type.
+
+        .. versionadded:: 1.6.0
+
+        :param _access_type: The type of access to evaluate (``read``, ``edit``, or ``delete``)
+        :type _access_type: str
+        :returns: The name of the access level field or ``None`` if the access type is invalid
+        """
+        _access_type_field_mapping = {
+            'read': const.SOBJECT_FIELDS.HAS_READ_ACCESS,
+            'edit': const.SOBJECT_FIELDS.HAS_EDIT_ACCESS,
+            'delete': const.SOBJECT_FIELDS.HAS_DELETE_ACCESS,
+        }
+        return _access_type_field_mapping.get(str(_access_type).lower())
+
     @staticmethod
     def _eval_user_record_access(
         _field: str,
@@ -829,20 +1236,13 @@ class Salesforce:
         can_access = None
 
         # Identify the correct field to query based on access type
-        access_type_field_mapping = {
-            'read': const.SOBJECT_FIELDS.HAS_READ_ACCESS,
-            'edit': const.SOBJECT_FIELDS.HAS_EDIT_ACCESS,
-            'delete': const.SOBJECT_FIELDS.HAS_DELETE_ACCESS,
-        }
-        if access_type.lower() not in access_type_field_mapping:
+        read_access_field = self._get_access_type_field(access_type)
+        if not read_access_field:
             error_msg = f"The access_type '{access_type}' is invalid (must use 'read', 'edit', or 'delete')"
             logger.error(error_msg)
             if raise_exc_on_failure:
                 raise errors.exceptions.InvalidParameterError(error_msg)
         else:
-            # Retrieve the field name to check
-            read_access_field = access_type_field_mapping.get(access_type.lower())
-
             # Check to see if record access data was provided and validate that it is a dictionary
             if record_access_data and not isinstance(record_access_data, dict):
                 error_msg = f'The record_access_data provided is Type {type(read_access_field)} but must be a dict'
@@ -942,6 +1342,9 @@ class Salesforce:
 
         .. versionadded:: 1.4.0
 
+        .. versionchanged:: 1.6.0
+           The method now evaluates the ``HasDeleteAccess`` field rather than the ``HasEditAccess`` field.
+
         :param record_id: The ID of the record
         :type record_id: str
         :param user_id: The ID of the user to evaluate (defaults to the current/running user if not defined)
@@ -954,13 +1357,181 @@ class Salesforce:
         :raises: :py:exc:`salespyforce.errors.exceptions.InvalidFieldError`
         """
         return self.can_access_record(
-            access_type='edit',
+            access_type='delete',
             record_id=record_id,
             user_id=user_id,
             record_access_data=record_access_data,
             raise_exc_on_failure=raise_exc_on_failure,
         )
 
+    def can_access_records(
+        self,
+        access_type: str,
+        record_ids: Union[str, list, tuple, set],
+        user_id: Optional[str] = None,
+        record_access_data: Optional[dict] = None,
+        raise_exc_on_failure: bool = True,
+    ) -> dict:
+        """This method evaluates if a user can access multiple records given the access type.
+
+        .. versionadded:: 1.6.0
+
+        The record access data is retrieved in bulk using the :py:meth:`check_user_record_access_bulk` method when
+        it is not provided.
+
+        :param access_type: The type of access to evaluate (``read``, ``edit``, or ``delete``)
+        :type access_type: str
+        :param record_ids: One or more IDs of the records to evaluate
+        :type record_ids: str, list, tuple, set
+        :param user_id: The ID of the user to evaluate (defaults to the current/running user if not defined)
+        :type user_id: str, None
+        :param record_access_data: The bulk user record access data (i.e. a dictionary mapping record IDs to their
+                                   access data) that has already been retrieved (optional)
+        :type record_access_data: dict, None
+        :param raise_exc_on_failure: Raises an exception rather than returning a ``None`` value (``True`` by default)
+        :type raise_exc_on_failure: bool
+        :returns: Dictionary mapping each record ID to a Boolean value indicating the access level
+        :raises: :py:exc:`ValueError`,
+                 :py:exc:`salespyforce.errors.exceptions.DataMismatchError`,
+                 :py:exc:`salespyforce.errors.exceptions.InvalidFieldError`,
+                 :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`,
+                 :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
+        """
+        record_ids = [record_ids] if isinstance(record_ids, str) else list(dict.fromkeys(record_ids))
+
+        # Identify the correct field to evaluate based on access type
+        access_field = self._get_access_type_field(access_type)
+        if not access_field:
+            error_msg = f"The access_type '{access_type}' is invalid (must use 'read', 'edit', or 'delete')"
+            logger.error(error_msg)
+            if raise_exc_on_failure:
+                raise errors.exceptions.InvalidParameterError(error_msg)
+            return {_id: None for _id in record_ids}
+
+        # Check to see if record access data was provided and validate that it is a dictionary
+        if record_access_data and not isinstance(record_access_data, dict):
+            error_msg = f'The record_access_data provided is Type {type(record_access_data)} but must be a dict'
+            logger.error(error_msg)
+            if raise_exc_on_failure:
+                raise errors.exceptions.DataMismatchError(error_msg)
+            record_access_data = None
+
+        # Retrieve the record access data in bulk for any records without data
+        record_access_data = dict(record_access_data or {})
+        missing_ids = [_id for _id in record_ids if not record_access_data.get(_id)]
+        if missing_ids:
+            record_access_data.update(self.check_user_record_access_bulk(record_ids=missing_ids, user_id=user_id))
+
+        # Evaluate the access level for each record
+        can_access = {}
+        for record_id in record_ids:
+            can_access[record_id] = self._eval_user_record_access(
+                _field=access_field,
+                _record_id=record_id,
+                _record_access_data=record_access_data.get(record_id) or {},
+                _raise_exc_on_failure=raise_exc_on_failure,
+            )
+
+        # Emit a warning if any values are None rather than a boolean
+        undefined_count = sum(1 for _value in can_access.values() if _value is None)
+        if undefined_count:
+            warn_msg = f'The record access check could not be completed for {undefined_count} record(s) and will return None'
+            logger.warning(warn_msg)
+            errors.handlers.display_warning(warn_msg)
+
+        # Return the results
+        return can_access
+
+    def can_read_records(
+        self,
+        record_ids: Union[str, list, tuple, set],
+        user_id: Optional[str] = None,
+        record_access_data: Optional[dict] = None,
+        raise_exc_on_failure: bool = True,
+    ) -> dict:
+        """This method evaluates if a user has access to read multiple records.
+
+        .. versionadded:: 1.6.0
+
+        :param record_ids: One or more IDs of the records to evaluate
+        :type record_ids: str, list, tuple, set
+        :param user_id: The ID of the user to evaluate (defaults to the current/running user if not defined)
+        :type user_id: str, None
+        :param record_access_data: The bulk user record access data that has already been retrieved (optional)
+        :type record_access_data: dict, None
+        :param raise_exc_on_failure: Raises an exception rather than returning a ``None`` value (``True`` by default)
+        :type raise_exc_on_failure: bool
+        :returns: Dictionary mapping each record ID to a Boolean value indicating the access level
+        :raises: :py:exc:`salespyforce.errors.exceptions.InvalidFieldError`
+        """
+        return self.can_access_records(
+            access_type='read',
+            record_ids=record_ids,
+            user_id=user_id,
+            record_access_data=record_access_data,
+            raise_exc_on_failure=raise_exc_on_failure,
+        )
+
+    def can_edit_records(
+        self,
+        record_ids: Union[str, list, tuple, set],
+        user_id: Optional[str] = None,
+        record_access_data: Optional[dict] = None,
+        raise_exc_on_failure: bool = True,
+    ) -> dict:
+        """This method evaluates if a user has access to edit multiple records.
+
+        .. versionadded:: 1.6.0
+
+        :param record_ids: One or more IDs of the records to evaluate
+        :type record_ids: str, list, tuple, set
+        :param user_id: The ID of the user to evaluate (defaults to the current/running user if not defined)
+        :type user_id: str, None
+        :param record_access_data: The bulk user record access data that has already been retrieved (optional)
+        :type record_access_data: dict, None
+        :param raise_exc_on_failure: Raises an exception rather than returning a ``None`` value (``True`` by default)
+        :type raise_exc_on_failure: bool
+        :returns: Dictionary mapping each record ID to a Boolean value indicating the access level
+        :raises: :py:exc:`salespyforce.errors.exceptions.InvalidFieldError`
+        """
+        return self.can_access_records(
+            access_type='edit',
+            record_ids=record_ids,
+            user_id=user_id,
+            record_access_data=record_access_data,
+            raise_exc_on_failure=raise_exc_on_failure,
+        )
+
+    def can_delete_records(
+        self,
+        record_ids: Union[str, list, tuple, set],
+        user_id: Optional[str] = None,
+        record_access_data: Optional[dict] = None,
+        raise_exc_on_failure: bool = True,
+    ) -> dict:
+        """This method evaluates if a user has access to delete multiple records.
+
+        .. versionadded:: 1.6.0
+
+        :param record_ids: One or more IDs of the records to evaluate
+        :type record_ids: str, list, tuple, set
+        :param user_id: The ID of the user to evaluate (defaults to the current/running user if not defined)
+        :type user_id: str, None
+        :param record_access_data: The bulk user record access data that has already been retrieved (optional)
+        :type record_access_data: dict, None
+        :param raise_exc_on_failure: Raises an exception rather than returning a ``None`` value (``True`` by default)
+        :type raise_exc_on_failure: bool
+        :returns: Dictionary mapping each record ID to a Boolean value indicating the access level
+        :raises: :py:exc:`salespyforce.errors.exceptions.InvalidFieldError`
+        """
+        return self.can_access_records(
+            access_type='delete',
+            record_ids=record_ids,
+            user_id=user_id,
+            record_access_data=record_access_data,
+            raise_exc_on_failure=raise_exc_on_failure,
+        )
+
     def create_sobject_record(self, sobject: str, payload: dict):
         """This method creates a new record for a specific sObject.
         (`Reference <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/dome_sobject_create.htm>`__)
@@ -983,6 +1554,253 @@ class Salesforce:
         response = self.post(endpoint, payload=payload)
         return response
 
+    @staticmethod
+    def _get_collection_results(_chunks: list, _chunk_results: list) -> list:
+        """This private method combines the sObject Collections results of each chunk of records.
+
+        .. versionadded:: 1.6.0
+
+        A chunk whose API call raised an exception results in an unsuccessful result for each of its records so that
+        the results remain in the order of the records.
+
+        :param _chunks: The chunks of records that were submitted
+        :type _chunks: list
+        :param _chunk_results: The results (or raised exceptions) of each chunk
+        :type _chunk_results: list
+        :returns: List of the results in the order of the records
+        """
+        _results = []
+        for _chunk, _result in zip(_chunks, _chunk_results):
+            if isinstance(_result, Exception):
+                logger.error(f'The sObject Collections request for {len(_chunk)} record(s) failed: {_result}')
+                _result = [
+                    {
+                        const.RESPONSE_KEYS.SUCCESS: False,
+                        const.RESPONSE_KEYS.ERRORS: [{const.RESPONSE_KEYS.MESSAGE: str(_result)}],
+                    }
+                    for _ in _chunk
+                ]
+            _results.extend(_result or [])
+        return _results
+
+    def _invalidate_cached_records(self, _sobject: str, _results: list) -> None:
+        """This private method invalidates the cached responses for the records of successful sObject Collections
+        results.
+
+        .. versionadded:: 1.6.0
+
+        :param _sobject: The sObject of the records
+        :type _sobject: str
+        :param _results: The sObject Collections results (with the ``id`` and ``success`` values)
+        :type _results: list
+        :returns: None
+        """
+        for _result in _results:
+            if _result.get(const.RESPONSE_KEYS.SUCCESS) and _result.get(const.RESPONSE_KEYS.ID):
+                _record_url = const.REST_PATHS.SOBJECT_BY_ID.format(
+                    api_version=self.version,
+                    sobject=_sobject,
+                    record_id=_result[const.RESPONSE_KEYS.ID],
+                )
+                api._invalidate_cached_responses(self, _record_url)
+
+    def create_sobject_records(
+        self,
+        sobject: str,
+        records: list,
+        all_or_none: bool = False,
+        max_workers: int = 1,
+    ) -> list:
+        """This method creates multiple records for a specific sObject using the sObject Collections endpoint.
+        (`Reference <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_composite_sobjects_collections_create.htm>`__)
+
+        .. versionadded:: 1.6.0
+
+        The records are created 200 at a time (the maximum supported by the endpoint) and the chunks can optionally
+        be submitted concurrently. When the API call for a chunk fails, each record in that chunk has an unsuccessful
+        result (with the error message in its ``errors`` value) rather than the exception being raised. Any cached
+        responses for the URL of each created record are invalidated.
+
+        :param sobject: The sObject under which to create the new records
+        :type sobject: str
+        :param records: The list of dictionaries with the details of each record
+        :type records: list
+        :param all_or_none: Determines if all records in a chunk should be rolled back when any record fails
+                            (``False`` by default)
+        :type all_or_none: bool
+        :param max_workers: The maximum number of chunks to submit concurrently (``1`` by default)
+        :type max_workers: int
+        :returns: List of the results (with the ``id``, ``success`` and ``errors`` values) in the order of the records
+        :raises: :py:exc:`TypeError`
+        """
+        # Ensure the records are in the appropriate format
+        if not isinstance(records, list) or not all(isinstance(_record, dict) for _record in records):
+            logger.error(const._LOG_MESSAGES._SOBJECT_PAYLOAD_MUST_BE_DICT)
+            raise TypeError(const._LOG_MESSAGES._SOBJECT_PAYLOAD_MUST_BE_DICT)
+
+        # Define the function that creates a single chunk of records
+        endpoint = const.REST_PATHS.COMPOSITE_SOBJECTS.format(api_version=self.version)
+
+        def _create_records(_records: list) -> list:
+            _payload = {
+                const.QUERY_PARAMS.ALL_OR_NONE: all_or_none,
+                const.QUERY_PARAMS.RECORDS: [
+                    {const.RESPONSE_KEYS.ATTRIBUTES: {const.RESPONSE_KEYS.TYPE: sobject}, **_record} for _record in _records
+                ],
+            }
+            return self.post(endpoint, payload=_payload)
+
+        # Perform the API calls and return the combined results
+        chunks = list(core_utils.chunk_iterable(records, const.CONCURRENCY_SETTINGS.MAX_SOBJECT_COLLECTION_RECORDS))
+        chunk_results = concurrency_utils.run_concurrently(
+            _create_records, chunks, max_workers=max_workers, return_exceptions=True
+        )
+        results = self._get_collection_results(chunks, chunk_results)
+        self._invalidate_cached_records(sobject, results)
+        return results
+
+    def update_sobject_records(
+        self,
+        sobject: str,
+        records: list,
+        all_or_none: bool = False,
+        max_workers: int = 1,
+    ) -> list:
+        """This method updates multiple existing records for a specific sObject using the sObject Collections endpoint.
+        (`Reference <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_composite_sobjects_collections_update.htm>`__)
+
+        .. versionadded:: 1.6.0
+
+        The records are updated 200 at a time (the maximum supported by the endpoint) and the chunks can optionally
+        be submitted concurrently. When the API call for a chunk fails, each record in that chunk has an unsuccessful
+        result (with the error message in its ``errors`` value) rather than the exception being raised. Any cached
+        responses for the URL of each updated record are invalidated.
+
+        :param sobject: The sObject under which to update the records
+        :type sobject: str
+        :param records: The list of dictionaries with the ``Id`` and the fields to update for each record
+        :type records: list
+        :param all_or_none: Determines if all records in a chunk should be rolled back when any record fails
+                            (``False`` by default)
+        :type all_or_none: bool
+        :param max_workers: The maximum number of chunks to submit concurrently (``1`` by default)
+        :type max_workers: int
+        :returns: List of the results (with the ``id``, ``success`` and ``errors`` values) in the order of the records
+        :raises: :py:exc:`TypeError`
+        """
+        # Ensure the records are in the appropriate format
+        if not isinstance(records, list) or not all(
+            isinstance(_record, dict) and _record.get(const.SOBJECT_FIELDS.ID) for _record in records
+        ):
+            error_msg = 'The records must be a list of dictionaries that each include an Id value'
+            logger.error(error_msg)
+            raise TypeError(error_msg)
+
+        # Define the function that updates a single chunk of records
+        endpoint = const.REST_PATHS.COMPOSITE_SOBJECTS.format(api_version=self.version)
+
+        def _update_records(_records: list) -> list:
+            _payload = {
+                const.QUERY_PARAMS.ALL_OR_NONE: all_or_none,
+                const.QUERY_PARAMS.RECORDS: [
+                    {const.RESPONSE_KEYS.ATTRIBUTES: {const.RESPONSE_KEYS.TYPE: sobject}, **_record} for _record in _records
+                ],
+            }
+            return self.patch(endpoint, payload=_payload, return_json=True)
+
+        # Perform the API calls and return the combined results
+        chunks = list(core_utils.chunk_iterable(records, const.CONCURRENCY_SETTINGS.MAX_SOBJECT_COLLECTION_RECORDS))
+        chunk_results = concurrency_utils.run_concurrently(
+            _update_records, chunks, max_workers=max_workers, return_exceptions=True
+        )
+        results = self._get_collection_results(chunks, chunk_results)
+        self._invalidate_cached_records(sobject, results)
+        return results
+
+    def composite_batch(self, subrequests: list, halt_on_error: bool = False, max_workers: int = 1) -> list:
+        """This method performs multiple subrequests using the Composite Batch endpoint.
+        (`Reference <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_composite_batch.htm>`__)
+
+        .. versionadded:: 1.6.0
+
+        The subrequests are submitted 25 at a time (the maximum supported by the endpoint) and the batches can
+        optionally be submitted concurrently. Each subrequest is a dictionary with the ``method`` and ``url`` values
+        and an optional ``richInput`` payload, where the ``url`` can be a full REST path (e.g.
+        ``/services/data/v65.0/sobjects/Account/001...``) or a path relative to ``/services/data/``. Any cached
+        responses for the URL of each successful subrequest (other than ``GET`` subrequests) are invalidated.
+
+        When the API call for a batch fails, the remaining batches are still performed and each subrequest in the
+        failed batch has a result with a ``None`` status code and the error message (e.g.
+        ``{'statusCode': None, 'result': [{'message': '...'}]}``) so that the results stay aligned with the
+        subrequests.
+
+        :param subrequests: The list of subrequest dictionaries
+        :type subrequests: list
+        :param halt_on_error: Determines if the remaining subrequests in a batch should be skipped after an error
+                              (``False`` by default)
+        :type halt_on_error: bool
+        :param max_workers: The maximum number of batches to submit concurrently (``1`` by default)
+        :type max_workers: int
+        :returns: List of the subrequest results (with the ``statusCode`` and ``result`` values) in the order of the
+                  subrequests
+        :raises: :py:exc:`TypeError`
+        """
+        # Ensure the subrequests are in the appropriate format
+        if not isinstance(subrequests, list) or not all(
+            isinstance(_subrequest, dict) and _subrequest.get(const.QUERY_PARAMS.URL) for _subrequest in subrequests
+        ):
+            error_msg = 'The subrequests must be a list of dictionaries that each include a URL'
+            logger.error(error_msg)
+            raise TypeError(error_msg)
+
+        # Define the function that performs a single batch of subrequests
+        endpoint = const.REST_PATHS.COMPOSITE_BATCH.format(api_version=self.version)
+        _url_prefix = const.REST_PATHS.SERVICES_DATA + '/'
+
+        def _perform_batch(_subrequests: list) -> list:
+            _batch_requests = []
+            for _subrequest in _subrequests:
+                _url = _subrequest[const.QUERY_PARAMS.URL]
+                _batch_requests.append(
+                    {
+                        **_subrequest,
+                        const.QUERY_PARAMS.URL: _url[len(_url_prefix) :] if _url.startswith(_url_prefix) else _url,
+                    }
+                )
+            _payload = {
+                const.QUERY_PARAMS.BATCH_REQUESTS: _batch_requests,
+                const.QUERY_PARAMS.HALT_ON_ERROR: halt_on_error,
+            }
+            _response = self.post(endpoint, payload=_payload)
+            _results = _response.get(const.RESPONSE_KEYS.RESULTS) or []
+
+            # Invalidate any cached responses for the records modified by the successful subrequests
+            for _subrequest, _result in zip(_subrequests, _results):
+                _status_code = _result.get(const.RESPONSE_KEYS.STATUS_CODE) or 0
+                if str(_subrequest.get(const.QUERY_PARAMS.METHOD)).upper() != 'GET' and 200 <= _status_code < 300:
+                    _url = _subrequest[const.QUERY_PARAMS.URL]
+                    api._invalidate_cached_responses(self, _url if _url.startswith(_url_prefix) else _url_prefix + _url)
+            return _results
+
+        # Perform the API calls and return the combined results (with an error result for each failed subrequest)
+        batches = list(core_utils.chunk_iterable(subrequests, const.CONCURRENCY_SETTINGS.MAX_COMPOSITE_BATCH_REQUESTS))
+        batch_results = concurrency_utils.run_concurrently(
+            _perform_batch, batches, max_workers=max_workers, return_exceptions=True
+        )
+        results = []
+        for batch, batch_result in zip(batches, batch_results):
+            if isinstance(batch_result, Exception):
+                logger.error(f'The Composite Batch request for {len(batch)} subrequest(s) failed: {batch_result}')
+                batch_result = [
+                    {
+                        const.RESPONSE_KEYS.STATUS_CODE: None,
+                        const.RESPONSE_KEYS.RESULT: [{const.RESPONSE_KEYS.MESSAGE: str(batch_result)}],
+                    }
+                    for _ in batch
+                ]
+            results.extend(batch_result)
+        return results
+
     def update_sobject_record(self, sobject: str, record_id: str, payload: dict):
         """This method updates an existing sObject record.
         (`Reference <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/dome_update_fields.htm>`__)
@@ -1076,23 +1894,191 @@ class Salesforce:
             raise RuntimeError(error_msg)
         return image_path
 
-    class Chatter:
-        """This class includes methods associated with Salesforce Chatter."""
-
-        def __init__(self, sfdc_object: Salesforce):
-            """This method initializes the :py:class:`salespyforce.core.Salesforce.Chatter` inner class object.
+    def download_images(
+        self,
+        images: Union[list, tuple],
+        file_path: Optional[str] = None,
+        sobject: Optional[str] = None,
+        max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+        overwrite: bool = False,
+        rate_limiter: Optional[concurrency_utils.RateLimiter] = None,
+    ) -> dict:
+        """This method downloads many images using the sObject Rich Text Image Retrieve functionality concurrently.
+        (`Reference <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_sobject_rich_text_image_retrieve.htm>`__)
 
-            :param sfdc_object: The core :py:class:`salespyforce.Salesforce` object
-            :type sfdc_object: class[salespyforce.Salesforce]
-            """
-            self.sfdc_object = sfdc_object
+        .. versionadded:: 1.6.0
 
-        def get_my_news_feed(self, site_id: Optional[str] = None):
-            """This method retrieves the news feed for the user calling the function.
-            (`Reference <https://developer.salesforce.com/docs/atlas.en-us.chatterapi.meta/chatterapi/quickreference_get_news_feed.htm>`__)
+        The images are deduplicated by their reference ID (``refid``) and each image is streamed to disk in chunks
+        rather than being held in memory. Images whose file already exists with the same size as the ``Content-Length``
+        header of the streamed response are skipped without reading the response body unless ``overwrite`` is
+        ``True``, so truncated files are downloaded again.
 
-            :param site_id: The ID of an Experience Cloud site against which to query (optional)
-            :type site_id: str, None
+        :param images: The ``(image_url, record_id, field_name)`` tuples for the images to download
+        :type images: list, tuple
+        :param file_path: The path to the directory where the images should be saved (current directory if not defined)
+        :type file_path: str, None
+        :param sobject: The sObject for the records where the images are found (``Knowledge__kav`` by default)
+        :type sobject: str, None
+        :param max_workers: The maximum number of images to download concurrently (``8`` by default)
+        :type max_workers: int
+        :param overwrite: Determines if existing files with a matching size should be downloaded again
+                          (``False`` by default)
+        :type overwrite: bool
+        :param rate_limiter: Optional rate limiter that is acquired before each image is downloaded
+        :type rate_limiter: class[salespyforce.utils.concurrency_utils.RateLimiter], None
+        :returns: Dictionary with the ``images`` report (keyed by ``refid`` with the ``status``, ``path``, ``bytes``
+                  and ``error`` values) and the ``downloaded``, ``skipped``, ``failed``, ``duplicates``, ``bytes``,
+                  ``seconds`` and ``bytes_per_second`` totals
+        :raises: :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+        """
+        # Ensure a valid sObject is defined (SFDC Knowledge unless otherwise specified)
+        if not sobject or not isinstance(sobject, str):
+            sobject = const.SOBJECTS.KNOWLEDGE
+            logger.info(f'The {sobject} sObject will be leveraged to download the images as an object was not provided')
+
+        # Deduplicate the images by their reference ID
+        downloads = {}
+        for image in images or []:
+            try:
+                ref_id = core_utils.get_image_ref_id(image[0]) if len(image) == 3 and all(image) else None
+            except (TypeError, AttributeError):
+                ref_id = None
+            if not ref_id:
+                error_msg = f'The image {image} must be an (image_url, record_id, field_name) tuple with a refid value'
+                logger.error(error_msg)
+                raise errors.exceptions.InvalidParameterError(error_msg)
+            downloads.setdefault(ref_id, (image[1], image[2]))
+        file_path = file_path or '.'
+        os.makedirs(file_path, exist_ok=True)
+
+        # Define the function that downloads a single image
+        def _download_image(_ref_id: str) -> dict:
+            _record_id, _field_name = downloads[_ref_id]
+            _image_path = os.path.join(file_path, f'{_ref_id}.{const.FILE_EXTENSIONS.JPEG}')
+            _existing_size = os.path.getsize(_image_path) if os.path.isfile(_image_path) else 0
+            try:
+                if rate_limiter is not None:
+                    rate_limiter.acquire()
+                _endpoint = const.REST_PATHS.RICH_TEXT_IMAGE_FIELD_BY_REF_ID.format(
+                    api_version=self.version,
+                    sobject=sobject,
+                    record_id=_record_id,
+                    field_name=_field_name,
+                    ref_id=_ref_id,
+                )
+                _response = self.get(_endpoint, return_json=False, stream=True)
+
+                # Skip existing files whose size matches the Content-Length header without reading the response body
+                _content_length = _response.headers.get('Content-Length')
+                if not overwrite and _existing_size and _content_length and _existing_size == int(_content_length):
+                    _response.close()
+                    return {'status': 'skipped', 'path': _image_path, 'bytes': 0, 'error': None}
+                _bytes = core_utils.save_streamed_response(_response, _image_path)
+                return {'status': 'downloaded', 'path': _image_path, 'bytes': _bytes, 'error': None}
+            except Exception as _exc:
+                _exc_type = errors.handlers.get_exception_type(_exc)
+                _error_msg = f'Failed to download the image with refid {_ref_id} due to {_exc_type} exception: {_exc}'
+                logger.error(_error_msg)
+                return {'status': 'failed', 'path': None, 'bytes': 0, 'error': _error_msg}
+
+        # Download the images concurrently and report on the outcome and throughput
+        start_time = time.monotonic()
+        results = concurrency_utils.run_concurrently(_download_image, downloads, max_workers=max_workers)
+        elapsed_seconds = time.monotonic() - start_time
+        total_bytes = sum(_result['bytes'] for _result in results)
+        report = {
+            'images': dict(zip(downloads, results)),
+            'downloaded': sum(1 for _result in results if _result['status'] == 'downloaded'),
+            'skipped': sum(1 for _result in results if _result['status'] == 'skipped'),
+            'failed': sum(1 for _result in results if _result['status'] == 'failed'),
+            'duplicates': len(images or []) - len(downloads),
+            'bytes': total_bytes,
+            'seconds': elapsed_seconds,
+            'bytes_per_second': total_bytes / elapsed_seconds if elapsed_seconds else 0.0,
+        }
+        logger.info(
+            f'Downloaded {report["downloaded"]} image(s) ({total_bytes} bytes) in {elapsed_seconds:.2f} seconds '
+            f'with {report["skipped"]} skipped and {report["failed"]} failed'
+        )
+        return report
+
+    def export_rich_text_images(
+        self,
+        records: Union[str, Iterable],
+        field_names: Union[str, list, tuple],
+        file_path: Optional[str] = None,
+        sobject: Optional[str] = None,
+        max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+        rewrite_html: bool = False,
+        overwrite: bool = False,
+    ) -> dict:
+        """This method extracts the images from rich text fields, downloads them and optionally rewrites the HTML.
+
+        .. versionadded:: 1.6.0
+
+        The field values are scanned with precompiled patterns rather than being parsed into a DOM, and the images
+        are downloaded with the :py:meth:`salespyforce.core.Salesforce.download_images` method. When requested, the
+        image URLs within the HTML are replaced with the paths of the downloaded files in a single pass.
+
+        :param records: A SOQL query (whose records are retrieved one page at a time) or an iterable of records
+        :type records: str, Iterable
+        :param field_names: The name(s) of the rich text fields to scan
+        :type field_names: str, list, tuple
+        :param file_path: The path to the directory where the images should be saved (current directory if not defined)
+        :type file_path: str, None
+        :param sobject: The sObject for the records where the images are found (``Knowledge__kav`` by default)
+        :type sobject: str, None
+        :param max_workers: The maximum number of images to download concurrently (``8`` by default)
+        :type max_workers: int
+        :param rewrite_html: Determines if the HTML should be rewritten to reference the downloaded images
+                             (``False`` by default)
+        :type rewrite_html: bool
+        :param overwrite: Determines if existing files with a matching size should be downloaded again
+                          (``False`` by default)
+        :type overwrite: bool
+        :returns: Dictionary with the ``download_report`` from the :py:meth:`download_images` method and the
+                  ``records`` dictionary that maps each Record ID to its rewritten field values (when requested)
+        :raises: :py:exc:`RuntimeError`,
+                 :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+        """
+        # Scan the records for images while retaining the field values that will be rewritten
+        field_names = (field_names,) if isinstance(field_names, str) else tuple(field_names)
+        records = self.iter_soql_query(records) if isinstance(records, str) else records
+        images, rich_text_values = [], {}
+        for record in records:
+            record_images = list(rich_text_utils.iter_record_images((record,), field_names))
+            images.extend(record_images)
+            if rewrite_html and record_images:
+                record_id = record.get(const.SOBJECT_FIELDS.ID)
+                rich_text_values[record_id] = {_field: record.get(_field) for _field in field_names}
+        logger.info(f'Found {len(images)} rich text image reference(s) to export')
+
+        # Download the images and rewrite the HTML with the paths of the downloaded files
+        report = self.download_images(images, file_path=file_path, sobject=sobject, max_workers=max_workers, overwrite=overwrite)
+        image_paths = {_ref_id: _image['path'] for _ref_id, _image in report['images'].items() if _image['path']}
+        rewritten_records = {
+            _record_id: {_field: rich_text_utils.rewrite_image_urls(_value, image_paths) for _field, _value in _values.items()}
+            for _record_id, _values in rich_text_values.items()
+        }
+        return {'download_report': report, 'records': rewritten_records}
+
+    class Chatter:
+        """This class includes methods associated with Salesforce Chatter."""
+
+        def __init__(self, sfdc_object: Salesforce):
+            """This method initializes the :py:class:`salespyforce.core.Salesforce.Chatter` inner class object.
+
+            :param sfdc_object: The core :py:class:`salespyforce.Salesforce` object
+            :type sfdc_object: class[salespyforce.Salesforce]
+            """
+            self.sfdc_object = sfdc_object
+
+        def get_my_news_feed(self, site_id: Optional[str] = None):
+            """This method retrieves the news feed for the user calling the function.
+            (`Reference <https://developer.salesforce.com/docs/atlas.en-us.chatterapi.meta/chatterapi/quickreference_get_news_feed.htm>`__)
+
+            :param site_id: The ID of an Experience Cloud site against which to query (optional)
+            :type site_id: str, None
             :returns: The news feed data
             :raises: :py:exc:`RuntimeError`
             """
@@ -1124,6 +2110,249 @@ class Salesforce:
             """
             return chatter_module.get_group_feed(self.sfdc_object, group_id=group_id, site_id=site_id)
 
+        def iter_my_news_feed(
+            self,
+            site_id: Optional[str] = None,
+            page_size: int = const.QUERY_PARAMS.MAX_PAGE_SIZE,
+            since: Optional[Union[datetime, str]] = None,
+            max_elements: Optional[int] = None,
+            sort: Optional[str] = None,
+        ) -> Iterator[dict]:
+            """This method yields the feed elements of the news feed for the user calling the method across every page.
+            (`Reference <https://developer.salesforce.com/docs/atlas.en-us.chatterapi.meta/chatterapi/quickreference_get_news_feed.htm>`__)
+
+            .. versionadded:: 1.6.0
+
+            :param site_id: The ID of an Experience Cloud site against which to query (optional)
+            :type site_id: str, None
+            :param page_size: The number of feed elements to retrieve per page (``100`` by default, which is the
+                              maximum)
+            :type page_size: int
+            :param since: Stops the iteration at the first feed element that is older than this date (optional)
+            :type since: datetime, str, None
+            :param max_elements: Stops the iteration once this number of feed elements has been yielded (optional)
+            :type max_elements: int, None
+            :param sort: The ``sortParam`` value (``CreatedDateDesc`` by default when ``since`` is defined)
+            :type sort: str, None
+            :returns: Generator that yields each feed element
+            :raises: :py:exc:`RuntimeError`
+            """
+            return chatter_module.iter_my_news_feed(
+                self.sfdc_object,
+                site_id=site_id,
+                page_size=page_size,
+                since=since,
+                max_elements=max_elements,
+                sort=sort,
+            )
+
+        def iter_user_news_feed(
+            self,
+            user_id: str,
+            site_id: Optional[str] = None,
+            page_size: int = const.QUERY_PARAMS.MAX_PAGE_SIZE,
+            since: Optional[Union[datetime, str]] = None,
+            max_elements: Optional[int] = None,
+            sort: Optional[str] = None,
+        ) -> Iterator[dict]:
+            """This method yields the feed elements of another user's news feed across every page.
+            (`Reference <https://developer.salesforce.com/docs/atlas.en-us.chatterapi.meta/chatterapi/quickreference_get_user_profile_feed.htm>`__)
+
+            .. versionadded:: 1.6.0
+
+            :param user_id: The ID of the user whose feed you wish to return
+            :type user_id: str
+            :param site_id: The ID of an Experience Cloud site against which to query (optional)
+            :type site_id: str, None
+            :param page_size: The number of feed elements to retrieve per page (``100`` by default, which is the
+                              maximum)
+            :type page_size: int
+            :param since: Stops the iteration at the first feed element that is older than this date (optional)
+            :type since: datetime, str, None
+            :param max_elements: Stops the iteration once this number of feed elements has been yielded (optional)
+            :type max_elements: int, None
+            :param sort: The ``sortParam`` value (``CreatedDateDesc`` by default when ``since`` is defined)
+            :type sort: str, None
+            :returns: Generator that yields each feed element
+            :raises: :py:exc:`RuntimeError`
+            """
+            return chatter_module.iter_user_news_feed(
+                self.sfdc_object,
+                user_id=user_id,
+                site_id=site_id,
+                page_size=page_size,
+                since=since,
+                max_elements=max_elements,
+                sort=sort,
+            )
+
+        def iter_group_feed(
+            self,
+            group_id: str,
+            site_id: Optional[str] = None,
+            page_size: int = const.QUERY_PARAMS.MAX_PAGE_SIZE,
+            since: Optional[Union[datetime, str]] = None,
+            max_elements: Optional[int] = None,
+            sort: Optional[str] = None,
+        ) -> Iterator[dict]:
+            """This method yields the feed elements of a group's news feed across every page.
+            (`Reference <https://developer.salesforce.com/docs/atlas.en-us.chatterapi.meta/chatterapi/quickreference_get_group_feed.htm>`__)
+
+            .. versionadded:: 1.6.0
+
+            :param group_id: The ID of the group whose feed you wish to return
+            :type group_id: str
+            :param site_id: The ID of an Experience Cloud site against which to query (optional)
+            :type site_id: str, None
+            :param page_size: The number of feed elements to retrieve per page (``100`` by default, which is the
+                              maximum)
+            :type page_size: int
+            :param since: Stops the iteration at the first feed element that is older than this date (optional)
+            :type since: datetime, str, None
+            :param max_elements: Stops the iteration once this number of feed elements has been yielded (optional)
+            :type max_elements: int, None
+            :param sort: The ``sortParam`` value (``CreatedDateDesc`` by default when ``since`` is defined)
+            :type sort: str, None
+            :returns: Generator that yields each feed element
+            :raises: :py:exc:`RuntimeError`
+            """
+            return chatter_module.iter_group_feed(
+                self.sfdc_object,
+                group_id=group_id,
+                site_id=site_id,
+                page_size=page_size,
+                since=since,
+                max_elements=max_elements,
+                sort=sort,
+            )
+
+        def get_feed_poller(
+            self,
+            group_id: Optional[str] = None,
+            user_id: Optional[str] = None,
+            site_id: Optional[str] = None,
+            poll_interval: Union[int, float] = const.CHATTER_SETTINGS.DEFAULT_POLL_INTERVAL_SECONDS,
+            page_size: int = const.CHATTER_SETTINGS.DEFAULT_POLL_PAGE_SIZE,
+            include_existing: bool = False,
+        ) -> chatter_module.FeedPoller:
+            """This method returns a poller that detects new feed elements using the change-detection URLs of a feed.
+
+            .. versionadded:: 1.6.0
+
+            :param group_id: The ID of the group whose feed should be polled (optional)
+            :type group_id: str, None
+            :param user_id: The ID of the user whose news feed should be polled when no group is defined (optional)
+            :type user_id: str, None
+            :param site_id: The ID of an Experience Cloud site against which to query (optional)
+            :type site_id: str, None
+            :param poll_interval: The number of seconds to wait between polls when iterating (``5`` by default)
+            :type poll_interval: int, float
+            :param page_size: The number of feed elements to retrieve when the feed has changed (``25`` by default)
+            :type page_size: int
+            :param include_existing: Determines if the feed elements of the first poll should be returned
+                                     (``False`` by default)
+            :type include_existing: bool
+            :returns: The :py:class:`salespyforce.chatter.FeedPoller` object (the news feed of the calling user is
+                      polled by default)
+            """
+            return chatter_module.FeedPoller(
+                self.sfdc_object,
+                group_id=group_id,
+                user_id=user_id,
+                site_id=site_id,
+                poll_interval=poll_interval,
+                page_size=page_size,
+                include_existing=include_existing,
+            )
+
+        def get_feed_elements(
+            self, feed_element_ids: Union[list, tuple, set], site_id: Optional[str] = None, max_workers: int = 1
+        ) -> dict:
+            """This method retrieves many feed elements using batched requests of up to 500 feed elements.
+            (`Reference <https://developer.salesforce.com/docs/atlas.en-us.chatterapi.meta/chatterapi/connect_resources_feed_element_batch.htm>`__)
+
+            .. versionadded:: 1.6.0
+
+            :param feed_element_ids: The IDs of the feed elements to retrieve
+            :type feed_element_ids: list, tuple, set
+            :param site_id: The ID of an Experience Cloud site against which to query (optional)
+            :type site_id: str, None
+            :param max_workers: The maximum number of batches to retrieve concurrently (``1`` by default)
+            :type max_workers: int
+            :returns: Dictionary mapping each feed element ID to its feed element (or ``None`` if it could not be
+                      retrieved)
+            :raises: :py:exc:`RuntimeError`
+            """
+            return chatter_module.get_feed_elements(
+                self.sfdc_object, feed_element_ids=feed_element_ids, site_id=site_id, max_workers=max_workers
+            )
+
+        def get_comment_threads(
+            self,
+            feed_element_ids: Union[list, tuple, set],
+            site_id: Optional[str] = None,
+            max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+        ) -> dict:
+            """This method retrieves the complete comment threads of many feed elements.
+            (`Reference <https://developer.salesforce.com/docs/atlas.en-us.chatterapi.meta/chatterapi/connect_resources_feed_element_capability_comments_items.htm>`__)
+
+            .. versionadded:: 1.6.0
+
+            :param feed_element_ids: The IDs of the feed elements whose comments should be retrieved
+            :type feed_element_ids: list, tuple, set
+            :param site_id: The ID of an Experience Cloud site against which to query (optional)
+            :type site_id: str, None
+            :param max_workers: The maximum number of comment threads to retrieve concurrently (``8`` by default)
+            :type max_workers: int
+            :returns: Dictionary mapping each feed element ID to its list of comments (or ``None`` if it could not
+                      be retrieved)
+            :raises: :py:exc:`RuntimeError`
+            """
+            return chatter_module.get_comment_threads(
+                self.sfdc_object, feed_element_ids=feed_element_ids, site_id=site_id, max_workers=max_workers
+            )
+
+        def get_record_feeds(
+            self,
+            subject_ids: Union[list, tuple, set],
+            site_id: Optional[str] = None,
+            max_elements: Optional[int] = const.CHATTER_SETTINGS.DEFAULT_RECORD_FEED_ELEMENTS,
+            since: Optional[Union[datetime, str]] = None,
+            max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+            requests_per_second: Optional[Union[int, float]] = None,
+        ) -> dict:
+            """This method retrieves the record feeds of many records (e.g. groups, users or cases) concurrently.
+            (`Reference <https://developer.salesforce.com/docs/atlas.en-us.chatterapi.meta/chatterapi/connect_resources_record_feed_elements.htm>`__)
+
+            .. versionadded:: 1.6.0
+
+            :param subject_ids: The IDs of the records whose feeds should be retrieved
+            :type subject_ids: list, tuple, set
+            :param site_id: The ID of an Experience Cloud site against which to query (optional)
+            :type site_id: str, None
+            :param max_elements: The maximum number of feed elements to retrieve per record (``20`` by default and
+                                 ``None`` retrieves every feed element)
+            :type max_elements: int, None
+            :param since: Excludes the feed elements that are older than this date (optional)
+            :type since: datetime, str, None
+            :param max_workers: The maximum number of record feeds to retrieve concurrently (``8`` by default)
+            :type max_workers: int
+            :param requests_per_second: The maximum number of API calls to perform per second (unlimited by default)
+            :type requests_per_second: int, float, None
+            :returns: Dictionary mapping each subject ID to its list of feed elements (or ``None`` if the feed could
+                      not be retrieved)
+            :raises: :py:exc:`RuntimeError`
+            """
+            return chatter_module.get_record_feeds(
+                self.sfdc_object,
+                subject_ids=subject_ids,
+                site_id=site_id,
+                max_elements=max_elements,
+                since=since,
+                max_workers=max_workers,
+                requests_per_second=requests_per_second,
+            )
+
         def post_feed_item(
             self,
             subject_id: str,
@@ -1192,6 +2421,83 @@ class Salesforce:
                 created_by_id=created_by_id,
             )
 
+        def post_feed_items(
+            self,
+            items: Union[list, tuple],
+            site_id: Optional[str] = None,
+            max_workers: int = 1,
+            message_template: Optional[chatter_module.MessageTemplate] = None,
+        ) -> list:
+            """This method publishes many Chatter feed items using batched requests of up to 500 feed items.
+            (`Reference <https://developer.salesforce.com/docs/atlas.en-us.chatterapi.meta/chatterapi/connect_resources_feed_element_batch_post.htm>`__)
+
+            .. versionadded:: 1.6.0
+
+            Each item is a dictionary with the ``subject_id`` value and either the ``message_text`` or
+            ``message_segments`` value, along with an optional ``created_by_id`` value. Items without a message can
+            instead be rendered from a :py:class:`salespyforce.chatter.MessageTemplate` using their ``template_values``.
+
+            :param items: The dictionaries that define the feed items to publish
+            :type items: list, tuple
+            :param site_id: The ID of an Experience Cloud site against which to query (optional)
+            :type site_id: str, None
+            :param max_workers: The maximum number of batches to submit concurrently (``1`` by default)
+            :type max_workers: int
+            :param message_template: The template used to render the message of the items without a message (optional)
+            :type message_template: class[salespyforce.chatter.MessageTemplate], None
+            :returns: List of dictionaries in the order of the items with the ``subject_id``, ``id`` and ``error`` values
+            :raises: :py:exc:`RuntimeError`,
+                     :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
+            """
+            return chatter_module.post_feed_items(
+                self.sfdc_object,
+                items=items,
+                site_id=site_id,
+                max_workers=max_workers,
+                message_template=message_template,
+            )
+
+        def post_comments(
+            self,
+            comments: Union[list, tuple],
+            site_id: Optional[str] = None,
+            max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+            requests_per_second: Optional[Union[int, float]] = None,
+            message_template: Optional[chatter_module.MessageTemplate] = None,
+        ) -> list:
+            """This method publishes many comments on Chatter feed elements using concurrent, rate-limited requests.
+            (`Reference <https://developer.salesforce.com/docs/atlas.en-us.chatterapi.meta/chatterapi/quickreference_post_comment_to_feed_element.htm>`__)
+
+            .. versionadded:: 1.6.0
+
+            Each comment is a dictionary with the ``feed_element_id`` value and either the ``message_text`` or
+            ``message_segments`` value, along with an optional ``created_by_id`` value. Comments without a message can
+            instead be rendered from a :py:class:`salespyforce.chatter.MessageTemplate` using their ``template_values``.
+
+            :param comments: The dictionaries that define the comments to publish
+            :type comments: list, tuple
+            :param site_id: The ID of an Experience Cloud site against which to query (optional)
+            :type site_id: str, None
+            :param max_workers: The maximum number of comments to publish concurrently (``8`` by default)
+            :type max_workers: int
+            :param requests_per_second: The maximum number of API calls to perform per second (unlimited by default)
+            :type requests_per_second: int, float, None
+            :param message_template: The template used to render the message of the comments without a message
+                                     (optional)
+            :type message_template: class[salespyforce.chatter.MessageTemplate], None
+            :returns: List of dictionaries in the order of the comments with the ``feed_element_id``, ``id`` and
+                      ``error`` values
+            :raises: :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
+            """
+            return chatter_module.post_comments(
+                self.sfdc_object,
+                comments=comments,
+                site_id=site_id,
+                max_workers=max_workers,
+                requests_per_second=requests_per_second,
+                message_template=message_template,
+            )
+
     class Knowledge:
         """This class includes methods associated with Salesforce Knowledge."""
 
@@ -1236,6 +2542,31 @@ class Salesforce:
                 include_archived=include_archived,
             )
 
+        def check_for_existing_articles(
+            self,
+            titles: Union[list, tuple, set],
+            sobject: Optional[str] = None,
+            include_archived: bool = False,
+        ) -> dict:
+            """This method checks to see if articles already exist for many titles using batched ``IN`` queries.
+            (`Reference <https://developer.salesforce.com/docs/atlas.en-us.soql_sosl.meta/soql_sosl/sforce_api_calls_soql_select_quotedstringescapes.htm>`__)
+
+            .. versionadded:: 1.6.0
+
+            :param titles: The titles of the knowledge articles for which to check
+            :type titles: list, tuple, set
+            :param sobject: The Salesforce object to query (``Knowledge__kav`` by default)
+            :type sobject: str, None
+            :param include_archived: Determines if archived articles should be included (``False`` by default)
+            :type include_archived: bool
+            :returns: Dictionary mapping each title to an ``(Article ID, Article Number)`` tuple, or ``('', '')`` if
+                      not found
+            :raises: :py:exc:`RuntimeError`
+            """
+            return knowledge_module.check_for_existing_articles(
+                self.sfdc_object, titles=titles, sobject=sobject, include_archived=include_archived
+            )
+
         def get_article_id_from_number(
             self,
             article_number: Union[str, int],
@@ -1250,6 +2581,9 @@ class Salesforce:
                The ability to retrieve the article URI/URL rather than the ID will be moved to a separate function in
                a future release.
 
+            .. versionchanged:: 1.6.0
+               The Article ID is retrieved from (and added to) the article number index of the core object when defined.
+
             :param article_number: The Article Number to query
             :type article_number: str, int
             :param sobject: The Salesforce object to query (``Knowledge__kav`` by default)
@@ -1265,6 +2599,40 @@ class Salesforce:
                 self.sfdc_object, article_number=article_number, sobject=sobject, return_uri=return_uri
             )
 
+        def get_article_ids_from_numbers(
+            self,
+            article_numbers: Union[list, tuple, set],
+            sobject: Optional[str] = None,
+        ) -> dict:
+            """This method returns the Article IDs for many article numbers using batched ``IN`` queries.
+
+            .. versionadded:: 1.6.0
+
+            :param article_numbers: The article numbers to query
+            :type article_numbers: list, tuple, set
+            :param sobject: The Salesforce object to query (``Knowledge__kav`` by default)
+            :type sobject: str, None
+            :returns: Dictionary mapping each article number to its Article ID, or a blank string if no article is found
+            :raises: :py:exc:`RuntimeError`
+            """
+            return knowledge_module.get_article_ids_from_numbers(
+                self.sfdc_object, article_numbers=article_numbers, sobject=sobject
+            )
+
+        def load_article_number_index(self, sobject: Optional[str] = None, full_refresh: bool = False) -> int:
+            """This method loads the article number index of the core object with a single paged query.
+
+            .. versionadded:: 1.6.0
+
+            :param sobject: The Salesforce object to query (``Knowledge__kav`` by default)
+            :type sobject: str, None
+            :param full_refresh: Determines if the index should be cleared and fully reloaded (``False`` by default)
+            :type full_refresh: bool
+            :returns: The number of article versions that were loaded
+            :raises: :py:exc:`RuntimeError`
+            """
+            return knowledge_module.load_article_number_index(self.sfdc_object, sobject=sobject, full_refresh=full_refresh)
+
         def get_articles_list(
             self,
             query: Optional[str] = None,
@@ -1272,10 +2640,15 @@ class Salesforce:
             order: Optional[str] = None,
             page_size: int = const.QUERY_PARAMS.DEFAULT_PAGE_SIZE,
             page_num: int = const.QUERY_PARAMS.DEFAULT_PAGE_NUM,
-        ) -> list:
+            articles_only: bool = False,
+        ) -> Union[dict, list]:
             """This method retrieves a list of knowledge articles.
             (`Reference <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_knowledge_support_artlist.htm>`__)
 
+            .. versionchanged:: 1.6.0
+               The optional ``articles_only`` parameter can be used to return only the list of articles rather than
+               the full response data that includes the page URLs.
+
             :param query: A SOQL query with which to filter the results (optional)
             :type query: str, None
             :param sort: Optionally sort the results with one of the following values: ``LastPublishedDate``,
@@ -1287,12 +2660,57 @@ class Salesforce:
             :type page_size: int
             :param page_num: The starting page number (``1`` by default)
             :type page_num: int
-            :returns: The list of retrieved knowledge articles
+            :param articles_only: Returns only the list of articles rather than the full response
+                                  (``False`` by default)
+            :type articles_only: bool
+            :returns: The response data with the list of retrieved knowledge articles (or only the list of articles)
             :raises: :py:exc:`RuntimeError`
             """
             # TODO: Update to use constants for page_size and page_num
             return knowledge_module.get_articles_list(
-                self.sfdc_object, query=query, sort=sort, order=order, page_size=page_size, page_num=page_num
+                self.sfdc_object,
+                query=query,
+                sort=sort,
+                order=order,
+                page_size=page_size,
+                page_num=page_num,
+                articles_only=articles_only,
+            )
+
+        def iter_articles(
+            self,
+            query: Optional[str] = None,
+            sort: Optional[str] = None,
+            order: Optional[str] = None,
+            page_size: int = const.QUERY_PARAMS.MAX_PAGE_SIZE,
+            parallel_pages: int = 1,
+        ) -> Iterator[dict]:
+            """This method yields every knowledge article in the list of articles while retrieving each page as needed.
+            (`Reference <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_knowledge_support_artlist.htm>`__)
+
+            .. versionadded:: 1.6.0
+
+            :param query: A SOQL query with which to filter the results (optional)
+            :type query: str, None
+            :param sort: Optionally sort the results with one of the following values: ``LastPublishedDate``,
+                         ``CreatedDate``, ``Title``, or ``ViewScore``
+            :type sort: str, None
+            :param order: Optionally define the ORDER BY as ``ASC`` or ``DESC``
+            :type order: str, None
+            :param page_size: The number of results per page (``100`` by default)
+            :type page_size: int
+            :param parallel_pages: The number of pages to retrieve concurrently (``1`` by default)
+            :type parallel_pages: int
+            :returns: Generator that yields each knowledge article
+            :raises: :py:exc:`RuntimeError`
+            """
+            return knowledge_module.iter_articles(
+                self.sfdc_object,
+                query=query,
+                sort=sort,
+                order=order,
+                page_size=page_size,
+                parallel_pages=parallel_pages,
             )
 
         def get_article_details(
@@ -1327,6 +2745,51 @@ class Salesforce:
                 use_knowledge_articles_endpoint=use_knowledge_articles_endpoint,
             )
 
+        def get_articles_details(
+            self,
+            article_ids: Union[str, list, tuple, set],
+            fields: Optional[Union[str, list, tuple]] = None,
+            sobject: Optional[str] = None,
+            use_collections_endpoint: bool = False,
+            fallback_to_individual: bool = True,
+            max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+        ) -> dict:
+            """This method retrieves details for multiple knowledge articles using chunked bulk requests.
+            (`Reference <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_composite_sobjects_collections_retrieve.htm>`__)
+
+            .. versionadded:: 1.6.0
+
+            :param article_ids: One or more Article IDs for which to retrieve details
+            :type article_ids: str, list, tuple, set
+            :param fields: The fields to retrieve as a list or comma-separated string (all fields by default)
+            :type fields: str, list, tuple, None
+            :param sobject: The Salesforce object to query (``Knowledge__kav`` by default)
+            :type sobject: str, None
+            :param use_collections_endpoint: Retrieves the articles with the sObject Collections endpoint rather than
+                                             a SOQL query (``False`` by default and requires the ``fields`` parameter)
+            :type use_collections_endpoint: bool
+            :param fallback_to_individual: Retrieves the articles individually when a bulk request fails
+                                           (``True`` by default)
+            :type fallback_to_individual: bool
+            :param max_workers: The maximum number of concurrent requests when retrieving articles individually
+                                (``8`` by default)
+            :type max_workers: int
+            :returns: Dictionary mapping each provided Article ID to its details (or ``None`` if not retrieved)
+            :raises: :py:exc:`RuntimeError`,
+                     :py:exc:`TypeError`,
+                     :py:exc:`salespyforce.errors.exceptions.APIRequestError`,
+                     :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+            """
+            return knowledge_module.get_articles_details(
+                self.sfdc_object,
+                article_ids=article_ids,
+                fields=fields,
+                sobject=sobject,
+                use_collections_endpoint=use_collections_endpoint,
+                fallback_to_individual=fallback_to_individual,
+                max_workers=max_workers,
+            )
+
         def get_validation_status(
             self,
             article_id: Optional[str] = None,
@@ -1482,6 +2945,40 @@ class Salesforce:
             """
             return knowledge_module.create_draft_from_online_article(self.sfdc_object, article_id=article_id, unpublish=unpublish)
 
+        def create_drafts_from_online_articles(
+            self,
+            article_ids: Union[list, tuple, set],
+            unpublish: bool = False,
+            chunk_size: int = const.CONCURRENCY_SETTINGS.MAX_STANDARD_ACTION_INPUTS,
+            max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+        ) -> dict:
+            """This method creates draft knowledge articles from many online articles using batched standard actions.
+            (`Reference <https://developer.salesforce.com/docs/atlas.en-us.knowledge_dev.meta/knowledge_dev/actions_obj_knowledge.htm#createDraftFromOnlineKnowledgeArticle>`__)
+
+            .. versionadded:: 1.6.0
+
+            :param article_ids: The IDs of the online articles from which to create the drafts
+            :type article_ids: list, tuple, set
+            :param unpublish: Determines if the online articles should be unpublished when the drafts are created
+                              (``False`` by default)
+            :type unpublish: bool
+            :param chunk_size: The maximum number of inputs to include in each action (``200`` by default)
+            :type chunk_size: int
+            :param max_workers: The maximum number of actions to perform concurrently (``8`` by default)
+            :type max_workers: int
+            :returns: Dictionary mapping each provided Article ID to a dictionary with the ``draft_id`` value of the
+                      new draft and the ``error`` message (if any)
+            :raises: :py:exc:`ValueError`,
+                     :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
+            """
+            return knowledge_module.create_drafts_from_online_articles(
+                self.sfdc_object,
+                article_ids=article_ids,
+                unpublish=unpublish,
+                chunk_size=chunk_size,
+                max_workers=max_workers,
+            )
+
         def create_draft_from_master_version(
             self,
             article_id: Optional[str] = None,
@@ -1557,6 +3054,48 @@ class Salesforce:
                 self.sfdc_object, article_id_list=article_id_list, major_version=major_version
             )
 
+        def publish_articles(
+            self,
+            article_ids: Union[list, tuple, set],
+            major_version: bool = True,
+            chunk_size: int = const.CONCURRENCY_SETTINGS.DEFAULT_PUBLISH_CHUNK_SIZE,
+            max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+            requests_per_second: Optional[Union[int, float]] = None,
+            bisect_failures: bool = True,
+        ) -> dict:
+            """This method publishes many knowledge article drafts using concurrent chunks and reports on each article.
+            (`Reference <https://developer.salesforce.com/docs/atlas.en-us.knowledge_dev.meta/knowledge_dev/actions_obj_knowledge.htm#publishKnowledgeArticles>`__)
+
+            .. versionadded:: 1.6.0
+
+            :param article_ids: The Article IDs to be published
+            :type article_ids: list, tuple, set
+            :param major_version: Determines if the published articles should be major versions (``True`` by default)
+            :type major_version: bool
+            :param chunk_size: The maximum number of articles to publish in each action (``50`` by default)
+            :type chunk_size: int
+            :param max_workers: The maximum number of chunks to publish concurrently (``8`` by default)
+            :type max_workers: int
+            :param requests_per_second: The maximum number of API calls to perform per second (unlimited by default)
+            :type requests_per_second: int, float, None
+            :param bisect_failures: Determines if failed chunks should be split and retried to isolate the failed
+                                    articles (``True`` by default)
+            :type bisect_failures: bool
+            :returns: Dictionary mapping each Article ID to a dictionary with the ``published`` Boolean value and
+                      the ``error`` message (if any)
+            :raises: :py:exc:`ValueError`,
+                     :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
+            """
+            return knowledge_module.publish_articles(
+                self.sfdc_object,
+                article_ids=article_ids,
+                major_version=major_version,
+                chunk_size=chunk_size,
+                max_workers=max_workers,
+                requests_per_second=requests_per_second,
+                bisect_failures=bisect_failures,
+            )
+
         def assign_data_category(self, article_id: str, category_group_name: str, category_name: str):
             """This method assigns a single data category for a knowledge article.
             (`Reference <https://itsmemohit.medium.com/quick-win-15-salesforce-knowledge-rest-apis-bb0725b2040e>`__)
@@ -1576,6 +3115,37 @@ class Salesforce:
                 self.sfdc_object, article_id=article_id, category_group_name=category_group_name, category_name=category_name
             )
 
+        def assign_data_categories(
+            self,
+            assignments: Union[list, tuple],
+            skip_existing: bool = True,
+            max_workers: int = 1,
+        ) -> list:
+            """This method assigns data categories for many knowledge articles using sObject Collections inserts.
+            (`Reference <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_composite_sobjects_collections_create.htm>`__)
+
+            .. versionadded:: 1.6.0
+
+            :param assignments: The ``(article_id, category_group_name, category_name)`` tuples to assign
+            :type assignments: list, tuple
+            :param skip_existing: Determines if assignments that already exist should be skipped (``True`` by default)
+            :type skip_existing: bool
+            :param max_workers: The maximum number of collection inserts to perform concurrently (``1`` by default)
+            :type max_workers: int
+            :returns: List of dictionaries in the order of the assignments with the ``article_id``,
+                      ``category_group_name``, ``category_name``, ``status`` (``created``, ``skipped`` or ``failed``),
+                      ``id`` and ``error`` values
+            :raises: :py:exc:`RuntimeError`,
+                     :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`,
+                     :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
+            """
+            return knowledge_module.assign_data_categories(
+                self.sfdc_object,
+                assignments=assignments,
+                skip_existing=skip_existing,
+                max_workers=max_workers,
+            )
+
         def archive_article(self, article_id: str):
             """This function archives a published knowledge article.
             (`Reference <https://developer.salesforce.com/docs/atlas.en-us.knowledge_dev.meta/knowledge_dev/knowledge_REST_archive_master_version.htm>`__)
@@ -1589,6 +3159,26 @@ class Salesforce:
             """
             return knowledge_module.archive_article(self.sfdc_object, article_id=article_id)
 
+        def archive_articles(
+            self,
+            article_ids: Union[list, tuple, set],
+            max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+        ) -> dict:
+            """This method archives many published knowledge articles using Composite Batch subrequests.
+            (`Reference <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_composite_batch.htm>`__)
+
+            .. versionadded:: 1.6.0
+
+            :param article_ids: The IDs of the articles to archive
+            :type article_ids: list, tuple, set
+            :param max_workers: The maximum number of batches to submit concurrently (``8`` by default)
+            :type max_workers: int
+            :returns: Dictionary mapping each Article ID to a dictionary with the ``archived`` Boolean value and the
+                      ``error`` message (if any)
+            :raises: :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
+            """
+            return knowledge_module.archive_articles(self.sfdc_object, article_ids=article_ids, max_workers=max_workers)
+
         def delete_article_draft(
             self,
             version_id: str,
@@ -1620,6 +3210,171 @@ class Salesforce:
                 use_knowledge_management_endpoint=use_knowledge_management_endpoint,
             )
 
+        def delete_article_drafts(
+            self,
+            version_ids: Union[list, tuple, set],
+            sobject: Optional[str] = None,
+            use_knowledge_management_endpoint: bool = True,
+            max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+        ) -> dict:
+            """This method deletes many unpublished knowledge article drafts using Composite Batch subrequests.
+            (`Reference <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_composite_batch.htm>`__)
+
+            .. versionadded:: 1.6.0
+
+            :param version_ids: The 15-character or 18-character ``Id`` (Knowledge Article Version ID) values
+            :type version_ids: list, tuple, set
+            :param sobject: The Salesforce object to query (``Knowledge__kav`` by default)
+            :type sobject: str, None
+            :param use_knowledge_management_endpoint: Leverage the ``/knowledgeManagement/articleVersions/masterVersions/``
+                                                      endpoint rather than the ``/sobjects/Knowledge__kav/`` endpoint
+                                                      (``True`` by default)
+            :type use_knowledge_management_endpoint: bool
+            :param max_workers: The maximum number of batches to submit concurrently (``8`` by default)
+            :type max_workers: int
+            :returns: Dictionary mapping each version ID to a dictionary with the ``deleted`` Boolean value and the
+                      ``error`` message (if any)
+            :raises: :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
+            """
+            return knowledge_module.delete_article_drafts(
+                self.sfdc_object,
+                version_ids=version_ids,
+                sobject=sobject,
+                use_knowledge_management_endpoint=use_knowledge_management_endpoint,
+                max_workers=max_workers,
+            )
+
+        def export_knowledge(
+            self,
+            output_path: str,
+            fields: Optional[Union[str, list, tuple]] = None,
+            sobject: Optional[str] = None,
+            include_categories: bool = True,
+            include_images: bool = True,
+            rich_text_fields: Optional[Union[str, list, tuple]] = None,
+            archive_format: Optional[str] = None,
+            page_size: int = const.EXPORT_SETTINGS.DEFAULT_PAGE_SIZE,
+            max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+            requests_per_second: Optional[Union[int, float]] = None,
+            min_remaining_api_requests: Optional[int] = const.EXPORT_SETTINGS.DEFAULT_MIN_REMAINING_API_REQUESTS,
+        ) -> dict:
+            """This method exports every knowledge article version with its data categories and images to a directory.
+
+            .. versionadded:: 1.6.0
+
+            The progress of the export is recorded in a checkpoint file within the output directory so that an
+            interrupted export resumes where it stopped when the method is called again with the same output path.
+
+            :param output_path: The directory where the export should be written
+            :type output_path: str
+            :param fields: The fields to export as a list or comma-separated string (all fields by default)
+            :type fields: str, list, tuple, None
+            :param sobject: The Salesforce object to export (``Knowledge__kav`` by default)
+            :type sobject: str, None
+            :param include_categories: Determines if the data category selections should be exported
+                                       (``True`` by default)
+            :type include_categories: bool
+            :param include_images: Determines if the rich text images should be exported (``True`` by default)
+            :type include_images: bool
+            :param rich_text_fields: The rich text fields to scan for images (identified with a describe call
+                                     by default)
+            :type rich_text_fields: str, list, tuple, None
+            :param archive_format: The optional archive format (``zip``, ``tar``, ``gztar``, ``bztar`` or ``xztar``)
+            :type archive_format: str, None
+            :param page_size: The number of article versions to retrieve per page (``2000`` by default, or ``200``
+                              when all fields are exported)
+            :type page_size: int
+            :param max_workers: The maximum number of concurrent API calls (``8`` by default)
+            :type max_workers: int
+            :param requests_per_second: The maximum number of API calls to perform per second (unlimited by default)
+            :type requests_per_second: int, float, None
+            :param min_remaining_api_requests: The number of remaining daily API requests below which the export
+                                               stops (``1000`` by default or ``None`` to disable the check)
+            :type min_remaining_api_requests: int, None
+            :returns: The manifest of the export (including the ``archive`` path if an archive was created)
+            :raises: :py:exc:`RuntimeError`,
+                     :py:exc:`salespyforce.errors.exceptions.APIRequestLimitError`,
+                     :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+            """
+            return knowledge_export_module.export_knowledge(
+                self.sfdc_object,
+                output_path=output_path,
+                fields=fields,
+                sobject=sobject,
+                include_categories=include_categories,
+                include_images=include_images,
+                rich_text_fields=rich_text_fields,
+                archive_format=archive_format,
+                page_size=page_size,
+                max_workers=max_workers,
+                requests_per_second=requests_per_second,
+                min_remaining_api_requests=min_remaining_api_requests,
+            )
+
+        def import_knowledge(
+            self,
+            input_path: str,
+            fields: Optional[Union[str, list, tuple]] = None,
+            sobject: Optional[str] = None,
+            match_by: str = const.IMPORT_SETTINGS.MATCH_BY_TITLE,
+            publish_status: Optional[str] = const.SOBJECT_FIELD_VALUES.ONLINE,
+            include_categories: bool = True,
+            publish: bool = True,
+            major_version: bool = True,
+            journal_path: Optional[str] = None,
+            max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+        ) -> dict:
+            """This method imports the knowledge articles of an export directory as drafts and optionally publishes them.
+
+            .. versionadded:: 1.6.0
+
+            The outcome of every article is recorded in a journal file so that an interrupted import resumes without
+            creating, assigning or publishing anything a second time.
+
+            :param input_path: The export directory that contains the ``manifest.json`` file
+            :type input_path: str
+            :param fields: The fields to import as a list or comma-separated string (the fields that are createable
+                           and updateable in the target org by default)
+            :type fields: str, list, tuple, None
+            :param sobject: The Salesforce object into which to import the articles (``Knowledge__kav`` by default)
+            :type sobject: str, None
+            :param match_by: Identifies existing articles by their ``title`` (default) or article ``number``
+            :type match_by: str
+            :param publish_status: Only imports the exported versions with this publish status (``Online`` by
+                                   default or ``None`` to import every version)
+            :type publish_status: str, None
+            :param include_categories: Determines if the data category selections should be assigned
+                                       (``True`` by default)
+            :type include_categories: bool
+            :param publish: Determines if the imported drafts should be published (``True`` by default)
+            :type publish: bool
+            :param major_version: Determines if the published articles should be major versions (``True`` by default)
+            :type major_version: bool
+            :param journal_path: The path to the journal file (``.import_journal.json`` within the input path by
+                                 default)
+            :type journal_path: str, None
+            :param max_workers: The maximum number of concurrent API calls (``8`` by default)
+            :type max_workers: int
+            :returns: Dictionary with the ``articles`` report (keyed by the exported ``Id``) and the ``created``,
+                      ``updated``, ``failed``, ``categories_assigned`` and ``published`` totals
+            :raises: :py:exc:`RuntimeError`,
+                     :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`,
+                     :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
+            """
+            return knowledge_import_module.import_knowledge(
+                self.sfdc_object,
+                input_path=input_path,
+                fields=fields,
+                sobject=sobject,
+                match_by=match_by,
+                publish_status=publish_status,
+                include_categories=include_categories,
+                publish=publish,
+                major_version=major_version,
+                journal_path=journal_path,
+                max_workers=max_workers,
+            )
+
 
 def define_connection_info() -> dict:
     """This function prompts the user for the connection information.
@@ -4,7 +4,7 @@
 :Synopsis:          Collection of exception classes relating to the SalesPyForce library
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff (via GPT-5.5-codex)
-:Modified Date:     15 Jul 2026
+:Modified Date:     18 Oct 2026
 """
 
 from __future__ import annotations
@@ -171,6 +171,19 @@ class APIRequestError(SalesPyForceError):
         super().__init__(*args)
 
 
+class APIRequestLimitError(SalesPyForceError):
+    """This exception is used when the remaining API requests for the org have fallen below a defined threshold.
+
+    .. versionadded:: 1.6.0
+    """
+
+    def __init__(self, *args, **kwargs):
+        default_msg = 'The remaining API requests for the org have fallen below the defined threshold.'
+        if not (args or kwargs):
+            args = (default_msg,)
+        super().__init__(*args)
+
+
 class GETRequestError(SalesPyForceError):
     """This exception is used for generic GET request errors when there is not a more specific exception."""
 
@@ -3,17 +3,21 @@
 :Module:            salespyforce.knowledge
 :Synopsis:          Defines the Knowledge-related functions associated with the Salesforce API
 :Created By:        Jeff Shurtliff
-:Last Modified:     Jeff Shurtliff (via GPT-5.5-codex)
-:Modified Date:     15 Jul 2026
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
 """
 
 from __future__ import annotations
 
-from typing import Optional, Tuple, Union
+import re
+from datetime import datetime, timezone
+from typing import Iterator, Optional, Tuple, Union
 
+from . import api, errors
+from . import cache as cache_module
 from . import constants as const
-from . import errors
-from .utils import log_utils
+from . import soql as soql_module
+from .utils import concurrency_utils, core_utils, log_utils
 from .utils.core_utils import ensure_ends_with
 
 # Initialize logging
@@ -32,6 +36,9 @@ def check_for_existing_article(
     (`Reference 1 <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/dome_query.htm>`__,
     `Reference 2 <https://developer.salesforce.com/docs/atlas.en-us.knowledge_dev.meta/knowledge_dev/knowledge_development_soql_sosl_intro.htm>`__)
 
+    .. versionchanged:: 1.6.0
+       The title is now escaped within the query using the :py:mod:`salespyforce.soql` query builder.
+
     .. versionchanged:: 1.2.2
        You can now specify whether archived articles are included in the query results.
 
@@ -50,18 +57,19 @@ def check_for_existing_article(
     :returns: The Article Number, Article ID, or both, if found, or a blank string if not found
     :raises: :py:exc:`TypeError`
     """
-    # Prepare the SOQL query
+    # Prepare the SOQL query template
     sobject = _validate_knowledge_sobject(sobject)
-    query = f"""
-        SELECT {const.SOBJECT_FIELDS.ID}, {const.SOBJECT_FIELDS.ARTICLE_NUMBER} 
-        FROM {sobject} 
-        WHERE {const.SOBJECT_FIELDS.TITLE} = '{title}'
-    """
+    query_template = (
+        f'SELECT {const.SOBJECT_FIELDS.ID}, {const.SOBJECT_FIELDS.ARTICLE_NUMBER} '
+        f'FROM {sobject} WHERE {const.SOBJECT_FIELDS.TITLE} = :title'
+    )
     if not include_archived:
-        query += f" AND {const.SOBJECT_FIELDS.PUBLISH_STATUS} != '{const.SOBJECT_FIELD_VALUES.ARCHIVED}'"
+        query_template += f' AND {const.SOBJECT_FIELDS.PUBLISH_STATUS} != :archived'
 
     # Perform and parse the SOQL query
-    response = sfdc_object.soql_query(query, replace_quotes=False)
+    response = soql_module.compile_query(query_template).execute(
+        sfdc_object, title=title, archived=const.SOBJECT_FIELD_VALUES.ARCHIVED
+    )
     if response.get(const.RESPONSE_KEYS.TOTAL_SIZE) > 0:
         if return_id:
             return_value = response[const.RESPONSE_KEYS.RECORDS][0][const.SOBJECT_FIELDS.ID]
@@ -79,6 +87,55 @@ def check_for_existing_article(
     return return_value
 
 
+def check_for_existing_articles(
+    sfdc_object,
+    titles: Union[list, tuple, set],
+    sobject: Optional[str] = None,
+    include_archived: bool = False,
+) -> dict:
+    """This function checks to see if articles already exist for many titles using batched ``IN`` queries.
+    (`Reference <https://developer.salesforce.com/docs/atlas.en-us.soql_sosl.meta/soql_sosl/sforce_api_calls_soql_select_quotedstringescapes.htm>`__)
+
+    .. versionadded:: 1.6.0
+
+    The titles are escaped and split into as few ``Title IN (...)`` queries as the SOQL and URI length limits allow.
+    Titles are matched without regard to case (as with SOQL) and the first matching article is returned for each.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param titles: The titles of the knowledge articles for which to check
+    :type titles: list, tuple, set
+    :param sobject: The Salesforce object to query (``Knowledge__kav`` by default)
+    :type sobject: str, None
+    :param include_archived: Determines if archived articles should be included (``False`` by default)
+    :type include_archived: bool
+    :returns: Dictionary mapping each title to an ``(Article ID, Article Number)`` tuple, or ``('', '')`` if not found
+    :raises: :py:exc:`RuntimeError`
+    """
+    # Prepare the SOQL query template
+    sobject = _validate_knowledge_sobject(sobject)
+    titles = list(dict.fromkeys(titles or []))
+    query_template = (
+        f'SELECT {const.SOBJECT_FIELDS.ID}, {const.SOBJECT_FIELDS.ARTICLE_NUMBER}, {const.SOBJECT_FIELDS.TITLE} '
+        f'FROM {sobject} WHERE {const.SOBJECT_FIELDS.TITLE} IN :titles'
+    )
+    if not include_archived:
+        query_template += f' AND {const.SOBJECT_FIELDS.PUBLISH_STATUS} != :archived'
+
+    # Perform the queries for each chunk of titles and map the results by title
+    existing_articles = {}
+    if titles:
+        records = soql_module.compile_query(query_template).query_all(
+            sfdc_object, titles=titles, archived=const.SOBJECT_FIELD_VALUES.ARCHIVED
+        )
+        for record in records:
+            existing_articles.setdefault(
+                str(record.get(const.SOBJECT_FIELDS.TITLE)).casefold(),
+                (record[const.SOBJECT_FIELDS.ID], record[const.SOBJECT_FIELDS.ARTICLE_NUMBER]),
+            )
+    return {_title: existing_articles.get(str(_title).casefold(), ('', '')) for _title in titles}
+
+
 def get_article_id_from_number(
     sfdc_object,
     article_number: Union[str, int],
@@ -93,6 +150,12 @@ def get_article_id_from_number(
        The ability to retrieve the article URI/URL rather than the ID will be moved to a separate function in
        a future release.
 
+    .. versionchanged:: 1.6.0
+       The Article ID is retrieved from (and added to) the article number index of the core object when defined.
+       The article number is now escaped within the query using the :py:mod:`salespyforce.soql` query builder.
+       An article whose ``ArticleNumber`` exactly matches the zero-padded article number is preferred over other
+       partial matches, and only exact matches are added to the index.
+
     .. versionchanged:: 1.4.0
        A logic issue has been fixed and improved to make this function more robust and stable.
 
@@ -111,18 +174,32 @@ def get_article_id_from_number(
     # Ensure the sobject is defined appropriately
     sobject = _validate_knowledge_sobject(sobject)
 
+    # Return the indexed Article ID when available
+    article_number_index = getattr(sfdc_object, 'article_number_index', None)
+    if article_number_index is not None and not return_uri:
+        article_id = article_number_index.get(sobject, article_number)
+        if article_id:
+            return article_id
+
     # Construct the SOQL query to perform
     if not isinstance(article_number, str):
         article_number = str(article_number)
-    query = f'SELECT {const.SOBJECT_FIELDS.ID} FROM {sobject} '
-    if len(article_number) < 9:
-        query += f"WHERE {const.SOBJECT_FIELDS.ARTICLE_NUMBER} LIKE '%0{article_number}'"
+    if len(article_number) < const.SOQL_QUERIES.ARTICLE_NUMBER_LENGTH:
+        operator, pattern = 'LIKE', f'%0{article_number}'
     else:
-        query += f"WHERE {const.SOBJECT_FIELDS.ARTICLE_NUMBER} = '{article_number}'"
+        operator, pattern = '=', article_number
+    query_template = (
+        f'SELECT {const.SOBJECT_FIELDS.ID}, {const.SOBJECT_FIELDS.ARTICLE_NUMBER} FROM {sobject} '
+        f'WHERE {const.SOBJECT_FIELDS.ARTICLE_NUMBER} {operator} :pattern'
+    )
 
-    # Perform the SOQL query and return the article number if found
-    response = sfdc_object.soql_query(query)
+    # Perform the SOQL query and return the article number if found (preferring an exact article number match)
+    response = soql_module.compile_query(query_template).execute(sfdc_object, pattern=pattern)
     if response.get(const.RESPONSE_KEYS.TOTAL_SIZE) > 0:
+        normalized_number = cache_module.ArticleNumberIndex.normalize_article_number(article_number)
+        records = response[const.RESPONSE_KEYS.RECORDS]
+        exact_records = [_record for _record in records if _record.get(const.SOBJECT_FIELDS.ARTICLE_NUMBER) == normalized_number]
+        record = (exact_records or records)[0]
         if return_uri:
             # TODO: Split out the return_uri functionality into a separate function and method
             warn_msg = (
@@ -131,9 +208,11 @@ def get_article_id_from_number(
             )
             logger.warning(warn_msg)
             errors.handlers.display_warning(warn_msg)
-            return_value = response[const.RESPONSE_KEYS.RECORDS][0][const.RESPONSE_KEYS.ATTRIBUTES][const.RESPONSE_KEYS.URL]
+            return_value = record[const.RESPONSE_KEYS.ATTRIBUTES][const.RESPONSE_KEYS.URL]
         else:
-            return_value = response[const.RESPONSE_KEYS.RECORDS][0][const.SOBJECT_FIELDS.ID]
+            return_value = record[const.SOBJECT_FIELDS.ID]
+            if article_number_index is not None and exact_records:
+                article_number_index.update(sobject, {normalized_number: return_value})
     else:
         return_value = ''
         warn_msg = f'No results were returned when querying for the article number {article_number}'
@@ -141,6 +220,141 @@ def get_article_id_from_number(
     return return_value
 
 
+def get_article_ids_from_numbers(
+    sfdc_object,
+    article_numbers: Union[list, tuple, set],
+    sobject: Optional[str] = None,
+) -> dict:
+    """This function returns the Article IDs for many article numbers using batched ``IN`` queries.
+
+    .. versionadded:: 1.6.0
+
+    Article numbers found in the article number index of the core object (when defined) are resolved locally, and
+    the remaining article numbers are queried up to 200 at a time (with escaped values) and added to the index. When
+    an article number has multiple versions, the ``Id`` of the most recently modified version is returned.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param article_numbers: The article numbers to query
+    :type article_numbers: list, tuple, set
+    :param sobject: The Salesforce object to query (``Knowledge__kav`` by default)
+    :type sobject: str, None
+    :returns: Dictionary mapping each article number to its Article ID, or a blank string if no article is found
+    :raises: :py:exc:`RuntimeError`
+    """
+    # Ensure the sobject is defined appropriately and resolve any indexed article numbers
+    sobject = _validate_knowledge_sobject(sobject)
+    article_number_index = getattr(sfdc_object, 'article_number_index', None)
+    article_ids = {}
+    for article_number in dict.fromkeys(article_numbers or []):
+        article_id = article_number_index.get(sobject, article_number) if article_number_index is not None else None
+        article_ids[article_number] = article_id or ''
+
+    # Query the remaining article numbers in chunks
+    normalize = cache_module.ArticleNumberIndex.normalize_article_number
+    pending = list(dict.fromkeys(normalize(_number) for _number, _id in article_ids.items() if not _id))
+    found = {}
+    query_template = soql_module.compile_query(
+        f'SELECT {const.SOBJECT_FIELDS.ID}, {const.SOBJECT_FIELDS.ARTICLE_NUMBER} FROM {sobject} '
+        f'WHERE {const.SOBJECT_FIELDS.ARTICLE_NUMBER} IN :numbers '
+        f'ORDER BY {const.SOBJECT_FIELDS.SYSTEM_MODSTAMP}'
+    )
+    for number_chunk in core_utils.chunk_iterable(pending, const.SOQL_QUERIES.MAX_ARTICLE_NUMBER_VALUES):
+        for record in query_template.query_all(sfdc_object, numbers=number_chunk):
+            found[record[const.SOBJECT_FIELDS.ARTICLE_NUMBER]] = record[const.SOBJECT_FIELDS.ID]
+    if found and article_number_index is not None:
+        article_number_index.update(sobject, found)
+
+    # Populate and return the Article IDs in the order of the article numbers
+    for article_number, article_id in article_ids.items():
+        if not article_id:
+            article_ids[article_number] = found.get(normalize(article_number), '')
+    missing_count = sum(1 for _id in article_ids.values() if not _id)
+    if missing_count:
+        logger.warning(f'No results were returned when querying for {missing_count} of the article numbers')
+    return article_ids
+
+
+def load_article_number_index(sfdc_object, sobject: Optional[str] = None, full_refresh: bool = False) -> int:
+    """This function loads the article number index of the core object with a single paged query.
+
+    .. versionadded:: 1.6.0
+
+    The first load (or a full refresh) retrieves the ``Id`` and ``ArticleNumber`` values of every article version,
+    while subsequent loads only retrieve the versions modified since the latest ``SystemModstamp`` value that was
+    loaded. An index is attached to the core object if one has not already been defined.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param sobject: The Salesforce object to query (``Knowledge__kav`` by default)
+    :type sobject: str, None
+    :param full_refresh: Determines if the index should be cleared and fully reloaded (``False`` by default)
+    :type full_refresh: bool
+    :returns: The number of article versions that were loaded
+    :raises: :py:exc:`RuntimeError`
+    """
+    # Ensure the sobject is defined appropriately and the index exists
+    sobject = _validate_knowledge_sobject(sobject)
+    if getattr(sfdc_object, 'article_number_index', None) is None:
+        sfdc_object.article_number_index = cache_module.ArticleNumberIndex()
+    article_number_index = sfdc_object.article_number_index
+    if full_refresh:
+        article_number_index.clear(sobject)
+
+    # Construct the SOQL query, filtering on the latest loaded modification timestamp if available
+    query = (
+        f'SELECT {const.SOBJECT_FIELDS.ID}, {const.SOBJECT_FIELDS.ARTICLE_NUMBER}, '
+        f'{const.SOBJECT_FIELDS.SYSTEM_MODSTAMP} FROM {sobject}'
+    )
+    watermark = article_number_index.get_watermark(sobject)
+    if watermark:
+        query += f' WHERE {const.SOBJECT_FIELDS.SYSTEM_MODSTAMP} >= {_get_soql_datetime(watermark)}'
+    query += f' ORDER BY {const.SOBJECT_FIELDS.SYSTEM_MODSTAMP}'
+
+    # Perform the query and update the index
+    records = _get_all_query_records(sfdc_object, query)
+    article_ids = {_record[const.SOBJECT_FIELDS.ARTICLE_NUMBER]: _record[const.SOBJECT_FIELDS.ID] for _record in records}
+    latest_modstamp = max((_record.get(const.SOBJECT_FIELDS.SYSTEM_MODSTAMP) or '' for _record in records), default='')
+    article_number_index.update(sobject, article_ids, watermark=latest_modstamp or None)
+    logger.info(f'Loaded {len(records)} article version(s) into the article number index for {sobject}')
+    return len(records)
+
+
+def _get_soql_datetime(_timestamp: str) -> str:
+    """This function converts a timestamp from an API response into a SOQL dateTime literal in UTC.
+
+    .. versionadded:: 1.6.0
+
+    :param _timestamp: The timestamp (e.g. ``2026-10-18T15:04:05.000+0000``)
+    :type _timestamp: str
+    :returns: The SOQL dateTime literal (e.g. ``2026-10-18T15:04:05Z``)
+    """
+    _datetime = datetime.strptime(_timestamp, '%Y-%m-%dT%H:%M:%S.%f%z')
+    return _datetime.astimezone(timezone.utc).strftime(const.SOQL_QUERIES.DATETIME_FORMAT)
+
+
+def _get_all_query_records(sfdc_object, _query: str, _replace_quotes: bool = True) -> list:
+    """This function performs a SOQL query and returns the records from every page of the results.
+
+    .. versionadded:: 1.6.0
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param _query: The SOQL query to perform
+    :type _query: str
+    :param _replace_quotes: Determines if double-quotes should be replaced with single-quotes (``True`` by default)
+    :type _replace_quotes: bool
+    :returns: List of the retrieved records
+    :raises: :py:exc:`RuntimeError`
+    """
+    _response = sfdc_object.soql_query(_query, replace_quotes=_replace_quotes)
+    _records = list(_response.get(const.RESPONSE_KEYS.RECORDS) or [])
+    while not _response.get(const.RESPONSE_KEYS.DONE, True) and _response.get(const.RESPONSE_KEYS.NEXT_RECORDS_URL):
+        _response = sfdc_object.soql_query(_response[const.RESPONSE_KEYS.NEXT_RECORDS_URL], next_records_url=True)
+        _records.extend(_response.get(const.RESPONSE_KEYS.RECORDS) or [])
+    return _records
+
+
 def get_articles_list(
     sfdc_object,
     query: Optional[str] = None,
@@ -148,10 +362,15 @@ def get_articles_list(
     order: Optional[str] = None,
     page_size: int = const.QUERY_PARAMS.DEFAULT_PAGE_SIZE,  # Default: 20
     page_num: int = const.QUERY_PARAMS.DEFAULT_PAGE_NUM,  # Default: 1
-) -> list:
+    articles_only: bool = False,
+) -> Union[dict, list]:
     """This function retrieves a list of knowledge articles.
     (`Reference <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_knowledge_support_artlist.htm>`__)
 
+    .. versionchanged:: 1.6.0
+       The optional ``articles_only`` parameter can be used to return only the list of articles rather than the
+       full response data that includes the page URLs.
+
     .. versionchanged:: 1.4.0
        The errors now log as errors via the logger rather than to the stderr console.
 
@@ -167,7 +386,9 @@ def get_articles_list(
     :type page_size: int
     :param page_num: The starting page number (``1`` by default)
     :type page_num: int
-    :returns: The list of retrieved knowledge articles
+    :param articles_only: Returns only the list of articles rather than the full response (``False`` by default)
+    :type articles_only: bool
+    :returns: The response data with the list of retrieved knowledge articles (or only the list of articles)
     """
     # Define the headers
     headers = sfdc_object._get_headers(const.HEADER_TYPE_ARTICLES)
@@ -211,10 +432,66 @@ def get_articles_list(
     params[const.QUERY_PARAMS.PAGE_SIZE] = page_size
     params[const.QUERY_PARAMS.PAGE_NUM] = page_num
 
-    # Perform the query
-    # TODO: Determine what is returned by this API call and see if data should be pruned to just the list of articles
+    # Perform the query and return the response data (or only the list of articles if requested)
     endpoint = const.REST_PATHS.KNOWLEDGE_ARTICLES.format(api_version=sfdc_object.version)
-    return sfdc_object.get(endpoint, params=params, headers=headers)
+    response = sfdc_object.get(endpoint, params=params, headers=headers)
+    if articles_only:
+        return (response or {}).get(const.RESPONSE_KEYS.ARTICLES) or []
+    return response
+
+
+def iter_articles(
+    sfdc_object,
+    query: Optional[str] = None,
+    sort: Optional[str] = None,
+    order: Optional[str] = None,
+    page_size: int = const.QUERY_PARAMS.MAX_PAGE_SIZE,  # Default: 100
+    parallel_pages: int = 1,
+) -> Iterator[dict]:
+    """This function yields every knowledge article in the list of articles while retrieving each page as needed.
+    (`Reference <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_knowledge_support_artlist.htm>`__)
+
+    .. versionadded:: 1.6.0
+
+    The pages are retrieved one at a time by default. When ``parallel_pages`` is greater than ``1``, that number of
+    subsequent pages is retrieved concurrently. As the API does not return the total number of articles, the pages
+    are fetched speculatively and the iteration stops at the first page without a ``nextPageUrl`` value or with
+    fewer articles than the page size.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param query: A SOQL query with which to filter the results (optional)
+    :type query: str, None
+    :param sort: One of the following optional values: ``LastPublishedDate``, ``CreatedDate``, ``Title``, or ``ViewScore``
+    :type sort: str, None
+    :param order: Optionally define the ORDER BY as ``ASC`` or ``DESC``
+    :type order: str, None
+    :param page_size: The number of results per page (``100`` by default)
+    :type page_size: int
+    :param parallel_pages: The number of pages to retrieve concurrently (``1`` by default)
+    :type parallel_pages: int
+    :returns: Generator that yields each knowledge article
+    :raises: :py:exc:`RuntimeError`
+    """
+    page_size = min(page_size, const.QUERY_PARAMS.MAX_PAGE_SIZE)
+    parallel_pages = max(1, parallel_pages)
+
+    def _get_page(_page_num: int) -> dict:
+        return get_articles_list(sfdc_object, query=query, sort=sort, order=order, page_size=page_size, page_num=_page_num)
+
+    page_num = const.QUERY_PARAMS.DEFAULT_PAGE_NUM
+    while True:
+        page_numbers = range(page_num, page_num + parallel_pages)
+        if parallel_pages == 1:
+            responses = [_get_page(page_num)]
+        else:
+            responses = concurrency_utils.run_concurrently(_get_page, page_numbers, max_workers=parallel_pages)
+        for response in responses:
+            articles = (response or {}).get(const.RESPONSE_KEYS.ARTICLES) or []
+            yield from articles
+            if not (response or {}).get(const.RESPONSE_KEYS.NEXT_PAGE_URL) or len(articles) < page_size:
+                return
+        page_num += parallel_pages
 
 
 def get_article_details(
@@ -269,6 +546,189 @@ def get_article_details(
     return data
 
 
+def get_articles_details(
+    sfdc_object,
+    article_ids: Union[str, list, tuple, set],
+    fields: Optional[Union[str, list, tuple]] = None,
+    sobject: Optional[str] = None,
+    use_collections_endpoint: bool = False,
+    fallback_to_individual: bool = True,
+    max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+) -> dict:
+    """This function retrieves details for multiple knowledge articles using chunked bulk requests.
+    (`Reference <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_composite_sobjects_collections_retrieve.htm>`__)
+
+    .. versionadded:: 1.6.0
+
+    The articles are retrieved 200 at a time with SOQL ``Id IN (...)`` queries (using ``FIELDS(ALL)`` when specific
+    fields are not defined and splitting the IDs further when needed to stay within the SOQL length limits) or,
+    optionally, with the sObject Collections endpoint. If a bulk request fails then the articles in that chunk are
+    retrieved individually using concurrent requests.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param article_ids: One or more Article IDs for which to retrieve details
+    :type article_ids: str, list, tuple, set
+    :param fields: The fields to retrieve as a list or comma-separated string (all fields by default)
+    :type fields: str, list, tuple, None
+    :param sobject: The Salesforce object to query (``Knowledge__kav`` by default)
+    :type sobject: str, None
+    :param use_collections_endpoint: Retrieves the articles with the sObject Collections endpoint rather than a SOQL
+                                     query (``False`` by default and requires the ``fields`` parameter)
+    :type use_collections_endpoint: bool
+    :param fallback_to_individual: Retrieves the articles individually when a bulk request fails (``True`` by default)
+    :type fallback_to_individual: bool
+    :param max_workers: The maximum number of concurrent requests when retrieving articles individually (``8`` by
+                        default)
+    :type max_workers: int
+    :returns: Dictionary mapping each provided Article ID to its details (or ``None`` if they could not be retrieved)
+    :raises: :py:exc:`RuntimeError`,
+             :py:exc:`TypeError`,
+             :py:exc:`salespyforce.errors.exceptions.APIRequestError`,
+             :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+    """
+    # Remove duplicate Article IDs while preserving the original order and ensure they are valid
+    article_ids = [article_ids] if isinstance(article_ids, str) else list(dict.fromkeys(article_ids))
+    invalid_ids = [_id for _id in article_ids if not core_utils.is_valid_salesforce_id(_id, verify_checksum=False)]
+    if invalid_ids:
+        error_msg = f'The following Article IDs are not valid Salesforce IDs: {invalid_ids}'
+        logger.error(error_msg)
+        raise errors.exceptions.InvalidParameterError(error_msg)
+
+    # Ensure the sObject and fields are defined appropriately
+    sobject = _validate_knowledge_sobject(sobject)
+    fields = _validate_field_names(fields)
+    if use_collections_endpoint and not fields:
+        logger.warning('The sObject Collections endpoint requires specific fields so a SOQL query will be used instead')
+        use_collections_endpoint = False
+
+    # Retrieve the article details for each chunk of Article IDs
+    article_details = {_id: None for _id in article_ids}
+    id_lookup = {core_utils.get_18_char_id(_id): _id for _id in article_ids}
+    for id_chunk in core_utils.chunk_iterable(article_ids, const.CONCURRENCY_SETTINGS.MAX_SOBJECT_COLLECTION_RECORDS):
+        try:
+            if use_collections_endpoint:
+                records = _get_article_collection(sfdc_object, id_chunk, fields, sobject)
+            else:
+                records = _query_articles_by_id(sfdc_object, id_chunk, fields, sobject)
+        except (RuntimeError, errors.exceptions.SalesPyForceError) as exc:
+            if not fallback_to_individual:
+                raise
+            logger.warning(f'The bulk retrieval of {len(id_chunk)} articles failed and will be retried individually: {exc}')
+            records = concurrency_utils.run_concurrently(
+                lambda _article_id: _get_single_article_details(sfdc_object, _article_id, fields, sobject),
+                id_chunk,
+                max_workers=max_workers,
+                return_exceptions=True,
+            )
+            for _article_id, _record in zip(id_chunk, records):
+                if isinstance(_record, Exception):
+                    logger.error(f'Failed to retrieve the details for the article {_article_id}: {_record}')
+            records = [_record for _record in records if isinstance(_record, dict)]
+
+        # Map the retrieved records to the provided Article IDs
+        for record in records:
+            if isinstance(record, dict) and record.get(const.SOBJECT_FIELDS.ID):
+                record_id = id_lookup.get(core_utils.get_18_char_id(record[const.SOBJECT_FIELDS.ID]))
+                if record_id:
+                    article_details[record_id] = record
+
+    # Return the mapping of article details
+    return article_details
+
+
+def _validate_field_names(_fields: Optional[Union[str, list, tuple]]) -> list:
+    """This function normalizes a list or comma-separated string of field names and ensures they are valid.
+
+    .. versionadded:: 1.6.0
+
+    :param _fields: The field names as a list or comma-separated string
+    :type _fields: str, list, tuple, None
+    :returns: List of the field names (or an empty list if no fields were provided)
+    :raises: :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+    """
+    _fields = _fields.split(',') if isinstance(_fields, str) else list(_fields or [])
+    _fields = [str(_field).strip() for _field in _fields if str(_field).strip()]
+    _invalid_fields = [
+        _field for _field in _fields if not re.fullmatch(r'[A-Za-z][A-Za-z0-9_]*(\.[A-Za-z][A-Za-z0-9_]*)*', _field)
+    ]
+    if _invalid_fields:
+        _error_msg = f'The following field names are not valid: {_invalid_fields}'
+        logger.error(_error_msg)
+        raise errors.exceptions.InvalidParameterError(_error_msg)
+    if _fields and const.SOBJECT_FIELDS.ID not in _fields:
+        _fields.insert(0, const.SOBJECT_FIELDS.ID)
+    return _fields
+
+
+def _query_articles_by_id(sfdc_object, _article_ids: list, _fields: list, _sobject: str) -> list:
+    """This function retrieves the records for a chunk of Article IDs using SOQL ``Id IN (...)`` queries.
+
+    .. versionadded:: 1.6.0
+
+    The IDs are escaped as bind values and split across as many queries as the SOQL and URI length limits require.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param _article_ids: The Article IDs to retrieve (up to 200)
+    :type _article_ids: list
+    :param _fields: The fields to retrieve (or an empty list to retrieve all fields)
+    :type _fields: list
+    :param _sobject: The Knowledge sObject to query
+    :type _sobject: str
+    :returns: List of the retrieved records
+    :raises: :py:exc:`RuntimeError`
+    """
+    _select_fields = ', '.join(_fields) if _fields else const.SOQL_QUERIES.FIELDS_ALL
+    _query = f'SELECT {_select_fields} FROM {_sobject} WHERE {const.SOBJECT_FIELDS.ID} IN :ids'
+    if not _fields:
+        _query += f' LIMIT {const.SOQL_QUERIES.MAX_FIELDS_ALL_RECORDS}'
+    return soql_module.compile_query(_query).query_all(sfdc_object, ids=_article_ids)
+
+
+def _get_article_collection(sfdc_object, _article_ids: list, _fields: list, _sobject: str) -> list:
+    """This function retrieves the records for a chunk of Article IDs using the sObject Collections endpoint.
+
+    .. versionadded:: 1.6.0
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param _article_ids: The Article IDs to retrieve (up to 200)
+    :type _article_ids: list
+    :param _fields: The fields to retrieve
+    :type _fields: list
+    :param _sobject: The Knowledge sObject to query
+    :type _sobject: str
+    :returns: List of the retrieved records
+    :raises: :py:exc:`RuntimeError`
+    """
+    _endpoint = const.REST_PATHS.COMPOSITE_SOBJECTS_BY_SOBJECT.format(api_version=sfdc_object.version, sobject=_sobject)
+    _params = {const.QUERY_PARAMS.IDS: ','.join(_article_ids), const.QUERY_PARAMS.FIELDS: ','.join(_fields)}
+    _response = sfdc_object.get(_endpoint, params=_params)
+    return [_record for _record in (_response or []) if isinstance(_record, dict)]
+
+
+def _get_single_article_details(sfdc_object, _article_id: str, _fields: list, _sobject: str) -> dict:
+    """This function retrieves the details for a single article with only the requested fields (if defined).
+
+    .. versionadded:: 1.6.0
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param _article_id: The Article ID to retrieve
+    :type _article_id: str
+    :param _fields: The fields to retrieve (or an empty list to retrieve all fields)
+    :type _fields: list
+    :param _sobject: The Knowledge sObject to query
+    :type _sobject: str
+    :returns: The details for the knowledge article
+    :raises: :py:exc:`RuntimeError`
+    """
+    _endpoint = const.REST_PATHS.SOBJECT_BY_ID.format(api_version=sfdc_object.version, sobject=_sobject, record_id=_article_id)
+    _params = {const.QUERY_PARAMS.FIELDS: ','.join(_fields)} if _fields else None
+    return sfdc_object.get(_endpoint, params=_params)
+
+
 def get_validation_status(
     sfdc_object,
     article_id: Optional[str] = None,
@@ -525,6 +985,86 @@ def create_draft_from_online_article(sfdc_object, article_id: str, unpublish: bo
     return sfdc_object.post(endpoint, payload)
 
 
+def create_drafts_from_online_articles(
+    sfdc_object,
+    article_ids: Union[list, tuple, set],
+    unpublish: bool = False,
+    chunk_size: int = const.CONCURRENCY_SETTINGS.MAX_STANDARD_ACTION_INPUTS,
+    max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+) -> dict:
+    """This function creates draft knowledge articles from many online articles using batched standard actions.
+    (`Reference <https://developer.salesforce.com/docs/atlas.en-us.knowledge_dev.meta/knowledge_dev/actions_obj_knowledge.htm#createDraftFromOnlineKnowledgeArticle>`__)
+
+    .. versionadded:: 1.6.0
+
+    Each ``createDraftFromOnlineKnowledgeArticle`` action includes an input for up to 200 articles and the chunks
+    are submitted concurrently. If a chunk fails entirely, then its articles are retried individually.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param article_ids: The IDs of the online articles from which to create the drafts
+    :type article_ids: list, tuple, set
+    :param unpublish: Determines if the online articles should be unpublished when the drafts are created
+                      (``False`` by default)
+    :type unpublish: bool
+    :param chunk_size: The maximum number of inputs to include in each action (``200`` by default)
+    :type chunk_size: int
+    :param max_workers: The maximum number of actions to perform concurrently (``8`` by default)
+    :type max_workers: int
+    :returns: Dictionary mapping each provided Article ID to a dictionary with the ``draft_id`` value of the new
+              draft and the ``error`` message (if any)
+    :raises: :py:exc:`ValueError`,
+             :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
+    """
+    # Remove duplicate Article IDs while preserving the original order
+    article_ids = list(dict.fromkeys(article_ids or []))
+    if not article_ids:
+        error_msg = const._LOG_MESSAGES._MUST_BE_PROVIDED_ERROR.format(data='list of Article IDs')
+        logger.error(error_msg)
+        raise errors.exceptions.MissingRequiredDataError(error_msg)
+    chunk_size = min(chunk_size, const.CONCURRENCY_SETTINGS.MAX_STANDARD_ACTION_INPUTS)
+    endpoint = const.REST_PATHS.CREATE_DRAFT_FROM_ONLINE_ARTICLE.format(api_version=sfdc_object.version)
+    results = {}
+
+    def _create_drafts(_article_ids: list) -> None:
+        _payload = {
+            const.QUERY_PARAMS.INPUTS: [
+                {
+                    const.QUERY_PARAMS.ACTION: const.PAYLOAD_VALUES.EDIT_AS_DRAFT,
+                    const.QUERY_PARAMS.UNPUBLISH: unpublish,
+                    const.QUERY_PARAMS.ARTICLE_ID: _article_id,
+                }
+                for _article_id in _article_ids
+            ]
+        }
+        try:
+            _response = sfdc_object.post(endpoint, _payload)
+        except (RuntimeError, errors.exceptions.SalesPyForceError) as _exc:
+            if len(_article_ids) > 1:
+                logger.warning(f'Failed to create {len(_article_ids)} drafts at once so they will be created individually')
+                for _article_id in _article_ids:
+                    _create_drafts([_article_id])
+                return
+            logger.error(f'Failed to create a draft for the article {_article_ids[0]}: {_exc}')
+            results[_article_ids[0]] = {'draft_id': None, 'error': str(_exc)}
+            return
+
+        # Map the results of the action (which are returned in the order of the inputs) to the Article IDs
+        _action_results = _response if isinstance(_response, list) else [_response]
+        for _index, _article_id in enumerate(_article_ids):
+            _result = _action_results[_index] if _index < len(_action_results) else None
+            _output_values = (_result or {}).get(const.RESPONSE_KEYS.OUTPUT_VALUES) or {}
+            _error_msg = _get_action_error_message(_result) if _result else 'No result was returned for the article'
+            results[_article_id] = {
+                'draft_id': None if _error_msg else _output_values.get(const.RESPONSE_KEYS.DRAFT_ID),
+                'error': _error_msg,
+            }
+
+    # Create the drafts concurrently and return the results in the original order
+    concurrency_utils.run_concurrently(_create_drafts, core_utils.chunk_iterable(article_ids, chunk_size), max_workers)
+    return {_id: results[_id] for _id in article_ids}
+
+
 def create_draft_from_master_version(
     sfdc_object,
     article_id: Optional[str] = None,
@@ -669,6 +1209,100 @@ def publish_multiple_articles(sfdc_object, article_id_list: list, major_version:
     return sfdc_object.post(endpoint, payload)
 
 
+def publish_articles(
+    sfdc_object,
+    article_ids: Union[list, tuple, set],
+    major_version: bool = True,
+    chunk_size: int = const.CONCURRENCY_SETTINGS.DEFAULT_PUBLISH_CHUNK_SIZE,
+    max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+    requests_per_second: Optional[Union[int, float]] = None,
+    bisect_failures: bool = True,
+) -> dict:
+    """This function publishes many knowledge article drafts using concurrent chunks and reports on each article.
+    (`Reference <https://developer.salesforce.com/docs/atlas.en-us.knowledge_dev.meta/knowledge_dev/actions_obj_knowledge.htm#publishKnowledgeArticles>`__)
+
+    .. versionadded:: 1.6.0
+
+    The Article IDs are split into chunks that are each published with a single ``publishKnowledgeArticles`` action
+    using the :py:func:`publish_multiple_articles` function. When a chunk fails, it is split in half and each half
+    is retried until the articles responsible for the failure have been isolated.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param article_ids: The Article IDs to be published
+    :type article_ids: list, tuple, set
+    :param major_version: Determines if the published articles should be major versions (``True`` by default)
+    :type major_version: bool
+    :param chunk_size: The maximum number of articles to publish in each action (``50`` by default)
+    :type chunk_size: int
+    :param max_workers: The maximum number of chunks to publish concurrently (``8`` by default)
+    :type max_workers: int
+    :param requests_per_second: The maximum number of API calls to perform per second (unlimited by default)
+    :type requests_per_second: int, float, None
+    :param bisect_failures: Determines if failed chunks should be split and retried to isolate the failed articles
+                            (``True`` by default)
+    :type bisect_failures: bool
+    :returns: Dictionary mapping each Article ID to a dictionary with the ``published`` Boolean value and the
+              ``error`` message (if any)
+    :raises: :py:exc:`ValueError`,
+             :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
+    """
+    # Remove duplicate Article IDs while preserving the original order
+    article_ids = list(dict.fromkeys(article_ids or []))
+    if not article_ids:
+        error_msg = const._LOG_MESSAGES._MUST_BE_PROVIDED_ERROR.format(data='list of Article IDs to publish')
+        logger.error(error_msg)
+        raise errors.exceptions.MissingRequiredDataError(error_msg)
+
+    # Define the rate limiter that applies to every API call (including retries)
+    rate_limiter = concurrency_utils.RateLimiter(requests_per_second) if requests_per_second else None
+    results = {}
+
+    def _publish_chunk(_article_ids: list) -> None:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            _response = publish_multiple_articles(sfdc_object, list(_article_ids), major_version=major_version)
+            _error_msg = _get_action_error_message(_response)
+        except (RuntimeError, errors.exceptions.SalesPyForceError) as _exc:
+            _error_msg = str(_exc)
+        if not _error_msg:
+            results.update({_id: {'published': True, 'error': None} for _id in _article_ids})
+        elif bisect_failures and len(_article_ids) > 1:
+            logger.warning(f'Failed to publish a chunk of {len(_article_ids)} articles and it will be split and retried')
+            _midpoint = len(_article_ids) // 2
+            _publish_chunk(_article_ids[:_midpoint])
+            _publish_chunk(_article_ids[_midpoint:])
+        else:
+            logger.error(f'Failed to publish the article(s) {_article_ids}: {_error_msg}')
+            results.update({_id: {'published': False, 'error': _error_msg} for _id in _article_ids})
+
+    # Publish the chunks concurrently and return the results in the original order
+    concurrency_utils.run_concurrently(_publish_chunk, core_utils.chunk_iterable(article_ids, chunk_size), max_workers)
+    return {_id: results[_id] for _id in article_ids}
+
+
+def _get_action_error_message(_response: Union[list, dict, None]) -> Optional[str]:
+    """This function returns the error message(s) from an unsuccessful standard action response.
+
+    .. versionadded:: 1.6.0
+
+    :param _response: The JSON response from the standard action API call
+    :type _response: list, dict, None
+    :returns: The error message(s) or ``None`` if the action was successful
+    """
+    _messages = []
+    for _result in _response if isinstance(_response, list) else [_response]:
+        if isinstance(_result, dict) and _result.get(const.RESPONSE_KEYS.IS_SUCCESS) is False:
+            _errors = _result.get(const.RESPONSE_KEYS.ERRORS) or []
+            _messages.extend(
+                str(_error.get(const.RESPONSE_KEYS.MESSAGE, _error)) for _error in _errors if isinstance(_error, dict)
+            )
+            if not _errors:
+                _messages.append('The action was not successful')
+    return '; '.join(_messages) or None
+
+
 def assign_data_category(sfdc_object, article_id: str, category_group_name: str, category_name: str):
     """This function assigns a single data category for a knowledge article.
     (`Reference <https://itsmemohit.medium.com/quick-win-15-salesforce-knowledge-rest-apis-bb0725b2040e>`__)
@@ -702,6 +1336,144 @@ def assign_data_category(sfdc_object, article_id: str, category_group_name: str,
     return sfdc_object.post(endpoint, payload)
 
 
+def assign_data_categories(
+    sfdc_object,
+    assignments: Union[list, tuple],
+    skip_existing: bool = True,
+    max_workers: int = 1,
+) -> list:
+    """This function assigns data categories for many knowledge articles using sObject Collections inserts.
+    (`Reference <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_composite_sobjects_collections_create.htm>`__)
+
+    .. versionadded:: 1.6.0
+
+    The ``Knowledge__DataCategorySelection`` records are created 200 at a time. Assignments that already exist
+    can optionally be identified with batched queries and skipped, and duplicate assignments are only created once.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param assignments: The ``(article_id, category_group_name, category_name)`` tuples to assign
+    :type assignments: list, tuple
+    :param skip_existing: Determines if assignments that already exist should be skipped (``True`` by default)
+    :type skip_existing: bool
+    :param max_workers: The maximum number of collection inserts to perform concurrently (``1`` by default)
+    :type max_workers: int
+    :returns: List of dictionaries in the order of the assignments with the ``article_id``, ``category_group_name``,
+              ``category_name``, ``status`` (``created``, ``skipped`` or ``failed``), ``id`` and ``error`` values
+    :raises: :py:exc:`RuntimeError`,
+             :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`,
+             :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
+    """
+    # Ensure the assignments are defined appropriately
+    if not assignments:
+        error_msg = const._LOG_MESSAGES._MUST_BE_PROVIDED_ERROR.format(data='list of data category assignments')
+        logger.error(error_msg)
+        raise errors.exceptions.MissingRequiredDataError(error_msg)
+    for assignment in assignments:
+        if (
+            not isinstance(assignment, (list, tuple))
+            or len(assignment) != 3
+            or not all(isinstance(_value, str) and _value for _value in assignment)
+            or not core_utils.is_valid_salesforce_id(assignment[0], verify_checksum=False)
+        ):
+            error_msg = f'The data category assignment {assignment} must be an (article_id, group, category) tuple'
+            logger.error(error_msg)
+            raise errors.exceptions.InvalidParameterError(error_msg)
+
+    # Define the initial results and identify the assignments that already exist (if requested)
+    results = [
+        {
+            'article_id': _article_id,
+            'category_group_name': _group_name,
+            'category_name': _category_name,
+            'status': None,
+            'id': None,
+            'error': None,
+        }
+        for _article_id, _group_name, _category_name in assignments
+    ]
+    existing = _get_existing_data_categories(sfdc_object, [_result['article_id'] for _result in results]) if skip_existing else {}
+
+    # Identify the assignments to create and skip any that exist or are duplicated
+    pending = []
+    for result in results:
+        _key = (core_utils.get_18_char_id(result['article_id']), result['category_group_name'], result['category_name'])
+        if _key in existing:
+            result['status'] = 'skipped'
+            result['id'] = existing[_key]
+        else:
+            existing[_key] = None
+            pending.append(result)
+    if len(pending) < len(results):
+        logger.info(f'Skipping {len(results) - len(pending)} data category assignment(s) that already exist')
+
+    # Create the pending assignments and record the outcome of each row
+    records = [
+        {
+            const.SOBJECT_FIELDS.PARENT_ID: _result['article_id'],
+            const.SOBJECT_FIELDS.DATA_CATEGORY_GROUP_NAME: _result['category_group_name'],
+            const.SOBJECT_FIELDS.DATA_CATEGORY_NAME: _result['category_name'],
+        }
+        for _result in pending
+    ]
+    responses = (
+        sfdc_object.create_sobject_records(const.SOBJECTS.KNOWLEDGE_DATA_CATEGORY_SELECTION, records, max_workers=max_workers)
+        if records
+        else []
+    )
+    for index, result in enumerate(pending):
+        response = responses[index] if index < len(responses) else {}
+        if response.get(const.RESPONSE_KEYS.SUCCESS):
+            result['status'] = 'created'
+            result['id'] = response.get(const.RESPONSE_KEYS.ID)
+        else:
+            result['status'] = 'failed'
+            result['error'] = (
+                '; '.join(
+                    str(_error.get(const.RESPONSE_KEYS.MESSAGE, _error))
+                    for _error in response.get(const.RESPONSE_KEYS.ERRORS) or [{}]
+                    if isinstance(_error, dict)
+                )
+                or 'No result was returned for the assignment'
+            )
+    return results
+
+
+def _get_existing_data_categories(sfdc_object, _article_ids: list) -> dict:
+    """This function retrieves the existing data category assignments for a list of articles.
+
+    .. versionadded:: 1.6.0
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param _article_ids: The IDs of the articles whose data category assignments should be retrieved
+    :type _article_ids: list
+    :returns: Dictionary mapping ``(18-character article ID, group name, category name)`` tuples to record IDs
+    :raises: :py:exc:`RuntimeError`
+    """
+    _existing = {}
+    _select_fields = ', '.join(
+        (
+            const.SOBJECT_FIELDS.ID,
+            const.SOBJECT_FIELDS.PARENT_ID,
+            const.SOBJECT_FIELDS.DATA_CATEGORY_GROUP_NAME,
+            const.SOBJECT_FIELDS.DATA_CATEGORY_NAME,
+        )
+    )
+    _query_template = soql_module.compile_query(
+        f'SELECT {_select_fields} FROM {const.SOBJECTS.KNOWLEDGE_DATA_CATEGORY_SELECTION} '
+        f'WHERE {const.SOBJECT_FIELDS.PARENT_ID} IN :parent_ids'
+    )
+    for _record in _query_template.query_all(sfdc_object, parent_ids=list(_article_ids)):
+        _key = (
+            core_utils.get_18_char_id(_record[const.SOBJECT_FIELDS.PARENT_ID]),
+            _record.get(const.SOBJECT_FIELDS.DATA_CATEGORY_GROUP_NAME),
+            _record.get(const.SOBJECT_FIELDS.DATA_CATEGORY_NAME),
+        )
+        _existing[_key] = _record.get(const.SOBJECT_FIELDS.ID)
+    return _existing
+
+
 def archive_article(sfdc_object, article_id: str):
     """This function archives a published knowledge article.
     (`Reference <https://developer.salesforce.com/docs/atlas.en-us.knowledge_dev.meta/knowledge_dev/knowledge_REST_archive_master_version.htm>`__)
@@ -769,6 +1541,177 @@ def delete_article_draft(
     return sfdc_object.delete(endpoint)
 
 
+def archive_articles(
+    sfdc_object,
+    article_ids: Union[list, tuple, set],
+    max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+) -> dict:
+    """This function archives many published knowledge articles using Composite Batch subrequests.
+    (`Reference <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_composite_batch.htm>`__)
+
+    .. versionadded:: 1.6.0
+
+    The same ``PATCH`` request performed by the :py:func:`archive_article` function is submitted for each article
+    as a subrequest, with up to 25 subrequests per API call and multiple API calls performed concurrently.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param article_ids: The IDs of the articles to archive
+    :type article_ids: list, tuple, set
+    :param max_workers: The maximum number of batches to submit concurrently (``8`` by default)
+    :type max_workers: int
+    :returns: Dictionary mapping each Article ID to a dictionary with the ``archived`` Boolean value and the
+              ``error`` message (if any)
+    :raises: :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
+    """
+    # Remove duplicate Article IDs while preserving the original order
+    article_ids = list(dict.fromkeys(article_ids or []))
+    if not article_ids:
+        error_msg = const._LOG_MESSAGES._MUST_BE_PROVIDED_ERROR.format(data='list of Article IDs to archive')
+        logger.error(error_msg)
+        raise errors.exceptions.MissingRequiredDataError(error_msg)
+
+    # Define the subrequests and perform the batch API calls
+    payload = {const.QUERY_PARAMS.PUBLISH_STATUS: const.PAYLOAD_VALUES.ARCHIVED}
+    subrequests = {
+        _article_id: {
+            const.QUERY_PARAMS.METHOD: 'PATCH',
+            const.QUERY_PARAMS.URL: const.REST_PATHS.ARTICLE_MASTER_VERSION_BY_ID.format(
+                api_version=sfdc_object.version,
+                article_id=_article_id,
+            ),
+            const.QUERY_PARAMS.RICH_INPUT: payload,
+        }
+        for _article_id in article_ids
+    }
+    return _perform_batch_subrequests(sfdc_object, subrequests, 'archived', max_workers, const.SOBJECTS.KNOWLEDGE)
+
+
+def delete_article_drafts(
+    sfdc_object,
+    version_ids: Union[list, tuple, set],
+    sobject: Optional[str] = None,
+    use_knowledge_management_endpoint: bool = True,
+    max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+) -> dict:
+    """This function deletes many unpublished knowledge article drafts using Composite Batch subrequests.
+    (`Reference <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_composite_batch.htm>`__)
+
+    .. versionadded:: 1.6.0
+
+    The same ``DELETE`` request performed by the :py:func:`delete_article_draft` function is submitted for each
+    draft as a subrequest, with up to 25 subrequests per API call and multiple API calls performed concurrently.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param version_ids: The 15-character or 18-character ``Id`` (Knowledge Article Version ID) values
+    :type version_ids: list, tuple, set
+    :param sobject: The Salesforce object to query (``Knowledge__kav`` by default)
+    :type sobject: str, None
+    :param use_knowledge_management_endpoint: Leverage the ``/knowledgeManagement/articleVersions/masterVersions/``
+                                              endpoint rather than the ``/sobjects/Knowledge__kav/`` endpoint
+                                              (``True`` by default)
+    :type use_knowledge_management_endpoint: bool
+    :param max_workers: The maximum number of batches to submit concurrently (``8`` by default)
+    :type max_workers: int
+    :returns: Dictionary mapping each version ID to a dictionary with the ``deleted`` Boolean value and the
+              ``error`` message (if any)
+    :raises: :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
+    """
+    # Remove duplicate version IDs while preserving the original order
+    version_ids = list(dict.fromkeys(version_ids or []))
+    if not version_ids:
+        error_msg = const._LOG_MESSAGES._MUST_BE_PROVIDED_ERROR.format(data='list of version IDs to delete')
+        logger.error(error_msg)
+        raise errors.exceptions.MissingRequiredDataError(error_msg)
+
+    # Define the subrequests using the appropriate REST path and perform the batch API calls
+    sobject = _validate_knowledge_sobject(sobject, use_knowledge_management_endpoint)
+    subrequests = {}
+    for version_id in version_ids:
+        if use_knowledge_management_endpoint:
+            endpoint = const.REST_PATHS.ARTICLE_MASTER_VERSION_BY_ID.format(
+                api_version=sfdc_object.version,
+                article_id=version_id,
+            )
+        else:
+            endpoint = const.REST_PATHS.SOBJECT_BY_ID.format(
+                api_version=sfdc_object.version,
+                sobject=sobject,
+                record_id=version_id,
+            )
+        subrequests[version_id] = {const.QUERY_PARAMS.METHOD: 'DELETE', const.QUERY_PARAMS.URL: endpoint}
+    return _perform_batch_subrequests(sfdc_object, subrequests, 'deleted', max_workers, sobject)
+
+
+def _perform_batch_subrequests(
+    sfdc_object,
+    _subrequests: dict,
+    _outcome_key: str,
+    _max_workers: int,
+    _sobject: str,
+) -> dict:
+    """This function performs Composite Batch subrequests in concurrent batches and reports on each subrequest.
+
+    .. versionadded:: 1.6.0
+
+    Any cached responses for the record URL (``/sobjects/<sobject>/<id>``) of each successful subrequest are
+    invalidated.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param _subrequests: Dictionary mapping each record ID to its subrequest
+    :type _subrequests: dict
+    :param _outcome_key: The key of the Boolean value that indicates whether the subrequest was successful
+    :type _outcome_key: str
+    :param _max_workers: The maximum number of batches to submit concurrently
+    :type _max_workers: int
+    :param _sobject: The sObject of the records (e.g. ``Knowledge__kav``)
+    :type _sobject: str
+    :returns: Dictionary mapping each record ID to a dictionary with the outcome and the ``error`` message (if any)
+    """
+
+    def _perform_batch(_batch_ids: list) -> dict:
+        try:
+            _results = sfdc_object.composite_batch([_subrequests[_id] for _id in _batch_ids])
+        except (RuntimeError, errors.exceptions.SalesPyForceError) as _exc:
+            logger.error(f'Failed to perform a batch of {len(_batch_ids)} subrequests: {_exc}')
+            return {_id: {_outcome_key: False, 'error': str(_exc)} for _id in _batch_ids}
+        _report = {}
+        for _index, _id in enumerate(_batch_ids):
+            _result = _results[_index] if _index < len(_results) else {}
+            _status_code = _result.get(const.RESPONSE_KEYS.STATUS_CODE) or 0
+            if 200 <= _status_code < 300:
+                _report[_id] = {_outcome_key: True, 'error': None}
+                _record_url = const.REST_PATHS.SOBJECT_BY_ID.format(
+                    api_version=sfdc_object.version,
+                    sobject=_sobject,
+                    record_id=_id,
+                )
+                api._invalidate_cached_responses(sfdc_object, _record_url)
+                continue
+            _errors = _result.get(const.RESPONSE_KEYS.RESULT)
+            _error_msg = (
+                '; '.join(
+                    str(_error.get(const.RESPONSE_KEYS.MESSAGE, _error))
+                    for _error in (_errors if isinstance(_errors, list) else [])
+                    if isinstance(_error, dict)
+                )
+                or f'The subrequest failed with the status code {_status_code or "(none)"}'
+            )
+            logger.error(f'The subrequest for the record {_id} was unsuccessful: {_error_msg}')
+            _report[_id] = {_outcome_key: False, 'error': _error_msg}
+        return _report
+
+    # Perform the batches concurrently and return the results in the original order
+    _record_ids = list(_subrequests)
+    _batches = core_utils.chunk_iterable(_record_ids, const.CONCURRENCY_SETTINGS.MAX_COMPOSITE_BATCH_REQUESTS)
+    _report = {}
+    for _batch_report in concurrency_utils.run_concurrently(_perform_batch, _batches, max_workers=_max_workers):
+        _report.update(_batch_report)
+    return {_id: _report[_id] for _id in _record_ids}
+
+
 def _validate_knowledge_sobject(
     _sobject: Optional[str] = None,
     _use_knowledge_articles_endpoint: Optional[bool] = None,
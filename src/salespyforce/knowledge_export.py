@@ -0,0 +1,468 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            salespyforce.knowledge_export
+:Synopsis:          Defines the resumable bulk exporter for Salesforce Knowledge articles, categories and images
+:Usage:             ``from salespyforce.knowledge_export import export_knowledge``
+:Example:           ``manifest = export_knowledge(sfdc, '/tmp/knowledge_export', archive_format='zip')``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+from typing import Optional, Union
+
+from . import constants as const
+from . import errors
+from . import knowledge as knowledge_module
+from . import soql as soql_module
+from .utils import concurrency_utils, log_utils, rich_text_utils
+from .utils.checkpoint import Checkpoint
+
+# Initialize logging
+logger = log_utils.initialize_logging(__name__)
+
+# Define the checkpoint stage names
+_VERSIONS_STAGE = 'versions'
+_CATEGORIES_STAGE = 'categories'
+_IMAGES_STAGE = 'images'
+
+
+def export_knowledge(
+    sfdc_object,
+    output_path: str,
+    fields: Optional[Union[str, list, tuple]] = None,
+    sobject: Optional[str] = None,
+    include_categories: bool = True,
+    include_images: bool = True,
+    rich_text_fields: Optional[Union[str, list, tuple]] = None,
+    archive_format: Optional[str] = None,
+    page_size: int = const.EXPORT_SETTINGS.DEFAULT_PAGE_SIZE,
+    max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+    requests_per_second: Optional[Union[int, float]] = None,
+    min_remaining_api_requests: Optional[int] = const.EXPORT_SETTINGS.DEFAULT_MIN_REMAINING_API_REQUESTS,
+) -> dict:
+    """This function exports every knowledge article version with its data categories and images to a directory.
+
+    .. versionadded:: 1.6.0
+
+    The export is performed in the following stages, each of which is recorded in a checkpoint file within the
+    output directory so that an interrupted export resumes where it stopped when the function is called again:
+
+    * The article versions are retrieved in pages ordered by ``Id`` and written to JSON Lines files.
+    * The data category selections of each page are retrieved concurrently and written to JSON Lines files.
+    * The images within the rich text fields of each page are downloaded concurrently.
+
+    A ``manifest.json`` file describing the export is written once every stage has completed, and the directory
+    can optionally be packaged as an archive. The export stops with an exception (leaving the checkpoint in place)
+    when the remaining daily API requests for the org fall below the ``min_remaining_api_requests`` threshold.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param output_path: The directory where the export should be written
+    :type output_path: str
+    :param fields: The fields to export as a list or comma-separated string (all fields by default)
+    :type fields: str, list, tuple, None
+    :param sobject: The Salesforce object to export (``Knowledge__kav`` by default)
+    :type sobject: str, None
+    :param include_categories: Determines if the data category selections should be exported (``True`` by default)
+    :type include_categories: bool
+    :param include_images: Determines if the rich text images should be exported (``True`` by default)
+    :type include_images: bool
+    :param rich_text_fields: The rich text fields to scan for images (identified with a describe call by default)
+    :type rich_text_fields: str, list, tuple, None
+    :param archive_format: The optional archive format (``zip``, ``tar``, ``gztar``, ``bztar`` or ``xztar``)
+    :type archive_format: str, None
+    :param page_size: The number of article versions to retrieve per page (``2000`` by default, or ``200`` when
+                      all fields are exported)
+    :type page_size: int
+    :param max_workers: The maximum number of concurrent API calls (``8`` by default)
+    :type max_workers: int
+    :param requests_per_second: The maximum number of API calls to perform per second (unlimited by default)
+    :type requests_per_second: int, float, None
+    :param min_remaining_api_requests: The number of remaining daily API requests below which the export stops
+                                       (``1000`` by default or ``None`` to disable the check)
+    :type min_remaining_api_requests: int, None
+    :returns: The manifest of the export (including the ``archive`` path if an archive was created)
+    :raises: :py:exc:`RuntimeError`,
+             :py:exc:`salespyforce.errors.exceptions.APIRequestLimitError`,
+             :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+    """
+    # Validate the parameters
+    if archive_format and archive_format not in const.EXPORT_SETTINGS.ARCHIVE_FORMATS:
+        _valid_formats = sorted(const.EXPORT_SETTINGS.ARCHIVE_FORMATS)
+        error_msg = f"The archive format '{archive_format}' is not valid (valid formats: {_valid_formats})"
+        logger.error(error_msg)
+        raise errors.exceptions.InvalidParameterError(error_msg)
+    sobject = knowledge_module._validate_knowledge_sobject(sobject)
+    fields = knowledge_module._validate_field_names(fields)
+    if include_images and rich_text_fields is None:
+        rich_text_fields = _get_rich_text_fields(sfdc_object, sobject)
+    rich_text_fields = knowledge_module._validate_field_names(rich_text_fields) if include_images else []
+    rich_text_fields = [_field for _field in rich_text_fields if _field != const.SOBJECT_FIELDS.ID]
+    if fields:
+        fields.extend(_field for _field in rich_text_fields if _field not in fields)
+
+    # Prepare the output directory, checkpoint and rate limiter
+    for directory in (
+        const.EXPORT_SETTINGS.VERSIONS_DIR,
+        const.EXPORT_SETTINGS.CATEGORIES_DIR,
+        const.EXPORT_SETTINGS.IMAGES_DIR,
+    ):
+        os.makedirs(os.path.join(output_path, directory), exist_ok=True)
+    checkpoint = Checkpoint(os.path.join(output_path, const.EXPORT_SETTINGS.CHECKPOINT_FILE_NAME))
+    if not checkpoint.get_state('started'):
+        checkpoint.set_state('started', datetime.now(timezone.utc).isoformat())
+    rate_limiter = concurrency_utils.RateLimiter(requests_per_second) if requests_per_second else None
+
+    # Perform each stage of the export
+    _export_versions(sfdc_object, output_path, sobject, fields, page_size, checkpoint, min_remaining_api_requests)
+    pages = checkpoint.get_state('version_pages', [])
+    if include_categories:
+        _ensure_api_requests_available(sfdc_object, min_remaining_api_requests, checkpoint)
+        _export_categories(sfdc_object, output_path, pages, checkpoint, max_workers, rate_limiter)
+    failed_images = []
+    if include_images and rich_text_fields:
+        failed_images = _export_images(
+            sfdc_object,
+            output_path,
+            sobject,
+            pages,
+            rich_text_fields,
+            checkpoint,
+            max_workers,
+            rate_limiter,
+            min_remaining_api_requests,
+        )
+
+    # Write the manifest and remove the checkpoint when the export is complete
+    manifest = _write_manifest(
+        output_path, sobject, fields, rich_text_fields, pages, include_categories, failed_images, checkpoint
+    )
+    if not failed_images:
+        checkpoint.delete()
+    else:
+        logger.warning(f'{len(failed_images)} image(s) failed to download and will be retried when the export is resumed')
+
+    # Package the export as an archive if requested
+    manifest['archive'] = None
+    if archive_format:
+        manifest['archive'] = shutil.make_archive(os.path.normpath(output_path), archive_format, root_dir=output_path)
+        logger.info(f'The knowledge export has been archived as {manifest["archive"]}')
+    return manifest
+
+
+def _export_versions(
+    sfdc_object,
+    _output_path: str,
+    _sobject: str,
+    _fields: list,
+    _page_size: int,
+    _checkpoint: Checkpoint,
+    _min_remaining_api_requests: Optional[int],
+) -> None:
+    """This function exports the article versions in pages ordered by ``Id`` and records each page in the checkpoint.
+
+    .. versionadded:: 1.6.0
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param _output_path: The directory where the export is written
+    :type _output_path: str
+    :param _sobject: The Knowledge sObject to export
+    :type _sobject: str
+    :param _fields: The fields to export (or an empty list to export all fields)
+    :type _fields: list
+    :param _page_size: The number of article versions to retrieve per page
+    :type _page_size: int
+    :param _checkpoint: The checkpoint of the export
+    :type _checkpoint: class[salespyforce.utils.checkpoint.Checkpoint]
+    :param _min_remaining_api_requests: The number of remaining daily API requests below which the export stops
+    :type _min_remaining_api_requests: int, None
+    :returns: None
+    :raises: :py:exc:`RuntimeError`,
+             :py:exc:`salespyforce.errors.exceptions.APIRequestLimitError`
+    """
+    if _checkpoint.is_complete(_VERSIONS_STAGE, 'all'):
+        return
+    _select_fields = ', '.join(_fields) if _fields else const.SOQL_QUERIES.FIELDS_ALL
+    _limit = _page_size if _fields else min(_page_size, const.SOQL_QUERIES.MAX_FIELDS_ALL_RECORDS)
+    _pages = _checkpoint.get_state('version_pages', [])
+    while True:
+        if len(_pages) % const.EXPORT_SETTINGS.LIMIT_CHECK_INTERVAL_PAGES == 0:
+            _ensure_api_requests_available(sfdc_object, _min_remaining_api_requests, _checkpoint)
+
+        # Retrieve the next page of article versions after the last exported ID
+        _last_id = _checkpoint.get_state('last_version_id')
+        _where_clause = f' WHERE {const.SOBJECT_FIELDS.ID} > :last_id' if _last_id else ''
+        _query = f'SELECT {_select_fields} FROM {_sobject}{_where_clause} ORDER BY {const.SOBJECT_FIELDS.ID} LIMIT {_limit}'
+        _records = soql_module.compile_query(_query).query_all(sfdc_object, **({'last_id': _last_id} if _last_id else {}))
+        if not _records:
+            break
+
+        # Write the page and record it in the checkpoint
+        _page = {'page': f'{len(_pages) + 1:05d}', 'count': len(_records)}
+        _write_json_lines(_get_page_file(_output_path, const.EXPORT_SETTINGS.VERSIONS_DIR, _page['page']), _records)
+        _pages.append(_page)
+        _checkpoint.set_state('version_pages', _pages, save=False)
+        _checkpoint.set_state('last_version_id', _records[-1][const.SOBJECT_FIELDS.ID])
+        logger.info(f'Exported {sum(_item["count"] for _item in _pages)} article version(s)')
+        if len(_records) < _limit:
+            break
+    _checkpoint.mark_complete(_VERSIONS_STAGE, 'all')
+
+
+def _export_categories(
+    sfdc_object,
+    _output_path: str,
+    _pages: list,
+    _checkpoint: Checkpoint,
+    _max_workers: int,
+    _rate_limiter: Optional[concurrency_utils.RateLimiter],
+) -> None:
+    """This function concurrently exports the data category selections for each page of article versions.
+
+    .. versionadded:: 1.6.0
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param _output_path: The directory where the export is written
+    :type _output_path: str
+    :param _pages: The pages of article versions that have been exported
+    :type _pages: list
+    :param _checkpoint: The checkpoint of the export
+    :type _checkpoint: class[salespyforce.utils.checkpoint.Checkpoint]
+    :param _max_workers: The maximum number of concurrent API calls
+    :type _max_workers: int
+    :param _rate_limiter: The optional rate limiter that is acquired before each API call
+    :type _rate_limiter: class[salespyforce.utils.concurrency_utils.RateLimiter], None
+    :returns: None
+    :raises: :py:exc:`RuntimeError`
+    """
+    _select_fields = ', '.join(
+        (
+            const.SOBJECT_FIELDS.ID,
+            const.SOBJECT_FIELDS.PARENT_ID,
+            const.SOBJECT_FIELDS.DATA_CATEGORY_GROUP_NAME,
+            const.SOBJECT_FIELDS.DATA_CATEGORY_NAME,
+        )
+    )
+
+    _query_template = soql_module.compile_query(
+        f'SELECT {_select_fields} FROM {const.SOBJECTS.KNOWLEDGE_DATA_CATEGORY_SELECTION} '
+        f'WHERE {const.SOBJECT_FIELDS.PARENT_ID} IN :parent_ids'
+    )
+
+    def _export_page(_page: dict) -> None:
+        _version_ids = [
+            _record[const.SOBJECT_FIELDS.ID]
+            for _record in _read_json_lines(_get_page_file(_output_path, const.EXPORT_SETTINGS.VERSIONS_DIR, _page['page']))
+        ]
+        _selections = []
+        for _query in _query_template.iter_queries(parent_ids=_version_ids) if _version_ids else []:
+            if _rate_limiter is not None:
+                _rate_limiter.acquire()
+            _selections.extend(knowledge_module._get_all_query_records(sfdc_object, _query, _replace_quotes=False))
+        _write_json_lines(_get_page_file(_output_path, const.EXPORT_SETTINGS.CATEGORIES_DIR, _page['page']), _selections)
+        _checkpoint.set_state(f'category_count_{_page["page"]}', len(_selections), save=False)
+        _checkpoint.mark_complete(_CATEGORIES_STAGE, _page['page'])
+
+    _pending = [_page for _page in _pages if not _checkpoint.is_complete(_CATEGORIES_STAGE, _page['page'])]
+    concurrency_utils.run_concurrently(_export_page, _pending, max_workers=_max_workers)
+
+
+def _export_images(
+    sfdc_object,
+    _output_path: str,
+    _sobject: str,
+    _pages: list,
+    _rich_text_fields: list,
+    _checkpoint: Checkpoint,
+    _max_workers: int,
+    _rate_limiter: Optional[concurrency_utils.RateLimiter],
+    _min_remaining_api_requests: Optional[int],
+) -> list:
+    """This function downloads the images within the rich text fields of each page of article versions.
+
+    .. versionadded:: 1.6.0
+
+    Pages with images that failed to download are not marked as complete so that they are retried (skipping the
+    images that were already downloaded) when the export is resumed.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param _output_path: The directory where the export is written
+    :type _output_path: str
+    :param _sobject: The Knowledge sObject being exported
+    :type _sobject: str
+    :param _pages: The pages of article versions that have been exported
+    :type _pages: list
+    :param _rich_text_fields: The rich text fields to scan for images
+    :type _rich_text_fields: list
+    :param _checkpoint: The checkpoint of the export
+    :type _checkpoint: class[salespyforce.utils.checkpoint.Checkpoint]
+    :param _max_workers: The maximum number of concurrent API calls
+    :type _max_workers: int
+    :param _rate_limiter: The optional rate limiter that is acquired before each API call
+    :type _rate_limiter: class[salespyforce.utils.concurrency_utils.RateLimiter], None
+    :param _min_remaining_api_requests: The number of remaining daily API requests below which the export stops
+    :type _min_remaining_api_requests: int, None
+    :returns: List of the reference IDs (``refid``) of the images that failed to download
+    :raises: :py:exc:`salespyforce.errors.exceptions.APIRequestLimitError`
+    """
+    _images_path = os.path.join(_output_path, const.EXPORT_SETTINGS.IMAGES_DIR)
+    _failed_images = []
+    for _index, _page in enumerate(_pages):
+        if _checkpoint.is_complete(_IMAGES_STAGE, _page['page']):
+            continue
+        if _index % const.EXPORT_SETTINGS.LIMIT_CHECK_INTERVAL_PAGES == 0:
+            _ensure_api_requests_available(sfdc_object, _min_remaining_api_requests, _checkpoint)
+        _records = _read_json_lines(_get_page_file(_output_path, const.EXPORT_SETTINGS.VERSIONS_DIR, _page['page']))
+        _images = list(rich_text_utils.iter_record_images(_records, _rich_text_fields))
+        _report = sfdc_object.download_images(
+            _images,
+            file_path=_images_path,
+            sobject=_sobject,
+            max_workers=_max_workers,
+            rate_limiter=_rate_limiter,
+        )
+        _page_failures = [_ref_id for _ref_id, _image in _report['images'].items() if _image['status'] == 'failed']
+        _failed_images.extend(_page_failures)
+        if not _page_failures:
+            _checkpoint.mark_complete(_IMAGES_STAGE, _page['page'])
+    return _failed_images
+
+
+def _write_manifest(
+    _output_path: str,
+    _sobject: str,
+    _fields: list,
+    _rich_text_fields: list,
+    _pages: list,
+    _include_categories: bool,
+    _failed_images: list,
+    _checkpoint: Checkpoint,
+) -> dict:
+    """This function writes the manifest that describes the contents of the export.
+
+    .. versionadded:: 1.6.0
+
+    :param _output_path: The directory where the export is written
+    :type _output_path: str
+    :param _sobject: The Knowledge sObject that was exported
+    :type _sobject: str
+    :param _fields: The fields that were exported (or an empty list if all fields were exported)
+    :type _fields: list
+    :param _rich_text_fields: The rich text fields that were scanned for images
+    :type _rich_text_fields: list
+    :param _pages: The pages of article versions that were exported
+    :type _pages: list
+    :param _include_categories: Determines if the data category selections were exported
+    :type _include_categories: bool
+    :param _failed_images: The reference IDs of the images that failed to download
+    :type _failed_images: list
+    :param _checkpoint: The checkpoint of the export
+    :type _checkpoint: class[salespyforce.utils.checkpoint.Checkpoint]
+    :returns: The manifest data
+    """
+    _images_path = os.path.join(_output_path, const.EXPORT_SETTINGS.IMAGES_DIR)
+    _image_files = sorted(_file for _file in os.listdir(_images_path) if not _file.endswith('.part'))
+    _manifest = {
+        'sobject': _sobject,
+        'fields': _fields or [const.SOQL_QUERIES.FIELDS_ALL],
+        'rich_text_fields': _rich_text_fields,
+        'started': _checkpoint.get_state('started'),
+        'completed': datetime.now(timezone.utc).isoformat(),
+        'complete': not _failed_images,
+        'versions': {
+            'count': sum(_page['count'] for _page in _pages),
+            'files': [f'{const.EXPORT_SETTINGS.VERSIONS_DIR}/{_page["page"]}.jsonl' for _page in _pages],
+        },
+        'categories': {
+            'count': sum(_checkpoint.get_state(f'category_count_{_page["page"]}', 0) for _page in _pages),
+            'files': [f'{const.EXPORT_SETTINGS.CATEGORIES_DIR}/{_page["page"]}.jsonl' for _page in _pages]
+            if _include_categories
+            else [],
+        },
+        'images': {
+            'count': len(_image_files),
+            'files': [f'{const.EXPORT_SETTINGS.IMAGES_DIR}/{_file}' for _file in _image_files],
+            'failed': _failed_images,
+        },
+    }
+    with open(os.path.join(_output_path, const.EXPORT_SETTINGS.MANIFEST_FILE_NAME), 'w', encoding='utf-8') as _file:
+        json.dump(_manifest, _file, indent=2)
+    return _manifest
+
+
+def _get_rich_text_fields(sfdc_object, _sobject: str) -> list:
+    """This function identifies the rich text fields of an sObject using its describe information.
+
+    .. versionadded:: 1.6.0
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param _sobject: The sObject to describe
+    :type _sobject: str
+    :returns: List of the rich text field names
+    :raises: :py:exc:`RuntimeError`
+    """
+    _describe = sfdc_object.describe_object(_sobject)
+    return [_field['name'] for _field in _describe.get('fields', []) if _field.get('extraTypeInfo') == 'richtextarea']
+
+
+def _ensure_api_requests_available(sfdc_object, _min_remaining: Optional[int], _checkpoint: Checkpoint) -> None:
+    """This function stops the export when the remaining daily API requests fall below the defined threshold.
+
+    .. versionadded:: 1.6.0
+
+    The org limits are retrieved with a GET request that bypasses the response cache so that the check always uses
+    the current number of remaining daily API requests.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param _min_remaining: The number of remaining daily API requests below which the export stops
+    :type _min_remaining: int, None
+    :param _checkpoint: The checkpoint of the export (which is saved before the export stops)
+    :type _checkpoint: class[salespyforce.utils.checkpoint.Checkpoint]
+    :returns: None
+    :raises: :py:exc:`salespyforce.errors.exceptions.APIRequestLimitError`
+    """
+    if not _min_remaining:
+        return
+    _endpoint = const.REST_PATHS.LIMITS.format(api_version=sfdc_object.version)
+    _limits = sfdc_object.get(_endpoint, return_json=False).json() or {}
+    _remaining = _limits.get(const.EXPORT_SETTINGS.DAILY_API_REQUESTS, {}).get(const.EXPORT_SETTINGS.REMAINING)
+    if _remaining is not None and _remaining < _min_remaining:
+        _checkpoint.save()
+        _error_msg = (
+            f'The export has stopped as only {_remaining} daily API requests remain (threshold: {_min_remaining}) '
+            f'and it can be resumed later using the checkpoint file {_checkpoint.file_path}'
+        )
+        logger.error(_error_msg)
+        raise errors.exceptions.APIRequestLimitError(_error_msg)
+
+
+def _get_page_file(_output_path: str, _directory: str, _page: str) -> str:
+    """This function returns the path of the JSON Lines file for a page within an export directory."""
+    return os.path.join(_output_path, _directory, f'{_page}.jsonl')
+
+
+def _write_json_lines(_file_path: str, _records: list) -> None:
+    """This function writes records to a JSON Lines file using a temporary file that replaces the destination."""
+    _temp_path = f'{_file_path}.part'
+    with open(_temp_path, 'w', encoding='utf-8') as _file:
+        for _record in _records:
+            _file.write(json.dumps(_record) + '\n')
+    os.replace(_temp_path, _file_path)
+
+
+def _read_json_lines(_file_path: str) -> list:
+    """This function reads the records from a JSON Lines file."""
+    with open(_file_path, encoding='utf-8') as _file:
+        return [json.loads(_line) for _line in _file if _line.strip()]
@@ -0,0 +1,466 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            salespyforce.knowledge_import
+:Synopsis:          Defines the resumable bulk importer for knowledge articles exported with the knowledge exporter
+:Usage:             ``from salespyforce.knowledge_import import import_knowledge``
+:Example:           ``report = import_knowledge(sfdc, '/tmp/knowledge_export', match_by='title')``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Optional, Union
+
+from . import constants as const
+from . import errors
+from . import knowledge as knowledge_module
+from . import soql as soql_module
+from .knowledge_export import _read_json_lines
+from .utils import core_utils, log_utils
+from .utils.checkpoint import Checkpoint
+
+# Initialize logging
+logger = log_utils.initialize_logging(__name__)
+
+# Define the journal stage names and state keys
+_CATEGORIES_STAGE = 'categories'
+_ARTICLES_STATE = 'articles'
+
+
+def import_knowledge(
+    sfdc_object,
+    input_path: str,
+    fields: Optional[Union[str, list, tuple]] = None,
+    sobject: Optional[str] = None,
+    match_by: str = const.IMPORT_SETTINGS.MATCH_BY_TITLE,
+    publish_status: Optional[str] = const.SOBJECT_FIELD_VALUES.ONLINE,
+    include_categories: bool = True,
+    publish: bool = True,
+    major_version: bool = True,
+    journal_path: Optional[str] = None,
+    max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+) -> dict:
+    """This function imports the knowledge articles of an export directory as drafts and optionally publishes them.
+
+    .. versionadded:: 1.6.0
+
+    The article versions listed in the ``manifest.json`` file of a directory written by the
+    :py:func:`salespyforce.knowledge_export.export_knowledge` function are imported one page at a time:
+
+    * Existing articles are identified in batches by their title or article number.
+    * New articles are created and existing articles are updated (using a new draft when only an online version
+      exists) with sObject Collections requests of up to 200 records.
+    * The exported data category selections are assigned to the drafts in bulk.
+    * The drafts are published in concurrent chunks.
+
+    The outcome of every article is recorded in a journal file so that an interrupted import resumes without
+    creating, assigning or publishing anything a second time.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param input_path: The export directory that contains the ``manifest.json`` file
+    :type input_path: str
+    :param fields: The fields to import as a list or comma-separated string (the fields that are createable and
+                   updateable in the target org by default)
+    :type fields: str, list, tuple, None
+    :param sobject: The Salesforce object into which to import the articles (``Knowledge__kav`` by default)
+    :type sobject: str, None
+    :param match_by: Identifies existing articles by their ``title`` (default) or article ``number``
+    :type match_by: str
+    :param publish_status: Only imports the exported versions with this publish status (``Online`` by default or
+                           ``None`` to import every version)
+    :type publish_status: str, None
+    :param include_categories: Determines if the data category selections should be assigned (``True`` by default)
+    :type include_categories: bool
+    :param publish: Determines if the imported drafts should be published (``True`` by default)
+    :type publish: bool
+    :param major_version: Determines if the published articles should be major versions (``True`` by default)
+    :type major_version: bool
+    :param journal_path: The path to the journal file (``.import_journal.json`` within the input path by default)
+    :type journal_path: str, None
+    :param max_workers: The maximum number of concurrent API calls (``8`` by default)
+    :type max_workers: int
+    :returns: Dictionary with the ``articles`` report (keyed by the exported ``Id`` with the ``target_id``,
+              ``action``, ``published`` and ``error`` values) and the ``created``, ``updated``, ``failed``,
+              ``categories_assigned`` and ``published`` totals
+    :raises: :py:exc:`RuntimeError`,
+             :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`,
+             :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`
+    """
+    # Validate the parameters and load the manifest
+    if match_by not in const.IMPORT_SETTINGS.VALID_MATCH_BY:
+        error_msg = f"The match_by value '{match_by}' is not valid (valid values: {sorted(const.IMPORT_SETTINGS.VALID_MATCH_BY)})"
+        logger.error(error_msg)
+        raise errors.exceptions.InvalidParameterError(error_msg)
+    sobject = knowledge_module._validate_knowledge_sobject(sobject)
+    manifest_path = os.path.join(input_path, const.EXPORT_SETTINGS.MANIFEST_FILE_NAME)
+    if not os.path.isfile(manifest_path):
+        error_msg = const._LOG_MESSAGES._MISSING_REQUIRED_DATA.format(data=f'manifest file {manifest_path}')
+        logger.error(error_msg)
+        raise errors.exceptions.MissingRequiredDataError(error_msg)
+    with open(manifest_path, encoding='utf-8') as _file:
+        manifest = json.load(_file)
+
+    # Identify the fields that can be written when creating and updating articles
+    create_fields, update_fields = _get_writable_fields(sfdc_object, sobject, fields)
+    journal = Checkpoint(journal_path or os.path.join(input_path, const.IMPORT_SETTINGS.JOURNAL_FILE_NAME))
+    articles = journal.get_state(_ARTICLES_STATE, {})
+
+    # Import each page of article versions along with its data category selections (retrying any failures)
+    for version_file in manifest.get('versions', {}).get('files', []):
+        records = [
+            _record
+            for _record in _read_json_lines(os.path.join(input_path, version_file))
+            if not publish_status or _record.get(const.SOBJECT_FIELDS.PUBLISH_STATUS, publish_status) == publish_status
+        ]
+        pending = [
+            _record
+            for _record in records
+            if articles.get(_record[const.SOBJECT_FIELDS.ID], {}).get('action', 'failed') == 'failed'
+        ]
+        for batch in core_utils.chunk_iterable(pending, const.CONCURRENCY_SETTINGS.MAX_SOBJECT_COLLECTION_RECORDS):
+            _import_batch(sfdc_object, batch, sobject, match_by, create_fields, update_fields, max_workers, articles, journal)
+
+        # Assign the data categories of the page to the imported drafts (existing assignments are skipped)
+        page = os.path.splitext(os.path.basename(version_file))[0]
+        if include_categories and not journal.is_complete(_CATEGORIES_STAGE, page):
+            category_file = os.path.join(input_path, const.EXPORT_SETTINGS.CATEGORIES_DIR, f'{page}.jsonl')
+            assigned_count = _assign_categories(sfdc_object, category_file, articles, max_workers)
+            journal.set_state('categories_assigned', journal.get_state('categories_assigned', 0) + assigned_count)
+            if all(articles[_record[const.SOBJECT_FIELDS.ID]]['action'] != 'failed' for _record in records):
+                journal.mark_complete(_CATEGORIES_STAGE, page)
+
+    # Publish the imported drafts that have not already been published
+    unpublished = {
+        _article['target_id']: _source_id
+        for _source_id, _article in articles.items()
+        if _article['action'] != 'failed' and not _article['published']
+    }
+    if publish and unpublished:
+        publish_results = knowledge_module.publish_articles(
+            sfdc_object, list(unpublished), major_version=major_version, max_workers=max_workers
+        )
+        for target_id, result in publish_results.items():
+            articles[unpublished[target_id]]['published'] = result['published']
+            articles[unpublished[target_id]]['error'] = result['error']
+        journal.set_state(_ARTICLES_STATE, articles)
+
+    # Compile the report and remove the journal when every article was imported successfully
+    report = {
+        'articles': articles,
+        'created': sum(1 for _article in articles.values() if _article['action'] == 'created'),
+        'updated': sum(1 for _article in articles.values() if _article['action'] == 'updated'),
+        'failed': sum(1 for _article in articles.values() if _article['error']),
+        'categories_assigned': journal.get_state('categories_assigned', 0),
+        'published': sum(1 for _article in articles.values() if _article['published']),
+    }
+    logger.info(
+        f'Imported {len(articles)} article(s) with {report["created"]} created, {report["updated"]} updated '
+        f'and {report["failed"]} failed'
+    )
+    if report['failed']:
+        logger.warning(f'The journal file {journal.file_path} has been retained as {report["failed"]} article(s) failed')
+    else:
+        journal.delete()
+    return report
+
+
+def _import_batch(
+    sfdc_object,
+    _records: list,
+    _sobject: str,
+    _match_by: str,
+    _create_fields: set,
+    _update_fields: set,
+    _max_workers: int,
+    _articles: dict,
+    _journal: Checkpoint,
+) -> None:
+    """This function creates or updates the drafts for a batch of up to 200 exported article versions.
+
+    .. versionadded:: 1.6.0
+
+    The outcome of the articles is recorded in the journal after each sObject Collections request (with the
+    created drafts recorded before any updates are issued) so that an interruption never loses a created draft.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param _records: The exported article versions
+    :type _records: list
+    :param _sobject: The Knowledge sObject into which to import the articles
+    :type _sobject: str
+    :param _match_by: Identifies existing articles by their ``title`` or article ``number``
+    :type _match_by: str
+    :param _create_fields: The fields that can be written when creating an article
+    :type _create_fields: set
+    :param _update_fields: The fields that can be written when updating an article
+    :type _update_fields: set
+    :param _max_workers: The maximum number of concurrent API calls
+    :type _max_workers: int
+    :param _articles: The article results (keyed by the exported ``Id``) that are updated with the outcome of the batch
+    :type _articles: dict
+    :param _journal: The journal in which the article results are recorded
+    :type _journal: class[salespyforce.utils.checkpoint.Checkpoint]
+    :returns: None
+    :raises: :py:exc:`RuntimeError`
+    """
+    _results = {}
+    _valid_records = []
+    for _record in _records:
+        try:
+            knowledge_module._check_required_article_fields(_record)
+            _valid_records.append(_record)
+        except errors.exceptions.MissingRequiredDataError as _exc:
+            _results[_record[const.SOBJECT_FIELDS.ID]] = _get_article_result(None, 'failed', str(_exc))
+
+    # Identify the drafts of the existing articles and split the records into creates and updates
+    _drafts = _get_existing_drafts(sfdc_object, _valid_records, _sobject, _match_by, _max_workers)
+    _creates, _updates = [], []
+    for _record in _valid_records:
+        _source_id = _record[const.SOBJECT_FIELDS.ID]
+        _draft_id, _error_msg = _drafts.get(_source_id, (None, None))
+        if _error_msg:
+            _results[_source_id] = _get_article_result(None, 'failed', _error_msg)
+        elif _draft_id:
+            _payload = {_field: _value for _field, _value in _record.items() if _field in _update_fields}
+            _updates.append((_source_id, {const.SOBJECT_FIELDS.ID: _draft_id, **_payload}))
+        else:
+            _creates.append((_source_id, {_field: _value for _field, _value in _record.items() if _field in _create_fields}))
+
+    # Record the articles that could not be prepared before any sObject Collections requests are issued
+    _articles.update(_results)
+    _journal.set_state(_ARTICLES_STATE, _articles)
+
+    # Create and then update the drafts with sObject Collections requests and record the outcome after each request
+    for _action, _items, _method in (
+        ('created', _creates, sfdc_object.create_sobject_records),
+        ('updated', _updates, sfdc_object.update_sobject_records),
+    ):
+        if not _items:
+            continue
+        try:
+            _responses = _method(_sobject, [_payload for _source_id, _payload in _items], max_workers=_max_workers)
+        except RuntimeError as _exc:
+            logger.error(f'The sObject Collections request for {len(_items)} article draft(s) failed: {_exc}')
+            _error = {const.RESPONSE_KEYS.MESSAGE: str(_exc)}
+            _responses = [{const.RESPONSE_KEYS.SUCCESS: False, const.RESPONSE_KEYS.ERRORS: [_error]} for _ in _items]
+        _results = {}
+        for _index, (_source_id, _payload) in enumerate(_items):
+            _response = _responses[_index] if _index < len(_responses) else {}
+            if _response.get(const.RESPONSE_KEYS.SUCCESS):
+                _results[_source_id] = _get_article_result(_response.get(const.RESPONSE_KEYS.ID), _action)
+            else:
+                _results[_source_id] = _get_article_result(
+                    _payload.get(const.SOBJECT_FIELDS.ID), 'failed', _get_collection_error_message(_response)
+                )
+        _articles.update(_results)
+        _journal.set_state(_ARTICLES_STATE, _articles)
+
+
+def _get_existing_drafts(sfdc_object, _records: list, _sobject: str, _match_by: str, _max_workers: int) -> dict:
+    """This function identifies the draft of each existing article (creating drafts from online articles as needed).
+
+    .. versionadded:: 1.6.0
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param _records: The exported article versions
+    :type _records: list
+    :param _sobject: The Knowledge sObject into which the articles are imported
+    :type _sobject: str
+    :param _match_by: Identifies existing articles by their ``title`` or article ``number``
+    :type _match_by: str
+    :param _max_workers: The maximum number of concurrent API calls
+    :type _max_workers: int
+    :returns: Dictionary mapping the exported ``Id`` of each existing article to a ``(draft_id, error)`` tuple
+    :raises: :py:exc:`RuntimeError`
+    """
+    if not _records:
+        return {}
+
+    # Identify the existing articles in batches by title or article number
+    if _match_by == const.IMPORT_SETTINGS.MATCH_BY_NUMBER:
+        _match_field = const.SOBJECT_FIELDS.ARTICLE_NUMBER
+        _values = [_record[_match_field] for _record in _records if _record.get(_match_field)]
+        _matches = knowledge_module.get_article_ids_from_numbers(sfdc_object, _values, sobject=_sobject) if _values else {}
+    else:
+        _match_field = const.SOBJECT_FIELDS.TITLE
+        _matches = {
+            _title: _ids[0]
+            for _title, _ids in knowledge_module.check_for_existing_articles(
+                sfdc_object, [_record[_match_field] for _record in _records], sobject=_sobject
+            ).items()
+        }
+    _matched_ids = {_record[const.SOBJECT_FIELDS.ID]: _matches.get(_record.get(_match_field)) or None for _record in _records}
+    if not any(_matched_ids.values()):
+        return {}
+
+    # Retrieve the draft and online versions of the matched articles
+    _version_ids = list(dict.fromkeys(_id for _id in _matched_ids.values() if _id))
+    _knowledge_article_ids = {
+        _record[const.SOBJECT_FIELDS.ID]: _record[const.SOBJECT_FIELDS.KNOWLEDGE_ARTICLE_ID]
+        for _record in _query_in_chunks(sfdc_object, _sobject, const.SOBJECT_FIELDS.ID, _version_ids)
+    }
+    _versions = {}
+    for _record in _query_in_chunks(
+        sfdc_object,
+        _sobject,
+        const.SOBJECT_FIELDS.KNOWLEDGE_ARTICLE_ID,
+        list(dict.fromkeys(_knowledge_article_ids.values())),
+        [const.SOBJECT_FIELD_VALUES.DRAFT, const.SOBJECT_FIELD_VALUES.ONLINE],
+    ):
+        _statuses = _versions.setdefault(_record[const.SOBJECT_FIELDS.KNOWLEDGE_ARTICLE_ID], {})
+        _statuses[_record[const.SOBJECT_FIELDS.PUBLISH_STATUS]] = _record[const.SOBJECT_FIELDS.ID]
+
+    # Create drafts for the articles that only have an online version
+    _online_only = [_ka_id for _ka_id, _statuses in _versions.items() if const.SOBJECT_FIELD_VALUES.DRAFT not in _statuses]
+    _new_drafts = (
+        knowledge_module.create_drafts_from_online_articles(sfdc_object, _online_only, max_workers=_max_workers)
+        if _online_only
+        else {}
+    )
+
+    # Map each exported article to the draft of its existing article
+    _drafts = {}
+    for _source_id, _version_id in _matched_ids.items():
+        _ka_id = _knowledge_article_ids.get(_version_id)
+        if not _ka_id:
+            continue
+        if _ka_id in _new_drafts:
+            _drafts[_source_id] = (_new_drafts[_ka_id]['draft_id'], _new_drafts[_ka_id]['error'])
+        elif const.SOBJECT_FIELD_VALUES.DRAFT in _versions.get(_ka_id, {}):
+            _drafts[_source_id] = (_versions[_ka_id][const.SOBJECT_FIELD_VALUES.DRAFT], None)
+    return _drafts
+
+
+def _assign_categories(sfdc_object, _category_file: str, _articles: dict, _max_workers: int) -> int:
+    """This function assigns the exported data category selections of a page to the imported drafts.
+
+    .. versionadded:: 1.6.0
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param _category_file: The JSON Lines file with the exported data category selections
+    :type _category_file: str
+    :param _articles: The import results keyed by the exported ``Id``
+    :type _articles: dict
+    :param _max_workers: The maximum number of concurrent API calls
+    :type _max_workers: int
+    :returns: The number of data category selections that were created
+    :raises: :py:exc:`RuntimeError`
+    """
+    if not os.path.isfile(_category_file):
+        return 0
+    _assignments = []
+    for _selection in _read_json_lines(_category_file):
+        _article = _articles.get(_selection.get(const.SOBJECT_FIELDS.PARENT_ID)) or {}
+        if _article.get('action') in ('created', 'updated'):
+            _assignments.append(
+                (
+                    _article['target_id'],
+                    _selection[const.SOBJECT_FIELDS.DATA_CATEGORY_GROUP_NAME],
+                    _selection[const.SOBJECT_FIELDS.DATA_CATEGORY_NAME],
+                )
+            )
+    if not _assignments:
+        return 0
+    _results = knowledge_module.assign_data_categories(sfdc_object, _assignments, max_workers=_max_workers)
+    for _result in _results:
+        if _result['status'] == 'failed':
+            logger.error(
+                f'Failed to assign the {_result["category_group_name"]}:{_result["category_name"]} data category '
+                f'to the article {_result["article_id"]}: {_result["error"]}'
+            )
+    return sum(1 for _result in _results if _result['status'] == 'created')
+
+
+def _get_writable_fields(sfdc_object, _sobject: str, _fields: Optional[Union[str, list, tuple]]) -> tuple:
+    """This function identifies the fields that can be written when creating and updating articles.
+
+    .. versionadded:: 1.6.0
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param _sobject: The Knowledge sObject into which the articles are imported
+    :type _sobject: str
+    :param _fields: The explicitly defined fields to import (if any)
+    :type _fields: str, list, tuple, None
+    :returns: Tuple with the set of createable fields and the set of updateable fields
+    :raises: :py:exc:`RuntimeError`,
+             :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+    """
+    _fields = knowledge_module._validate_field_names(_fields)
+    if _fields:
+        _field_names = set(_fields) | const.SOBJECT_FIELDS.REQUIRED_ARTICLE_CREATE_UPDATE_FIELDS
+        _field_names -= const.IMPORT_SETTINGS.EXCLUDED_FIELDS
+        return _field_names, set(_field_names)
+    _describe_fields = sfdc_object.describe_object(_sobject).get(const.RESPONSE_KEYS.FIELDS, [])
+    _create_fields, _update_fields = set(), set()
+    for _field in _describe_fields:
+        if _field[const.RESPONSE_KEYS.NAME] in const.IMPORT_SETTINGS.EXCLUDED_FIELDS:
+            continue
+        if _field.get(const.RESPONSE_KEYS.CREATEABLE):
+            _create_fields.add(_field[const.RESPONSE_KEYS.NAME])
+        if _field.get(const.RESPONSE_KEYS.UPDATEABLE):
+            _update_fields.add(_field[const.RESPONSE_KEYS.NAME])
+    return _create_fields, _update_fields
+
+
+def _query_in_chunks(
+    sfdc_object,
+    _sobject: str,
+    _field: str,
+    _values: list,
+    _publish_statuses: Optional[list] = None,
+) -> list:
+    """This function queries the ID, Knowledge Article ID and publish status of versions with ``IN`` queries.
+
+    .. versionadded:: 1.6.0
+
+    The values are escaped as bind values and split across as many queries as the SOQL and URI length limits require.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param _sobject: The Knowledge sObject to query
+    :type _sobject: str
+    :param _field: The ID field to filter with the ``IN`` clause
+    :type _field: str
+    :param _values: The ID values for the ``IN`` clause
+    :type _values: list
+    :param _publish_statuses: The publish statuses by which to filter the versions (optional)
+    :type _publish_statuses: list, None
+    :returns: List of the retrieved records
+    :raises: :py:exc:`RuntimeError`
+    """
+    if not _values:
+        return []
+    _select_fields = ', '.join(
+        (const.SOBJECT_FIELDS.ID, const.SOBJECT_FIELDS.KNOWLEDGE_ARTICLE_ID, const.SOBJECT_FIELDS.PUBLISH_STATUS)
+    )
+    _query = f'SELECT {_select_fields} FROM {_sobject} WHERE {_field} IN :values'
+    _binds = {'values': list(_values)}
+    if _publish_statuses:
+        _query += f' AND {const.SOBJECT_FIELDS.PUBLISH_STATUS} IN :statuses'
+        _binds['statuses'] = tuple(_publish_statuses)
+    return soql_module.compile_query(_query).query_all(sfdc_object, **_binds)
+
+
+def _get_article_result(_target_id: Optional[str], _action: str, _error: Optional[str] = None) -> dict:
+    """This function returns the journal entry that records the outcome of importing an article."""
+    return {'target_id': _target_id, 'action': _action, 'published': False, 'error': _error}
+
+
+def _get_collection_error_message(_response: dict) -> str:
+    """This function returns the error message(s) from an unsuccessful sObject Collections result."""
+    return (
+        '; '.join(
+            str(_error.get(const.RESPONSE_KEYS.MESSAGE, _error))
+            for _error in _response.get(const.RESPONSE_KEYS.ERRORS) or [{}]
+            if isinstance(_error, dict)
+        )
+        or 'No result was returned for the article'
+    )
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            salespyforce.records
+:Synopsis:          Defines the compact record objects that can be used to store SOQL query results efficiently
+:Usage:             ``from salespyforce.records import compact_records``
+:Example:           ``records = compact_records(response['records'])``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+from __future__ import annotations
+
+import keyword
+import sys
+import threading
+from typing import Any, Iterable, Optional
+
+from . import constants as const
+from .utils import log_utils
+
+# Initialize logging
+logger = log_utils.initialize_logging(__name__)
+
+# Define the cache of generated record classes keyed by the sObject type and field names
+_RECORD_CLASSES = {}
+_RECORD_CLASSES_LOCK = threading.Lock()
+
+
+class CompactRecord:
+    """This is the base class for the compact record classes that are generated for each query field list.
+
+    .. versionadded:: 1.6.0
+
+    Each generated class defines its field names in ``__slots__`` so that every record only stores an array of
+    pointers to its values rather than a dictionary of field names. The values can be accessed as attributes
+    (e.g. ``record.Name``) or with dictionary-style lookups (e.g. ``record['Name']`` or ``record.get('Name')``).
+    The per-record ``attributes`` data is not retained, although the sObject type is stored on the class.
+    """
+
+    __slots__ = ()
+    _fields = ()
+    _sobject_type = None
+
+    def __getitem__(self, field: str) -> Any:
+        """This method returns the value of a field using a dictionary-style lookup."""
+        if field not in self._fields:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __contains__(self, field: str) -> bool:
+        """This method determines if a field is present in the record."""
+        return field in self._fields
+
+    def __iter__(self):
+        """This method iterates over the field names of the record in the same way as a dictionary."""
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        """This method returns the number of fields in the record."""
+        return len(self._fields)
+
+    def __eq__(self, other: Any) -> bool:
+        """This method compares the record to another compact record or a dictionary."""
+        if isinstance(other, CompactRecord):
+            return self._fields == other._fields and self.values() == other.values()
+        if isinstance(other, dict):
+            return self.to_dict() == {_key: _val for _key, _val in other.items() if _key != const.RESPONSE_KEYS.ATTRIBUTES}
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """This method returns a string representation of the record."""
+        _values = ', '.join(f'{_field}={getattr(self, _field)!r}' for _field in self._fields)
+        return f'{type(self).__name__}({_values})'
+
+    def __reduce__(self) -> tuple:
+        """This method allows records of the dynamically generated classes to be pickled."""
+        return _rebuild_record, (self._sobject_type, self._fields, self.values())
+
+    def get(self, field: str, default: Any = None) -> Any:
+        """This method returns the value of a field or a default value if the field is not present.
+
+        :param field: The name of the field
+        :type field: str
+        :param default: The value to return if the field is not present (``None`` by default)
+        :returns: The field value or the default value
+        """
+        return getattr(self, field) if field in self._fields else default
+
+    def keys(self) -> tuple:
+        """This method returns the field names of the record.
+
+        :returns: Tuple with the field names
+        """
+        return self._fields
+
+    def values(self) -> tuple:
+        """This method returns the field values of the record.
+
+        :returns: Tuple with the field values
+        """
+        return tuple(getattr(self, _field) for _field in self._fields)
+
+    def items(self) -> tuple:
+        """This method returns the field names and values of the record.
+
+        :returns: Tuple with a tuple for each field name and value
+        """
+        return tuple(zip(self._fields, self.values()))
+
+    def to_dict(self) -> dict:
+        """This method converts the record (and any nested records) into a dictionary.
+
+        :returns: Dictionary with the field names and values of the record
+        """
+        return {_field: _to_dict_value(getattr(self, _field)) for _field in self._fields}
+
+
+def get_record_class(fields: Iterable[str], sobject_type: Optional[str] = None) -> Optional[type]:
+    """This function returns the compact record class for a given field list, generating it on first use.
+
+    .. versionadded:: 1.6.0
+
+    :param fields: The names of the fields in the order they are returned by the API
+    :type fields: Iterable[str]
+    :param sobject_type: The sObject type of the records (optional)
+    :type sobject_type: str, None
+    :returns: The record class or ``None`` if the field names cannot be used as attributes
+    """
+    fields = tuple(fields)
+    _key = (sobject_type, fields)
+    _record_class = _RECORD_CLASSES.get(_key)
+    if _record_class is not None:
+        return _record_class
+
+    # Ensure the field names can be defined as slots without overriding the record methods
+    if any(not _is_valid_field_name(_field) for _field in fields) or len(set(fields)) != len(fields):
+        logger.warning(f'The fields {fields} cannot be used for a compact record and dictionaries will be used instead')
+        return None
+
+    with _RECORD_CLASSES_LOCK:
+        _record_class = _RECORD_CLASSES.get(_key)
+        if _record_class is None:
+            _fields = tuple(sys.intern(_field) for _field in fields)
+            _class_name = sobject_type if sobject_type and sobject_type.isidentifier() else 'Record'
+            _record_class = type(
+                _class_name,
+                (CompactRecord,),
+                {'__slots__': _fields, '_fields': _fields, '_sobject_type': sobject_type, '__module__': __name__},
+            )
+            _RECORD_CLASSES[_key] = _record_class
+    return _record_class
+
+
+def compact_record(record: dict) -> Any:
+    """This function converts a record dictionary from an API response into a compact record object.
+
+    .. versionadded:: 1.6.0
+
+    Nested relationship records are converted as well, and the records of any nested subquery results are
+    converted while the subquery result itself remains a dictionary.
+
+    :param record: The record dictionary (including the optional ``attributes`` data)
+    :type record: dict
+    :returns: The compact record object (or the original dictionary if it cannot be converted)
+    """
+    if not isinstance(record, dict):
+        return record
+    _attributes = record.get(const.RESPONSE_KEYS.ATTRIBUTES)
+    _sobject_type = _attributes.get(const.RESPONSE_KEYS.TYPE) if isinstance(_attributes, dict) else None
+    _fields = tuple(_field for _field in record if _field != const.RESPONSE_KEYS.ATTRIBUTES)
+    _record_class = get_record_class(_fields, _sobject_type)
+    if _record_class is None:
+        return record
+    _record = _record_class.__new__(_record_class)
+    for _field in _fields:
+        object.__setattr__(_record, _field, _compact_value(record[_field]))
+    return _record
+
+
+def compact_records(records: Iterable[dict]) -> list:
+    """This function converts a list of record dictionaries from an API response into compact record objects.
+
+    .. versionadded:: 1.6.0
+
+    :param records: The record dictionaries (e.g. the ``records`` value of a SOQL query response)
+    :type records: Iterable[dict]
+    :returns: List of the compact record objects
+    """
+    return [compact_record(_record) for _record in records]
+
+
+def _compact_value(_value: Any) -> Any:
+    """This function converts nested relationship records and subquery results within a field value."""
+    if isinstance(_value, dict):
+        if const.RESPONSE_KEYS.ATTRIBUTES in _value:
+            return compact_record(_value)
+        if isinstance(_value.get(const.RESPONSE_KEYS.RECORDS), list):
+            _value = dict(_value)
+            _value[const.RESPONSE_KEYS.RECORDS] = compact_records(_value[const.RESPONSE_KEYS.RECORDS])
+    return _value
+
+
+def _to_dict_value(_value: Any) -> Any:
+    """This function converts nested compact records within a field value back into dictionaries."""
+    if isinstance(_value, CompactRecord):
+        return _value.to_dict()
+    if isinstance(_value, dict) and isinstance(_value.get(const.RESPONSE_KEYS.RECORDS), list):
+        _value = dict(_value)
+        _value[const.RESPONSE_KEYS.RECORDS] = [_to_dict_value(_record) for _record in _value[const.RESPONSE_KEYS.RECORDS]]
+    return _value
+
+
+def _is_valid_field_name(_field: Any) -> bool:
+    """This function determines if a field name can be defined as a slot on a compact record class."""
+    return (
+        isinstance(_field, str)
+        and _field.isidentifier()
+        and not keyword.iskeyword(_field)
+        and not _field.startswith('_')
+        and not hasattr(CompactRecord, _field)
+    )
+
+
+def _rebuild_record(_sobject_type: Optional[str], _fields: tuple, _values: tuple) -> CompactRecord:
+    """This function rebuilds a compact record when it is unpickled."""
+    _record_class = get_record_class(_fields, _sobject_type)
+    _record = _record_class.__new__(_record_class)
+    for _field, _value in zip(_fields, _values):
+        object.__setattr__(_record, _field, _value)
+    return _record
@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            salespyforce.search
+:Synopsis:          Defines the functions that perform parameterized SOSL searches for one or many search terms
+:Usage:             ``from salespyforce.search import parameterized_search, search_many``
+:Example:           ``records = search_many(sfdc, ['Acme', 'Globex'], returning={'Account': ['Id', 'Name']})``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+from __future__ import annotations
+
+from typing import Iterator, Optional, Union
+
+from . import constants as const
+from . import errors
+from .utils import concurrency_utils, log_utils
+
+# Initialize logging
+logger = log_utils.initialize_logging(__name__)
+
+# Define the keys that can be included in the object definitions of the returning value
+_SOBJECT_SPEC_KEYS = (
+    const.QUERY_PARAMS.NAME,
+    const.QUERY_PARAMS.FIELDS,
+    const.QUERY_PARAMS.LIMIT,
+    const.QUERY_PARAMS.WHERE,
+    const.QUERY_PARAMS.ORDER_BY,
+)
+
+
+def parameterized_search(
+    sfdc_object,
+    search_term: str,
+    returning: Optional[Union[str, list, tuple, dict]] = None,
+    fields: Optional[Union[str, list, tuple]] = None,
+    search_in: Optional[str] = None,
+    default_limit: Optional[int] = None,
+    overall_limit: Optional[int] = None,
+    offset: Optional[int] = None,
+) -> dict:
+    """This function performs a SOSL search using the ``parameterizedSearch`` resource.
+    (`Reference <https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_search_parameterized.htm>`__)
+
+    .. versionadded:: 1.6.0
+
+    The ``returning`` value defines the objects to search (i.e. the ``RETURNING`` clause) and can be an object
+    name (e.g. ``Account``), a list of object names, or a dictionary that maps each object name to its list of
+    fields or to a dictionary with its ``fields``, ``limit``, ``where`` and ``orderBy`` values (e.g.
+    ``{'Account': {'fields': ['Id', 'Name'], 'limit': 5}}``).
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param search_term: The string for which to search
+    :type search_term: str
+    :param returning: The objects to search along with their fields and limits (all searchable objects by default)
+    :type returning: str, list, tuple, dict, None
+    :param fields: The fields to return for every object that does not define its own fields (optional)
+    :type fields: str, list, tuple, None
+    :param search_in: The search group (i.e. ``ALL``, ``NAME``, ``EMAIL``, ``PHONE`` or ``SIDEBAR``) (optional)
+    :type search_in: str, None
+    :param default_limit: The maximum number of records to return for each object (optional)
+    :type default_limit: int, None
+    :param overall_limit: The maximum number of records to return across every object (optional)
+    :type overall_limit: int, None
+    :param offset: The starting row offset into the results, which requires a single object (optional)
+    :type offset: int, None
+    :returns: The search response data in JSON format
+    :raises: :py:exc:`RuntimeError`,
+             :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+    """
+    payload = _construct_search_payload(search_term, returning, fields, search_in, default_limit, overall_limit, offset)
+    endpoint = const.REST_PATHS.PARAMETERIZED_SEARCH.format(api_version=sfdc_object.version)
+    return sfdc_object.post(endpoint=endpoint, payload=payload)
+
+
+def iter_search_records(
+    sfdc_object,
+    search_term: str,
+    returning: Union[str, list, tuple, dict],
+    fields: Optional[Union[str, list, tuple]] = None,
+    search_in: Optional[str] = None,
+    page_size: int = const.SEARCH_SETTINGS.DEFAULT_PAGE_SIZE,
+    max_records: Optional[int] = None,
+) -> Iterator[dict]:
+    """This function yields the records that match a search term while paginating through the results of one object.
+
+    .. versionadded:: 1.6.0
+
+    Each page is only retrieved once the records of the previous page have been consumed. As SOSL only supports an
+    offset when searching a single object, the ``returning`` value must define exactly one object and the results
+    are limited to the maximum offset of 2000 records.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param search_term: The string for which to search
+    :type search_term: str
+    :param returning: The object to search along with its fields (e.g. ``{'Account': ['Id', 'Name']}``)
+    :type returning: str, list, tuple, dict
+    :param fields: The fields to return when they are not defined by the ``returning`` value (optional)
+    :type fields: str, list, tuple, None
+    :param search_in: The search group (i.e. ``ALL``, ``NAME``, ``EMAIL``, ``PHONE`` or ``SIDEBAR``) (optional)
+    :type search_in: str, None
+    :param page_size: The number of records to retrieve per page (``200`` by default)
+    :type page_size: int
+    :param max_records: Stops the iteration once this number of records has been yielded (optional)
+    :type max_records: int, None
+    :returns: Generator that yields each record
+    :raises: :py:exc:`RuntimeError`,
+             :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+    """
+    sobject_specs = _get_sobject_specs(returning)
+    if not sobject_specs or len(sobject_specs) != 1:
+        error_msg = 'Exactly one object must be defined in the returning value to paginate through search results'
+        logger.error(error_msg)
+        raise errors.exceptions.InvalidParameterError(error_msg)
+
+    # Yield the records of each page until the results, the maximum offset or the maximum records have been reached
+    offset, yielded = 0, 0
+    while offset <= const.SEARCH_SETTINGS.MAX_OFFSET:
+        sobject_spec = {**sobject_specs[0], const.QUERY_PARAMS.LIMIT: page_size}
+        response = parameterized_search(
+            sfdc_object, search_term, returning=[sobject_spec], fields=fields, search_in=search_in, offset=offset
+        )
+        records = (response or {}).get(const.RESPONSE_KEYS.SEARCH_RECORDS) or []
+        for record in records:
+            yield record
+            yielded += 1
+            if max_records is not None and yielded >= max_records:
+                return
+        if len(records) < page_size:
+            return
+        offset += page_size
+
+
+def search_many(
+    sfdc_object,
+    search_terms: Union[list, tuple, set],
+    returning: Optional[Union[str, list, tuple, dict]] = None,
+    fields: Optional[Union[str, list, tuple]] = None,
+    search_in: Optional[str] = None,
+    default_limit: Optional[int] = None,
+    overall_limit: Optional[int] = None,
+    max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+    requests_per_second: Optional[Union[int, float]] = None,
+) -> dict:
+    """This function performs parameterized SOSL searches for many search terms concurrently and merges the results.
+
+    .. versionadded:: 1.6.0
+
+    Duplicate search terms are only searched once and a record that matches multiple search terms is only returned
+    once. The records are ordered by the search terms they matched and then by their order in the search results. A
+    failed search is logged without affecting the results of the other search terms.
+
+    :param sfdc_object: The instantiated SalesPyForce object
+    :type sfdc_object: class[salespyforce.Salesforce]
+    :param search_terms: The strings for which to search
+    :type search_terms: list, tuple, set
+    :param returning: The objects to search along with their fields and limits (all searchable objects by default)
+    :type returning: str, list, tuple, dict, None
+    :param fields: The fields to return for every object that does not define its own fields (optional)
+    :type fields: str, list, tuple, None
+    :param search_in: The search group (i.e. ``ALL``, ``NAME``, ``EMAIL``, ``PHONE`` or ``SIDEBAR``) (optional)
+    :type search_in: str, None
+    :param default_limit: The maximum number of records to return for each object per search term (optional)
+    :type default_limit: int, None
+    :param overall_limit: The maximum number of records to return across every object per search term (optional)
+    :type overall_limit: int, None
+    :param max_workers: The maximum number of searches to perform concurrently (``8`` by default)
+    :type max_workers: int
+    :param requests_per_second: The maximum number of API calls to perform per second (unlimited by default)
+    :type requests_per_second: int, float, None
+    :returns: Dictionary that maps the ``Id`` value of each record to the record
+    :raises: :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+    """
+    # Validate the search parameters once before any searches are performed
+    search_terms = list(dict.fromkeys(search_terms or []))
+    for search_term in search_terms:
+        _construct_search_payload(search_term, returning, fields, search_in, default_limit, overall_limit)
+
+    # Define the function that performs the search for a single search term
+    def _search(_search_term: str) -> list:
+        _response = parameterized_search(
+            sfdc_object,
+            _search_term,
+            returning=returning,
+            fields=fields,
+            search_in=search_in,
+            default_limit=default_limit,
+            overall_limit=overall_limit,
+        )
+        return (_response or {}).get(const.RESPONSE_KEYS.SEARCH_RECORDS) or []
+
+    # Perform the searches concurrently and merge the records by their IDs
+    rate_limiter = concurrency_utils.RateLimiter(requests_per_second) if requests_per_second else None
+    results = concurrency_utils.run_concurrently(
+        _search, search_terms, max_workers=max_workers, return_exceptions=True, rate_limiter=rate_limiter
+    )
+    records = {}
+    for search_term, result in zip(search_terms, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to perform the search for '{search_term}': {result}")
+            continue
+        for record in result:
+            records.setdefault(record.get(const.SOBJECT_FIELDS.ID), record)
+    return records
+
+
+def _construct_search_payload(
+    _search_term: str,
+    _returning: Optional[Union[str, list, tuple, dict]] = None,
+    _fields: Optional[Union[str, list, tuple]] = None,
+    _search_in: Optional[str] = None,
+    _default_limit: Optional[int] = None,
+    _overall_limit: Optional[int] = None,
+    _offset: Optional[int] = None,
+) -> dict:
+    """This function constructs and validates the payload of a parameterized search.
+
+    .. versionadded:: 1.6.0
+
+    :param _search_term: The string for which to search
+    :type _search_term: str
+    :param _returning: The objects to search along with their fields and limits
+    :type _returning: str, list, tuple, dict, None
+    :param _fields: The fields to return for every object that does not define its own fields
+    :type _fields: str, list, tuple, None
+    :param _search_in: The search group
+    :type _search_in: str, None
+    :param _default_limit: The maximum number of records to return for each object
+    :type _default_limit: int, None
+    :param _overall_limit: The maximum number of records to return across every object
+    :type _overall_limit: int, None
+    :param _offset: The starting row offset into the results
+    :type _offset: int, None
+    :returns: The search payload
+    :raises: :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+    """
+    if not isinstance(_search_term, str) or not _search_term.strip():
+        error_msg = 'The search term must be a non-empty string'
+        logger.error(error_msg)
+        raise errors.exceptions.InvalidParameterError(error_msg)
+    _payload = {const.QUERY_PARAMS.Q: _search_term}
+    _sobject_specs = _get_sobject_specs(_returning)
+    if _sobject_specs:
+        _payload[const.QUERY_PARAMS.SOBJECTS] = _sobject_specs
+    if _fields:
+        _payload[const.QUERY_PARAMS.FIELDS] = _get_field_list(_fields)
+    if _search_in:
+        if _search_in.upper() not in const.SEARCH_SETTINGS.VALID_SEARCH_GROUPS:
+            error_msg = f"The search group '{_search_in}' is invalid"
+            logger.error(error_msg)
+            raise errors.exceptions.InvalidParameterError(error_msg)
+        _payload[const.QUERY_PARAMS.IN] = _search_in.upper()
+    if _default_limit:
+        _payload[const.QUERY_PARAMS.DEFAULT_LIMIT] = _default_limit
+    if _overall_limit:
+        _payload[const.QUERY_PARAMS.OVERALL_LIMIT] = _overall_limit
+    if _offset is not None:
+        if not _sobject_specs or len(_sobject_specs) != 1 or not 0 <= _offset <= const.SEARCH_SETTINGS.MAX_OFFSET:
+            error_msg = f'An offset requires exactly one object and must be between 0 and {const.SEARCH_SETTINGS.MAX_OFFSET}'
+            logger.error(error_msg)
+            raise errors.exceptions.InvalidParameterError(error_msg)
+        _payload[const.QUERY_PARAMS.OFFSET] = _offset
+    return _payload
+
+
+def _get_sobject_specs(_returning: Optional[Union[str, list, tuple, dict]]) -> Optional[list]:
+    """This function converts the ``returning`` value of a search into the ``sobjects`` list of the payload.
+
+    .. versionadded:: 1.6.0
+
+    Each object definition is validated so that it only includes the ``name``, ``fields``, ``limit``, ``where`` and
+    ``orderBy`` keys, where the ``limit`` is a positive integer and the ``where`` and ``orderBy`` values are strings.
+
+    :param _returning: The objects to search along with their fields and limits
+    :type _returning: str, list, tuple, dict, None
+    :returns: List of object dictionaries with the ``name`` value and optional ``fields``, ``limit``, ``where`` and
+              ``orderBy`` values (or ``None`` if no objects were defined)
+    :raises: :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+    """
+    if not _returning:
+        return None
+    if isinstance(_returning, str):
+        _returning = [_name.strip() for _name in _returning.split(',') if _name.strip()]
+    if isinstance(_returning, dict):
+        _returning = [
+            {const.QUERY_PARAMS.NAME: _name, **_spec}
+            if isinstance(_spec, dict)
+            else {const.QUERY_PARAMS.NAME: _name, const.QUERY_PARAMS.FIELDS: _spec}
+            if _spec
+            else _name
+            for _name, _spec in _returning.items()
+        ]
+    _specs = []
+    for _spec in _returning:
+        if isinstance(_spec, str):
+            _spec = {const.QUERY_PARAMS.NAME: _spec}
+        if not isinstance(_spec, dict) or not _spec.get(const.QUERY_PARAMS.NAME):
+            error_msg = f'The object definition {_spec} in the returning value must include an object name'
+            logger.error(error_msg)
+            raise errors.exceptions.InvalidParameterError(error_msg)
+        _name = _spec[const.QUERY_PARAMS.NAME]
+        _unsupported = [_key for _key in _spec if _key not in _SOBJECT_SPEC_KEYS]
+        if _unsupported:
+            error_msg = (
+                f'The object definition for {_name} includes unsupported key(s) ({", ".join(map(str, _unsupported))}) '
+                f'and can only include the following keys: {", ".join(_SOBJECT_SPEC_KEYS)}'
+            )
+            logger.error(error_msg)
+            raise errors.exceptions.InvalidParameterError(error_msg)
+
+        # Construct the object definition with the validated values
+        _object_spec = {const.QUERY_PARAMS.NAME: _name}
+        if _spec.get(const.QUERY_PARAMS.FIELDS):
+            _object_spec[const.QUERY_PARAMS.FIELDS] = _get_field_list(_spec[const.QUERY_PARAMS.FIELDS])
+        _limit = _spec.get(const.QUERY_PARAMS.LIMIT)
+        if _limit is not None:
+            if not isinstance(_limit, int) or isinstance(_limit, bool) or _limit < 1:
+                error_msg = f'The limit for the {_name} object must be a positive integer'
+                logger.error(error_msg)
+                raise errors.exceptions.InvalidParameterError(error_msg)
+            _object_spec[const.QUERY_PARAMS.LIMIT] = _limit
+        for _clause_key in (const.QUERY_PARAMS.WHERE, const.QUERY_PARAMS.ORDER_BY):
+            _clause = _spec.get(_clause_key)
+            if _clause is None:
+                continue
+            if not isinstance(_clause, str) or not _clause.strip():
+                error_msg = f'The {_clause_key} value for the {_name} object must be a non-empty string'
+                logger.error(error_msg)
+                raise errors.exceptions.InvalidParameterError(error_msg)
+            _object_spec[_clause_key] = _clause.strip()
+        _specs.append(_object_spec)
+    return _specs
+
+
+def _get_field_list(_fields: Union[str, list, tuple]) -> list:
+    """This function converts a comma-separated string or collection of field names into a list of field names.
+
+    .. versionadded:: 1.6.0
+
+    :param _fields: The field names
+    :type _fields: str, list, tuple
+    :returns: List of the field names
+    """
+    if isinstance(_fields, str):
+        _fields = _fields.split(',')
+    return [_field.strip() for _field in _fields if _field and _field.strip()]
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            salespyforce.soql
+:Synopsis:          Defines the SOQL query builder that compiles query templates with safely escaped bind values
+:Usage:             ``from salespyforce.soql import compile_query``
+:Example:           ``query = compile_query('SELECT Id FROM Account WHERE Name = :name').render(name="O'Brien")``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, Iterator
+
+from . import constants as const
+from . import errors
+from .utils import core_utils, log_utils
+
+# Initialize logging
+logger = log_utils.initialize_logging(__name__)
+
+# Define the pattern that identifies the string literals and the bind placeholders (e.g. ``:name``) of a template
+_BIND_REGEX = re.compile(r"'(?:\\.|[^'\\])*'|:(?P<name>[A-Za-z_]\w*)")
+
+
+class SoqlQuery(str):
+    """This class is a rendered SOQL query string that also stores its URL-encoded form.
+
+    .. versionadded:: 1.6.0
+
+    As the class is a subclass of :py:class:`str`, the query can be used anywhere a query string is accepted. The
+    :py:meth:`salespyforce.core.Salesforce.soql_query` method uses the ``encoded`` value rather than encoding the
+    query again.
+    """
+
+    encoded: str
+
+    def __new__(cls, query: str, encoded: str) -> SoqlQuery:
+        """This method instantiates the rendered query with its URL-encoded form."""
+        _query = super().__new__(cls, query)
+        _query.encoded = encoded
+        return _query
+
+
+class SoqlTemplate:
+    """This class is a compiled SOQL query template with named bind placeholders (e.g. ``:title``).
+
+    .. versionadded:: 1.6.0
+
+    The template is parsed and its literal segments are URL-encoded once when compiled, so each rendered query only
+    escapes and encodes its bind values. Placeholders within string literals of the template are ignored. The bind
+    values are converted into SOQL literals as follows:
+
+    * ``str`` - An escaped string literal (e.g. ``'O\\'Brien'``)
+    * ``bool`` and ``None`` - The ``true``, ``false`` and ``null`` literals
+    * ``int``, ``float`` and ``Decimal`` - A numeric literal without an exponent (``NaN`` and infinity are rejected)
+    * ``datetime`` and ``date`` - A ``dateTime`` literal in UTC or a ``date`` literal
+    * ``list``, ``tuple``, ``set`` and ``frozenset`` - A parenthesized list of literals for ``IN`` clauses
+
+    :param template: The SOQL query template
+    :type template: str
+    :raises: :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+    """
+
+    def __init__(self, template: str) -> None:
+        """This method instantiates the template object and compiles the template."""
+        if not isinstance(template, str) or not template.strip():
+            error_msg = 'The SOQL query template must be a non-empty string'
+            logger.error(error_msg)
+            raise errors.exceptions.InvalidParameterError(error_msg)
+        self.template = template
+        self._literals, self._binds = [], []
+        _position = 0
+        for _match in _BIND_REGEX.finditer(template):
+            if _match.group('name'):
+                self._literals.append(template[_position : _match.start()])
+                self._binds.append(_match.group('name'))
+                _position = _match.end()
+        self._literals.append(template[_position:])
+        self._encoded_literals = [core_utils.url_encode(_literal) for _literal in self._literals]
+        self.bind_names = tuple(dict.fromkeys(self._binds))
+
+    def render(self, **values) -> SoqlQuery:
+        """This method renders the query by replacing the bind placeholders with their escaped values.
+
+        :param values: The values of the bind placeholders as keyword arguments
+        :returns: The rendered query as a :py:class:`salespyforce.soql.SoqlQuery` string
+        :raises: :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`,
+                 :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+        """
+        missing = [_name for _name in self.bind_names if _name not in values]
+        if missing:
+            error_msg = f'The SOQL query is missing values for the following bind placeholder(s): {", ".join(missing)}'
+            logger.error(error_msg)
+            raise errors.exceptions.MissingRequiredDataError(error_msg)
+        literals = {_name: format_soql_value(values[_name]) for _name in self.bind_names}
+        query, encoded = [self._literals[0]], [self._encoded_literals[0]]
+        for name, literal, encoded_literal in zip(self._binds, self._literals[1:], self._encoded_literals[1:]):
+            query.extend((literals[name], literal))
+            encoded.extend((core_utils.url_encode(literals[name]), encoded_literal))
+        return SoqlQuery(''.join(query), ''.join(encoded))
+
+    def iter_queries(self, **values) -> Iterator[SoqlQuery]:
+        """This method renders as many queries as needed to keep the largest list of bind values within length limits.
+
+        The largest ``list``, ``tuple``, ``set`` or ``frozenset`` bind value is deduplicated and split with the
+        :py:func:`salespyforce.utils.core_utils.chunk_soql_values` function so that each ``IN`` clause stays within
+        the SOQL and URI length limits. A single query is rendered when no bind value is a collection.
+
+        :param values: The values of the bind placeholders as keyword arguments
+        :returns: Generator that yields each rendered query
+        :raises: :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`,
+                 :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+        """
+        collections = [_name for _name in self.bind_names if isinstance(values.get(_name), (list, tuple, set, frozenset))]
+        if not collections:
+            yield self.render(**values)
+            return
+        split_name = max(collections, key=lambda _name: len(values[_name]))
+        split_values = list(dict.fromkeys(values[split_name]))
+        if not split_values:
+            error_msg = f"The '{split_name}' bind value must include at least one value"
+            logger.error(error_msg)
+            raise errors.exceptions.InvalidParameterError(error_msg)
+        for chunk in core_utils.chunk_soql_values(split_values):
+            yield self.render(**{**values, split_name: chunk})
+
+    def execute(self, sfdc_object, **values) -> dict:
+        """This method renders the query and performs it with the :py:meth:`salespyforce.core.Salesforce.soql_query`
+        method.
+
+        :param sfdc_object: The instantiated SalesPyForce object
+        :type sfdc_object: class[salespyforce.Salesforce]
+        :param values: The values of the bind placeholders as keyword arguments
+        :returns: The result of the SOQL query
+        :raises: :py:exc:`RuntimeError`,
+                 :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`,
+                 :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+        """
+        return sfdc_object.soql_query(self.render(**values), replace_quotes=False)
+
+    def query_all(self, sfdc_object, **values) -> list:
+        """This method performs as many queries as needed for the bind values and returns the records of every page.
+
+        The queries are rendered with the :py:meth:`iter_queries` method so that large lists of ``IN`` clause values
+        are split across multiple queries, and the records of every query are merged into a single list.
+
+        :param sfdc_object: The instantiated SalesPyForce object
+        :type sfdc_object: class[salespyforce.Salesforce]
+        :param values: The values of the bind placeholders as keyword arguments
+        :returns: List of the retrieved records
+        :raises: :py:exc:`RuntimeError`,
+                 :py:exc:`salespyforce.errors.exceptions.MissingRequiredDataError`,
+                 :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+        """
+        records = []
+        for query in self.iter_queries(**values):
+            response = sfdc_object.soql_query(query, replace_quotes=False)
+            records.extend(response.get(const.RESPONSE_KEYS.RECORDS) or [])
+            while not response.get(const.RESPONSE_KEYS.DONE, True) and response.get(const.RESPONSE_KEYS.NEXT_RECORDS_URL):
+                response = sfdc_object.soql_query(response[const.RESPONSE_KEYS.NEXT_RECORDS_URL], next_records_url=True)
+                records.extend(response.get(const.RESPONSE_KEYS.RECORDS) or [])
+        return records
+
+
+@functools.lru_cache(maxsize=const.SOQL_QUERIES.MAX_COMPILED_TEMPLATES)
+def compile_query(template: str) -> SoqlTemplate:
+    """This function compiles a SOQL query template and caches the compiled template for subsequent calls.
+
+    .. versionadded:: 1.6.0
+
+    :param template: The SOQL query template with named bind placeholders (e.g. ``:title``)
+    :type template: str
+    :returns: The compiled :py:class:`salespyforce.soql.SoqlTemplate` object
+    :raises: :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+    """
+    return SoqlTemplate(template)
+
+
+def format_soql_value(value: Any) -> str:
+    """This function converts a Python value into a SOQL literal.
+
+    .. versionadded:: 1.6.0
+
+    :param value: The value to convert (e.g. a string, number, Boolean, date, datetime, ``None`` or collection)
+    :returns: The SOQL literal
+    :raises: :py:exc:`salespyforce.errors.exceptions.InvalidParameterError`
+    """
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, (float, Decimal)):
+        _value = Decimal(repr(value)) if isinstance(value, float) else value
+        if not _value.is_finite():
+            error_msg = f'The value {value!r} is not a finite number and cannot be used as a SOQL bind value'
+            logger.error(error_msg)
+            raise errors.exceptions.InvalidParameterError(error_msg)
+        return format(_value, 'f')
+    if isinstance(value, datetime):
+        _value = value.astimezone(timezone.utc) if value.tzinfo else value
+        return _value.strftime(const.SOQL_QUERIES.DATETIME_FORMAT)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        if not value:
+            error_msg = 'A collection used as a SOQL bind value must include at least one value'
+            logger.error(error_msg)
+            raise errors.exceptions.InvalidParameterError(error_msg)
+        return f'({", ".join(format_soql_value(_value) for _value in value)})'
+    if isinstance(value, str):
+        return f"'{core_utils.escape_soql_string(value)}'"
+    error_msg = f'The value {value!r} of type {type(value).__name__} cannot be used as a SOQL bind value'
+    logger.error(error_msg)
+    raise errors.exceptions.InvalidParameterError(error_msg)
@@ -4,7 +4,7 @@
 :Synopsis:       This is the ``__init__`` module for the salespyforce.utils modules
 :Created By:     Jeff Shurtliff
 :Last Modified:  Jeff Shurtliff
-:Modified Date:  13 Mar 2023
+:Modified Date:  18 Oct 2026
 """
 
-__all__ = ['core_utils', 'helper', 'version']
+__all__ = ['checkpoint', 'concurrency_utils', 'core_utils', 'helper', 'rich_text_utils', 'version']
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            salespyforce.utils.checkpoint
+:Synopsis:          Defines the checkpoint file used to resume long-running operations where they stopped
+:Usage:             ``from salespyforce.utils.checkpoint import Checkpoint``
+:Example:           ``checkpoint = Checkpoint('/tmp/export/.export_checkpoint.json')``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import Any, Hashable
+
+from . import log_utils
+
+# Initialize logging
+logger = log_utils.initialize_logging(__name__)
+
+
+class Checkpoint:
+    """This class is a thread-safe JSON checkpoint file that records the completed items of each stage.
+
+    .. versionadded:: 1.6.0
+
+    The checkpoint is written to a temporary file that replaces the original file so that an interruption while
+    saving never leaves a corrupted checkpoint behind. Any existing checkpoint file is loaded when instantiated.
+
+    :param file_path: The path to the checkpoint file
+    :type file_path: str
+    """
+
+    def __init__(self, file_path: str) -> None:
+        """This method instantiates the checkpoint object and loads any existing checkpoint file."""
+        self.file_path = file_path
+        self._lock = threading.RLock()
+        self._completed = {}
+        self._state = {}
+        if os.path.isfile(file_path):
+            with open(file_path, encoding='utf-8') as _file:
+                _data = json.load(_file)
+            self._completed = {_stage: set(_keys) for _stage, _keys in _data.get('completed', {}).items()}
+            self._state = _data.get('state', {})
+            logger.info(f'Resuming from the checkpoint file {file_path}')
+
+    def is_complete(self, stage: str, key: Hashable) -> bool:
+        """This method determines if an item of a stage has been completed.
+
+        :param stage: The name of the stage
+        :type stage: str
+        :param key: The key that identifies the item
+        :type key: str, int
+        :returns: Boolean value indicating whether the item has been completed
+        """
+        with self._lock:
+            return str(key) in self._completed.get(stage, set())
+
+    def mark_complete(self, stage: str, key: Hashable, save: bool = True) -> None:
+        """This method records that an item of a stage has been completed.
+
+        :param stage: The name of the stage
+        :type stage: str
+        :param key: The key that identifies the item
+        :type key: str, int
+        :param save: Determines if the checkpoint file should be saved immediately (``True`` by default)
+        :type save: bool
+        :returns: None
+        """
+        with self._lock:
+            self._completed.setdefault(stage, set()).add(str(key))
+            if save:
+                self.save()
+
+    def get_state(self, key: str, default: Any = None) -> Any:
+        """This method returns a value that has been stored in the checkpoint state.
+
+        :param key: The key of the state value
+        :type key: str
+        :param default: The value to return if the key is not present (``None`` by default)
+        :returns: The state value or the default value
+        """
+        with self._lock:
+            return self._state.get(key, default)
+
+    def set_state(self, key: str, value: Any, save: bool = True) -> None:
+        """This method stores a JSON-serializable value in the checkpoint state.
+
+        :param key: The key of the state value
+        :type key: str
+        :param value: The JSON-serializable value to store
+        :param save: Determines if the checkpoint file should be saved immediately (``True`` by default)
+        :type save: bool
+        :returns: None
+        """
+        with self._lock:
+            self._state[key] = value
+            if save:
+                self.save()
+
+    def save(self) -> None:
+        """This method writes the checkpoint to its file.
+
+        :returns: None
+        :raises: :py:exc:`OSError`
+        """
+        with self._lock:
+            _data = {
+                'completed': {_stage: sorted(_keys) for _stage, _keys in self._completed.items()},
+                'state': self._state,
+            }
+            _temp_path = f'{self.file_path}.tmp'
+            with open(_temp_path, 'w', encoding='utf-8') as _file:
+                json.dump(_data, _file)
+            os.replace(_temp_path, self.file_path)
+
+    def delete(self) -> None:
+        """This method removes the checkpoint file and clears the recorded progress.
+
+        :returns: None
+        """
+        with self._lock:
+            self._completed.clear()
+            self._state.clear()
+            if os.path.isfile(self.file_path):
+                os.remove(self.file_path)
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            salespyforce.utils.concurrency_utils
+:Synopsis:          Collection of utilities that support performing API calls concurrently
+:Usage:             ``from salespyforce.utils import concurrency_utils``
+:Example:           ``result = single_flight.do(key, requests.get, url)``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Iterable, Optional, Union
+
+from .. import constants as const
+from . import log_utils
+
+# Initialize logging
+logger = log_utils.initialize_logging(__name__)
+
+
+class _InFlightCall:
+    """This class tracks a single in-flight call and the outcome that will be shared with any waiting callers.
+
+    .. versionadded:: 1.6.0
+    """
+
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """This class deduplicates concurrent calls that share the same key so that only one call is performed.
+
+    .. versionadded:: 1.6.0
+
+    The first caller for a given key performs the call while any other callers that arrive before it completes
+    wait for and receive the same result (or exception). Once the call completes the key is released so that
+    subsequent calls are performed normally.
+    """
+
+    def __init__(self) -> None:
+        """This method instantiates the single-flight group."""
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._performed = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """This method performs the call for a key or waits for the identical in-flight call to complete.
+
+        :param key: The hashable key that identifies identical calls
+        :type key: Hashable
+        :param func: The function to call when no identical call is in flight
+        :type func: Callable
+        :param args: The positional arguments to pass to the function
+        :param kwargs: The keyword arguments to pass to the function
+        :returns: The result of the (possibly shared) call
+        :raises: Any exception raised by the shared call
+        """
+        with self._lock:
+            _call = self._calls.get(key)
+            _is_leader = _call is None
+            if _is_leader:
+                _call = _InFlightCall()
+                self._calls[key] = _call
+                self._performed += 1
+            else:
+                self._coalesced += 1
+
+        # Wait for the in-flight call to complete and share its outcome
+        if not _is_leader:
+            _call.event.wait()
+            if _call.error is not None:
+                raise _call.error
+            return _call.result
+
+        # Perform the call and release any waiting callers
+        try:
+            _call.result = func(*args, **kwargs)
+        except BaseException as exc:
+            _call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            _call.event.set()
+        return _call.result
+
+    @property
+    def stats(self) -> dict:
+        """This property returns the number of performed and coalesced calls.
+
+        :returns: Dictionary with the single-flight statistics
+        """
+        with self._lock:
+            return {
+                'performed': self._performed,
+                'coalesced': self._coalesced,
+                'in_flight': len(self._calls),
+            }
+
+
+class RateLimiter:
+    """This class is a thread-safe token bucket that limits the rate at which calls are performed.
+
+    .. versionadded:: 1.6.0
+
+    :param rate: The maximum number of calls per second
+    :type rate: int, float
+    :param burst: The number of calls that can be performed at once before the rate is enforced (``1`` by default)
+    :type burst: int
+    :raises: :py:exc:`ValueError`
+    """
+
+    def __init__(self, rate: Union[int, float], burst: int = 1) -> None:
+        """This method instantiates the rate limiter."""
+        if rate <= 0 or burst < 1:
+            error_msg = 'The rate must be greater than zero and the burst must be at least one'
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """This method blocks until a call is permitted by the rate limit.
+
+        :returns: The number of seconds spent waiting
+        """
+        with self._lock:
+            _now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (_now - self._updated_at) * self.rate)
+            self._updated_at = _now
+            self._tokens -= 1
+            _wait_seconds = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if _wait_seconds:
+            time.sleep(_wait_seconds)
+        return _wait_seconds
+
+
+def run_concurrently(
+    func: Callable[[Any], Any],
+    items: Iterable,
+    max_workers: int = const.CONCURRENCY_SETTINGS.DEFAULT_MAX_WORKERS,
+    return_exceptions: bool = False,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> list:
+    """This function calls a function for each item using a pool of threads and returns the results in order.
+
+    .. versionadded:: 1.6.0
+
+    :param func: The function to call with each item as its only argument
+    :type func: Callable
+    :param items: The items for which to call the function
+    :type items: Iterable
+    :param max_workers: The maximum number of concurrent threads (``8`` by default)
+    :type max_workers: int
+    :param return_exceptions: Returns any raised exceptions in place of the results rather than raising the first
+                              exception encountered (``False`` by default)
+    :type return_exceptions: bool
+    :param rate_limiter: Optional rate limiter that is acquired before each call
+    :type rate_limiter: class[salespyforce.utils.concurrency_utils.RateLimiter], None
+    :returns: List of the results (or exceptions) in the same order as the items
+    :raises: Any exception raised by the function when ``return_exceptions`` is ``False``
+    """
+    items = list(items)
+    if not items:
+        return []
+    max_workers = max(1, min(max_workers or 1, len(items)))
+
+    def _call(_item: Any) -> Any:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        return func(_item)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_call, _item) for _item in items]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                if not return_exceptions:
+                    for _future in futures:
+                        _future.cancel()
+                    raise
+                results.append(exc)
+    return results
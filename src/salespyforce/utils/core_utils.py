@@ -6,7 +6,7 @@
 :Example:           ``encoded_string = core_utils.encode_url(decoded_string)``
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff (via GPT-5.5-codex)
-:Modified Date:     15 Jul 2026
+:Modified Date:     18 Oct 2026
 """
 
 from __future__ import annotations
@@ -17,10 +17,15 @@ import re
 import string
 import urllib.parse
 import warnings
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 import requests
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover - NumPy is an optional dependency
+    numpy = None
+
 from .. import constants as const
 from .. import errors
 from ..decorators import deprecated
@@ -29,6 +34,23 @@ from . import log_utils
 # Initialize the logger for this module
 logger = log_utils.initialize_logging(__name__)
 
+# Compile the regex pattern used to validate Salesforce record IDs
+_SALESFORCE_ID_REGEX = re.compile(const.SALESFORCE_ID_PATTERN)
+
+# Define the translation table used to escape reserved characters in SOQL string literals
+_SOQL_ESCAPE_TABLE = str.maketrans(
+    {
+        '\\': '\\\\',
+        "'": "\\'",
+        '"': '\\"',
+        '\n': '\\n',
+        '\r': '\\r',
+        '\t': '\\t',
+        '\b': '\\b',
+        '\f': '\\f',
+    }
+)
+
 
 def url_encode(raw_string: str) -> str:
     """This function encodes a string for use in URLs.
@@ -211,6 +233,182 @@ def get_18_char_id(record_id: str) -> str:
     return record_id + suffix
 
 
+def get_18_char_ids(record_ids: Iterable[str], use_numpy: Optional[bool] = None) -> list:
+    """This function converts many 15-character Salesforce record IDs to their 18-character form at once.
+
+    .. versionadded:: 1.6.0
+
+    When NumPy is installed, the checksum suffixes for batches of at least 1,000 15-character IDs are computed
+    together over a fixed-width byte array. Otherwise (or for smaller batches) each ID is converted using the
+    :py:func:`get_18_char_id` function.
+
+    :param record_ids: The Salesforce record IDs to convert (IDs that are already 18 characters are unchanged)
+    :type record_ids: Iterable[str], numpy.ndarray
+    :param use_numpy: Determines if NumPy should be used (determined by the batch size and availability of NumPy
+                      when not explicitly defined)
+    :type use_numpy: bool, None
+    :returns: List of the 18-character Salesforce record IDs in the original order
+    :raises: :py:exc:`ValueError`
+    """
+    record_ids = record_ids.tolist() if numpy is not None and isinstance(record_ids, numpy.ndarray) else list(record_ids)
+
+    # Identify the IDs that require conversion and ensure every ID has a valid length
+    short_id_positions = []
+    for position, record_id in enumerate(record_ids):
+        if not isinstance(record_id, str):
+            raise ValueError('Salesforce ID must be a string')
+        if len(record_id) == 15:
+            short_id_positions.append(position)
+        elif len(record_id) != 18:
+            raise ValueError('Salesforce ID must be 15 or 18 characters long')
+
+    # Determine whether the checksum suffixes should be computed with NumPy
+    if use_numpy is None:
+        use_numpy = len(short_id_positions) >= const.SALESFORCE_ID_VECTORIZE_MIN_BATCH_SIZE
+    if use_numpy and numpy is None:
+        logger.warning('NumPy is not installed so the Salesforce IDs will be converted individually')
+        use_numpy = False
+
+    # Convert the 15-character IDs and return the full list of IDs
+    if not use_numpy:
+        return [get_18_char_id(_id) if len(_id) == 15 else _id for _id in record_ids]
+    suffixes = _get_id_checksum_suffixes([record_ids[_position] for _position in short_id_positions])
+    for position, suffix in zip(short_id_positions, suffixes):
+        record_ids[position] += suffix
+    return record_ids
+
+
+def _get_id_checksum_suffixes(_record_ids: list) -> list:
+    """This function computes the checksum suffixes for a list of 15-character IDs using NumPy.
+
+    .. versionadded:: 1.6.0
+
+    :param _record_ids: The 15-character Salesforce record IDs
+    :type _record_ids: list
+    :returns: List of the 3-character checksum suffixes
+    """
+    # Represent the IDs as a matrix of bytes with three 5-character chunks per ID
+    _id_bytes = numpy.frombuffer(''.join(_record_ids).encode('ascii'), dtype=numpy.uint8).reshape(-1, 3, 5)
+
+    # Set the bit for each uppercase character and map each chunk bitmask to the suffix alphabet
+    _is_upper = (_id_bytes >= ord('A')) & (_id_bytes <= ord('Z'))
+    _bitmasks = (_is_upper * (1 << numpy.arange(5, dtype=numpy.uint8))).sum(axis=2)
+    _alphabet = numpy.frombuffer(const.SALESFORCE_ID_SUFFIX_ALPHABET.encode('ascii'), dtype=numpy.uint8)
+    _suffix_bytes = numpy.ascontiguousarray(_alphabet[_bitmasks]).tobytes().decode('ascii')
+    return [_suffix_bytes[_index : _index + 3] for _index in range(0, len(_suffix_bytes), 3)]
+
+
+def get_15_char_id(record_id: str) -> str:
+    """This function converts an 18-character Salesforce record ID to its 15-character case-sensitive form.
+
+    .. versionadded:: 1.6.0
+
+    This allows IDs from sources that use different ID lengths to be normalized prior to joining the data.
+
+    :param record_id: The Salesforce record ID to convert (or return unchanged if already 15 characters)
+    :type record_id: str
+    :returns: The 15-character Salesforce record ID
+    :raises: :py:exc:`ValueError`
+    """
+    if not isinstance(record_id, str):
+        raise ValueError('Salesforce ID must be a string')
+    if len(record_id) not in (15, 18):
+        raise ValueError('Salesforce ID must be 15 or 18 characters long')
+    return record_id[:15]
+
+
+def is_valid_salesforce_id(record_id: str, verify_checksum: bool = True) -> bool:
+    """This function evaluates a value to determine if it is a valid Salesforce record ID.
+
+    .. versionadded:: 1.6.0
+
+    :param record_id: The value to evaluate
+    :type record_id: str
+    :param verify_checksum: Determines if the checksum suffix of 18-character IDs should be verified
+                            (``True`` by default)
+    :type verify_checksum: bool
+    :returns: Boolean value depending on whether the value is a valid Salesforce record ID
+    """
+    if not isinstance(record_id, str) or not _SALESFORCE_ID_REGEX.fullmatch(record_id):
+        return False
+    if verify_checksum and len(record_id) == 18:
+        return get_18_char_id(record_id[:15]) == record_id
+    return True
+
+
+def chunk_iterable(iterable: Iterable, chunk_size: int) -> Iterator[list]:
+    """This function splits an iterable into consecutive lists containing a maximum number of items.
+
+    .. versionadded:: 1.6.0
+
+    :param iterable: The iterable to split into chunks
+    :type iterable: Iterable
+    :param chunk_size: The maximum number of items in each chunk
+    :type chunk_size: int
+    :returns: Generator that yields each chunk as a list
+    :raises: :py:exc:`ValueError`
+    """
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError('The chunk size must be a positive integer')
+    _chunk = []
+    for _item in iterable:
+        _chunk.append(_item)
+        if len(_chunk) == chunk_size:
+            yield _chunk
+            _chunk = []
+    if _chunk:
+        yield _chunk
+
+
+def escape_soql_string(value: str) -> str:
+    """This function escapes the reserved characters of a string so that it can be used as a SOQL string literal.
+
+    .. versionadded:: 1.6.0
+
+    :param value: The string to escape (excluding the surrounding single quotes)
+    :type value: str
+    :returns: The escaped string
+    """
+    return str(value).translate(_SOQL_ESCAPE_TABLE)
+
+
+def chunk_soql_values(
+    values: Iterable[str],
+    max_length: int = const.SOQL_QUERIES.MAX_IN_CLAUSE_LENGTH,
+    max_encoded_length: int = const.SOQL_QUERIES.MAX_ENCODED_IN_CLAUSE_LENGTH,
+) -> Iterator[list]:
+    """This function splits string values into chunks whose quoted ``IN`` clause list stays within length limits.
+
+    .. versionadded:: 1.6.0
+
+    The length of each value is measured after it has been escaped and quoted (e.g. ``'O\\'Brien'``) and again after
+    it has been URL-encoded, as queries are sent in the URI of a GET request. A single value that exceeds the
+    limits on its own is yielded in a chunk by itself.
+
+    :param values: The string values to split into chunks
+    :type values: Iterable[str]
+    :param max_length: The maximum length of the comma-separated list of quoted values (``3500`` by default)
+    :type max_length: int
+    :param max_encoded_length: The maximum URL-encoded length of the comma-separated list (``12000`` by default)
+    :type max_encoded_length: int
+    :returns: Generator that yields each chunk of (unescaped) values as a list
+    """
+    _chunk, _length, _encoded_length = [], 0, 0
+    for _value in values:
+        _literal = f"'{escape_soql_string(_value)}'"
+        _value_length = len(_literal) + (2 if _chunk else 0)
+        _value_encoded_length = len(url_encode(_literal)) + (4 if _chunk else 0)
+        if _chunk and (_length + _value_length > max_length or _encoded_length + _value_encoded_length > max_encoded_length):
+            yield _chunk
+            _chunk, _length, _encoded_length = [], 0, 0
+            _value_length, _value_encoded_length = len(_literal), len(url_encode(_literal))
+        _chunk.append(_value)
+        _length += _value_length
+        _encoded_length += _value_encoded_length
+    if _chunk:
+        yield _chunk
+
+
 def matches_regex_pattern(pattern: str, text: str, full_match: bool = False, must_start_with: bool = False) -> bool:
     """This function compares a text string against a regex pattern and determines whether they match.
 
@@ -311,3 +509,39 @@ def download_image(
     with open(f'{file_path}{file_name}', 'wb') as file:
         file.write(response.content)
     return f'{file_path}{file_name}'
+
+
+def save_streamed_response(
+    response,
+    file_path: str,
+    chunk_size: int = const.DEFAULT_DOWNLOAD_CHUNK_SIZE_BYTES,
+) -> int:
+    """This function writes the body of a streamed response to a file in chunks and closes the response.
+
+    .. versionadded:: 1.6.0
+
+    The content is written to a temporary ``.part`` file that is renamed once the download is complete so that
+    an interrupted download never leaves a partial file at the destination path.
+
+    :param response: The response of an API call performed with ``stream=True``
+    :param file_path: The full path of the file to write
+    :type file_path: str
+    :param chunk_size: The number of bytes to read and write at a time (``65536`` by default)
+    :type chunk_size: int
+    :returns: The number of bytes that were written
+    :raises: :py:exc:`OSError`
+    """
+    _temp_path = f'{file_path}.part'
+    _bytes_written = 0
+    try:
+        with open(_temp_path, 'wb') as _file:
+            for _chunk in response.iter_content(chunk_size=chunk_size):
+                if _chunk:
+                    _file.write(_chunk)
+                    _bytes_written += len(_chunk)
+        os.replace(_temp_path, file_path)
+    finally:
+        response.close()
+        if os.path.exists(_temp_path):
+            os.remove(_temp_path)
+    return _bytes_written
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            salespyforce.utils.rich_text_utils
+:Synopsis:          Collection of utilities that scan and rewrite the images within rich text field values
+:Usage:             ``from salespyforce.utils import rich_text_utils``
+:Example:           ``images = list(rich_text_utils.iter_record_images(records, ['Body__c']))``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+from __future__ import annotations
+
+import html
+import re
+from typing import Iterable, Iterator, Optional, Union
+
+from .. import constants as const
+from . import core_utils, log_utils
+
+# Initialize logging
+logger = log_utils.initialize_logging(__name__)
+
+# Compile the patterns that locate image sources and their reference IDs without parsing the full HTML document
+_IMAGE_SRC_REGEX = re.compile(r'(<img\b[^>]*?\bsrc\s*=\s*)(["\'])(.*?)\2', re.IGNORECASE | re.DOTALL)
+_REF_ID_REGEX = re.compile(rf'[?&]{const.QUERY_PARAMS.REF_ID}=([^&#]+)')
+
+
+def get_ref_id(image_url: str) -> Optional[str]:
+    """This function returns the reference ID (``refid``) value of a rich text image URL.
+
+    .. versionadded:: 1.6.0
+
+    The value is parsed with the :py:func:`salespyforce.utils.core_utils.get_image_ref_id` function so that
+    URL-encoded reference IDs match the keys used by the :py:meth:`salespyforce.Salesforce.download_images` method.
+
+    :param image_url: The URL of the image (with or without HTML-escaped ampersands)
+    :type image_url: str
+    :returns: The reference ID value or ``None`` if the URL does not include one
+    """
+    _image_url = html.unescape(image_url)
+    return core_utils.get_image_ref_id(_image_url) if _REF_ID_REGEX.search(_image_url) else None
+
+
+def iter_image_urls(rich_text: Optional[str]) -> Iterator[str]:
+    """This function yields the URL of every rich text image (i.e. images with a ``refid`` value) within HTML.
+
+    .. versionadded:: 1.6.0
+
+    :param rich_text: The HTML value of a rich text field
+    :type rich_text: str, None
+    :returns: Generator that yields each unescaped image URL in the order it appears
+    """
+    if not rich_text:
+        return
+    for _match in _IMAGE_SRC_REGEX.finditer(rich_text):
+        _image_url = html.unescape(_match.group(3))
+        if _REF_ID_REGEX.search(_image_url):
+            yield _image_url
+
+
+def iter_record_images(
+    records: Iterable,
+    field_names: Union[str, list, tuple],
+    id_field: str = const.SOBJECT_FIELDS.ID,
+) -> Iterator[tuple]:
+    """This function scans the rich text fields of records and yields a tuple for each image that is found.
+
+    .. versionadded:: 1.6.0
+
+    The records are consumed one at a time so that a generator such as the one returned by the
+    :py:meth:`salespyforce.core.Salesforce.iter_soql_query` method can be scanned without loading every record.
+
+    :param records: The records (dictionaries or compact records) whose fields should be scanned
+    :type records: Iterable
+    :param field_names: The name(s) of the rich text fields to scan
+    :type field_names: str, list, tuple
+    :param id_field: The name of the field that contains the Record ID (``Id`` by default)
+    :type id_field: str
+    :returns: Generator that yields ``(image_url, record_id, field_name)`` tuples
+    """
+    field_names = (field_names,) if isinstance(field_names, str) else tuple(field_names)
+    for record in records:
+        for field_name in field_names:
+            for image_url in iter_image_urls(record.get(field_name)):
+                yield image_url, record.get(id_field), field_name
+
+
+def rewrite_image_urls(rich_text: Optional[str], image_paths: dict) -> Optional[str]:
+    """This function replaces the source of each rich text image with a local path in a single pass.
+
+    .. versionadded:: 1.6.0
+
+    :param rich_text: The HTML value of a rich text field
+    :type rich_text: str, None
+    :param image_paths: Dictionary mapping reference IDs (``refid``) to the paths that should replace the image URLs
+    :type image_paths: dict
+    :returns: The rewritten HTML (images without a mapped path are left unchanged)
+    """
+    if not rich_text or not image_paths:
+        return rich_text
+
+    def _replace_source(_match: re.Match) -> str:
+        _image_path = image_paths.get(get_ref_id(_match.group(3)))
+        if not _image_path:
+            return _match.group(0)
+        return f'{_match.group(1)}{_match.group(2)}{html.escape(_image_path, quote=True)}{_match.group(2)}'
+
+    return _IMAGE_SRC_REGEX.sub(_replace_source, rich_text)
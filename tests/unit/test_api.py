@@ -4,8 +4,8 @@
 :Module:         tests.unit.test_api
 :Synopsis:       Tests low-level Salesforce API request and response handling
 :Created By:     Jeff Shurtliff
-:Last Modified:  Jeff Shurtliff (via GPT-5.5-codex)
-:Modified Date:  15 Jul 2026
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  18 Oct 2026
 """
 
 from types import SimpleNamespace
@@ -13,7 +13,9 @@ from types import SimpleNamespace
 import pytest
 
 from salespyforce import api
+from salespyforce.cache import ResponseCache
 from salespyforce.core import Salesforce
+from salespyforce.utils.concurrency_utils import SingleFlight
 
 
 class FakeResponse:
@@ -203,3 +205,25 @@ def test_salesforce_patch_allows_explicit_json_conversion(monkeypatch, api_clien
 
     assert result == {'success': True}
     assert captured['return_json'] is True
+
+
+def test_get_stream_bypasses_cache_and_coalescing(monkeypatch, api_client):
+    """Streamed GET requests pass stream=True and return the raw response without caching or coalescing."""
+    calls = []
+    response = FakeResponse(json_body={'unused': True})
+
+    def fake_get(url, **kwargs):
+        calls.append(kwargs)
+        return response
+
+    monkeypatch.setattr(api.requests, 'get', fake_get)
+    api_client.response_cache = ResponseCache()
+    api_client.inflight_requests = SingleFlight()
+
+    result = api.get(api_client, '/services/data/image', return_json=False, stream=True)
+
+    assert result is response
+    assert calls[0]['stream'] is True
+    assert response.json_calls == 0
+    assert len(api_client.response_cache) == 0
+    assert api_client.inflight_requests.stats['performed'] == 0
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+# bandit: skip=B101
+"""
+:Module:         tests.unit.test_cache
+:Synopsis:       Tests the optional response and record access caches
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  18 Oct 2026
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from salespyforce import api
+from salespyforce.cache import (
+    ArticleNumberIndex,
+    RecordAccessCache,
+    ResponseCache,
+    get_article_number_index,
+    get_record_access_cache,
+    get_response_cache,
+)
+
+RECORD_URL = 'https://example.my.salesforce.com/services/data/v65.0/sobjects/Account/001xx000003DGb2AAG'
+
+
+class CountingResponse:
+    """Represent a successful JSON response whose body is provided as raw bytes."""
+
+    def __init__(self, content=b'{"Id": "001xx000003DGb2AAG"}', status_code=200):
+        self.content = content
+        self.status_code = status_code
+        self.text = content.decode()
+
+    def json(self):
+        """Deserialize the raw body in the same way as the requests library."""
+        return json.loads(self.content)
+
+
+@pytest.fixture()
+def cached_client():
+    """Return the minimum client state needed by the API functions with a response cache attached."""
+    return SimpleNamespace(
+        access_token='token',
+        instance_url='https://example.my.salesforce.com',
+        response_cache=ResponseCache(),
+    )
+
+
+def _patch_requests(monkeypatch, method, response):
+    """Patch a requests function and return the list that records each call."""
+    calls = []
+
+    def fake_request(url, **kwargs):
+        calls.append((url, kwargs))
+        return response
+
+    monkeypatch.setattr(api.requests, method, fake_request)
+    return calls
+
+
+def test_repeated_get_requests_are_served_from_cache(monkeypatch, cached_client):
+    """Identical GET requests only perform a single API call and return independent objects."""
+    calls = _patch_requests(monkeypatch, 'get', CountingResponse())
+
+    first = api.get(cached_client, RECORD_URL)
+    first['Id'] = 'mutated'
+    second = api.get(cached_client, RECORD_URL)
+
+    assert len(calls) == 1
+    assert second == {'Id': '001xx000003DGb2AAG'}
+    assert cached_client.response_cache.stats['hits'] == 1
+    assert cached_client.response_cache.stats['misses'] == 1
+
+
+def test_shared_cache_is_scoped_to_each_access_token(monkeypatch, cached_client):
+    """Clients that share a response cache but authenticate as different users do not share cached responses."""
+    calls = _patch_requests(monkeypatch, 'get', CountingResponse())
+    other_client = SimpleNamespace(
+        access_token='other-token',
+        instance_url=cached_client.instance_url,
+        response_cache=cached_client.response_cache,
+    )
+
+    api.get(cached_client, RECORD_URL)
+    api.get(other_client, RECORD_URL)
+    api.get(other_client, RECORD_URL)
+
+    assert len(calls) == 2
+    assert len(cached_client.response_cache) == 2
+    assert all('token' not in str(key) for key in cached_client.response_cache._entries)
+
+
+def test_cache_keys_normalize_query_parameter_order():
+    """Equivalent URLs and parameters produce the same cache key."""
+    cache = ResponseCache()
+
+    key_one = cache.build_key('get', 'HTTPS://Example.com/services/data/?b=2&a=1', {'x': 1})
+    key_two = cache.build_key('GET', 'https://example.com/services/data?a=1&b=2', {'x': '1'})
+
+    assert key_one == key_two
+
+
+def test_patch_and_delete_invalidate_cached_record(monkeypatch, cached_client):
+    """Modifying or deleting a record removes the cached responses for that record."""
+    get_calls = _patch_requests(monkeypatch, 'get', CountingResponse())
+    _patch_requests(monkeypatch, 'patch', CountingResponse(content=b'', status_code=204))
+    _patch_requests(monkeypatch, 'delete', CountingResponse(content=b'', status_code=204))
+
+    api.get(cached_client, RECORD_URL)
+    api.api_call_with_payload(cached_client, 'patch', RECORD_URL, {'Name': 'Updated'})
+    api.get(cached_client, RECORD_URL)
+    api.delete(cached_client, RECORD_URL)
+    api.get(cached_client, RECORD_URL)
+
+    assert len(get_calls) == 3
+    assert cached_client.response_cache.stats['invalidations'] == 2
+
+
+def test_cache_evicts_least_recently_used_entries_by_size():
+    """Entries are evicted in LRU order once the byte limit is exceeded."""
+    cache = ResponseCache(max_bytes=10)
+    key_one = cache.build_key('GET', 'https://example.com/one')
+    key_two = cache.build_key('GET', 'https://example.com/two')
+    key_three = cache.build_key('GET', 'https://example.com/three')
+
+    cache.set(key_one, b'12345')
+    cache.set(key_two, b'12345')
+    cache.get(key_one)
+    cache.set(key_three, b'12345')
+
+    assert cache.get(key_one) == b'12345'
+    assert cache.get(key_two) is None
+    assert cache.stats['evictions'] == 1
+    assert cache.stats['size_bytes'] == 10
+
+
+def test_ttl_rules_override_default_ttl(monkeypatch):
+    """Per-endpoint TTL rules control expiration and can disable caching."""
+    cache = ResponseCache(default_ttl=60, ttl_rules={r'/describe$': 3600, r'/limits$': 0})
+    clock = [1000.0]
+    monkeypatch.setattr('salespyforce.cache.time.monotonic', lambda: clock[0])
+    describe_key = cache.build_key('GET', 'https://example.com/sobjects/Account/describe')
+    record_key = cache.build_key('GET', RECORD_URL)
+
+    assert cache.set(cache.build_key('GET', 'https://example.com/limits'), b'{}') is False
+    cache.set(describe_key, b'{}')
+    cache.set(record_key, b'{}')
+    clock[0] += 120
+
+    assert cache.get(describe_key) == b'{}'
+    assert cache.get(record_key) is None
+
+
+def test_get_response_cache_validates_value():
+    """The response cache argument accepts Booleans, cache objects or None."""
+    custom_cache = ResponseCache()
+
+    assert get_response_cache(None) is None
+    assert get_response_cache(False) is None
+    assert isinstance(get_response_cache(True), ResponseCache)
+    assert get_response_cache(custom_cache) is custom_cache
+    with pytest.raises(TypeError):
+        get_response_cache('yes')
+
+
+def test_record_access_cache_expires_and_invalidates_entries(monkeypatch):
+    """Record access entries expire after the TTL and can be invalidated by user or record."""
+    cache = RecordAccessCache(ttl=60, max_entries=2)
+    clock = [1000.0]
+    monkeypatch.setattr('salespyforce.cache.time.monotonic', lambda: clock[0])
+    access = {'HasReadAccess': True, 'HasEditAccess': False, 'HasDeleteAccess': False}
+
+    cache.set('005xx000001Sv6A', '001xx000003DGb2', access)
+    cache.set('005xx000001Sv6AAAS', '001xx000003DGb3AAG', access)
+    cache.set('005xx000001Sv6BAAS', '001xx000003DGb3AAG', access)
+
+    assert cache.get('005xx000001Sv6AAAS', '001xx000003DGb2AAG') is None
+    assert cache.stats['evictions'] == 1
+    assert cache.get('005xx000001Sv6AAAS', '001xx000003DGb3AAG') == access
+    assert cache.invalidate_record('001xx000003DGb3') == 2
+    cache.set('005xx000001Sv6AAAS', '001xx000003DGb2AAG', access)
+    clock[0] += 61
+    assert cache.get('005xx000001Sv6AAAS', '001xx000003DGb2AAG') is None
+    assert cache.stats['hits'] == 1
+
+
+def test_get_record_access_cache_validates_value():
+    """The record access cache argument accepts Booleans, cache objects or None."""
+    assert get_record_access_cache(None) is None
+    assert isinstance(get_record_access_cache(True), RecordAccessCache)
+    with pytest.raises(TypeError):
+        get_record_access_cache(ResponseCache())
+
+
+def test_article_number_index_normalizes_numbers_and_tracks_watermarks():
+    """Article numbers share entries regardless of padding and watermarks only move forward."""
+    index = ArticleNumberIndex()
+
+    index.update('Knowledge__kav', {'1234': 'ka0xx0000000001AAA'}, watermark='2026-10-18T10:00:00.000+0000')
+    index.update('Knowledge__kav', {}, watermark='2026-10-17T10:00:00.000+0000')
+
+    assert index.get('Knowledge__kav', 1234) == 'ka0xx0000000001AAA'
+    assert index.get('Knowledge__kav', '000001234') == 'ka0xx0000000001AAA'
+    assert index.get('FAQ__kav', 1234) is None
+    assert index.get_watermark('Knowledge__kav') == '2026-10-18T10:00:00.000+0000'
+    assert index.stats['hits'] == 2
+    index.clear('Knowledge__kav')
+    assert len(index) == 0
+    assert index.get_watermark('Knowledge__kav') is None
+    assert isinstance(get_article_number_index(True), ArticleNumberIndex)
+    assert get_article_number_index(None) is None
@@ -4,10 +4,11 @@
 :Module:         tests.unit.test_chatter
 :Synopsis:       Tests centralized Salesforce Chatter endpoints and payloads
 :Created By:     Jeff Shurtliff
-:Last Modified:  Jeff Shurtliff (via GPT-5.5-codex)
-:Modified Date:  15 Jul 2026
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  18 Oct 2026
 """
 
+import asyncio
 from types import SimpleNamespace
 
 import pytest
@@ -114,3 +115,310 @@ def test_post_comment_uses_site_endpoint_and_message_segments():
             const.QUERY_PARAMS.MESSAGE_SEGMENTS: segments,
         }
     }
+
+
+class PagedFeedClient:
+    """Return pages of feed elements that link to one another with a next page URL."""
+
+    version = 'v65.0'
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def get(self, endpoint, params=None):
+        """Return the page for the endpoint and record the call."""
+        self.calls.append((endpoint, params))
+        return self.pages[len(self.calls) - 1]
+
+
+def _feed_page(dates, next_page_url=None):
+    """Return a feed elements page with one element for each created date."""
+    elements = [{'id': f'0D5xx{_date[8:10]}', 'createdDate': _date} for _date in dates]
+    return {'elements': elements, 'nextPageUrl': next_page_url}
+
+
+def test_iter_group_feed_follows_next_page_url_lazily():
+    """Feed elements are yielded across pages and each page is only requested when needed."""
+    next_url = '/services/data/v65.0/chatter/feeds/record/0F9xx000000001/feed-elements?page=abc&pageSize=2'
+    client = PagedFeedClient(
+        [
+            _feed_page(['2026-10-18T00:00:00.000Z', '2026-10-17T00:00:00.000Z'], next_url),
+            _feed_page(['2026-10-16T00:00:00.000Z']),
+        ]
+    )
+
+    elements = chatter.iter_group_feed(client, '0F9xx000000001', page_size=500)
+    assert next(elements)['id'] == '0D5xx18'
+    assert client.calls == [('/services/data/v65.0/chatter/feeds/record/0F9xx000000001/feed-elements', {'pageSize': 100})]
+    assert [_element['id'] for _element in elements] == ['0D5xx17', '0D5xx16']
+    assert client.calls[1] == (next_url, None)
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'expected_ids', 'expected_sort'),
+    [
+        ({'since': '2026-10-17T00:00:00Z'}, ['0D5xx18', '0D5xx17'], 'CreatedDateDesc'),
+        ({'max_elements': 1, 'sort': 'LastModifiedDateDesc'}, ['0D5xx18'], 'LastModifiedDateDesc'),
+    ],
+)
+def test_iter_my_news_feed_stops_at_date_and_count_bounds(kwargs, expected_ids, expected_sort):
+    """The iteration stops at the first element older than the date bound or once the element count is reached."""
+    client = PagedFeedClient(
+        [_feed_page(['2026-10-18T00:00:00.000Z', '2026-10-17T00:00:00.000Z', '2026-10-16T00:00:00.000Z'], '/next')]
+    )
+
+    elements = list(chatter.iter_my_news_feed(client, **kwargs))
+
+    assert [_element['id'] for _element in elements] == expected_ids
+    assert client.calls[0][1]['sortParam'] == expected_sort
+    assert len(client.calls) == 1
+
+
+class PollingClient:
+    """Return queued JSON payloads for each GET request and record the requested endpoints."""
+
+    version = 'v65.0'
+
+    def __init__(self, payloads):
+        self.payloads = list(payloads)
+        self.calls = []
+
+    def get(self, endpoint, params=None, return_json=True):
+        """Return a response object for the next payload."""
+        assert return_json is False
+        self.calls.append((endpoint, params))
+        payload = self.payloads.pop(0)
+        return SimpleNamespace(json=lambda: payload)
+
+
+def test_feed_poller_checks_for_changes_before_retrieving_updates():
+    """The poller only retrieves the updates once the change-detection URL reports a modified feed."""
+    client = PollingClient(
+        [
+            {'elements': [{'id': 'e2'}, {'id': 'e1'}], 'isModifiedUrl': '/modified?t=1', 'updatesUrl': '/updates?t=1'},
+            {'isModified': False, 'nextPollUrl': '/modified?t=2'},
+            {'isModified': True, 'nextPollUrl': '/modified?t=3'},
+            {'elements': [{'id': 'e4'}, {'id': 'e3'}, {'id': 'e2'}], 'updatesUrl': '/updates?t=2'},
+        ]
+    )
+    poller = chatter.FeedPoller(client, group_id='0F9xx000000001')
+
+    assert poller.poll() == []
+    assert poller.poll() == []
+    assert [_element['id'] for _element in poller.poll()] == ['e3', 'e4']
+    assert [_endpoint for _endpoint, _ in client.calls] == [
+        '/services/data/v65.0/chatter/feeds/record/0F9xx000000001/feed-elements',
+        '/modified?t=1',
+        '/modified?t=2',
+        '/updates?t=1',
+    ]
+    assert poller.updates_url == '/updates?t=2'
+    assert poller.stats == {'polls': 3, 'unmodified': 1, 'retrieved': 2, 'elements': 2}
+
+
+def test_feed_poller_async_iterator_yields_new_elements():
+    """The asynchronous iterator falls back to the first page and yields unseen elements until stopped."""
+    client = PollingClient(
+        [
+            {'elements': [{'id': 'e1'}]},
+            {'elements': [{'id': 'e2'}, {'id': 'e1'}]},
+        ]
+    )
+    poller = chatter.FeedPoller(client, poll_interval=0, include_existing=True)
+
+    async def _collect():
+        collected = []
+        async for element in poller:
+            collected.append(element['id'])
+            if len(collected) == 2:
+                poller.stop()
+        return collected
+
+    assert asyncio.run(_collect()) == ['e1', 'e2']
+    assert client.calls[1] == ('/services/data/v65.0/chatter/feeds/news/me/feed-elements', {'pageSize': 25})
+
+
+class BatchClient:
+    """Capture batch POST requests and return a failure for subjects that start with 'bad'."""
+
+    version = 'v65.0'
+
+    def __init__(self):
+        self.calls = []
+
+    def post(self, endpoint, payload):
+        """Capture the POST request and return a batch or comment response."""
+        self.calls.append((endpoint, payload))
+        if 'inputs' not in payload:
+            return {'id': f'0D7xx{len(self.calls)}'}
+        results = []
+        for _input in payload['inputs']:
+            if _input['richInput']['subjectId'].startswith('bad'):
+                results.append({'statusCode': 400, 'result': [{'errorCode': 'INVALID_ID', 'message': 'Invalid subject'}]})
+            else:
+                results.append({'statusCode': 201, 'result': {'id': f'0D5{_input["richInput"]["subjectId"]}'}})
+        return {'hasErrors': True, 'results': results}
+
+
+def test_post_feed_items_uses_batches_and_reports_each_item():
+    """Feed items are posted 500 at a time and each item reports its ID or error."""
+    client = BatchClient()
+    items = [{'subject_id': f'0F9{_index}', 'message_text': 'Hello'} for _index in range(501)]
+    items.append({'subject_id': 'bad', 'message_segments': [{'type': 'Text', 'text': 'Hi'}]})
+
+    results = chatter.post_feed_items(client, items)
+
+    assert [len(_payload['inputs']) for _, _payload in client.calls] == [500, 2]
+    assert client.calls[0][0] == '/services/data/v65.0/chatter/feed-elements/batch'
+    assert client.calls[0][1]['inputs'][0]['richInput'] == {
+        'body': {'messageSegments': [{'type': 'text', 'text': 'Hello'}]},
+        'feedElementType': 'FeedItem',
+        'subjectId': '0F90',
+    }
+    assert results[0] == {'subject_id': '0F90', 'id': '0D50F90', 'error': None}
+    assert results[-1] == {'subject_id': 'bad', 'id': None, 'error': 'Invalid subject'}
+    with pytest.raises(errors.exceptions.MissingRequiredDataError):
+        chatter.post_feed_items(client, [{'subject_id': '0F9', 'message_text': 'Hi'}, {'subject_id': '0F9'}])
+    assert len(client.calls) == 2
+
+
+def test_post_comments_reports_each_comment():
+    """Comments are posted individually and failures are reported without stopping the other comments."""
+    client = BatchClient()
+    original_post = client.post
+
+    def post(endpoint, payload):
+        if '/bad/' in endpoint:
+            raise RuntimeError('Comment failed')
+        return original_post(endpoint, payload)
+
+    client.post = post
+    comments = [
+        {'feed_element_id': '0D5xx1', 'message_text': 'First'},
+        {'feed_element_id': 'bad', 'message_text': 'Second'},
+    ]
+
+    results = chatter.post_comments(client, comments, max_workers=1)
+
+    assert results == [
+        {'feed_element_id': '0D5xx1', 'id': '0D7xx1', 'error': None},
+        {'feed_element_id': 'bad', 'id': None, 'error': 'Comment failed'},
+    ]
+    with pytest.raises(errors.exceptions.MissingRequiredDataError):
+        chatter.post_comments(client, [{'feed_element_id': '0D5xx1'}])
+
+
+class FeedReadClient:
+    """Return canned responses for batch, comment and record feed GET requests."""
+
+    version = 'v65.0'
+
+    def __init__(self):
+        self.calls = []
+
+    def get(self, endpoint, params=None):
+        """Capture the GET request and return a response based on the endpoint."""
+        self.calls.append((endpoint, params))
+        if '/feed-elements/batch/' in endpoint:
+            results = []
+            for _id in endpoint.rsplit('/', 1)[-1].split(','):
+                if _id == 'missing':
+                    results.append({'statusCode': 404, 'result': [{'message': 'Not found'}]})
+                    continue
+                total = 3 if _id == 'long' else 1
+                page = {'items': [{'id': f'{_id}-c1'}], 'total': total}
+                results.append({'statusCode': 200, 'result': {'id': _id, 'capabilities': {'comments': {'page': page}}}})
+            return {'hasErrors': True, 'results': results}
+        if '/capabilities/comments/items' in endpoint:
+            if params:
+                return {
+                    'items': [{'id': 'long-c1'}, {'id': 'long-c2'}],
+                    'nextPageUrl': '/long/capabilities/comments/items?page=2',
+                }
+            return {'items': [{'id': 'long-c3'}]}
+        if '/record/bad/' in endpoint:
+            raise RuntimeError('Feed failed')
+        return {'elements': [{'id': f'{endpoint.split("/")[-2]}-e{_num}'} for _num in range(3)]}
+
+
+def test_get_feed_elements_uses_batches():
+    """Feed elements are retrieved 500 at a time and unavailable feed elements are mapped to None."""
+    client = FeedReadClient()
+    ids = [f'0D5{_index}' for _index in range(501)] + ['missing']
+
+    elements = chatter.get_feed_elements(client, ids, site_id='0DBxx')
+
+    assert len(client.calls) == 2
+    assert client.calls[1][0] == '/services/data/v65.0/connect/communities/0DBxx/chatter/feed-elements/batch/0D5500,missing'
+    assert elements['0D50']['id'] == '0D50'
+    assert elements['missing'] is None
+
+
+def test_get_comment_threads_only_requests_incomplete_threads():
+    """Comments included with the feed elements are reused and only incomplete threads are paged."""
+    client = FeedReadClient()
+
+    threads = chatter.get_comment_threads(client, ['short', 'long', 'missing'])
+
+    assert threads == {
+        'short': [{'id': 'short-c1'}],
+        'long': [{'id': 'long-c1'}, {'id': 'long-c2'}, {'id': 'long-c3'}],
+        'missing': None,
+    }
+    assert [_endpoint for _endpoint, _ in client.calls[1:]] == [
+        '/services/data/v65.0/chatter/feed-elements/long/capabilities/comments/items',
+        '/long/capabilities/comments/items?page=2',
+    ]
+
+
+def test_get_record_feeds_maps_feeds_to_subjects():
+    """Record feeds are retrieved for each subject and failed feeds are mapped to None."""
+    client = FeedReadClient()
+
+    feeds = chatter.get_record_feeds(client, ['001xx1', 'bad'], max_elements=2, max_workers=2)
+
+    assert feeds == {'001xx1': [{'id': '001xx1-e0'}, {'id': '001xx1-e1'}], 'bad': None}
+    assert ('/services/data/v65.0/chatter/feeds/record/001xx1/feed-elements', {'pageSize': 2}) in client.calls
+
+
+def test_message_template_renders_segments():
+    """A parsed template renders text, mention, hashtag, link and markup segments for each set of values."""
+    template = chatter.MessageTemplate('<b>Hello</b> {@user}, see {link:url} {{#{#topic}}} for {name}.')
+
+    assert template.placeholders == ('user', 'url', 'topic', 'name')
+    assert template.render({'user': '005xx1', 'url': 'https://example.com'}, topic='News', name='you') == [
+        {'type': 'MarkupBegin', 'markupType': 'Bold'},
+        {'type': 'text', 'text': 'Hello'},
+        {'type': 'MarkupEnd', 'markupType': 'Bold'},
+        {'type': 'text', 'text': ' '},
+        {'type': 'Mention', 'id': '005xx1'},
+        {'type': 'text', 'text': ', see '},
+        {'type': 'Link', 'url': 'https://example.com'},
+        {'type': 'text', 'text': ' {#'},
+        {'type': 'Hashtag', 'tag': 'News'},
+        {'type': 'text', 'text': '} for you.'},
+    ]
+    with pytest.raises(errors.exceptions.MissingRequiredDataError):
+        template.render(user='005xx1')
+    with pytest.raises(errors.exceptions.InvalidParameterError):
+        chatter.MessageTemplate('Hello {first name}')
+
+
+def test_post_feed_items_renders_message_template():
+    """Items without a message are rendered from the message template using their template values."""
+    client = BatchClient()
+    template = chatter.MessageTemplate('Hi {@user}')
+    items = [
+        {'subject_id': '0F91', 'template_values': {'user': '005xx1'}},
+        {'subject_id': '0F92', 'message_text': 'Plain'},
+    ]
+
+    chatter.post_feed_items(client, items, message_template=template)
+
+    inputs = client.calls[0][1]['inputs']
+    assert inputs[0]['richInput']['body']['messageSegments'] == [
+        {'type': 'text', 'text': 'Hi '},
+        {'type': 'Mention', 'id': '005xx1'},
+    ]
+    assert inputs[1]['richInput']['body']['messageSegments'] == [{'type': 'text', 'text': 'Plain'}]
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# bandit: skip=B101
+"""
+:Module:         tests.unit.test_concurrency_utils
+:Synopsis:       Tests the concurrency utilities and the coalescing of identical GET requests
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  18 Oct 2026
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from salespyforce import api
+from salespyforce.utils.concurrency_utils import RateLimiter, SingleFlight, run_concurrently
+
+RECORD_URL = 'https://example.my.salesforce.com/services/data/v65.0/sobjects/Account/001xx000003DGb2AAG'
+THREAD_COUNT = 5
+
+
+class SharedResponse:
+    """Represent a successful JSON response that returns a new dictionary each time it is parsed."""
+
+    status_code = 200
+    content = b'{"Id": "001xx000003DGb2AAG"}'
+    text = content.decode()
+
+    def json(self):
+        """Return a new dictionary for each caller."""
+        return {'Id': '001xx000003DGb2AAG'}
+
+
+def _wait_for_waiters(group, expected):
+    """Block until the expected number of callers are waiting on the in-flight call."""
+    for _ in range(500):
+        if group.stats['coalesced'] >= expected:
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError('The callers did not join the in-flight call')
+
+
+def _run_coalesced_calls(group, func):
+    """Run the function from multiple threads while holding the first call open until all callers join."""
+    release = threading.Event()
+
+    def blocking_call():
+        release.wait(5)
+        return func()
+
+    with ThreadPoolExecutor(max_workers=THREAD_COUNT) as executor:
+        futures = [executor.submit(group.do, 'key', blocking_call) for _ in range(THREAD_COUNT)]
+        _wait_for_waiters(group, THREAD_COUNT - 1)
+        release.set()
+        return [future.exception() or future.result() for future in futures]
+
+
+def test_single_flight_shares_one_call_between_concurrent_callers():
+    """Concurrent callers with the same key receive the result of a single call."""
+    group = SingleFlight()
+    calls = []
+
+    results = _run_coalesced_calls(group, lambda: calls.append(1) or 'result')
+
+    assert results == ['result'] * THREAD_COUNT
+    assert len(calls) == 1
+    assert group.stats == {'performed': 1, 'coalesced': THREAD_COUNT - 1, 'in_flight': 0}
+
+
+def test_single_flight_propagates_exceptions_to_every_caller():
+    """An exception raised by the shared call is raised for every waiting caller."""
+    group = SingleFlight()
+
+    def failing_call():
+        raise ConnectionError('timed out')
+
+    results = _run_coalesced_calls(group, failing_call)
+
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert group.do('key', lambda: 'retried') == 'retried'
+
+
+def test_concurrent_identical_get_requests_share_one_api_call(monkeypatch):
+    """Concurrent identical GET requests perform one API call and return independent objects."""
+    client = SimpleNamespace(
+        access_token='token',
+        instance_url='https://example.my.salesforce.com',
+        inflight_requests=SingleFlight(),
+    )
+    release = threading.Event()
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        release.wait(5)
+        return SharedResponse()
+
+    monkeypatch.setattr(api.requests, 'get', fake_get)
+    with ThreadPoolExecutor(max_workers=THREAD_COUNT) as executor:
+        futures = [executor.submit(api.get, client, RECORD_URL) for _ in range(THREAD_COUNT)]
+        _wait_for_waiters(client.inflight_requests, THREAD_COUNT - 1)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert results == [{'Id': '001xx000003DGb2AAG'}] * THREAD_COUNT
+    assert len({id(result) for result in results}) == THREAD_COUNT
+
+
+@pytest.mark.parametrize('params', [{'q': 'SELECT Id FROM Account'}, {'q': 'SELECT Id FROM Contact'}])
+def test_get_requests_without_single_flight_group_are_unchanged(monkeypatch, params):
+    """Clients without a single-flight group perform each GET request directly."""
+    client = SimpleNamespace(access_token='token', instance_url='https://example.my.salesforce.com')
+    calls = []
+    monkeypatch.setattr(api.requests, 'get', lambda url, **kwargs: calls.append(kwargs) or SharedResponse())
+
+    api.get(client, RECORD_URL, params=params)
+
+    assert calls[0]['params'] == params
+
+
+def test_run_concurrently_preserves_order_and_returns_exceptions():
+    """Results are returned in the order of the items and exceptions can be returned in place of results."""
+
+    def square(value):
+        if value == 3:
+            raise ValueError('invalid')
+        return value * value
+
+    results = run_concurrently(square, range(5), max_workers=3, return_exceptions=True)
+
+    assert results[:3] == [0, 1, 4] and results[4] == 16
+    assert isinstance(results[3], ValueError)
+    with pytest.raises(ValueError):
+        run_concurrently(square, range(5))
+
+
+def test_rate_limiter_waits_once_the_burst_is_exhausted(monkeypatch):
+    """The rate limiter permits the burst immediately and then waits according to the rate."""
+    clock = [100.0]
+    sleeps = []
+    monkeypatch.setattr('salespyforce.utils.concurrency_utils.time.monotonic', lambda: clock[0])
+    monkeypatch.setattr('salespyforce.utils.concurrency_utils.time.sleep', sleeps.append)
+    limiter = RateLimiter(rate=2, burst=2)
+
+    waits = [limiter.acquire() for _ in range(4)]
+
+    assert waits == [0.0, 0.0, 0.5, 1.0]
+    assert sleeps == [0.5, 1.0]
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
@@ -5,7 +5,7 @@
 :Synopsis:       This module is used by pytest to test core utility functions
 :Created By:     Jeff Shurtliff
 :Last Modified:  Jeff Shurtliff (via GPT-5.5-codex)
-:Modified Date:  15 Jul 2026
+:Modified Date:  18 Oct 2026
 """
 
 import os
@@ -237,3 +237,68 @@ def test_download_image_generates_file_name(monkeypatch, tmp_path):
     assert destination.startswith(f'{tmp_path}{os.sep}image_stub')
     assert destination.endswith('png')
     assert pathlib.Path(destination).read_bytes() == DummyResponse.content
+
+
+def test_chunk_iterable_splits_items_into_lists():
+    """This function tests that chunk_iterable yields lists with a maximum number of items.
+
+    .. versionadded:: 1.6.0
+    """
+    assert list(core_utils.chunk_iterable(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(core_utils.chunk_iterable([], 2)) == []
+    with pytest.raises(ValueError):
+        list(core_utils.chunk_iterable(range(5), 0))
+
+
+def test_get_18_char_ids_matches_single_conversion():
+    """This function tests that the batch ID conversion matches the single ID conversion.
+
+    .. versionadded:: 1.6.0
+    """
+    record_ids = [
+        core_utils.get_random_string(15, prefix_string='') if index % 3 else '001xx000003DGb2AAG' for index in range(50)
+    ]
+    expected = [core_utils.get_18_char_id(record_id) for record_id in record_ids]
+    assert core_utils.get_18_char_ids(record_ids, use_numpy=False) == expected
+    with pytest.raises(ValueError):
+        core_utils.get_18_char_ids(['001xx000003DGb2AAG', '001xx'])
+
+
+def test_get_18_char_ids_with_numpy():
+    """This function tests that the NumPy ID conversion matches the single ID conversion.
+
+    .. versionadded:: 1.6.0
+    """
+    numpy = pytest.importorskip('numpy')
+    record_ids = [core_utils.get_random_string(15) for _ in range(1200)] + ['001xx000003DGb2AAG']
+    expected = [core_utils.get_18_char_id(record_id) for record_id in record_ids]
+    assert core_utils.get_18_char_ids(record_ids) == expected
+    assert core_utils.get_18_char_ids(numpy.array(record_ids[:10]), use_numpy=True) == expected[:10]
+
+
+def test_salesforce_id_validation_and_15_char_conversion():
+    """This function tests the Salesforce ID validator and the 15-character ID conversion.
+
+    .. versionadded:: 1.6.0
+    """
+    assert core_utils.is_valid_salesforce_id('001xx000003DGb2AAG') is True
+    assert core_utils.is_valid_salesforce_id('001xx000003DGb2') is True
+    assert core_utils.is_valid_salesforce_id('001xx000003DGb2AAA') is False
+    assert core_utils.is_valid_salesforce_id('001xx000003DGb2AAA', verify_checksum=False) is True
+    assert core_utils.is_valid_salesforce_id("001xx000003DGb'") is False
+    assert core_utils.get_15_char_id('001xx000003DGb2AAG') == '001xx000003DGb2'
+    with pytest.raises(ValueError):
+        core_utils.get_15_char_id('001xx')
+
+
+def test_escape_soql_string_and_chunk_soql_values():
+    """This function tests the SOQL string escaping and the length-limited chunking of IN clause values.
+
+    .. versionadded:: 1.6.0
+    """
+    assert core_utils.escape_soql_string('O\'Brien "A\\B"\n') == 'O\\\'Brien \\"A\\\\B\\"\\n'
+    chunks = list(core_utils.chunk_soql_values(['abcdefgh'] * 10, max_length=50))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    encoded_chunks = list(core_utils.chunk_soql_values(['é' * 4] * 10, max_encoded_length=80))
+    assert [len(chunk) for chunk in encoded_chunks] == [2, 2, 2, 2, 2]
+    assert list(core_utils.chunk_soql_values(['x' * 100], max_length=10)) == [['x' * 100]]
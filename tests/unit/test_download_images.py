@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# bandit: skip=B101
+"""
+:Module:         tests.unit.test_download_images
+:Synopsis:       Tests the concurrent rich text image download pipeline
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  18 Oct 2026
+"""
+
+import pytest
+
+from salespyforce import errors
+from salespyforce.core import Salesforce
+from salespyforce.utils import core_utils
+
+IMAGE_URL = 'https://example.file.force.com/servlet/rtaImage?eid=ka0xx0000000001&feoid=00Nxx&refid={ref_id}'
+
+
+class StreamedResponse:
+    """Represent a streamed requests response that yields its body in chunks."""
+
+    def __init__(self, content=b'abcdefghij'):
+        self.content_bytes = content
+        self.headers = {'Content-Length': str(len(content))}
+        self.closed = False
+        self.chunk_sizes = []
+
+    def iter_content(self, chunk_size=1):
+        """Yield the body in chunks of the requested size."""
+        self.chunk_sizes.append(chunk_size)
+        for index in range(0, len(self.content_bytes), 4):
+            yield self.content_bytes[index : index + 4]
+
+    def close(self):
+        """Record that the response was closed."""
+        self.closed = True
+
+
+def _make_client(responses):
+    """Return a client whose GET method returns streamed responses and records each endpoint."""
+    client = Salesforce.__new__(Salesforce)
+    client.version = 'v65.0'
+    client.endpoints = []
+
+    def get(endpoint, **kwargs):
+        assert kwargs == {'return_json': False, 'stream': True}
+        client.endpoints.append(endpoint)
+        response = responses.get(endpoint.rsplit('/', 1)[-1])
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    client.get = get
+    return client
+
+
+def test_save_streamed_response_writes_chunks_and_closes(tmp_path):
+    """The streamed body is written in chunks to the destination and the response is closed."""
+    response = StreamedResponse()
+    destination = tmp_path / 'image.jpeg'
+
+    assert core_utils.save_streamed_response(response, str(destination), chunk_size=4) == 10
+    assert destination.read_bytes() == b'abcdefghij'
+    assert response.closed is True
+    assert response.chunk_sizes == [4]
+    assert not (tmp_path / 'image.jpeg.part').exists()
+
+
+def test_download_images_dedupes_skips_existing_and_reports(tmp_path):
+    """Images are downloaded once per refid, existing files of the same size are skipped and failures are reported."""
+    (tmp_path / 'ref2.jpeg').write_bytes(b'0123456789')
+    responses = {'ref1': StreamedResponse(), 'ref2': StreamedResponse(), 'ref3': RuntimeError('Not found')}
+    client = _make_client(responses)
+    images = [
+        (IMAGE_URL.format(ref_id='ref1'), 'ka0xx0000000001', 'Body__c'),
+        (IMAGE_URL.format(ref_id='ref1'), 'ka0xx0000000002', 'Body__c'),
+        (IMAGE_URL.format(ref_id='ref2'), 'ka0xx0000000001', 'Body__c'),
+        (IMAGE_URL.format(ref_id='ref3'), 'ka0xx0000000001', 'Body__c'),
+    ]
+
+    report = client.download_images(images, file_path=str(tmp_path), max_workers=2)
+
+    assert len(client.endpoints) == 3
+    assert client.endpoints[0].endswith('/sobjects/Knowledge__kav/ka0xx0000000001/richTextImageFields/Body__c/ref1')
+    assert (tmp_path / 'ref1.jpeg').read_bytes() == b'abcdefghij'
+    assert (tmp_path / 'ref2.jpeg').read_bytes() == b'0123456789'
+    assert responses['ref2'].closed is True and responses['ref2'].chunk_sizes == []
+    assert report['images']['ref1']['status'] == 'downloaded'
+    assert report['images']['ref2']['status'] == 'skipped'
+    assert 'Not found' in report['images']['ref3']['error']
+    assert (report['downloaded'], report['skipped'], report['failed'], report['duplicates']) == (1, 1, 1, 1)
+    assert report['bytes'] == 10
+
+
+def test_download_images_overwrites_existing_and_truncated_files(tmp_path):
+    """Existing files are downloaded again when overwrite is enabled or when their size does not match."""
+    (tmp_path / 'ref1.jpeg').write_bytes(b'0123456789')
+    (tmp_path / 'ref2.jpeg').write_bytes(b'abc')
+    client = _make_client({'ref1': StreamedResponse(), 'ref2': StreamedResponse()})
+    images = [(IMAGE_URL.format(ref_id='ref2'), 'ka0xx0000000001', 'Body__c')]
+
+    assert client.download_images(images, file_path=str(tmp_path))['downloaded'] == 1
+    images = [(IMAGE_URL.format(ref_id='ref1'), 'ka0xx0000000001', 'Body__c')]
+    assert client.download_images(images, file_path=str(tmp_path), overwrite=True)['downloaded'] == 1
+    assert (tmp_path / 'ref1.jpeg').read_bytes() == b'abcdefghij'
+    assert (tmp_path / 'ref2.jpeg').read_bytes() == b'abcdefghij'
+
+
+def test_download_images_validates_image_tuples(tmp_path):
+    """Image tuples without a refid value raise an exception before any downloads are attempted."""
+    client = _make_client({})
+
+    with pytest.raises(errors.exceptions.InvalidParameterError):
+        client.download_images([('https://example.com/image.png', 'ka0xx0000000001', 'Body__c')], file_path=str(tmp_path))
+    assert client.endpoints == []
+
+
+def test_export_rich_text_images_downloads_and_rewrites_html(tmp_path):
+    """Images found in the rich text fields are downloaded and the HTML is rewritten to the downloaded files."""
+    client = _make_client({'ref1': StreamedResponse()})
+    body = f'<p><img src="{IMAGE_URL.format(ref_id="ref1").replace("&", "&amp;")}"></p>'
+    records = [{'Id': 'ka0xx0000000001', 'Body__c': body}, {'Id': 'ka0xx0000000002', 'Body__c': '<p>None</p>'}]
+
+    result = client.export_rich_text_images(records, 'Body__c', file_path=str(tmp_path), rewrite_html=True)
+
+    assert result['download_report']['downloaded'] == 1
+    assert list(result['records']) == ['ka0xx0000000001']
+    assert result['records']['ka0xx0000000001']['Body__c'] == f'<p><img src="{tmp_path / "ref1.jpeg"}"></p>'
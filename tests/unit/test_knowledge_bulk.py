@@ -0,0 +1,500 @@
+# -*- coding: utf-8 -*-
+# bandit: skip=B101
+"""
+:Module:         tests.unit.test_knowledge_bulk
+:Synopsis:       Tests the bulk Salesforce Knowledge functions
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  18 Oct 2026
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from salespyforce import errors, knowledge
+from salespyforce.cache import ArticleNumberIndex
+from salespyforce.core import Salesforce
+from salespyforce.utils import core_utils
+
+ARTICLE_IDS = [f'ka0xx{index:010d}' for index in range(250)]
+
+
+def _record(article_id, **fields):
+    """Return a Knowledge__kav record dictionary with an 18-character Id."""
+    return {'attributes': {'type': 'Knowledge__kav'}, 'Id': core_utils.get_18_char_id(article_id), **fields}
+
+
+def test_get_articles_details_uses_chunked_soql_queries():
+    """Article details are retrieved with Id IN queries within the length limits and mapped to the provided IDs."""
+    queries = []
+
+    def soql_query(query, **kwargs):
+        queries.append(query)
+        return {'done': True, 'records': [_record(_id, Title=_id) for _id in ARTICLE_IDS if f"'{_id}'" in query]}
+
+    client = SimpleNamespace(version='v65.0', soql_query=soql_query)
+
+    details = knowledge.get_articles_details(client, ARTICLE_IDS, fields='Title, UrlName')
+
+    assert len(queries) == 3
+    assert all(_query.startswith('SELECT Id, Title, UrlName FROM Knowledge__kav WHERE Id IN (') for _query in queries)
+    assert all(len(_query.split('IN (', 1)[1]) <= 3500 for _query in queries)
+    assert list(details) == ARTICLE_IDS
+    assert details[ARTICLE_IDS[-1]]['Title'] == ARTICLE_IDS[-1]
+
+
+def test_get_articles_details_uses_fields_all_and_collections_endpoint():
+    """FIELDS(ALL) queries are limited to 200 records and the collections endpoint passes the IDs and fields."""
+    queries, requests = [], []
+
+    def soql_query(query, **kwargs):
+        queries.append(query)
+        return {'done': True, 'records': []}
+
+    def get(endpoint, params=None, **kwargs):
+        requests.append((endpoint, params))
+        return [_record(_id) for _id in params['ids'].split(',')] + [None]
+
+    client = SimpleNamespace(version='v65.0', soql_query=soql_query, get=get)
+
+    knowledge.get_articles_details(client, ARTICLE_IDS[:2])
+    details = knowledge.get_articles_details(client, ARTICLE_IDS[:2], fields=['Title'], use_collections_endpoint=True)
+
+    assert 'FIELDS(ALL)' in queries[0] and queries[0].endswith('LIMIT 200')
+    assert requests[0][0] == '/services/data/v65.0/composite/sobjects/Knowledge__kav'
+    assert requests[0][1] == {'ids': ','.join(ARTICLE_IDS[:2]), 'fields': 'Id,Title'}
+    assert all(details.values())
+
+
+def test_get_articles_details_falls_back_to_concurrent_individual_requests():
+    """Articles are retrieved individually when the bulk request fails and failures are mapped to None."""
+
+    def soql_query(query, **kwargs):
+        raise RuntimeError('The GET request failed with the following message: QUERY_TOO_COMPLICATED')
+
+    def get(endpoint, params=None, **kwargs):
+        article_id = endpoint.rsplit('/', 1)[-1]
+        if article_id == ARTICLE_IDS[1]:
+            raise RuntimeError('NOT_FOUND')
+        return _record(article_id, Title='Title')
+
+    client = SimpleNamespace(version='v65.0', soql_query=soql_query, get=get)
+
+    details = knowledge.get_articles_details(client, ARTICLE_IDS[:3], fields=['Title'])
+
+    assert details[ARTICLE_IDS[0]]['Title'] == 'Title'
+    assert details[ARTICLE_IDS[1]] is None
+    with pytest.raises(RuntimeError):
+        knowledge.get_articles_details(client, ARTICLE_IDS[:3], fallback_to_individual=False)
+
+
+def test_get_articles_details_rejects_invalid_values():
+    """Invalid Article IDs or field names raise an exception before any request is performed."""
+    client = SimpleNamespace(version='v65.0')
+
+    with pytest.raises(errors.exceptions.InvalidParameterError):
+        knowledge.get_articles_details(client, ["ka0xx' OR Id != '"])
+    with pytest.raises(errors.exceptions.InvalidParameterError):
+        knowledge.get_articles_details(client, ARTICLE_IDS[:1], fields=['Title FROM User'])
+
+
+def _make_articles_client(total_articles, requested_pages):
+    """Return a client whose knowledgeArticles endpoint returns pages of a fixed number of articles."""
+
+    def get(endpoint, params=None, headers=None):
+        requested_pages.append(params['pageNumber'])
+        start = (params['pageNumber'] - 1) * params['pageSize']
+        articles = [{'id': f'kA0{index}'} for index in range(start, min(start + params['pageSize'], total_articles))]
+        next_page = start + params['pageSize'] < total_articles
+        return {'articles': articles, 'nextPageUrl': f'/page/{params["pageNumber"] + 1}' if next_page else None}
+
+    return SimpleNamespace(version='v65.0', get=get, _get_headers=lambda header_type: {})
+
+
+@pytest.mark.parametrize('parallel_pages', [1, 3])
+def test_iter_articles_yields_every_article(parallel_pages):
+    """Every page is retrieved (serially or concurrently) and only the articles are yielded."""
+    requested_pages = []
+    client = _make_articles_client(250, requested_pages)
+
+    articles = list(knowledge.iter_articles(client, parallel_pages=parallel_pages))
+
+    assert [article['id'] for article in articles] == [f'kA0{index}' for index in range(250)]
+    assert sorted(requested_pages) == [1, 2, 3]
+
+
+def test_get_articles_list_can_return_only_articles():
+    """The article list can be returned without the response envelope."""
+    client = _make_articles_client(5, [])
+
+    assert knowledge.get_articles_list(client, articles_only=True) == [{'id': f'kA0{index}'} for index in range(5)]
+
+
+def test_publish_articles_bisects_failed_chunks():
+    """Failed chunks are split until the failing article is isolated and every article is reported."""
+    payloads = []
+    bad_article = ARTICLE_IDS[5]
+
+    def post(endpoint, payload):
+        article_ids = payload['inputs'][0]['articleVersionIdList']
+        payloads.append(article_ids)
+        if bad_article in article_ids:
+            raise RuntimeError('The POST request failed with a 400 status code.')
+        return [{'actionName': 'publishKnowledgeArticles', 'errors': None, 'isSuccess': True}]
+
+    client = SimpleNamespace(version='v65.0', post=post)
+
+    report = knowledge.publish_articles(client, ARTICLE_IDS[:16], chunk_size=8, max_workers=2)
+
+    assert list(report) == ARTICLE_IDS[:16]
+    assert report[bad_article]['published'] is False
+    assert 'status code' in report[bad_article]['error']
+    assert sum(result['published'] for result in report.values()) == 15
+    assert len(payloads) == 8
+
+
+def test_publish_articles_reports_unsuccessful_action_results():
+    """Unsuccessful action results are reported as failures when bisection is disabled."""
+
+    def post(endpoint, payload):
+        return [{'isSuccess': False, 'errors': [{'message': 'Validation failed'}]}]
+
+    client = SimpleNamespace(version='v65.0', post=post)
+
+    report = knowledge.publish_articles(client, ARTICLE_IDS[:2], bisect_failures=False)
+
+    assert report[ARTICLE_IDS[0]] == {'published': False, 'error': 'Validation failed'}
+    with pytest.raises(errors.exceptions.MissingRequiredDataError):
+        knowledge.publish_articles(client, [])
+
+
+def test_create_drafts_from_online_articles_maps_draft_ids():
+    """Drafts are created with multiple inputs per action and mapped back to the source Article IDs."""
+    payloads = []
+    source_ids = [f'kA0xx{index:010d}' for index in range(250)]
+
+    def post(endpoint, payload):
+        article_ids = [action_input['articleId'] for action_input in payload['inputs']]
+        payloads.append(article_ids)
+        if source_ids[-1] in article_ids:
+            raise RuntimeError('The POST request failed with a 400 status code.')
+        return [
+            {'isSuccess': article_id != source_ids[0], 'errors': None, 'outputValues': {'draftId': f'draft-{article_id}'}}
+            for article_id in article_ids
+        ]
+
+    client = SimpleNamespace(version='v65.0', post=post)
+
+    results = knowledge.create_drafts_from_online_articles(client, source_ids, unpublish=True)
+
+    assert sorted(len(article_ids) for article_ids in payloads[:2]) == [50, 200]
+    assert len(payloads) == 52
+    assert results[source_ids[1]] == {'draft_id': f'draft-{source_ids[1]}', 'error': None}
+    assert results[source_ids[0]]['draft_id'] is None and results[source_ids[0]]['error']
+    assert results[source_ids[-1]]['draft_id'] is None
+    assert results[source_ids[-2]]['draft_id'] == f'draft-{source_ids[-2]}'
+
+
+def test_create_sobject_records_uses_200_record_collections():
+    """Records are created through the sObject Collections endpoint 200 at a time with the results in order."""
+    payloads = []
+
+    def post(endpoint, payload=None, **kwargs):
+        payloads.append((endpoint, payload))
+        return [{'id': _record['ParentId'], 'success': True, 'errors': []} for _record in payload['records']]
+
+    invalidated = []
+    client = Salesforce.__new__(Salesforce)
+    client.version = 'v65.0'
+    client.post = post
+    client.response_cache = SimpleNamespace(invalidate=invalidated.append)
+    records = [{'ParentId': _id} for _id in ARTICLE_IDS]
+
+    results = client.create_sobject_records('Knowledge__DataCategorySelection', records, max_workers=2)
+
+    assert [len(_payload['records']) for _, _payload in payloads] == [200, 50]
+    assert payloads[0][0] == '/services/data/v65.0/composite/sobjects'
+    assert payloads[0][1]['records'][0]['attributes'] == {'type': 'Knowledge__DataCategorySelection'}
+    assert [_result['id'] for _result in results] == ARTICLE_IDS
+    assert invalidated[0] == f'/services/data/v65.0/sobjects/Knowledge__DataCategorySelection/{ARTICLE_IDS[0]}'
+    assert len(invalidated) == len(ARTICLE_IDS)
+
+
+def test_create_sobject_records_reports_failed_chunks():
+    """A chunk whose API call fails results in an unsuccessful result for each of its records."""
+
+    def post(endpoint, payload=None, **kwargs):
+        if len(payload['records']) < 200:
+            raise RuntimeError('The API call failed')
+        return [{'id': _record['ParentId'], 'success': True, 'errors': []} for _record in payload['records']]
+
+    client = Salesforce.__new__(Salesforce)
+    client.version = 'v65.0'
+    client.post = post
+
+    results = client.create_sobject_records('Knowledge__DataCategorySelection', [{'ParentId': _id} for _id in ARTICLE_IDS])
+
+    assert [_result['id'] for _result in results[:200]] == ARTICLE_IDS[:200]
+    assert results[200:] == [{'success': False, 'errors': [{'message': 'The API call failed'}]}] * 50
+
+
+def test_assign_data_categories_skips_existing_and_reports_outcomes():
+    """Existing and duplicate assignments are skipped and each row reports whether it was created or failed."""
+    queries, created = [], []
+
+    def soql_query(query, **kwargs):
+        queries.append(query)
+        return {
+            'done': True,
+            'records': [
+                {
+                    'Id': '02ox00000000001AAA',
+                    'ParentId': core_utils.get_18_char_id(ARTICLE_IDS[0]),
+                    'DataCategoryGroupName': 'Products',
+                    'DataCategoryName': 'Widgets',
+                }
+            ],
+        }
+
+    def create_sobject_records(sobject, records, **kwargs):
+        created.extend(records)
+        return [{'id': '02ox00000000002AAA', 'success': True, 'errors': []}, {'success': False, 'errors': [{'message': 'Bad'}]}]
+
+    client = SimpleNamespace(soql_query=soql_query, create_sobject_records=create_sobject_records)
+    assignments = [
+        (ARTICLE_IDS[0], 'Products', 'Widgets'),
+        (ARTICLE_IDS[1], 'Products', 'Widgets'),
+        (ARTICLE_IDS[1], 'Products', 'Widgets'),
+        (ARTICLE_IDS[2], 'Products', 'Gadgets'),
+    ]
+
+    results = knowledge.assign_data_categories(client, assignments)
+
+    assert len(queries) == 1
+    assert 'FROM Knowledge__DataCategorySelection WHERE ParentId IN (' in queries[0]
+    assert [_record['ParentId'] for _record in created] == [ARTICLE_IDS[1], ARTICLE_IDS[2]]
+    assert [_result['status'] for _result in results] == ['skipped', 'created', 'skipped', 'failed']
+    assert results[0]['id'] == '02ox00000000001AAA'
+    assert results[3]['error'] == 'Bad'
+    with pytest.raises(errors.exceptions.InvalidParameterError):
+        knowledge.assign_data_categories(client, [(ARTICLE_IDS[0], 'Products')])
+
+
+def test_composite_batch_submits_25_relative_subrequests_per_call():
+    """Subrequests are submitted 25 at a time with URLs relative to /services/data/ and results in order."""
+    payloads = []
+
+    def post(endpoint, payload=None, **kwargs):
+        payloads.append((endpoint, payload))
+        return {'hasErrors': False, 'results': [{'statusCode': 204, 'result': None} for _ in payload['batchRequests']]}
+
+    client = Salesforce.__new__(Salesforce)
+    client.version = 'v65.0'
+    client.post = post
+    subrequests = [{'method': 'DELETE', 'url': f'/services/data/v65.0/sobjects/Knowledge__kav/{_id}'} for _id in ARTICLE_IDS[:60]]
+
+    results = client.composite_batch(subrequests, max_workers=3)
+
+    assert [len(_payload['batchRequests']) for _, _payload in payloads] == [25, 25, 10]
+    assert payloads[0][0] == '/services/data/v65.0/composite/batch'
+    assert payloads[0][1]['batchRequests'][0]['url'] == f'v65.0/sobjects/Knowledge__kav/{ARTICLE_IDS[0]}'
+    assert payloads[0][1]['haltOnError'] is False
+    assert len(results) == 60
+
+
+def test_composite_batch_invalidates_cached_records_of_successful_subrequests():
+    """Cached responses are invalidated for each successful subrequest that is not a GET request."""
+
+    def post(endpoint, payload=None, **kwargs):
+        return {'results': [{'statusCode': 404 if 'Bad' in _request['url'] else 200} for _request in payload['batchRequests']]}
+
+    invalidated = []
+    client = Salesforce.__new__(Salesforce)
+    client.version = 'v65.0'
+    client.post = post
+    client.response_cache = SimpleNamespace(invalidate=invalidated.append)
+    subrequests = [
+        {'method': 'PATCH', 'url': f'v65.0/sobjects/Knowledge__kav/{ARTICLE_IDS[0]}', 'richInput': {'Title': 'New'}},
+        {'method': 'DELETE', 'url': f'/services/data/v65.0/sobjects/Bad/{ARTICLE_IDS[1]}'},
+        {'method': 'GET', 'url': f'v65.0/sobjects/Knowledge__kav/{ARTICLE_IDS[2]}'},
+    ]
+
+    client.composite_batch(subrequests)
+
+    assert invalidated == [f'/services/data/v65.0/sobjects/Knowledge__kav/{ARTICLE_IDS[0]}']
+
+
+def test_composite_batch_reports_failed_batches_per_subrequest():
+    """A failed batch results in an error result for each of its subrequests without discarding the other batches."""
+
+    def post(endpoint, payload=None, **kwargs):
+        if any(ARTICLE_IDS[30] in _request['url'] for _request in payload['batchRequests']):
+            raise RuntimeError('The POST request failed')
+        return {'results': [{'statusCode': 204, 'result': None} for _ in payload['batchRequests']]}
+
+    client = Salesforce.__new__(Salesforce)
+    client.version = 'v65.0'
+    client.post = post
+    subrequests = [{'method': 'DELETE', 'url': f'v65.0/sobjects/Knowledge__kav/{_id}'} for _id in ARTICLE_IDS[:60]]
+
+    results = client.composite_batch(subrequests, max_workers=2)
+
+    assert len(results) == 60
+    assert results[:25] == results[50:] + [{'statusCode': 204, 'result': None}] * 15
+    assert results[25:50] == [{'statusCode': None, 'result': [{'message': 'The POST request failed'}]}] * 25
+
+
+def test_archive_articles_reports_subrequest_and_batch_failures():
+    """Each article is reported as archived or failed, including every article of a batch whose call failed."""
+    batches = []
+
+    def composite_batch(subrequests, **kwargs):
+        batches.append(subrequests)
+        if any(ARTICLE_IDS[30] in _subrequest['url'] for _subrequest in subrequests):
+            raise RuntimeError('Batch failed')
+        return [
+            {'statusCode': 400, 'result': [{'errorCode': 'INVALID', 'message': 'Not published'}]}
+            if ARTICLE_IDS[1] in _subrequest['url']
+            else {'statusCode': 204, 'result': None}
+            for _subrequest in subrequests
+        ]
+
+    client = SimpleNamespace(version='v65.0', composite_batch=composite_batch)
+
+    report = knowledge.archive_articles(client, ARTICLE_IDS[:60] + [ARTICLE_IDS[0]], max_workers=2)
+
+    assert len(batches) == 3
+    assert batches[0][0]['method'] == 'PATCH'
+    assert batches[0][0]['richInput'] == {'publishStatus': 'Archived'}
+    assert list(report) == ARTICLE_IDS[:60]
+    assert report[ARTICLE_IDS[0]] == {'archived': True, 'error': None}
+    assert report[ARTICLE_IDS[1]] == {'archived': False, 'error': 'Not published'}
+    assert all(report[_id] == {'archived': False, 'error': 'Batch failed'} for _id in ARTICLE_IDS[25:50])
+
+
+def test_delete_article_drafts_uses_sobject_path_when_requested():
+    """Drafts are deleted with DELETE subrequests against the sObject path when the endpoint is not used."""
+    subrequests = []
+
+    def composite_batch(batch, **kwargs):
+        subrequests.extend(batch)
+        return [{'statusCode': 204, 'result': None} for _ in batch]
+
+    invalidated = []
+    client = SimpleNamespace(
+        version='v65.0', composite_batch=composite_batch, response_cache=SimpleNamespace(invalidate=invalidated.append)
+    )
+
+    report = knowledge.delete_article_drafts(client, ARTICLE_IDS[:3], use_knowledge_management_endpoint=False)
+
+    assert subrequests[0] == {'method': 'DELETE', 'url': f'/services/data/v65.0/sobjects/Knowledge__kav/{ARTICLE_IDS[0]}'}
+    assert invalidated == [f'/services/data/v65.0/sobjects/Knowledge__kav/{_id}' for _id in ARTICLE_IDS[:3]]
+    assert all(_result['deleted'] for _result in report.values())
+    with pytest.raises(errors.exceptions.MissingRequiredDataError):
+        knowledge.delete_article_drafts(client, [])
+
+
+def test_get_article_ids_from_numbers_uses_index_and_in_queries():
+    """Indexed article numbers are resolved locally and the rest are queried with padded IN queries."""
+    queries = []
+
+    def soql_query(query, **kwargs):
+        queries.append(query)
+        return {'done': True, 'records': [{'Id': 'ka0xx0000000002AAA', 'ArticleNumber': '000000002'}]}
+
+    index = ArticleNumberIndex()
+    index.update('Knowledge__kav', {'1': 'ka0xx0000000001AAA'})
+    client = SimpleNamespace(soql_query=soql_query, article_number_index=index)
+
+    article_ids = knowledge.get_article_ids_from_numbers(client, [1, '2', 3])
+
+    assert article_ids == {1: 'ka0xx0000000001AAA', '2': 'ka0xx0000000002AAA', 3: ''}
+    assert len(queries) == 1
+    assert "WHERE ArticleNumber IN ('000000002', '000000003')" in queries[0]
+    assert index.get('Knowledge__kav', 2) == 'ka0xx0000000002AAA'
+
+    knowledge.get_article_ids_from_numbers(client, ["1' OR Id != '"])
+    assert "IN ('1\\' OR Id != \\'')" in queries[-1]
+
+
+def test_get_article_id_from_number_only_indexes_exact_matches():
+    """A partial article number returns and indexes the exact match, and other partial matches are not indexed."""
+    responses = {
+        "'%0123'": [
+            {'Id': 'ka0xx0000010123AAA', 'ArticleNumber': '000010123'},
+            {'Id': 'ka0xx0000000123AAA', 'ArticleNumber': '000000123'},
+        ],
+        "'%045'": [{'Id': 'ka0xx0000001045AAA', 'ArticleNumber': '000001045'}],
+    }
+    queries = []
+
+    def soql_query(query, **kwargs):
+        queries.append(query)
+        records = next(_records for _pattern, _records in responses.items() if _pattern in query)
+        return {'done': True, 'totalSize': len(records), 'records': records}
+
+    index = ArticleNumberIndex()
+    client = SimpleNamespace(soql_query=soql_query, article_number_index=index)
+
+    assert knowledge.get_article_id_from_number(client, '123') == 'ka0xx0000000123AAA'
+    assert knowledge.get_article_id_from_number(client, '45') == 'ka0xx0000001045AAA'
+    assert queries[0].startswith('SELECT Id, ArticleNumber FROM Knowledge__kav WHERE ArticleNumber LIKE ')
+    assert index.get('Knowledge__kav', '000000123') == 'ka0xx0000000123AAA'
+    assert index.get('Knowledge__kav', '45') is None
+
+
+def test_load_article_number_index_refreshes_incrementally():
+    """The first load queries every version and later loads only query versions modified since the watermark."""
+    queries = []
+    responses = [
+        {
+            'done': True,
+            'records': [
+                {'Id': 'ka0xx0000000001AAA', 'ArticleNumber': '000000001', 'SystemModstamp': '2026-10-18T10:00:00.000+0000'}
+            ],
+        },
+        {
+            'done': True,
+            'records': [
+                {'Id': 'ka0xx0000000009AAA', 'ArticleNumber': '000000001', 'SystemModstamp': '2026-10-18T11:00:00.000+0000'}
+            ],
+        },
+    ]
+
+    def soql_query(query, **kwargs):
+        queries.append(query)
+        return responses[len(queries) - 1]
+
+    client = SimpleNamespace(soql_query=soql_query, base_url='https://example.lightning.force.com')
+
+    assert knowledge.load_article_number_index(client) == 1
+    assert knowledge.load_article_number_index(client) == 1
+    url = knowledge.get_article_url(client, article_number=1)
+
+    assert 'WHERE' not in queries[0]
+    assert 'WHERE SystemModstamp >= 2026-10-18T10:00:00Z ORDER BY SystemModstamp' in queries[1]
+    assert len(queries) == 2
+    assert url.endswith('ka0xx0000000009AAA/view')
+
+
+def test_check_for_existing_articles_escapes_titles_and_maps_results():
+    """Titles are escaped within chunked IN queries and matched to the returned records without regard to case."""
+    queries = []
+
+    def soql_query(query, **kwargs):
+        queries.append((query, kwargs))
+        return {'done': True, 'records': [{'Id': 'ka0xx0000000001AAA', 'ArticleNumber': '000000001', 'Title': "o'brien's guide"}]}
+
+    client = SimpleNamespace(soql_query=soql_query)
+    titles = ["O'Brien's Guide", 'Missing Title'] + [f'Title {index} with a longer description' for index in range(200)]
+
+    results = knowledge.check_for_existing_articles(client, titles)
+
+    assert len(queries) == 3
+    assert "WHERE Title IN ('O\\'Brien\\'s Guide', 'Missing Title'" in queries[0][0]
+    assert queries[0][0].endswith("AND PublishStatus != 'Archived'")
+    assert queries[0][1] == {'replace_quotes': False}
+    assert results["O'Brien's Guide"] == ('ka0xx0000000001AAA', '000000001')
+    assert results['Missing Title'] == ('', '')
+    assert len(results) == 202
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# bandit: skip=B101
+"""
+:Module:         tests.unit.test_knowledge_export
+:Synopsis:       Tests the resumable knowledge bulk exporter and its checkpoint file
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  18 Oct 2026
+"""
+
+import json
+import os
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from salespyforce import errors
+from salespyforce.knowledge_export import export_knowledge
+from salespyforce.utils.checkpoint import Checkpoint
+
+IMAGE_HTML = '<p><img src="https://example.file.force.com/servlet/rtaImage?eid={id}&amp;refid={ref_id}"></p>'
+
+
+class FakeSalesforce:
+    """Represent the subset of the core object used by the knowledge exporter."""
+
+    def __init__(self, remaining=50000):
+        self.remaining = remaining
+        self.versions = [
+            {
+                'Id': f'ka0xx000000000{_num}',
+                'Title': f'Article {_num}',
+                'Body__c': IMAGE_HTML.format(id=_num, ref_id=f'0EM{_num}'),
+            }
+            for _num in range(1, 4)
+        ]
+        self.version = 'v65.0'
+        self.queries = []
+        self.downloads = []
+        self.limit_requests = []
+
+    def soql_query(self, query, replace_quotes=True, next_records_url=False):
+        """Return the versions after the last ID or the category selections for the parent IDs."""
+        self.queries.append(query)
+        if 'Knowledge__DataCategorySelection' in query:
+            parent_ids = re.findall(r"'([^']+)'", query)
+            records = [{'Id': f'02o{_id}', 'ParentId': _id, 'DataCategoryName': 'FAQ'} for _id in parent_ids]
+            return {'done': True, 'records': records}
+        last_id = re.search(r"Id > '([^']+)'", query)
+        limit = int(re.search(r'LIMIT (\d+)', query).group(1))
+        records = [_record for _record in self.versions if not last_id or _record['Id'] > last_id.group(1)]
+        return {'done': True, 'records': records[:limit]}
+
+    def get(self, endpoint, return_json=True, **kwargs):
+        """Return a response with the daily API request limits and record whether the cache could be used."""
+        self.limit_requests.append((endpoint, return_json))
+        limits = {'DailyApiRequests': {'Max': 100000, 'Remaining': self.remaining}}
+        return SimpleNamespace(json=lambda: limits)
+
+    def download_images(self, images, file_path=None, sobject=None, max_workers=8, rate_limiter=None):
+        """Write a placeholder file for each image and return a successful report."""
+        report = {'images': {}}
+        for image_url, _record_id, _field_name in images:
+            ref_id = image_url.rsplit('=', 1)[-1]
+            self.downloads.append(ref_id)
+            with open(os.path.join(file_path, f'{ref_id}.jpeg'), 'wb') as _file:
+                _file.write(b'image')
+            report['images'][ref_id] = {'status': 'downloaded'}
+        return report
+
+
+def test_checkpoint_persists_progress(tmp_path):
+    """Completed items and state values are saved to the file and loaded by a new checkpoint."""
+    file_path = str(tmp_path / 'checkpoint.json')
+    checkpoint = Checkpoint(file_path)
+    checkpoint.mark_complete('pages', 1)
+    checkpoint.set_state('last_id', 'abc')
+
+    resumed = Checkpoint(file_path)
+    assert resumed.is_complete('pages', 1)
+    assert not resumed.is_complete('pages', 2)
+    assert resumed.get_state('last_id') == 'abc'
+
+    resumed.delete()
+    assert not os.path.exists(file_path)
+    assert resumed.get_state('last_id') is None
+
+
+def test_export_knowledge_writes_pages_manifest_and_archive(tmp_path):
+    """Versions, categories and images are exported per page with a manifest and an optional archive."""
+    sfdc = FakeSalesforce()
+    output_path = str(tmp_path / 'export')
+
+    manifest = export_knowledge(
+        sfdc, output_path, fields='Title', rich_text_fields=['Body__c'], archive_format='zip', page_size=2
+    )
+
+    assert manifest['versions'] == {'count': 3, 'files': ['versions/00001.jsonl', 'versions/00002.jsonl']}
+    assert manifest['categories']['count'] == 3
+    assert manifest['images']['files'] == ['images/0EM1.jpeg', 'images/0EM2.jpeg', 'images/0EM3.jpeg']
+    assert manifest['complete'] is True
+    assert sfdc.queries[0] == 'SELECT Id, Title, Body__c FROM Knowledge__kav ORDER BY Id LIMIT 2'
+    assert "WHERE Id > 'ka0xx0000000002'" in sfdc.queries[1]
+    with open(os.path.join(output_path, 'versions', '00002.jsonl'), encoding='utf-8') as _file:
+        assert [json.loads(_line)['Id'] for _line in _file] == ['ka0xx0000000003']
+    with open(os.path.join(output_path, 'manifest.json'), encoding='utf-8') as _file:
+        assert json.load(_file)['versions']['count'] == 3
+    assert not os.path.exists(os.path.join(output_path, '.export_checkpoint.json'))
+    assert manifest['archive'].endswith('export.zip') and os.path.isfile(manifest['archive'])
+
+
+def test_export_knowledge_stops_at_api_limit_and_resumes(tmp_path):
+    """The export stops when few API requests remain and resumes from the checkpoint without repeating work."""
+    sfdc = FakeSalesforce(remaining=10)
+    output_path = str(tmp_path / 'export')
+
+    with pytest.raises(errors.exceptions.APIRequestLimitError):
+        export_knowledge(sfdc, output_path, fields='Title', rich_text_fields='Body__c', min_remaining_api_requests=100)
+    assert sfdc.queries == []
+    assert sfdc.limit_requests == [('/services/data/v65.0/limits', False)]
+    assert os.path.isfile(os.path.join(output_path, '.export_checkpoint.json'))
+
+    # Export the versions and then simulate an interruption before the images are downloaded
+    sfdc.remaining = 50000
+    checkpoint = Checkpoint(os.path.join(output_path, '.export_checkpoint.json'))
+    export_kwargs = {'fields': 'Title', 'rich_text_fields': 'Body__c', 'include_images': False}
+    export_knowledge(sfdc, output_path, **export_kwargs)
+    checkpoint.set_state('version_pages', [{'page': '00001', 'count': 3}])
+    checkpoint.set_state('last_version_id', 'ka0xx0000000003')
+    checkpoint.mark_complete('versions', 'all')
+    checkpoint.mark_complete('categories', '00001')
+    query_count = len(sfdc.queries)
+
+    manifest = export_knowledge(sfdc, output_path, fields='Title', rich_text_fields='Body__c')
+    assert len(sfdc.queries) == query_count
+    assert sfdc.downloads == ['0EM1', '0EM2', '0EM3']
+    assert manifest['versions']['count'] == 3
+
+
+def test_export_knowledge_escapes_checkpoint_values_in_queries(tmp_path):
+    """The last exported ID from the checkpoint file is escaped as a bind value rather than injected into the query."""
+    sfdc = FakeSalesforce()
+    output_path = tmp_path / 'export'
+    os.makedirs(output_path)
+    Checkpoint(str(output_path / '.export_checkpoint.json')).set_state('last_version_id', "ka0' OR Id != '")
+
+    export_knowledge(sfdc, str(output_path), fields='Title', include_images=False)
+
+    assert "WHERE Id > 'ka0\\' OR Id != \\'' ORDER BY Id" in sfdc.queries[0]
+
+
+def test_export_knowledge_rejects_invalid_archive_format(tmp_path):
+    """An unsupported archive format raises an exception before anything is exported."""
+    with pytest.raises(errors.exceptions.InvalidParameterError):
+        export_knowledge(FakeSalesforce(), str(tmp_path), archive_format='rar')
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+# bandit: skip=B101
+"""
+:Module:         tests.unit.test_knowledge_import
+:Synopsis:       Tests the resumable knowledge bulk importer
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  18 Oct 2026
+"""
+
+import json
+import os
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from salespyforce import errors
+from salespyforce.core import Salesforce
+from salespyforce.knowledge_import import import_knowledge
+
+SOURCE_VERSIONS = [
+    {'Id': 'ka0src000000001', 'PublishStatus': 'Online', 'Title': 'New Article', 'UrlName': 'new', 'ArticleNumber': '1'},
+    {'Id': 'ka0src000000002', 'PublishStatus': 'Online', 'Title': 'Existing', 'UrlName': 'existing', 'ArticleNumber': '2'},
+    {'Id': 'ka0src000000003', 'PublishStatus': 'Online', 'Title': 'No URL', 'ArticleNumber': '3'},
+    {'Id': 'ka0src000000004', 'PublishStatus': 'Archived', 'Title': 'Old', 'UrlName': 'old', 'ArticleNumber': '4'},
+]
+
+
+def _write_export(path):
+    """Write an export directory with a manifest, a page of article versions and their data categories."""
+    os.makedirs(path / 'versions')
+    os.makedirs(path / 'categories')
+    (path / 'manifest.json').write_text(json.dumps({'versions': {'files': ['versions/00001.jsonl']}}))
+    (path / 'versions' / '00001.jsonl').write_text(''.join(json.dumps(_record) + '\n' for _record in SOURCE_VERSIONS))
+    selections = [
+        {'ParentId': 'ka0src000000001', 'DataCategoryGroupName': 'Products', 'DataCategoryName': 'Widgets'},
+        {'ParentId': 'ka0src000000002', 'DataCategoryGroupName': 'Products', 'DataCategoryName': 'Gadgets'},
+    ]
+    (path / 'categories' / '00001.jsonl').write_text(''.join(json.dumps(_record) + '\n' for _record in selections))
+
+
+def _make_client(calls, publish_success=True):
+    """Return a client that matches the 'Existing' title to an online article and records every call."""
+
+    def soql_query(query, **kwargs):
+        calls.setdefault('queries', []).append(query)
+        if 'WHERE Title IN' in query:
+            return {'done': True, 'records': [{'Id': 'ka0tgt000000002', 'ArticleNumber': '000000002', 'Title': 'Existing'}]}
+        if 'WHERE Id IN' in query:
+            return {'done': True, 'records': [{'Id': 'ka0tgt000000002', 'KnowledgeArticleId': 'kA0tgt000000002'}]}
+        if 'WHERE KnowledgeArticleId IN' in query:
+            record = {'Id': 'ka0tgt000000002', 'KnowledgeArticleId': 'kA0tgt000000002', 'PublishStatus': 'Online'}
+            return {'done': True, 'records': [record]}
+        return {'done': True, 'records': []}
+
+    def post(endpoint, payload, **kwargs):
+        calls.setdefault('posts', []).append(endpoint)
+        if endpoint.endswith('createDraftFromOnlineKnowledgeArticle'):
+            return [{'isSuccess': True, 'outputValues': {'draftId': 'ka0drf000000002'}}]
+        return [{'isSuccess': publish_success, 'errors': [{'message': 'Publish failed'}]}]
+
+    def create_sobject_records(sobject, records, **kwargs):
+        if sobject == 'Knowledge__DataCategorySelection':
+            calls.setdefault('categories', []).extend(records)
+            return [{'id': f'02o{_index}', 'success': True} for _index, _ in enumerate(records)]
+        calls.setdefault('created', []).extend(records)
+        return [{'id': f'ka0new00000000{_index + 1}', 'success': True, 'errors': []} for _index, _ in enumerate(records)]
+
+    def update_sobject_records(sobject, records, **kwargs):
+        calls.setdefault('updated', []).extend(records)
+        return [{'id': _record['Id'], 'success': True, 'errors': []} for _record in records]
+
+    def describe_object(object_name):
+        fields = [
+            {'name': 'Id', 'createable': False, 'updateable': False},
+            {'name': 'Title', 'createable': True, 'updateable': True},
+            {'name': 'UrlName', 'createable': True, 'updateable': True},
+            {'name': 'ArticleNumber', 'createable': False, 'updateable': False},
+        ]
+        return {'fields': fields}
+
+    return SimpleNamespace(
+        version='v65.0',
+        soql_query=soql_query,
+        post=post,
+        create_sobject_records=create_sobject_records,
+        update_sobject_records=update_sobject_records,
+        describe_object=describe_object,
+    )
+
+
+def test_import_knowledge_creates_updates_categorizes_and_publishes(tmp_path):
+    """New articles are created, existing articles are updated via drafts and the drafts are categorized and published."""
+    _write_export(tmp_path)
+    calls = {}
+
+    report = import_knowledge(_make_client(calls), str(tmp_path))
+
+    assert calls['created'] == [{'Title': 'New Article', 'UrlName': 'new'}]
+    assert calls['updated'] == [{'Id': 'ka0drf000000002', 'Title': 'Existing', 'UrlName': 'existing'}]
+    assert [(_record['ParentId'], _record['DataCategoryName']) for _record in calls['categories']] == [
+        ('ka0new000000001', 'Widgets'),
+        ('ka0drf000000002', 'Gadgets'),
+    ]
+    assert report['articles']['ka0src000000001'] == {
+        'target_id': 'ka0new000000001',
+        'action': 'created',
+        'published': True,
+        'error': None,
+    }
+    assert report['articles']['ka0src000000003']['action'] == 'failed'
+    assert 'ka0src000000004' not in report['articles']
+    assert (report['created'], report['updated'], report['failed'], report['published']) == (1, 1, 1, 2)
+    assert report['categories_assigned'] == 2
+    assert os.path.isfile(tmp_path / '.import_journal.json')
+    assert any(
+        "WHERE KnowledgeArticleId IN ('kA0tgt000000002') AND PublishStatus IN ('Draft', 'Online')" in _query
+        for _query in calls['queries']
+    )
+
+
+def test_import_knowledge_resumes_without_duplicating_work(tmp_path):
+    """A restarted import only retries the failed work recorded in the journal."""
+    _write_export(tmp_path)
+    first_calls = {}
+    import_knowledge(_make_client(first_calls, publish_success=False), str(tmp_path), publish_status=None)
+
+    second_calls = {}
+    report = import_knowledge(_make_client(second_calls), str(tmp_path), publish_status=None)
+
+    assert 'created' not in second_calls and 'updated' not in second_calls
+    assert 'FROM Knowledge__DataCategorySelection' in second_calls['queries'][0]
+    assert report['articles']['ka0src000000001']['published'] is True
+    assert report['articles']['ka0src000000004'] == {
+        'target_id': 'ka0new000000002',
+        'action': 'created',
+        'published': True,
+        'error': None,
+    }
+    assert report['articles']['ka0src000000003']['action'] == 'failed'
+
+
+def test_import_knowledge_journals_creates_before_failed_updates(tmp_path):
+    """Created drafts are journaled before the updates are issued and a failed request marks its articles as failed."""
+    _write_export(tmp_path)
+    first_calls = {}
+    client = _make_client(first_calls)
+
+    def update_sobject_records(sobject, records, **kwargs):
+        raise RuntimeError('The sObject Collections request failed')
+
+    client.update_sobject_records = update_sobject_records
+    report = import_knowledge(client, str(tmp_path), publish_status=None)
+
+    assert report['articles']['ka0src000000001']['action'] == 'created'
+    assert report['articles']['ka0src000000002'] == {
+        'target_id': 'ka0drf000000002',
+        'action': 'failed',
+        'published': False,
+        'error': 'The sObject Collections request failed',
+    }
+
+    second_calls = {}
+    report = import_knowledge(_make_client(second_calls), str(tmp_path), publish_status=None)
+
+    assert 'created' not in second_calls
+    assert second_calls['updated'] == [{'Id': 'ka0drf000000002', 'Title': 'Existing', 'UrlName': 'existing'}]
+    assert report['articles']['ka0src000000002']['action'] == 'updated'
+
+
+def test_import_knowledge_validates_parameters(tmp_path):
+    """An invalid match method or a missing manifest raises an exception."""
+    client = _make_client({})
+    with pytest.raises(errors.exceptions.InvalidParameterError):
+        import_knowledge(client, str(tmp_path), match_by='url')
+    with pytest.raises(errors.exceptions.MissingRequiredDataError):
+        import_knowledge(client, str(tmp_path))
+
+
+def test_update_sobject_records_uses_200_record_collections():
+    """Records are updated through the sObject Collections endpoint 200 at a time."""
+    payloads = []
+
+    def patch(endpoint, payload=None, **kwargs):
+        payloads.append((endpoint, payload, kwargs))
+        return [{'id': _record['Id'], 'success': True, 'errors': []} for _record in payload['records']]
+
+    client = Salesforce.__new__(Salesforce)
+    client.version = 'v65.0'
+    client.patch = patch
+    records = [{'Id': f'ka0xx{_index:010d}', 'Title': 'Updated'} for _index in range(250)]
+
+    results = client.update_sobject_records('Knowledge__kav', records)
+
+    assert [len(_payload['records']) for _, _payload, _ in payloads] == [200, 50]
+    assert payloads[0][0] == '/services/data/v65.0/composite/sobjects'
+    assert payloads[0][2] == {'return_json': True}
+    assert [_result['id'] for _result in results] == [_record['Id'] for _record in records]
+    with pytest.raises(TypeError):
+        client.update_sobject_records('Knowledge__kav', [{'Title': 'Missing Id'}])
+
+
+def test_update_sobject_records_reports_failed_chunks():
+    """A chunk whose API call fails results in an unsuccessful result for each of its records."""
+
+    def patch(endpoint, payload=None, **kwargs):
+        if len(payload['records']) == 200:
+            raise RuntimeError('The API call failed')
+        return [{'id': _record['Id'], 'success': True, 'errors': []} for _record in payload['records']]
+
+    invalidated = []
+    client = Salesforce.__new__(Salesforce)
+    client.version = 'v65.0'
+    client.patch = patch
+    client.response_cache = SimpleNamespace(invalidate=invalidated.append)
+    records = [{'Id': f'ka0xx{_index:010d}', 'Title': 'Updated'} for _index in range(250)]
+
+    results = client.update_sobject_records('Knowledge__kav', records, max_workers=2)
+
+    assert invalidated == [f'/services/data/v65.0/sobjects/Knowledge__kav/{_record["Id"]}' for _record in records[200:]]
+    assert results[:200] == [{'success': False, 'errors': [{'message': 'The API call failed'}]}] * 200
+    assert [_result['id'] for _result in results[200:]] == [_record['Id'] for _record in records[200:]]
+
+
+def test_import_knowledge_matches_by_article_number(tmp_path):
+    """Existing articles can be identified by their article number rather than their title."""
+    _write_export(tmp_path)
+    calls = {}
+
+    import_knowledge(_make_client(calls), str(tmp_path), match_by='number', include_categories=False, publish=False)
+
+    assert re.search(r"WHERE ArticleNumber IN \('000000001', '000000002'\)", calls['queries'][0])
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# bandit: skip=B101
+"""
+:Module:         tests.unit.test_record_access
+:Synopsis:       Tests the single and bulk user record access checks of the core client
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  18 Oct 2026
+"""
+
+import pytest
+
+from salespyforce import errors
+from salespyforce.cache import RecordAccessCache
+from salespyforce.core import Salesforce
+
+USER_ID = '005xx000001Sv6AAAS'
+
+
+def _make_client(access_by_id, queries, record_access_cache=None):
+    """Return a client whose SOQL queries return UserRecordAccess data for the requested records."""
+    client = Salesforce.__new__(Salesforce)
+    client.current_user_info = {}
+    client.record_access_cache = record_access_cache
+
+    def soql_query(query, **kwargs):
+        queries.append(query)
+        records = [
+            {'RecordId': record_id, 'HasReadAccess': read, 'HasEditAccess': edit, 'HasDeleteAccess': delete}
+            for record_id, (read, edit, delete) in access_by_id.items()
+            if f"'{record_id[:15]}" in query
+        ]
+        return {'totalSize': len(records), 'done': True, 'records': records}
+
+    client.soql_query = soql_query
+    return client
+
+
+def test_bulk_record_access_chunks_queries_by_200_records():
+    """Record access for many records is queried in chunks of up to 200 record IDs within the length limits."""
+    record_ids = [f'001xx{index:010d}' for index in range(450)]
+    access_by_id = {f'{record_id}AAA': (True, False, False) for record_id in record_ids}
+    queries = []
+    client = _make_client(access_by_id, queries)
+
+    record_access = client.check_user_record_access_bulk(record_ids, user_id=USER_ID)
+
+    assert len(queries) == 5
+    assert all(f"WHERE UserId = '{USER_ID}' AND RecordId IN (" in query for query in queries)
+    assert all(len(query.split('IN (', 1)[1]) <= 3500 for query in queries)
+    assert list(record_access) == record_ids
+    assert record_access[record_ids[0]] == {'HasReadAccess': True, 'HasEditAccess': False, 'HasDeleteAccess': False}
+
+
+def test_can_access_records_returns_access_by_record_id():
+    """The bulk access methods return a Boolean for each record and None for records without data."""
+    access_by_id = {'001xx000003DGb2AAG': (True, True, False), '001xx000003DGb3AAG': (True, False, True)}
+    queries = []
+    client = _make_client(access_by_id, queries)
+    record_ids = ['001xx000003DGb2AAG', '001xx000003DGb3AAG', '001xx000003DGb4AAG']
+
+    with pytest.warns(UserWarning):
+        can_edit = client.can_edit_records(record_ids, user_id=USER_ID, raise_exc_on_failure=False)
+    can_delete = client.can_delete_records(record_ids[:2], user_id=USER_ID)
+
+    assert can_edit == {'001xx000003DGb2AAG': True, '001xx000003DGb3AAG': False, '001xx000003DGb4AAG': None}
+    assert can_delete == {'001xx000003DGb2AAG': False, '001xx000003DGb3AAG': True}
+    assert len(queries) == 2
+
+
+def test_can_delete_record_evaluates_delete_access():
+    """The single-record delete check evaluates the HasDeleteAccess field."""
+    client = Salesforce.__new__(Salesforce)
+    record_access_data = {'HasReadAccess': True, 'HasEditAccess': True, 'HasDeleteAccess': False}
+
+    assert client.can_delete_record('001xx000003DGb2AAG', record_access_data=record_access_data) is False
+
+
+def test_bulk_record_access_rejects_invalid_values():
+    """Invalid record IDs, user IDs or access types raise an exception before any query is performed."""
+    queries = []
+    client = _make_client({}, queries)
+
+    with pytest.raises(ValueError):
+        client.check_user_record_access_bulk(["001xx000003DGb2' OR Id != '"], user_id=USER_ID)
+    with pytest.raises(ValueError):
+        client.check_user_record_access_bulk(['001xx000003DGb2AAG'], user_id="005xx' OR UserId != '")
+    with pytest.raises(errors.exceptions.InvalidParameterError):
+        client.can_access_records('share', ['001xx000003DGb2AAG'], user_id=USER_ID)
+    assert not queries
+
+
+def test_record_access_cache_avoids_repeated_queries():
+    """Cached access data is reused by the single and bulk checks until it is invalidated."""
+    access_by_id = {'001xx000003DGb2AAG': (True, True, False), '001xx000003DGb3AAG': (True, False, False)}
+    queries = []
+    client = _make_client(access_by_id, queries, record_access_cache=RecordAccessCache())
+
+    assert client.can_read_record('001xx000003DGb2', user_id=USER_ID) is True
+    assert client.can_edit_record('001xx000003DGb2AAG', user_id=USER_ID) is True
+    client.can_read_records(list(access_by_id), user_id=USER_ID)
+    client.can_read_records(list(access_by_id), user_id=USER_ID)
+
+    assert len(queries) == 2
+    assert "'001xx000003DGb2AAG'" not in queries[1]
+    assert client.invalidate_record_access_cache(record_id='001xx000003DGb2AAG') == 1
+    client.can_read_record('001xx000003DGb2AAG', user_id=USER_ID)
+    assert len(queries) == 3
+    assert client.get_record_access_cache_stats()['hits'] == 4
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# bandit: skip=B101
+"""
+:Module:         tests.unit.test_records
+:Synopsis:       Tests the compact record objects and the paginated SOQL query generator
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  18 Oct 2026
+"""
+
+import pickle
+
+import pytest
+
+from salespyforce.core import Salesforce
+from salespyforce.records import CompactRecord, compact_record, compact_records, get_record_class
+
+
+def _account(record_id, name):
+    """Return an Account record dictionary in the format returned by the query API."""
+    return {
+        'attributes': {'type': 'Account', 'url': f'/services/data/v65.0/sobjects/Account/{record_id}'},
+        'Id': record_id,
+        'Name': name,
+        'Owner': {'attributes': {'type': 'User', 'url': '/services/data/v65.0/sobjects/User/005'}, 'Name': 'Jeff'},
+    }
+
+
+def test_compact_records_share_a_generated_slots_class():
+    """Records with the same fields share one generated class and support attribute and key access."""
+    records = compact_records([_account('001A', 'Acme'), _account('001B', 'Globex')])
+
+    assert type(records[0]) is type(records[1])
+    assert type(records[0]).__name__ == 'Account'
+    assert not hasattr(records[0], '__dict__')
+    assert records[1].Name == 'Globex'
+    assert records[1]['Owner'].Name == 'Jeff'
+    assert records[1].get('Missing', 'default') == 'default'
+    assert records[0] == _account('001A', 'Acme') | {'Owner': {'Name': 'Jeff'}}
+    assert records[0].to_dict() == {'Id': '001A', 'Name': 'Acme', 'Owner': {'Name': 'Jeff'}}
+    with pytest.raises(KeyError):
+        records[0]['Missing']
+
+
+def test_compact_records_convert_subqueries_and_support_pickling():
+    """Subquery records are converted and compact records can be pickled."""
+    record = _account('001A', 'Acme')
+    record['Contacts'] = {'totalSize': 1, 'done': True, 'records': [{'attributes': {'type': 'Contact'}, 'Id': '003A'}]}
+
+    compacted = compact_record(record)
+    restored = pickle.loads(pickle.dumps(compacted))
+
+    assert isinstance(compacted.Contacts['records'][0], CompactRecord)
+    assert restored == compacted
+
+
+def test_unsupported_field_names_fall_back_to_dictionaries():
+    """Records whose field names would override the record methods are returned unchanged."""
+    record = {'Id': '001A', 'keys': 'value'}
+
+    assert get_record_class(('Id', 'keys')) is None
+    assert compact_record(record) is record
+
+
+def test_iter_soql_query_follows_next_records_url():
+    """The query generator retrieves each page using the nextRecordsUrl value."""
+    client = Salesforce.__new__(Salesforce)
+    client.version = 'v65.0'
+    pages = {
+        'first': {'done': False, 'nextRecordsUrl': '/services/data/v65.0/query/01gxx-2000', 'records': [_account('1', 'A')]},
+        '01gxx-2000': {'done': True, 'records': [_account('2', 'B')]},
+    }
+    requested = []
+
+    def get(endpoint):
+        requested.append(endpoint)
+        return pages['01gxx-2000'] if endpoint.endswith('01gxx-2000') else pages['first']
+
+    client.get = get
+    records = list(client.iter_soql_query('SELECT Id, Name FROM Account', compact_records=True))
+
+    assert [record.Name for record in records] == ['A', 'B']
+    assert requested[1] == '/services/data/v65.0/query/01gxx-2000'
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# bandit: skip=B101
+"""
+:Module:         tests.unit.test_rich_text_utils
+:Synopsis:       Tests the rich text image scanning and rewriting utilities
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  18 Oct 2026
+"""
+
+from salespyforce.utils import core_utils, rich_text_utils
+
+IMAGE_URL = 'https://example.file.force.com/servlet/rtaImage?eid=ka0xx0000000001&amp;feoid=00Nxx&amp;refid={ref_id}'
+BODY = (
+    f'<p>Intro</p><img alt="one" src="{IMAGE_URL.format(ref_id="0EMxx01")}">'
+    "<IMG class='x'\n SRC='https://example.com/logo.png'>"
+    f"<p><img src='{IMAGE_URL.format(ref_id='0EMxx02')}' /></p>"
+)
+
+
+def test_iter_image_urls_yields_unescaped_rich_text_images():
+    """Only images with a refid value are yielded, with escaped ampersands restored."""
+    image_urls = list(rich_text_utils.iter_image_urls(BODY))
+
+    assert len(image_urls) == 2
+    assert image_urls[0].endswith('&feoid=00Nxx&refid=0EMxx01')
+    assert rich_text_utils.get_ref_id(image_urls[1]) == '0EMxx02'
+    assert list(rich_text_utils.iter_image_urls(None)) == []
+
+
+def test_iter_record_images_streams_records_and_fields():
+    """Each image is yielded with the Record ID and field name of the rich text field where it was found."""
+    records = iter([{'Id': 'ka0xx0000000001', 'Body__c': BODY, 'Summary__c': None}, {'Id': 'ka0xx0000000002'}])
+
+    images = list(rich_text_utils.iter_record_images(records, ['Body__c', 'Summary__c']))
+
+    assert [(_record_id, _field) for _, _record_id, _field in images] == [('ka0xx0000000001', 'Body__c')] * 2
+
+
+def test_rewrite_image_urls_replaces_mapped_sources_only():
+    """Mapped refid values are replaced with escaped local paths while other images are unchanged."""
+    rewritten = rich_text_utils.rewrite_image_urls(BODY, {'0EMxx01': 'images/0EMxx01.jpeg', '0EMxx09': 'unused.jpeg'})
+
+    assert '<img alt="one" src="images/0EMxx01.jpeg">' in rewritten
+    assert "SRC='https://example.com/logo.png'" in rewritten
+    assert IMAGE_URL.format(ref_id='0EMxx02') in rewritten
+    assert rich_text_utils.rewrite_image_urls(BODY, {}) == BODY
+
+
+def test_get_ref_id_decodes_encoded_values():
+    """Encoded refid values are decoded to match the keys of the downloaded images."""
+    image_url = IMAGE_URL.format(ref_id='0EMxx%2B01')
+    rewritten = rich_text_utils.rewrite_image_urls(f'<img src="{image_url}">', {'0EMxx+01': 'images/0EMxx+01.jpeg'})
+
+    assert rich_text_utils.get_ref_id(image_url) == core_utils.get_image_ref_id(image_url.replace('&amp;', '&'))
+    assert rich_text_utils.get_ref_id(image_url) == '0EMxx+01'
+    assert rewritten == '<img src="images/0EMxx+01.jpeg">'
+    assert rich_text_utils.get_ref_id('https://example.com/logo.png') is None
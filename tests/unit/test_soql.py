@@ -4,10 +4,20 @@
 :Module:         tests.unit.test_soql
 :Synopsis:       This module is used by pytest to test performing SOQL queries
 :Created By:     Jeff Shurtliff
-:Last Modified:  Jeff Shurtliff (via GPT-5.3-Codex)
-:Modified Date:  02 Mar 2026
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  18 Oct 2026
 """
 
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from salespyforce import errors, knowledge, soql
+from salespyforce.core import Salesforce
+from salespyforce.utils import core_utils
+
 
 def test_soql_query(salesforce_unit):
     """This function tests the ability to perform a SOQL query.
@@ -21,3 +31,87 @@ def test_soql_query(salesforce_unit):
     soql_response = salesforce_unit.soql_query(soql_statement)
     assert 'done' in soql_response and soql_response.get('done') is True
     assert 'totalSize' in soql_response and 'records' in soql_response
+
+
+def test_soql_template_renders_escaped_bind_values():
+    """Bind values are converted into escaped SOQL literals and the encoded query matches the rendered query."""
+    template = soql.compile_query(
+        "SELECT Id FROM Account WHERE Name = :name AND Note__c != ':ignored' AND Type IN :types "
+        'AND Active__c = :active AND CreatedDate > :since AND Parent.Name = :name'
+    )
+
+    query = template.render(
+        name="O'Brien", types=['A', 'B'], active=True, since=datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+    )
+
+    assert template.bind_names == ('name', 'types', 'active', 'since')
+    assert query == (
+        "SELECT Id FROM Account WHERE Name = 'O\\'Brien' AND Note__c != ':ignored' AND Type IN ('A', 'B') "
+        "AND Active__c = true AND CreatedDate > 2026-10-18T12:00:00Z AND Parent.Name = 'O\\'Brien'"
+    )
+    assert query.encoded == core_utils.url_encode(query)
+    assert soql.compile_query(template.template) is template
+    with pytest.raises(errors.exceptions.MissingRequiredDataError):
+        template.render(name='Acme')
+    with pytest.raises(errors.exceptions.InvalidParameterError):
+        soql.format_soql_value(object())
+
+
+def test_format_soql_value_formats_numbers_without_exponents():
+    """Floats and decimals are formatted without an exponent and non-finite numbers are rejected."""
+    assert soql.format_soql_value(1e-07) == '0.0000001'
+    assert soql.format_soql_value(1.5e20) == '150000000000000000000'
+    assert soql.format_soql_value(0.1) == '0.1'
+    assert soql.format_soql_value(Decimal('1E+3')) == '1000'
+    assert soql.format_soql_value(42) == '42'
+    for value in (float('nan'), float('inf'), Decimal('-Infinity')):
+        with pytest.raises(errors.exceptions.InvalidParameterError):
+            soql.format_soql_value(value)
+
+
+def test_soql_template_query_all_splits_in_lists_and_merges_records():
+    """A large IN list is split across queries and the records of every page of each query are merged."""
+    queries = []
+
+    def soql_query(query, replace_quotes=True, next_records_url=False):
+        queries.append(query)
+        if next_records_url:
+            return {'done': True, 'records': [{'Id': 'next'}]}
+        return {'done': len(queries) > 1, 'nextRecordsUrl': '/query/01g-2000', 'records': [{'Id': str(len(queries))}]}
+
+    client = SimpleNamespace(soql_query=soql_query)
+    ids = [f'001xx{_index:013d}' for _index in range(300)] * 2
+
+    records = soql.compile_query('SELECT Id FROM Account WHERE Id IN :ids').query_all(client, ids=ids)
+
+    assert [_record['Id'] for _record in records] == ['1', 'next', '3']
+    assert queries[1] == '/query/01g-2000'
+    assert sum(_query.count("'001xx") for _query in (queries[0], queries[2])) == 300
+
+
+def test_soql_query_uses_encoded_form_of_rendered_queries():
+    """The core object sends the cached URL-encoded form of a rendered query without replacing quotes."""
+    endpoints = []
+    client = Salesforce.__new__(Salesforce)
+    client.version = 'v65.0'
+    client.get = lambda endpoint: endpoints.append(endpoint) or {'done': True, 'records': []}
+
+    client.soql_query(soql.compile_query('SELECT Id FROM Contact WHERE Name = :name').render(name='Say "Hi"'))
+
+    assert endpoints == ['/services/data/v65.0/query/?q=SELECT+Id+FROM+Contact+WHERE+Name+%3D+%27Say+%5C%22Hi%5C%22%27']
+
+
+def test_check_for_existing_article_escapes_title():
+    """The title of the article is escaped within the query."""
+    queries = []
+
+    def soql_query(query, **kwargs):
+        queries.append(query)
+        return {'totalSize': 1, 'records': [{'Id': 'ka0xx0000000001AAA', 'ArticleNumber': '000000001'}]}
+
+    client = SimpleNamespace(soql_query=soql_query)
+
+    assert knowledge.check_for_existing_article(client, "Bob's Guide") == '000000001'
+    assert queries[0] == (
+        "SELECT Id, ArticleNumber FROM Knowledge__kav WHERE Title = 'Bob\\'s Guide' AND PublishStatus != 'Archived'"
+    )
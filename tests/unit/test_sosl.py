@@ -4,12 +4,17 @@
 :Module:         tests.unit.test_sosl
 :Synopsis:       This module is used by pytest to test performing SOSL queries
 :Created By:     Jeff Shurtliff
-:Last Modified:  Jeff Shurtliff (via GPT-5.3-Codex)
-:Modified Date:  02 Mar 2026
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  18 Oct 2026
 """
 
+from types import SimpleNamespace
+
+import pytest
 import requests
 
+from salespyforce import errors, search
+
 from . import resources
 
 
@@ -27,3 +32,92 @@ def test_search_string(monkeypatch, salesforce_unit):
     # Perform the mock API call
     result = salesforce_unit.search_string('Account')
     assert 'searchRecords' in result
+
+
+def _make_search_client(calls, failing_terms=()):
+    """Return a client whose searches return one shared record and one record per search term."""
+
+    def post(endpoint, payload):
+        calls.append((endpoint, payload))
+        if payload['q'] in failing_terms:
+            raise RuntimeError('Search failed')
+        offset = payload.get('offset', 0)
+        records = [{'Id': '001shared'}, {'Id': f'001{payload["q"]}'}]
+        if 'offset' in payload:
+            limit = payload['sobjects'][0]['limit']
+            records = [{'Id': f'001{_num}'} for _num in range(offset, min(offset + limit, 5))]
+        return {'searchRecords': records}
+
+    return SimpleNamespace(version='v65.0', post=post)
+
+
+def test_parameterized_search_payload():
+    """The returning value is converted into object definitions with their fields and limits."""
+    calls = []
+    client = _make_search_client(calls)
+
+    search.parameterized_search(
+        client,
+        'Acme',
+        returning={'Account': 'Id, Name', 'Contact': {'fields': ['Id'], 'limit': 5}, 'Lead': None},
+        search_in='name',
+        overall_limit=20,
+    )
+
+    assert calls[0] == (
+        '/services/data/v65.0/parameterizedSearch',
+        {
+            'q': 'Acme',
+            'sobjects': [
+                {'name': 'Account', 'fields': ['Id', 'Name']},
+                {'name': 'Contact', 'fields': ['Id'], 'limit': 5},
+                {'name': 'Lead'},
+            ],
+            'in': 'NAME',
+            'overallLimit': 20,
+        },
+    )
+    with pytest.raises(errors.exceptions.InvalidParameterError):
+        search.parameterized_search(client, 'Acme', search_in='TITLE')
+    with pytest.raises(errors.exceptions.InvalidParameterError):
+        search.parameterized_search(client, 'Acme', returning='Account, Contact', offset=10)
+
+
+def test_parameterized_search_validates_object_clauses():
+    """The where and orderBy values of an object definition are included and unsupported keys are rejected."""
+    calls = []
+    client = _make_search_client(calls)
+
+    search.parameterized_search(
+        client, 'Acme', returning={'Account': {'fields': 'Id', 'where': " Type = 'Customer' ", 'orderBy': 'Name DESC'}}
+    )
+
+    assert calls[0][1]['sobjects'] == [
+        {'name': 'Account', 'fields': ['Id'], 'where': "Type = 'Customer'", 'orderBy': 'Name DESC'}
+    ]
+    for spec in ({'order_by': 'Name'}, {'where': ''}, {'limit': 0}, {'limit': '5'}):
+        with pytest.raises(errors.exceptions.InvalidParameterError):
+            search.parameterized_search(client, 'Acme', returning={'Account': spec})
+
+
+def test_iter_search_records_paginates_with_offset():
+    """The results of a single object are retrieved page by page until a partial page is returned."""
+    calls = []
+
+    records = list(search.iter_search_records(_make_search_client(calls), 'Acme', returning='Account', page_size=2))
+
+    assert [_record['Id'] for _record in records] == ['0010', '0011', '0012', '0013', '0014']
+    assert [_payload['offset'] for _, _payload in calls] == [0, 2, 4]
+    with pytest.raises(errors.exceptions.InvalidParameterError):
+        next(search.iter_search_records(_make_search_client([]), 'Acme', returning=['Account', 'Contact']))
+
+
+def test_search_many_merges_records_by_id():
+    """Each unique search term is searched once and the records are deduplicated by their IDs."""
+    calls = []
+    client = _make_search_client(calls, failing_terms=('Bad',))
+
+    records = search.search_many(client, ['Acme', 'Globex', 'Acme', 'Bad'], returning='Account', max_workers=2)
+
+    assert list(records) == ['001shared', '001Acme', '001Globex']
+    assert sorted(_payload['q'] for _, _payload in calls) == ['Acme', 'Bad', 'Globex']